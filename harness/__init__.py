@@ -0,0 +1,14 @@
+"""
+Load and performance harness for Trivia Party.
+
+The browser-driven scripts at the repository root (test_host.py,
+test_player.py, test_orchestrator.py) exercise the real UI. The modules in
+this package talk to PocketBase directly over REST and realtime so that
+backend load can be generated and measured without a browser per client.
+
+Every module assumes a PocketBase server started the same way dev.sh does
+(http://localhost:8090, superuser admin@example.com / Password123). Override
+the defaults with PB_URL, APP_URL, PB_SUPERUSER_EMAIL and
+PB_SUPERUSER_PASSWORD, or run a module against its own throwaway
+PocketBase with harness.fixture.
+"""
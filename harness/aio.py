@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+asyncio PocketBase client for simulating thousands of clients per process.
+
+Same surface as harness.pocketbase, built on asyncio streams so one event
+loop can hold a keep-alive REST connection and a realtime (SSE) stream per
+simulated client. Standard library only, like the rest of the harness.
+"""
+
+import asyncio
+import json
+import time
+import urllib.parse
+
+from harness.pocketbase import PB_URL, DEFAULT_PASSWORD, PocketBaseError
+
+
+async def _read_head(reader: asyncio.StreamReader):
+    """Status code and lower-cased headers of an HTTP/1.1 response."""
+    status_line = await reader.readuntil(b'\r\n')
+    status = int(status_line.split(b' ', 2)[1])
+    headers = {}
+    while True:
+        line = await reader.readuntil(b'\r\n')
+        if line == b'\r\n':
+            return status, headers
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+
+async def _iter_chunks(reader: asyncio.StreamReader, headers: dict):
+    """Body bytes as they arrive, for chunked or Content-Length bodies."""
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        while True:
+            size = int((await reader.readuntil(b'\r\n')).split(b';', 1)[0], 16)
+            if size == 0:
+                await reader.readuntil(b'\r\n')
+                return
+            chunk = await reader.readexactly(size)
+            await reader.readexactly(2)
+            yield chunk
+    elif 'content-length' in headers:
+        length = int(headers['content-length'])
+        if length:
+            yield await reader.readexactly(length)
+    else:
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk:
+                return
+            yield chunk
+
+
+class AsyncPocketBaseClient:
+    """
+    PocketBase REST client over one keep-alive connection.
+
+    Requests from the same client are serialised on that connection, which
+    matches a browser tab closely enough for load purposes.
+
+    Args:
+        base_url: PocketBase origin, e.g. http://localhost:8090
+        token: Optional auth token to start with
+        timeout: Per-request timeout in seconds
+    """
+
+    def __init__(self, base_url: str = PB_URL, token: str = None, timeout: float = 30):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.base_url = base_url.rstrip('/')
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.token = token
+        self.timeout = timeout
+        self.record = None
+        self._reader = None
+        self._writer = None
+        self._lock = asyncio.Lock()
+
+    def _request_bytes(self, method: str, target: str, body: bytes, accept: str = 'application/json') -> bytes:
+        lines = [f'{method} {target} HTTP/1.1', f'Host: {self.host}:{self.port}', f'Accept: {accept}']
+        if self.token:
+            lines.append(f'Authorization: {self.token}')
+        if body is not None:
+            lines.append('Content-Type: application/json')
+            lines.append(f'Content-Length: {len(body)}')
+        return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + (body or b'')
+
+    async def _exchange(self, payload: bytes):
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        self._writer.write(payload)
+        await self._writer.drain()
+        status, headers = await _read_head(self._reader)
+        raw = b''.join([chunk async for chunk in _iter_chunks(self._reader, headers)])
+        if headers.get('connection', '').lower() == 'close':
+            await self.close()
+        return status, raw
+
+    async def request(self, method: str, path: str, body=None, params: dict = None):
+        """Send a request and return the decoded JSON body (or None)."""
+        target = path
+        if params:
+            query = {k: v for k, v in params.items() if v is not None}
+            target += '?' + urllib.parse.urlencode(query)
+        payload = self._request_bytes(method, target, json.dumps(body).encode('utf-8') if body is not None else None)
+
+        async with self._lock:
+            reused = self._writer is not None
+            try:
+                status, raw = await asyncio.wait_for(self._exchange(payload), self.timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                await self.close()
+                if not reused:
+                    raise
+                # The server closed the idle keep-alive connection - retry once fresh
+                status, raw = await asyncio.wait_for(self._exchange(payload), self.timeout)
+            except asyncio.TimeoutError:
+                await self.close()
+                raise
+
+        if status >= 400:
+            try:
+                data = json.loads(raw or b'{}')
+            except ValueError:
+                data = {'message': raw.decode('utf-8', 'replace')}
+            raise PocketBaseError(status, data.get('message', ''), data.get('data'))
+        if not raw:
+            return None
+        return json.loads(raw)
+
+    async def close(self):
+        if self._writer is not None:
+            writer, self._reader, self._writer = self._writer, None, None
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+
+    # ------------------------------------------------------------------
+    # Auth
+    # ------------------------------------------------------------------
+
+    async def auth_with_password(self, email: str, password: str = DEFAULT_PASSWORD, collection: str = 'users'):
+        """Authenticate and keep the returned token on this client."""
+        result = await self.request(
+            'POST',
+            f'/api/collections/{collection}/auth-with-password',
+            {'identity': email, 'password': password},
+        )
+        self.token = result['token']
+        self.record = result.get('record')
+        return result
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+
+    async def get_list(self, collection: str, page: int = 1, per_page: int = 30, **params):
+        params.update({'page': page, 'perPage': per_page})
+        return await self.request('GET', f'/api/collections/{collection}/records', params=params)
+
+    async def get_first(self, collection: str, filter: str, **params):
+        result = await self.get_list(collection, page=1, per_page=1, filter=filter, skipTotal=1, **params)
+        return result['items'][0] if result['items'] else None
+
+    async def get_one(self, collection: str, record_id: str, **params):
+        return await self.request('GET', f'/api/collections/{collection}/records/{record_id}', params=params)
+
+    async def create(self, collection: str, data: dict):
+        return await self.request('POST', f'/api/collections/{collection}/records', data)
+
+    async def update(self, collection: str, record_id: str, data: dict):
+        return await self.request('PATCH', f'/api/collections/{collection}/records/{record_id}', data)
+
+
+class AsyncRealtimeSubscription:
+    """
+    Realtime (SSE) subscription on the client's event loop.
+
+    Args:
+        client: Authenticated client; the subscribe POST goes over its connection
+        topics: Subscription topics, e.g. ['games/<id>']
+        on_event: Callback receiving (topic, payload, received_at)
+    """
+
+    def __init__(self, client: AsyncPocketBaseClient, topics: list, on_event):
+        self.client = client
+        self.topics = topics
+        self.on_event = on_event
+        self.client_id = None
+        self.connected = asyncio.Event()
+        self._task = None
+        self._writer = None
+
+    async def start(self, timeout: float = 10):
+        self._task = asyncio.ensure_future(self._run())
+        connected = asyncio.ensure_future(self.connected.wait())
+        done, _ = await asyncio.wait({self._task, connected}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        if connected not in done:
+            connected.cancel()
+            if self._task in done:
+                self._task.result()  # Surface the connection error
+            await self.stop()
+            raise TimeoutError('Realtime connection was not established')
+        return self
+
+    async def wait_closed(self):
+        """Wait until the stream ends - closed by the server or cut by the network."""
+        try:
+            await self._task
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._writer is not None:
+            self._writer.close()
+
+    async def _run(self):
+        reader, self._writer = await asyncio.open_connection(self.client.host, self.client.port)
+        self._writer.write(self.client._request_bytes('GET', '/api/realtime', None, accept='text/event-stream'))
+        await self._writer.drain()
+        status, headers = await _read_head(reader)
+        if status >= 400:
+            raise PocketBaseError(status, 'Realtime connection refused')
+
+        buffer = b''
+        event_name, data_lines = None, []
+        async for chunk in _iter_chunks(reader, headers):
+            buffer += chunk
+            *lines, buffer = buffer.split(b'\n')
+            for raw_line in lines:
+                line = raw_line.decode('utf-8').rstrip('\r')
+                if line.startswith('event:'):
+                    event_name = line[6:].strip()
+                elif line.startswith('data:'):
+                    data_lines.append(line[5:].strip())
+                elif line == '' and event_name:
+                    await self._dispatch(event_name, '\n'.join(data_lines))
+                    event_name, data_lines = None, []
+
+    async def _dispatch(self, event_name: str, data: str):
+        received_at = time.time()
+        try:
+            payload = json.loads(data) if data else {}
+        except ValueError:
+            payload = {'raw': data}
+
+        if event_name == 'PB_CONNECT':
+            self.client_id = payload.get('clientId')
+            await self.client.request('POST', '/api/realtime', {
+                'clientId': self.client_id,
+                'subscriptions': self.topics,
+            })
+            self.connected.set()
+            return
+
+        self.on_event(event_name, payload, received_at)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+All-answered detection benchmark - many teams answer one question in a burst.
+
+A real ControllerPage runs the game with auto_reveal_on_all_answered on.
+Once the first question is live, every team submits within --burst-ms the
+way GamePage does (submitTeamAnswer: game lookup, existing-answer lookup,
+create), or with a bare create in --answer-mode direct.
+
+Measures, per team count:
+- detection latency: the controller's early-advance write seen over
+  realtime, minus the last answer seen over realtime
+- in-page detection: the controller's `all-teams-answered` performance
+  mark minus the last answer seen over realtime
+- fetches during the burst: record reads the controller tab issued, and
+  all record reads PocketBase served (request log)
+
+    python -m harness.bench_all_answered --teams 50 100 200
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import app_url, new_authenticated_context
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, iso_time
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import format_summary, summarize, write_report
+
+READ_ALL_ANSWERED_MARK = """() => performance.getEntriesByName('all-teams-answered')
+    .map(entry => (performance.timeOrigin + entry.startTime) / 1000)"""
+
+
+class BurstTracker:
+    """Watches one game's state and answers over realtime."""
+
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.question_live = threading.Event()
+        self.detected = threading.Event()
+        self.question_id = None
+        self.answer_times = []
+        self.detected_at = None
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if topic.startswith('game_answers/'):
+            if record.get('game') == self.game_id and payload.get('action') == 'create':
+                self.answer_times.append(received_at)
+            return
+        if record.get('id') != self.game_id:
+            return
+        data = record.get('data') or {}
+        question = data.get('question') or {}
+        if data.get('state') == 'round-play' and question.get('id') and not question.get('correct_answer'):
+            self.question_id = question['id']
+            self.question_live.set()
+        if (data.get('timer') or {}).get('isEarlyAdvance') and not self.detected.is_set():
+            self.detected_at = received_at
+            self.detected.set()
+
+
+def submit_like_app(player: PocketBaseClient, game: dict, question_id: str, team_id: str, answer: str):
+    """gameAnswersService.submitTeamAnswer, request for request."""
+    player.get_one('games', game['id'])
+    existing = player.get_full_list('game_answers',
+                                    filter=f'game = "{game["id"]}" && game_questions_id = "{question_id}"')
+    mine = next((a for a in existing if a['team'] == team_id), None)
+    if mine:
+        return player.update('game_answers', mine['id'], {'answer': answer})
+    return player.create('game_answers', {
+        'game': game['id'],
+        'game_questions_id': question_id,
+        'team': team_id,
+        'answer': answer,
+        'host': game['host'],
+    })
+
+
+def submit_direct(player: PocketBaseClient, game: dict, question_id: str, team_id: str, answer: str):
+    return player.create('game_answers', {
+        'game': game['id'],
+        'game_questions_id': question_id,
+        'team': team_id,
+        'answer': answer,
+        'host': game['host'],
+    })
+
+
+def count_record_reads(admin: PocketBaseClient, since: float, until: float) -> int:
+    """GETs on record endpoints PocketBase logged in [since, until]."""
+    log_filter = (f'data.type = "request" && data.method = "GET" && data.url ~ "/api/collections/" '
+                  f'&& created >= "{iso_time(since).replace("T", " ")}" '
+                  f'&& created <= "{iso_time(until).replace("T", " ")}"')
+    result = admin.request('GET', '/api/logs', params={'filter': log_filter, 'perPage': 1})
+    return result.get('totalItems', 0)
+
+
+def run_once(args, admin, browser, teams: int, players: list, host: PocketBaseClient, rng: random.Random):
+    built = create_game(host, f'All Answered Bench {teams}', rounds=1, questions_per_round=1, metadata={
+        'game_start_timer': 2,
+        'round_start_timer': 2,
+        'question_timer': args.question_timer,
+        'auto_reveal_on_all_answered': True,
+    }, rng=rng)
+    game = built['game']
+
+    print(f"🌱 ALL-ANSWERED BENCH: Seating {teams} teams", flush=True)
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        seats = list(pool.map(lambda i: join_game(players[i], game, team_name=f'Team {i + 1}'), range(teams)))
+
+    # Wait for the controller-maintained scoreboard to list every team
+    context = new_authenticated_context(browser, host)
+    page = context.new_page()
+    reads = []
+    page.on('request', lambda request: reads.append(time.time())
+            if request.method == 'GET' and '/api/collections/' in request.url else None)
+    page.goto(app_url(f'/controller/{game["id"]}'))
+    page.wait_for_load_state('networkidle')
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        scoreboard = admin.get_one('games', game['id']).get('scoreboard') or {}
+        seated = sum(1 for team_id, team in (scoreboard.get('teams') or {}).items()
+                     if team_id != 'no-team' and team.get('players'))
+        if seated >= teams:
+            break
+        time.sleep(0.5)
+
+    tracker = BurstTracker(game['id'])
+    realtime = RealtimeSubscription(admin, ['games/*', 'game_answers/*', *STATE_TOPICS],
+                                    GameStateFollower(tracker.on_event).on_event).start()
+
+    now = time.time()
+    host.update('games', game['id'], {'data': {
+        'state': 'game-start',
+        'timer': {'startedAt': iso_time(now), 'duration': 2, 'expiresAt': iso_time(now + 2)},
+    }})
+    if not tracker.question_live.wait(30):
+        raise TimeoutError('Controller never showed the first question')
+
+    submit = submit_like_app if args.answer_mode == 'app' else submit_direct
+    burst_started = time.time()
+    offsets = sorted(rng.uniform(0, args.burst_ms / 1000) for _ in range(teams))
+
+    def answer(i):
+        delay = burst_started + offsets[i] - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        try:
+            submit(players[i], game, tracker.question_id, seats[i]['team']['id'], rng.choice('ABCD'))
+        except PocketBaseError as e:
+            print(f"❌ ALL-ANSWERED BENCH: Answer failed for team {i + 1}: {e}", flush=True)
+
+    with ThreadPoolExecutor(max_workers=min(teams, 256)) as pool:
+        list(pool.map(answer, range(teams)))
+
+    tracker.detected.wait(args.question_timer)
+    finished = time.time()
+    realtime.stop()
+
+    marks = page.evaluate(READ_ALL_ANSWERED_MARK)
+    context.close()
+
+    last_answer = max(tracker.answer_times) if tracker.answer_times else None
+    result = {
+        'teams': teams,
+        'answers_seen': len(tracker.answer_times),
+        'detected': tracker.detected.is_set(),
+        'detection_ms': (tracker.detected_at - last_answer) * 1000 if tracker.detected_at and last_answer else None,
+        'in_page_detection_ms': (marks[0] - last_answer) * 1000 if marks and last_answer else None,
+        'controller_reads_during_burst': sum(1 for t in reads if burst_started <= t <= finished),
+    }
+
+    # The request log is written in batches - give it a moment
+    time.sleep(args.log_settle)
+    try:
+        result['server_reads_during_burst'] = count_record_reads(admin, burst_started, finished)
+        result['server_reads_per_answer'] = result['server_reads_during_burst'] / teams
+    except PocketBaseError as e:
+        print(f"⚠️ ALL-ANSWERED BENCH: Request log unavailable: {e}", flush=True)
+
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+    return result
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+
+    ensure_user(admin, 'answerhost@example.com')
+    host = login('answerhost@example.com')
+
+    most = max(args.teams)
+    print(f"🌱 ALL-ANSWERED BENCH: Preparing {most} player accounts", flush=True)
+    emails = [f'answerplayer{i + 1}@example.com' for i in range(most)]
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(lambda email: ensure_user(admin, email), emails))
+        players = list(pool.map(login, emails))
+
+    runs = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        for teams in args.teams:
+            for _ in range(args.repeat):
+                result = run_once(args, admin, browser, teams, players, host, rng)
+                print(f"   {teams} teams: detection {result['detection_ms']} ms, "
+                      f"controller reads {result['controller_reads_during_burst']}", flush=True)
+                runs.append(result)
+        browser.close()
+
+    by_teams = {}
+    for teams in args.teams:
+        matching = [r for r in runs if r['teams'] == teams]
+        by_teams[str(teams)] = {
+            'detected': sum(1 for r in matching if r['detected']),
+            'runs': len(matching),
+            'detection_ms': summarize([r['detection_ms'] for r in matching if r['detection_ms'] is not None]),
+            'in_page_detection_ms': summarize([r['in_page_detection_ms'] for r in matching
+                                               if r['in_page_detection_ms'] is not None]),
+            'controller_reads_during_burst': summarize([r['controller_reads_during_burst'] for r in matching]),
+            'server_reads_per_answer': summarize([r['server_reads_per_answer'] for r in matching
+                                                  if 'server_reads_per_answer' in r]),
+        }
+
+    return {'config': vars(args), 'by_teams': by_teams, 'runs': runs}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure all-answered detection with many teams answering at once')
+    parser.add_argument('--teams', type=int, nargs='+', default=[50, 100, 200], help='Team counts to run')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per team count')
+    parser.add_argument('--burst-ms', type=float, default=1000, help='Window every team answers within')
+    parser.add_argument('--answer-mode', choices=['app', 'direct'], default='app',
+                        help='app: same requests as submitTeamAnswer, direct: create only')
+    parser.add_argument('--question-timer', type=int, default=60, help='Seconds before the question times out')
+    parser.add_argument('--log-settle', type=float, default=3, help='Seconds to wait for the request log')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 ALL-ANSWERED DETECTION RESULTS")
+    print("=" * 60)
+    for teams, summary in result['by_teams'].items():
+        print(f"{teams} teams - detected {summary['detected']}/{summary['runs']}")
+        print(format_summary('  Detection (realtime)', summary['detection_ms']))
+        print(format_summary('  Detection (in page)', summary['in_page_detection_ms']))
+        print(format_summary('  Controller reads', summary['controller_reads_during_burst'], unit=''))
+        print(format_summary('  Server reads/answer', summary['server_reads_per_answer'], unit=''))
+    print(f"📄 Report: {write_report('all_answered', result)}")
+
+    sys.exit(0 if all(s['detected'] == s['runs'] for s in result['by_teams'].values()) else 1)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Audio pipeline load test - queues generate-audio jobs for many games at once.
+
+Measures, per job:
+- queue wait (POST /generate-audio -> job first seen as "processing")
+- completion time (POST -> "completed"/"failed")
+- stuck-job recovery (jobs injected as "processing" -> finished by the
+  worker's reset-and-retry path)
+and, for the whole run, the PocketBase write load the worker generates with
+its progress updates (counted from realtime update events).
+
+PocketBase must be started with TTS_API_BASE_URL pointing at the stub, e.g.
+
+    TTS_API_BASE_URL=http://127.0.0.1:8765 GEMINI_API_KEYS='["stub"]' pocketbase serve --dev
+    python -m harness.bench_audio_pipeline --games 20 --start-stub --stub-port 8765
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import tts_stub
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription
+from harness.seed import create_game, ensure_user, login
+from harness.stats import format_summary, peak_rate, summarize, write_report
+
+TERMINAL_STATUSES = ('completed', 'failed')
+
+
+class JobTracker:
+    """Collects job status transitions and write events from realtime."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.jobs = {}  # job id -> {'submitted': t, 'processing': t, 'finished': t, 'status': s}
+        self.writes = Counter()
+        self.write_times = []
+
+    def submitted(self, job_id: str, at: float, injected: bool = False):
+        with self.lock:
+            self.jobs.setdefault(job_id, {})
+            self.jobs[job_id].update({'submitted': at, 'injected': injected, 'status': 'pending'})
+
+    def on_event(self, topic: str, payload: dict, received_at: float):
+        collection = topic.split('/')[0]
+        record = payload.get('record', {})
+        with self.lock:
+            if payload.get('action') == 'update':
+                self.writes[collection] += 1
+                self.write_times.append(received_at)
+
+            if collection != 'audio_generation_jobs':
+                return
+            job = self.jobs.get(record.get('id'))
+            if job is None:
+                return
+            status = record.get('status')
+            job['status'] = status
+            if status == 'processing' and 'processing' not in job:
+                job['processing'] = received_at
+            if status in TERMINAL_STATUSES and 'finished' not in job:
+                job['finished'] = received_at
+
+    def pending_ids(self):
+        with self.lock:
+            return [job_id for job_id, job in self.jobs.items() if 'finished' not in job]
+
+    def mark_from_poll(self, record: dict):
+        with self.lock:
+            job = self.jobs.get(record['id'])
+            if job is not None and record['status'] in TERMINAL_STATUSES and 'finished' not in job:
+                job['status'] = record['status']
+                job['finished'] = time.time()
+
+
+def run_benchmark(args) -> dict:
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+
+    print(f"🌱 AUDIO BENCH: Seeding {args.games + args.inject_stuck} games across {args.hosts} hosts", flush=True)
+    hosts = []
+    for i in range(1, args.hosts + 1):
+        email = f'loadhost{i}@example.com'
+        ensure_user(admin, email, name=f'Load Host {i}')
+        hosts.append(login(email))
+
+    seeded = []
+    for i in range(args.games + args.inject_stuck):
+        host = hosts[i % len(hosts)]
+        seeded.append((host, create_game(host, f'Audio Bench {i + 1}', rounds=args.rounds,
+                                         questions_per_round=args.questions_per_round, status='setup')))
+
+    tracker = JobTracker()
+    realtime = RealtimeSubscription(admin, ['audio_generation_jobs/*', 'game_questions/*'], tracker.on_event).start()
+
+    triggered = seeded[:args.games]
+    stuck = seeded[args.games:]
+    request_latencies = []
+
+    def trigger(entry):
+        host, built = entry
+        started = time.time()
+        try:
+            result = host.request('POST', f"/api/games/{built['game']['id']}/generate-audio")
+        except PocketBaseError as e:
+            print(f"❌ AUDIO BENCH: generate-audio failed for {built['game']['id']}: {e}", flush=True)
+            return
+        request_latencies.append((time.time() - started) * 1000)
+        tracker.submitted(result['job_id'], started)
+
+    print(f"🚀 AUDIO BENCH: Queueing {len(triggered)} jobs concurrently", flush=True)
+    bench_started = time.time()
+    with ThreadPoolExecutor(max_workers=min(64, max(1, len(triggered)))) as pool:
+        list(pool.map(trigger, triggered))
+
+    # Jobs left in "processing" simulate a worker that died mid-run. Only the
+    # superuser may write the collection directly (updateRule is null).
+    for host, built in stuck:
+        job = admin.create('audio_generation_jobs', {
+            'game': built['game']['id'],
+            'status': 'processing',
+            'progress': 0,
+            'total_questions': args.rounds * args.questions_per_round,
+            'processed_questions': 0,
+            'failed_questions': [],
+            'current_api_key_index': 0,
+        })
+        tracker.submitted(job['id'], time.time(), injected=True)
+    if stuck:
+        print(f"🧟 AUDIO BENCH: Injected {len(stuck)} stuck jobs", flush=True)
+
+    deadline = time.time() + args.timeout
+    while time.time() < deadline:
+        pending = tracker.pending_ids()
+        if not pending:
+            break
+        # Realtime can miss events across reconnects - confirm with a poll
+        for i in range(0, len(pending), 50):
+            chunk = pending[i:i + 50]
+            records = admin.get_full_list('audio_generation_jobs',
+                                          filter=' || '.join(f'id = "{job_id}"' for job_id in chunk))
+            for record in records:
+                tracker.mark_from_poll(record)
+        print(f"⏳ AUDIO BENCH: {len(pending)} jobs outstanding ({int(time.time() - bench_started)}s)", flush=True)
+        time.sleep(args.poll_interval)
+
+    realtime.stop()
+    elapsed = time.time() - bench_started
+
+    completion, queue_wait, recovery = [], [], []
+    outcomes = Counter()
+    for job in tracker.jobs.values():
+        outcomes[job.get('status', 'unknown') if 'finished' in job else 'timed-out'] += 1
+        if 'finished' not in job:
+            continue
+        duration = (job['finished'] - job['submitted']) * 1000
+        if job['injected']:
+            recovery.append(duration)
+        else:
+            completion.append(duration)
+            if 'processing' in job:
+                queue_wait.append((job['processing'] - job['submitted']) * 1000)
+
+    total_questions = args.games * args.rounds * args.questions_per_round
+    total_writes = sum(tracker.writes.values())
+    report = {
+        'config': vars(args),
+        'elapsed_seconds': elapsed,
+        'outcomes': dict(outcomes),
+        'trigger_latency_ms': summarize(request_latencies),
+        'queue_wait_ms': summarize(queue_wait),
+        'completion_ms': summarize(completion),
+        'stuck_recovery_ms': summarize(recovery),
+        'writes': {
+            'by_collection': dict(tracker.writes),
+            'total': total_writes,
+            'per_question': total_writes / total_questions if total_questions else None,
+            'per_second_avg': total_writes / elapsed if elapsed else None,
+            'per_second_peak': peak_rate(tracker.write_times),
+        },
+    }
+
+    if not args.keep:
+        for host, built in seeded:
+            try:
+                host.delete('games', built['game']['id'])
+            except PocketBaseError:
+                pass
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Load test the TTS audio generation pipeline')
+    parser.add_argument('--games', type=int, default=10, help='Concurrent games queueing jobs')
+    parser.add_argument('--hosts', type=int, default=5, help='Synthetic host accounts to spread games over')
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--questions-per-round', type=int, default=5)
+    parser.add_argument('--inject-stuck', type=int, default=0, help='Extra jobs created directly in "processing"')
+    parser.add_argument('--timeout', type=float, default=900, help='Seconds to wait for all jobs')
+    parser.add_argument('--poll-interval', type=float, default=5)
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    parser.add_argument('--start-stub', action='store_true', help='Run harness.tts_stub in-process')
+    parser.add_argument('--stub-port', type=int, default=8765)
+    parser.add_argument('--stub-latency-ms', type=float, default=300)
+    parser.add_argument('--stub-jitter-ms', type=float, default=100)
+    parser.add_argument('--stub-error-rate', type=float, default=0.0)
+    parser.add_argument('--stub-rate-limit-rate', type=float, default=0.0)
+    args = parser.parse_args()
+
+    stub_config = None
+    if args.start_stub:
+        stub_config = tts_stub.StubConfig(args.stub_latency_ms, args.stub_jitter_ms, args.stub_error_rate,
+                                          args.stub_rate_limit_rate, frames=40)
+        tts_stub.serve('127.0.0.1', args.stub_port, stub_config)
+        print(f"🔊 AUDIO BENCH: TTS stub on http://127.0.0.1:{args.stub_port} "
+              f"(start PocketBase with TTS_API_BASE_URL pointing here)", flush=True)
+
+    result = run_benchmark(args)
+    if stub_config:
+        result['stub'] = dict(stub_config.counters)
+
+    print("\n" + "=" * 60)
+    print("📊 AUDIO PIPELINE RESULTS")
+    print("=" * 60)
+    print(f"Outcomes: {result['outcomes']}")
+    print(format_summary('Queue wait', result['queue_wait_ms']))
+    print(format_summary('Job completion', result['completion_ms']))
+    print(format_summary('Stuck recovery', result['stuck_recovery_ms']))
+    print(f"PocketBase writes: {result['writes']['total']} "
+          f"({result['writes']['per_question'] or 0:.1f}/question, peak {result['writes']['per_second_peak']}/s)")
+    print(f"📄 Report: {write_report('audio_pipeline', result)}")
+
+    sys.exit(0 if result['outcomes'].get('timed-out', 0) == 0 else 1)
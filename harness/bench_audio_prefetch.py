@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Audio prefetch benchmark - question shown to narration start on the display.
+
+Plays one fully timed game per mode with the real controller page
+(unthrottled) and the trivia-party-display app claimed for the game, the
+display emulating --profile (harness.browser.DEVICE_PROFILES). Every
+question gets a silent MP3 of --audio-seconds as its generated audio.
+
+Modes:
+- prefetch: the display fetches the next questions' audio from the
+  controller's upcoming_audio list (src/lib/audioPrefetch.ts)
+- cold: the prefetch downloads are aborted, so the display streams each
+  file when its question comes up - the behaviour before prefetching
+
+Measures, per mode:
+- audio start: the "Round r of R - Question n" heading appearing on the
+  display until its audio element fires 'playing'
+- stalls: 'waiting' events after playback started
+- questions whose audio never started
+
+Page-side times come from an init script (MutationObserver plus a wrapped
+HTMLMediaElement.play), so the Python polling interval does not affect them.
+
+Needs the display app's dev server on DISPLAY_URL (port 5174).
+
+    python -m harness.bench_audio_prefetch --profile venue-wifi-3g
+    python -m harness.bench_audio_prefetch --profile slow-3g --modes cold prefetch --audio-seconds 12
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from playwright.sync_api import sync_playwright
+
+from harness.bench_device_profiles import QuestionTracker
+from harness.bench_memory_leak import claim_display
+from harness.browser import DEVICE_PROFILES, app_url, apply_device_profile, display_url, new_authenticated_context
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, iso_time
+from harness.seed import create_game, ensure_user, login
+from harness.stats import format_summary, summarize, write_report
+from harness.tts_stub import SILENT_MP3_FRAME
+
+MODES = ('prefetch', 'cold')
+
+# One SILENT_MP3_FRAME is 1152 samples at 44.1 kHz
+FRAME_SECONDS = 1152 / 44100
+
+# Headless Chromium refuses play() without a user gesture otherwise
+LAUNCH_ARGS = ['--autoplay-policy=no-user-gesture-required']
+
+# First-seen times (epoch ms) of question headings, audio starts and stalls
+PAGE_MARKS_SCRIPT = """(() => {
+  const marks = window.__audioMarks = { visible: {}, playing: {}, stalls: {} }
+  const current = () => {
+    for (const h of document.querySelectorAll('h2')) {
+      const text = h.textContent.trim()
+      if (text.startsWith('Round ') && text.includes(' - Question ')) return text
+    }
+    return null
+  }
+  new MutationObserver(() => {
+    const heading = current()
+    if (heading && !(heading in marks.visible)) marks.visible[heading] = Date.now()
+  }).observe(document, { subtree: true, childList: true, characterData: true })
+
+  const play = HTMLMediaElement.prototype.play
+  HTMLMediaElement.prototype.play = function (...args) {
+    const heading = current()
+    if (heading && !(heading in marks.playing)) {
+      let started = false
+      this.addEventListener('playing', () => {
+        if (!started && !(heading in marks.playing)) marks.playing[heading] = Date.now()
+        started = true
+      })
+      this.addEventListener('waiting', () => {
+        if (started) marks.stalls[heading] = (marks.stalls[heading] || 0) + 1
+      })
+    }
+    return play.apply(this, args)
+  }
+})()"""
+
+READ_MARKS = "() => window.__audioMarks"
+
+AUDIO_ROUTE = '**/api/files/game_questions/**'
+
+
+def silent_mp3(seconds: float) -> bytes:
+    """A silent MP3 of roughly seconds, the size a TTS file of that length would be."""
+    return SILENT_MP3_FRAME * max(1, round(seconds / FRAME_SECONDS))
+
+
+def attach_audio(admin: PocketBaseClient, built: dict, audio: bytes) -> int:
+    """Give every question of a create_game() result audio, as the generation worker does."""
+    count = 0
+    for game_questions in built['questions'].values():
+        for game_question in game_questions:
+            admin.upload('game_questions', game_question['id'],
+                         {'audio_file': (f"{game_question['id']}.mp3", audio, 'audio/mpeg')},
+                         {'audio_status': 'available'})
+            count += 1
+    return count
+
+
+def route_audio(context, mode: str, counts: dict):
+    """Count audio requests by type; in cold mode abort the prefetch downloads so playback streams."""
+    def handle(route):
+        kind = route.request.resource_type
+        counts[kind] = counts.get(kind, 0) + 1
+        if mode == 'cold' and kind == 'fetch':
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route(AUDIO_ROUTE, handle)
+
+
+def run_mode(args, browser, admin, host, mode: str, audio: bytes, rng: random.Random) -> dict:
+    timers = {
+        'game_start_timer': args.state_timer,
+        'round_start_timer': args.state_timer,
+        'question_timer': args.question_timer,
+        'answer_timer': args.state_timer,
+        'round_end_timer': args.state_timer,
+        'game_end_timer': args.state_timer,
+    }
+    built = create_game(host, f'Audio Prefetch ({mode})', rounds=args.rounds,
+                        questions_per_round=args.questions_per_round, metadata=timers, rng=rng)
+    game = built['game']
+    attach_audio(admin, built, audio)
+
+    tracker = QuestionTracker(game['id'])
+    realtime = RealtimeSubscription(host, [f"games/{game['id']}", *STATE_TOPICS],
+                                    GameStateFollower(tracker.on_event).on_event).start()
+
+    controller = new_authenticated_context(browser, host).new_page()
+    controller.goto(app_url(f"/controller/{game['id']}"))
+
+    requests = {}
+    context = browser.new_context(viewport={'width': 1920, 'height': 1080})
+    context.add_init_script(PAGE_MARKS_SCRIPT)
+    route_audio(context, mode, requests)
+    apply_device_profile(context, args.profile)
+    display = context.new_page()
+    display.goto(display_url())
+    claim_display(admin, host, display, game)
+    for page in (controller, display):
+        page.wait_for_load_state('networkidle')
+
+    print(f"🔊 AUDIO BENCH: Playing '{mode}' on a '{args.profile}' display", flush=True)
+    started = time.time()
+    host.update('games', game['id'], {'data': {
+        'state': 'game-start',
+        'timer': {'startedAt': iso_time(started), 'duration': args.state_timer,
+                  'expiresAt': iso_time(started + args.state_timer)},
+    }})
+
+    deadline = started + args.timeout
+    while time.time() < deadline:
+        with tracker.lock:
+            if tracker.state == 'thanks':
+                break
+        time.sleep(0.5)
+
+    marks = display.evaluate(READ_MARKS)
+    realtime.stop()
+    for page in (controller, display):
+        page.context.close()
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+
+    audio_start = [marks['playing'][heading] - seen_at
+                   for heading, seen_at in marks['visible'].items() if heading in marks['playing']]
+    return {
+        'mode': mode,
+        'questions': len(marks['visible']),
+        'audio_start_ms': summarize(audio_start),
+        'never_started': sorted(set(marks['visible']) - set(marks['playing'])),
+        'stalls': sum(marks['stalls'].values()),
+        'audio_requests': requests,
+    }
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'audiohost@example.com')
+    host = login('audiohost@example.com')
+    audio = silent_mp3(args.audio_seconds)
+
+    runs = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        for mode in args.modes:
+            runs.append(run_mode(args, browser, admin, host, mode, audio, rng))
+        browser.close()
+
+    by_mode = {run['mode']: run for run in runs}
+    if all(mode in by_mode and by_mode[mode]['audio_start_ms'].get('count') for mode in MODES):
+        for key in ('p50', 'p95'):
+            by_mode['prefetch'][f'{key}_saved_ms'] = (by_mode['cold']['audio_start_ms'][key]
+                                                      - by_mode['prefetch']['audio_start_ms'][key])
+    return {'config': vars(args), 'audio_bytes': len(audio), 'modes': runs}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure question-shown to audio-start latency on the display')
+    parser.add_argument('--profile', choices=list(DEVICE_PROFILES), default='venue-wifi-3g',
+                        help='Device profile the display emulates')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--audio-seconds', type=float, default=8, help='Length of each question\'s audio')
+    parser.add_argument('--rounds', type=int, default=2)
+    parser.add_argument('--questions-per-round', type=int, default=4)
+    parser.add_argument('--question-timer', type=int, default=12, help='Seconds per question')
+    parser.add_argument('--state-timer', type=int, default=3, help='Seconds for every other timed state')
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 AUDIO PREFETCH RESULTS")
+    print("=" * 60)
+    print(f"Profile: {args.profile}, {result['audio_bytes'] / 1024:.0f}KB per question")
+    for run in result['modes']:
+        print(f"{run['mode']} - {run['questions']} questions, {len(run['never_started'])} without audio, "
+              f"{run['stalls']} stalls, requests {run['audio_requests']}")
+        print(format_summary('  Audio start', run['audio_start_ms']))
+        if 'p95_saved_ms' in run:
+            print(f"  Saved vs cold: p50 {run['p50_saved_ms']:.0f}ms, p95 {run['p95_saved_ms']:.0f}ms")
+    print(f"📄 Report: {write_report('audio_prefetch', result)}")
+
+    sys.exit(0 if all(not run['never_started'] for run in result['modes']) else 1)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Avatar bytes benchmark - what one roster render downloads.
+
+TeamRoster and TeamScoreCard on the display, and the team cards in the
+web app, show every player's avatar. A render is modelled as fetching
+each of those avatar URLs once, --concurrency at a time (a browser's
+connections per host).
+
+Seeds --players users with a --avatar-px square photo-sized avatar
+(incompressible PNG) and then renders the roster three ways:
+- original: the full upload. This is what every roster got while
+  users.avatar had no thumb sizes registered, because PocketBase serves
+  the original for unregistered sizes.
+- thumb (cold): ?thumb=100x100 on first request, so PocketBase generates
+  each thumb
+- thumb: the same URLs again, served from the stored thumbs
+
+Per render it reports bytes, request latency and the Cache-Control sent.
+A reload costs one revalidation per avatar unless the response is marked
+immutable. The run fails when thumbs are not smaller than the originals
+(size not registered) or avatars are not served as immutable.
+
+    python -m harness.bench_avatar_bytes --players 200
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.pocketbase import PB_URL, PocketBaseClient
+from harness.seed import ensure_user
+from harness.stats import format_summary, summarize, write_report
+
+# AVATAR_THUMBS.small in src/lib/pocketbase.ts
+ROSTER_THUMB = '100x100'
+
+
+def noise_png(size: int) -> bytes:
+    """A size x size RGB PNG of random pixels - about as large as a phone photo of that size."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    rows = b''.join(b'\x00' + os.urandom(size * 3) for _ in range(size))
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(rows, 1))
+            + chunk(b'IEND', b''))
+
+
+def seed_players(admin: PocketBaseClient, count: int, size: int, reupload: bool) -> list:
+    """(user id, avatar filename) for count players, uploading avatars they don't have yet."""
+    image = None
+    players = []
+    for i in range(count):
+        user = ensure_user(admin, f'avatarplayer{i + 1}@example.com')
+        if reupload or not user.get('avatar'):
+            image = image or noise_png(size)
+            user = admin.upload('users', user['id'], {'avatar': (f'avatar{i + 1}.png', image, 'image/png')})
+        players.append((user['id'], user['avatar']))
+    return players
+
+
+def avatar_url(user_id: str, filename: str, thumb: str = None) -> str:
+    url = f"{PB_URL.rstrip('/')}/api/files/_pb_users_auth_/{user_id}/{urllib.parse.quote(filename)}"
+    return f"{url}?thumb={thumb}" if thumb else url
+
+
+def fetch(url: str) -> dict:
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            body = response.read()
+            status, cache_control = response.status, response.headers.get('Cache-Control', '')
+    except urllib.error.HTTPError as e:
+        body, status, cache_control = e.read(), e.code, ''
+    return {
+        'bytes': len(body),
+        'ms': (time.perf_counter() - started) * 1000,
+        'status': status,
+        'cache_control': cache_control,
+    }
+
+
+def render(players: list, thumb: str, concurrency: int) -> dict:
+    """Fetch every player's avatar once, as one roster render would."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        responses = list(pool.map(fetch, [avatar_url(user_id, filename, thumb) for user_id, filename in players]))
+    cache_controls = sorted({r['cache_control'] for r in responses})
+    immutable = all('immutable' in r['cache_control'] for r in responses)
+    return {
+        'requests': len(responses),
+        'errors': sum(1 for r in responses if r['status'] != 200),
+        'bytes': sum(r['bytes'] for r in responses),
+        'bytes_per_avatar': [r['bytes'] for r in responses],
+        'request_ms': summarize([r['ms'] for r in responses]),
+        'render_seconds': time.perf_counter() - started,
+        'cache_control': cache_controls,
+        'immutable': immutable,
+        'revalidations_per_reload': 0 if immutable else len(responses),
+    }
+
+
+def run_benchmark(args):
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    print(f"🌱 AVATAR BENCH: Seeding {args.players} players with {args.avatar_px}px avatars", flush=True)
+    players = seed_players(admin, args.players, args.avatar_px, args.reupload)
+
+    renders = {}
+    for name, thumb in (('original', None), ('thumb_cold', ROSTER_THUMB), ('thumb', ROSTER_THUMB)):
+        print(f"🖼️  AVATAR BENCH: Rendering roster ({name})", flush=True)
+        renders[name] = render(players, thumb, args.concurrency)
+
+    original, thumb = renders['original'], renders['thumb']
+    # A thumb is only served if the size is registered on users.avatar
+    thumbs_served = all(small < full for small, full in zip(thumb['bytes_per_avatar'], original['bytes_per_avatar']))
+    for result in renders.values():
+        result['bytes_per_avatar'] = summarize(result.pop('bytes_per_avatar'))
+    return {
+        'config': vars(args),
+        'renders': renders,
+        'thumbs_served': thumbs_served,
+        'bytes_saved_per_render': original['bytes'] - thumb['bytes'],
+        'reduction': original['bytes'] / thumb['bytes'] if thumb['bytes'] else None,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure avatar bytes per roster render, originals vs thumbs')
+    parser.add_argument('--players', type=int, default=200, help='Players on the roster')
+    parser.add_argument('--avatar-px', type=int, default=800, help='Width and height of each uploaded avatar')
+    parser.add_argument('--concurrency', type=int, default=6, help='Parallel requests, like a browser per host')
+    parser.add_argument('--reupload', action='store_true', help='Upload new avatars even for players that have one')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 AVATAR BYTES RESULTS")
+    print("=" * 60)
+    for name, run in result['renders'].items():
+        print(f"{name}: {run['bytes'] / 1048576:.2f}MB in {run['render_seconds']:.1f}s, "
+              f"{run['errors']} errors, Cache-Control {run['cache_control']}")
+        print(format_summary('  Request', run['request_ms']))
+        print(f"  Revalidations per reload: {run['revalidations_per_reload']}")
+    if result['reduction']:
+        print(f"Saved per render: {result['bytes_saved_per_render'] / 1048576:.2f}MB "
+              f"({result['reduction']:.0f}x smaller)")
+    if not result['thumbs_served']:
+        print(f"🚨 Thumbs were not smaller than the originals - is {ROSTER_THUMB} registered on users.avatar?")
+    print(f"📄 Report: {write_report('avatar_bytes', result)}")
+
+    ok = result['thumbs_served'] and result['renders']['thumb']['immutable'] and not any(
+        run['errors'] for run in result['renders'].values())
+    sys.exit(0 if ok else 1)
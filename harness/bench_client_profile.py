@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Client profile benchmark - what one player browser costs, lean or not.
+
+Plays the same fully timed game once per profile with --clients player
+browsers, each in its own Chromium so its process tree can be measured:
+
+- full: the default Playwright context, as test_player.py uses it
+- lean: harness.browser's lean profile - images, fonts, media and
+  analytics blocked, animations off, 360x640 viewport
+
+A separate, unmeasured controller tab advances the game on its timers.
+Per client it samples CPU and PSS of the Chromium process tree from /proc
+(harness.procstat) and reads Chrome's own Performance.getMetrics at the
+end. A client only counts as working if its tab reached the thanks screen,
+which needs both the React app and the realtime stream.
+
+    python -m harness.bench_client_profile --clients 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import LEAN_CONTEXT_OPTIONS, apply_lean_profile, app_url, new_authenticated_context
+from harness.pocketbase import PocketBaseClient, PocketBaseError, iso_time
+from harness.procstat import TreeSampler, descendants, new_roots
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.sessions import SessionPool
+from harness.stats import format_summary, summarize, write_report
+
+THANKS_TEXT = 'Thanks for Playing!'
+
+# Performance.getMetrics names worth keeping (durations are in seconds)
+CDP_METRICS = ('TaskDuration', 'ScriptDuration', 'LayoutDuration', 'RecalcStyleDuration',
+               'JSHeapUsedSize', 'Nodes')
+
+
+class Client:
+    """One player in its own browser, with its process tree sampler."""
+
+    def __init__(self, playwright, pool: SessionPool, email: str, lean: bool):
+        before = descendants(os.getpid())
+        self.browser = playwright.chromium.launch(headless=True)
+        self.sampler = TreeSampler(new_roots(before, descendants(os.getpid())))
+        self.blocked = {}
+        context = pool.new_context(self.browser, email, **(LEAN_CONTEXT_OPTIONS if lean else {}))
+        if lean:
+            apply_lean_profile(context, self.blocked)
+        self.page = context.new_page()
+        self.cdp = context.new_cdp_session(self.page)
+        self.cdp.send('Performance.enable')
+        self.bytes_received = 0
+        self.page.on('response', self._count_bytes)
+        self.samples = []
+
+    def _count_bytes(self, response):
+        try:
+            self.bytes_received += int(response.headers.get('content-length') or 0)
+        except ValueError:
+            pass
+
+    def sample(self):
+        self.samples.append((time.time(), self.sampler.sample()))
+
+    def metrics(self) -> dict:
+        values = {m['name']: m['value'] for m in self.cdp.send('Performance.getMetrics')['metrics']}
+        return {name: values.get(name) for name in CDP_METRICS}
+
+    def reached_thanks(self) -> bool:
+        try:
+            return self.page.get_by_text(THANKS_TEXT).is_visible()
+        except Exception:
+            return False
+
+
+def run_profile(args, playwright, controller_browser, pool, profile: str) -> dict:
+    lean = profile == 'lean'
+    host = login(args.host_email)
+    timers = {
+        'game_start_timer': args.state_timer,
+        'round_start_timer': args.state_timer,
+        'question_timer': args.question_timer,
+        'answer_timer': args.state_timer,
+        'round_end_timer': args.state_timer,
+        'game_end_timer': args.state_timer,
+    }
+    built = create_game(host, f'Client Profile ({profile})', rounds=args.rounds,
+                        questions_per_round=args.questions_per_round, metadata=timers)
+    game = built['game']
+
+    emails = [f'profileplayer{i + 1}@example.com' for i in range(args.clients)]
+    for i, email in enumerate(emails):
+        join_game(pool.client(email), game, team_name=f'Profile Team {i + 1}')
+
+    controller = new_authenticated_context(controller_browser, host).new_page()
+    controller.goto(app_url(f"/controller/{game['id']}"))
+
+    print(f"🧪 PROFILE BENCH: Launching {args.clients} '{profile}' clients", flush=True)
+    clients = [Client(playwright, pool, email, lean) for email in emails]
+    for client in clients:
+        client.page.goto(app_url(f"/game/{game['id']}"))
+    for page in [controller] + [client.page for client in clients]:
+        page.wait_for_load_state('networkidle')
+
+    for client in clients:
+        client.sample()
+    started = time.time()
+    host.update('games', game['id'], {'data': {
+        'state': 'game-start',
+        'timer': {'startedAt': iso_time(started), 'duration': args.state_timer,
+                  'expiresAt': iso_time(started + args.state_timer)},
+    }})
+
+    deadline = started + args.timeout
+    while time.time() < deadline:
+        time.sleep(args.sample_interval)
+        for client in clients:
+            client.sample()
+        if host.get_one('games', game['id']).get('data', {}).get('state') == 'thanks':
+            break
+    # Give the players a moment to render the final state
+    time.sleep(2)
+
+    per_client = []
+    for client in clients:
+        client.sample()
+        (first_at, first), (last_at, last) = client.samples[0], client.samples[-1]
+        elapsed = last_at - first_at
+        per_client.append({
+            'cpu_percent': (last['cpu_seconds'] - first['cpu_seconds']) / elapsed * 100 if elapsed else None,
+            'memory_mb_mean': sum(s['memory_kb'] for _, s in client.samples) / len(client.samples) / 1024,
+            'memory_mb_peak': max(s['memory_kb'] for _, s in client.samples) / 1024,
+            'processes': last['processes'],
+            'bytes_received': client.bytes_received,
+            'blocked_requests': dict(client.blocked),
+            'cdp': client.metrics(),
+            'reached_thanks': client.reached_thanks(),
+        })
+        client.browser.close()
+    controller.context.close()
+
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+
+    def cdp_values(name, scale=1):
+        return [c['cdp'][name] * scale for c in per_client if c['cdp'].get(name) is not None]
+
+    return {
+        'profile': profile,
+        'game_seconds': time.time() - started,
+        'working_clients': sum(1 for c in per_client if c['reached_thanks']),
+        'cpu_percent': summarize([c['cpu_percent'] for c in per_client if c['cpu_percent'] is not None]),
+        'memory_mb_mean': summarize([c['memory_mb_mean'] for c in per_client]),
+        'memory_mb_peak': summarize([c['memory_mb_peak'] for c in per_client]),
+        'bytes_received': summarize([c['bytes_received'] for c in per_client]),
+        'task_ms': summarize(cdp_values('TaskDuration', 1000)),
+        'script_ms': summarize(cdp_values('ScriptDuration', 1000)),
+        'js_heap_mb': summarize(cdp_values('JSHeapUsedSize', 1 / 1024 / 1024)),
+        'clients': per_client,
+    }
+
+
+def run_benchmark(args):
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, args.host_email)
+    pool = SessionPool()
+    for i in range(args.clients):
+        ensure_user(admin, f'profileplayer{i + 1}@example.com')
+
+    runs = []
+    with sync_playwright() as p:
+        controller_browser = p.chromium.launch(headless=True)
+        for profile in args.profiles:
+            runs.append(run_profile(args, p, controller_browser, pool, profile))
+        controller_browser.close()
+    return {'config': vars(args), 'profiles': runs}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Compare per-client CPU and memory with and without the lean profile')
+    parser.add_argument('--clients', type=int, default=4, help='Player browsers per profile')
+    parser.add_argument('--profiles', nargs='+', choices=['full', 'lean'], default=['full', 'lean'])
+    parser.add_argument('--rounds', type=int, default=2)
+    parser.add_argument('--questions-per-round', type=int, default=3)
+    parser.add_argument('--question-timer', type=int, default=5, help='Seconds per question')
+    parser.add_argument('--state-timer', type=int, default=3, help='Seconds for every other timed state')
+    parser.add_argument('--sample-interval', type=float, default=1, help='Seconds between /proc samples')
+    parser.add_argument('--timeout', type=float, default=300, help='Seconds to wait for the game to finish')
+    parser.add_argument('--host-email', default='profilehost@example.com')
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 CLIENT PROFILE RESULTS (per client)")
+    print("=" * 60)
+    for run in result['profiles']:
+        print(f"{run['profile']} - {run['working_clients']}/{args.clients} clients reached the thanks screen")
+        print(format_summary('  CPU', run['cpu_percent'], unit='%'))
+        print(format_summary('  Memory (mean PSS)', run['memory_mb_mean'], unit='MB'))
+        print(format_summary('  Memory (peak PSS)', run['memory_mb_peak'], unit='MB'))
+        print(format_summary('  Bytes received', run['bytes_received'], unit='B'))
+        print(format_summary('  Main-thread tasks', run['task_ms']))
+        print(format_summary('  Scripting', run['script_ms']))
+        print(format_summary('  JS heap', run['js_heap_mb'], unit='MB'))
+    print(f"📄 Report: {write_report('client_profile', result)}")
+
+    sys.exit(0 if all(run['working_clients'] == args.clients for run in result['profiles']) else 1)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cold-start benchmark for the player path: /join?code=..., /lobby, /game/<id>.
+
+Serves the production build (`pnpm run build` -> ./dist) from a small
+local server that behaves like the nginx deployment: hashed assets are
+gzipped and cached immutably, index.html is revalidated. Each route is
+loaded in a fresh browser context (empty cache) on an emulated phone
+network (harness.browser.DEVICE_PROFILES), then reloaded in the same
+context.
+
+Per route it reports:
+- time to interactive: the app has rendered past the connection and
+  Suspense placeholders, and the main thread has no long task after that
+  (time from navigation start)
+- first contentful paint
+- JS and total bytes transferred, and which script chunks were loaded
+- on reload: bytes transferred and the share of scripts served from cache
+
+Budgets (JS kB over the wire, TTI ms, chunks that must not load) are
+checked per route and fail the run; the defaults keep host-only code such
+as ControllerPage out of the join path. Override them with --budgets FILE
+(JSON, same shape as DEFAULT_BUDGETS).
+
+    pnpm run build
+    python -m harness.bench_cold_start --profile venue-wifi-3g
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import sys
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import DEVICE_PROFILES, emulate_device, new_authenticated_context
+from harness.pocketbase import PocketBaseClient, PocketBaseError
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import summarize, format_summary, write_report
+
+DEFAULT_BUDGETS = {
+    'join': {'js_kb': 300, 'tti_ms': 6000, 'forbidden_chunks': ['ControllerPage', 'HostPage']},
+    'lobby': {'js_kb': 300, 'tti_ms': 6000, 'forbidden_chunks': ['ControllerPage', 'HostPage']},
+    'game': {'js_kb': 300, 'tti_ms': 6000, 'forbidden_chunks': ['ControllerPage', 'HostPage']},
+}
+
+COMPRESSIBLE = ('.js', '.css', '.html', '.svg', '.json', '.txt')
+
+# Long tasks are buffered from navigation start so TTI can account for them
+LONG_TASKS_SCRIPT = """(() => {
+  window.__longTaskEnds = []
+  try {
+    new PerformanceObserver(list => {
+      for (const entry of list.getEntries()) window.__longTaskEnds.push(entry.startTime + entry.duration)
+    }).observe({ type: 'longtask', buffered: true })
+  } catch (e) {}
+})()"""
+
+# performance.now() once the app shows a real page
+APP_READY = """() => {
+  const root = document.getElementById('root')
+  const text = document.body ? document.body.textContent : ''
+  if (!root || !root.children.length) return false
+  if (text.includes('Connecting to server') || text.includes('Loading...')) return false
+  return performance.now()
+}"""
+
+READ_PAGE_TIMING = """() => ({
+  longTaskEnds: window.__longTaskEnds || [],
+  fcp: (performance.getEntriesByName('first-contentful-paint')[0] || {}).startTime || null,
+})"""
+
+
+class StaticBuildHandler(BaseHTTPRequestHandler):
+    """dist/ with SPA fallback, gzip and nginx-like cache headers."""
+
+    root = 'dist'
+    _cache = {}
+    _lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _load(self, path: str, compress: bool):
+        key = (path, compress)
+        with self._lock:
+            if key not in self._cache:
+                with open(path, 'rb') as f:
+                    body = f.read()
+                if compress:
+                    body = gzip.compress(body, 6)
+                self._cache[key] = (body, hashlib.sha1(body).hexdigest())
+            return self._cache[key]
+
+    def do_GET(self):
+        rel = urllib.parse.urlsplit(self.path).path.lstrip('/')
+        path = os.path.normpath(os.path.join(self.root, rel))
+        if not path.startswith(os.path.normpath(self.root)) or not os.path.isfile(path):
+            path = os.path.join(self.root, 'index.html')
+
+        compress = path.endswith(COMPRESSIBLE) and 'gzip' in self.headers.get('Accept-Encoding', '')
+        body, digest = self._load(path, compress)
+        etag = f'"{digest}"'
+        hashed = os.path.relpath(path, self.root).startswith('assets' + os.sep)
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'public, max-age=31536000, immutable' if hashed else 'no-cache')
+        if compress:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve_build(dist: str, port: int):
+    handler = type('Handler', (StaticBuildHandler,), {'root': dist, '_cache': {}})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class NetworkLog:
+    """Transfer sizes and cache use of one page's requests, from CDP Network events."""
+
+    def __init__(self, cdp):
+        self.requests = {}
+        cdp.send('Network.enable')
+        cdp.on('Network.responseReceived', self._on_response)
+        cdp.on('Network.requestServedFromCache', self._on_memory_cache)
+        cdp.on('Network.loadingFinished', self._on_finished)
+
+    def reset(self):
+        self.requests = {}
+
+    def _entry(self, request_id):
+        return self.requests.setdefault(request_id, {'url': None, 'type': None, 'bytes': 0, 'cached': False})
+
+    def _on_response(self, params):
+        entry = self._entry(params['requestId'])
+        entry['url'] = params['response']['url']
+        entry['type'] = params.get('type')
+        if params['response'].get('fromDiskCache') or params['response'].get('status') == 304:
+            entry['cached'] = True
+
+    def _on_memory_cache(self, params):
+        self._entry(params['requestId'])['cached'] = True
+
+    def _on_finished(self, params):
+        self._entry(params['requestId'])['bytes'] = params.get('encodedDataLength', 0)
+
+    def summary(self, origin: str) -> dict:
+        ours = [r for r in self.requests.values() if r['url'] and r['url'].startswith(origin)]
+        scripts = [r for r in ours if r['type'] == 'Script']
+        return {
+            'requests': len(ours),
+            'total_bytes': sum(r['bytes'] for r in ours),
+            'js_bytes': sum(r['bytes'] for r in scripts),
+            'scripts': sorted(os.path.basename(urllib.parse.urlsplit(r['url']).path) for r in scripts),
+            'scripts_from_cache': sum(1 for r in scripts if r['cached']),
+        }
+
+
+def measure_load(page, log: NetworkLog, origin: str, navigate, timeout_ms: float) -> dict:
+    log.reset()
+    navigate()
+    ready = page.wait_for_function(APP_READY, polling='raf', timeout=timeout_ms).json_value()
+    page.wait_for_load_state('networkidle')
+    timing = page.evaluate(READ_PAGE_TIMING)
+    later_tasks = [end for end in timing['longTaskEnds'] if end > ready]
+    return {
+        'ready_ms': ready,
+        'tti_ms': max([ready] + later_tasks),
+        'fcp_ms': timing['fcp'],
+        **log.summary(origin),
+    }
+
+
+def check_budget(route: str, cold: dict, budget: dict) -> list:
+    violations = []
+    js_kb = cold['js_bytes'] / 1024
+    if 'js_kb' in budget and js_kb > budget['js_kb']:
+        violations.append(f"{route}: {js_kb:.0f}kB JS > {budget['js_kb']}kB")
+    if 'tti_ms' in budget and cold['tti_ms'] > budget['tti_ms']:
+        violations.append(f"{route}: TTI {cold['tti_ms']:.0f}ms > {budget['tti_ms']}ms")
+    for chunk in budget.get('forbidden_chunks', []):
+        loaded = [script for script in cold['scripts'] if script.startswith(chunk)]
+        if loaded:
+            violations.append(f"{route}: loaded {', '.join(loaded)}")
+    return violations
+
+
+def run_benchmark(args):
+    if not os.path.isfile(os.path.join(args.dist, 'index.html')):
+        raise SystemExit(f"❌ COLD START: No build in {args.dist} - run `pnpm run build` first")
+    budgets = DEFAULT_BUDGETS
+    if args.budgets:
+        with open(args.budgets) as f:
+            budgets = json.load(f)
+
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'coldhost@example.com')
+    ensure_user(admin, 'coldplayer@example.com')
+    host = login('coldhost@example.com')
+    player = login('coldplayer@example.com')
+    built = create_game(host, 'Cold Start Bench', rounds=1, questions_per_round=1)
+    game = built['game']
+
+    # The joining player is new to the game; lobby and game views use a joined one
+    ensure_user(admin, 'coldjoiner@example.com')
+    joiner = login('coldjoiner@example.com')
+    join_game(player, game, team_name='Cold Team')
+
+    server = serve_build(args.dist, args.port)
+    origin = f'http://127.0.0.1:{args.port}'
+    routes = [
+        ('join', joiner, f"/join?code={game['code']}"),
+        ('lobby', player, '/lobby'),
+        ('game', player, f"/game/{game['id']}"),
+    ]
+
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        for route, client, path in routes:
+            runs = []
+            for _ in range(args.repeat):
+                context = new_authenticated_context(browser, client)
+                context.add_init_script(LONG_TASKS_SCRIPT)
+                page = context.new_page()
+                log = NetworkLog(emulate_device(page, args.profile))
+                cold = measure_load(page, log, origin, lambda: page.goto(origin + path), args.timeout * 1000)
+                warm = measure_load(page, log, origin, page.reload, args.timeout * 1000)
+                context.close()
+                runs.append({'cold': cold, 'warm': warm})
+
+            cold_runs = [run['cold'] for run in runs]
+            warm_runs = [run['warm'] for run in runs]
+            cold_js = summarize([run['js_bytes'] for run in cold_runs])
+            worst = max(cold_runs, key=lambda run: run['tti_ms'])
+            results[route] = {
+                'path': path,
+                'tti_ms': summarize([run['tti_ms'] for run in cold_runs]),
+                'fcp_ms': summarize([run['fcp_ms'] for run in cold_runs if run['fcp_ms'] is not None]),
+                'js_bytes': cold_js,
+                'total_bytes': summarize([run['total_bytes'] for run in cold_runs]),
+                'scripts': cold_runs[0]['scripts'],
+                'reload_tti_ms': summarize([run['tti_ms'] for run in warm_runs]),
+                'reload_bytes': summarize([run['total_bytes'] for run in warm_runs]),
+                'reload_script_cache_ratio': (sum(run['scripts_from_cache'] for run in warm_runs)
+                                              / max(1, sum(len(run['scripts']) for run in warm_runs))),
+                'violations': check_budget(route, {**worst, 'js_bytes': cold_js['max']}, budgets.get(route, {})),
+                'runs': runs,
+            }
+            print(f"📦 COLD START: {route} measured", flush=True)
+        browser.close()
+
+    server.shutdown()
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+
+    return {'config': vars(args), 'budgets': budgets, 'routes': results}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure cold start and bundle size of the player join path')
+    parser.add_argument('--dist', default='./dist', help='Production build directory')
+    parser.add_argument('--port', type=int, default=4173, help='Port to serve the build on')
+    parser.add_argument('--profile', choices=list(DEVICE_PROFILES), default='venue-wifi-3g',
+                        help='Emulated device and network')
+    parser.add_argument('--repeat', type=int, default=3, help='Cold loads per route')
+    parser.add_argument('--budgets', help='JSON file with per-route budgets (see DEFAULT_BUDGETS)')
+    parser.add_argument('--timeout', type=float, default=60, help='Seconds to wait for a route to render')
+    parser.add_argument('--keep', action='store_true', help='Keep the seeded game after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print(f"📊 COLD START RESULTS ({args.profile})")
+    print("=" * 60)
+    violations = []
+    for route, summary in result['routes'].items():
+        print(f"{route} ({summary['path']}) - {len(summary['scripts'])} scripts: {', '.join(summary['scripts'])}")
+        print(format_summary('  Time to interactive', summary['tti_ms']))
+        print(format_summary('  First contentful paint', summary['fcp_ms']))
+        print(format_summary('  JS transferred', summary['js_bytes'], unit='B'))
+        print(format_summary('  Reload transferred', summary['reload_bytes'], unit='B'))
+        print(f"  Scripts from cache on reload: {summary['reload_script_cache_ratio']:.0%}")
+        violations.extend(summary['violations'])
+    for violation in violations:
+        print(f"🚨 Budget: {violation}")
+    print(f"📄 Report: {write_report('cold_start', result)}")
+
+    sys.exit(1 if violations else 0)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Console logging cost - CPU per game event with and without debug logging.
+
+ControllerPage, GamePage and the scoreboard used to console.log on every
+realtime event, grading pass and answer, often whole objects. Chrome
+serializes every argument for an attached DevTools client, and
+test_player.py wrote and flushed a file line per message. The app now
+logs through src/lib/logger.ts and the harness captures with
+harness.browser.ConsoleCapture.
+
+Plays one fully timed game per mode. Every page - the controller and
+--pages player tabs - emulates --profile (low-end-android by default).
+--teams REST teams answer every question as soon as it is live.
+
+- verbose-sync: app logger at debug; every message written and flushed
+  from the Playwright event handler (the old test_player.py)
+- verbose: app logger at debug; ConsoleCapture at debug
+- quiet: app logger at warn; ConsoleCapture at warning
+
+Per mode it reports renderer main-thread time (CDP TaskDuration and
+ScriptDuration), Chromium process-tree CPU (harness.procstat) and this
+process's CPU, each divided by the realtime events the game produced.
+
+    python -m harness.bench_console_logging --teams 20 --profile low-end-android
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.sync_api import sync_playwright
+
+from harness.bench_all_answered import submit_direct
+from harness.browser import (DEVICE_PROFILES, ConsoleCapture, app_log_level_script, app_url, apply_device_profile,
+                             new_authenticated_context)
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, iso_time
+from harness.procstat import TreeSampler, descendants, new_roots
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import format_summary, summarize, write_report
+
+HOST_EMAIL = 'logginghost@example.com'
+
+# mode -> (console level for the app and the capture, capture style)
+MODES = {
+    'verbose-sync': ('debug', 'sync'),
+    'verbose': ('debug', 'async'),
+    'quiet': ('warning', 'async'),
+}
+
+
+class SyncConsoleLog:
+    """What test_player.py did: format, write and flush in the event handler."""
+
+    def __init__(self, path: str):
+        self.captured = 0
+        self.skipped = 0
+        self._file = open(path, 'w')
+
+    def attach(self, page):
+        page.on('console', self._on_console)
+        page.on('pageerror', self._on_error)
+        return page
+
+    def _on_console(self, msg):
+        self.captured += 1
+        self._file.write(f"[CONSOLE {msg.type}] {msg.text}\n")
+        self._file.flush()
+
+    def _on_error(self, error):
+        self.captured += 1
+        self._file.write(f"[ERROR] {error}\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class GameEvents:
+    """Counts one game's realtime events and follows its state."""
+
+    def __init__(self, game_id: str):
+        self.game_id = game_id
+        self.lock = threading.Lock()
+        self.count = 0
+        self.state = None
+        self.question_id = None
+        self.follower = GameStateFollower(self._on_state)
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if self.game_id not in (record.get('id'), record.get('game')):
+            return
+        with self.lock:
+            self.count += 1
+        self.follower.on_event(topic, payload, received_at)
+
+    def _on_state(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if record.get('id') != self.game_id:
+            return
+        data = record.get('data') or {}
+        question = data.get('question') or {}
+        with self.lock:
+            self.state = data.get('state')
+            if data.get('state') == 'round-play' and question.get('id') and not question.get('correct_answer'):
+                self.question_id = question['id']
+
+
+def page_metrics(cdp) -> dict:
+    values = {m['name']: m['value'] for m in cdp.send('Performance.getMetrics')['metrics']}
+    return {'task_ms': values.get('TaskDuration', 0) * 1000, 'script_ms': values.get('ScriptDuration', 0) * 1000}
+
+
+def run_mode(args, playwright, host, teams: list, browser_players: list, mode: str, rng: random.Random) -> dict:
+    level, style = MODES[mode]
+    timers = {
+        'game_start_timer': args.state_timer,
+        'round_start_timer': args.state_timer,
+        'question_timer': args.question_timer,
+        'answer_timer': args.state_timer,
+        'round_end_timer': args.state_timer,
+        'game_end_timer': args.state_timer,
+    }
+    game = create_game(host, f'Console Logging ({mode})', rounds=args.rounds,
+                       questions_per_round=args.questions_per_round, metadata=timers, rng=rng)['game']
+    seats = [join_game(player, game, team_name=f'Logging Team {i + 1}') for i, player in enumerate(teams)]
+    for i, player in enumerate(browser_players):
+        join_game(player, game, team_name=f'Logging Tab {i + 1}')
+
+    events = GameEvents(game['id'])
+    realtime = RealtimeSubscription(host, [f"games/{game['id']}", *STATE_TOPICS, 'game_answers/*'],
+                                    events.on_event).start()
+
+    before = descendants(os.getpid())
+    browser = playwright.chromium.launch(headless=True)
+    sampler = TreeSampler(new_roots(before, descendants(os.getpid())))
+
+    pages, captures = [], []
+    for i, client in enumerate([host] + browser_players):
+        context = new_authenticated_context(browser, client)
+        context.add_init_script(app_log_level_script(level))
+        apply_device_profile(context, args.profile)
+        page = context.new_page()
+        path = f"./tmp/console_logging_{mode}_{'controller' if i == 0 else f'player{i}'}.log"
+        capture = SyncConsoleLog(path) if style == 'sync' else ConsoleCapture(path, level)
+        capture.attach(page)
+        page.goto(app_url(f"/controller/{game['id']}" if i == 0 else f"/game/{game['id']}"))
+        pages.append(page)
+        captures.append(capture)
+    for page in pages:
+        page.wait_for_load_state('networkidle')
+
+    cdps = [page.context.new_cdp_session(page) for page in pages]
+    for cdp in cdps:
+        cdp.send('Performance.enable')
+    first_metrics = [page_metrics(cdp) for cdp in cdps]
+    first_tree = sampler.sample()
+    first_cpu = time.process_time()
+    with events.lock:
+        first_events = events.count
+
+    print(f"🪵 LOGGING BENCH: Playing in '{mode}' mode as '{args.profile}'", flush=True)
+    started = time.time()
+    host.update('games', game['id'], {'data': {
+        'state': 'game-start',
+        'timer': {'startedAt': iso_time(started), 'duration': args.state_timer,
+                  'expiresAt': iso_time(started + args.state_timer)},
+    }})
+
+    answered = set()
+    deadline = started + args.timeout
+    with ThreadPoolExecutor(max_workers=min(len(teams), 32) or 1) as pool:
+        while time.time() < deadline:
+            with events.lock:
+                state, question_id = events.state, events.question_id
+            if state == 'thanks':
+                break
+            if question_id and question_id not in answered:
+                answered.add(question_id)
+                for player, seat in zip(teams, seats):
+                    pool.submit(submit_direct, player, game, question_id, seat['team']['id'], rng.choice('ABCD'))
+            time.sleep(0.1)
+    time.sleep(2)  # Let the pages finish with the last state
+
+    last_cpu = time.process_time()
+    last_tree = sampler.sample()
+    last_metrics = [page_metrics(cdp) for cdp in cdps]
+    with events.lock:
+        game_events = max(events.count - first_events, 1)
+        finished = events.state == 'thanks'
+    realtime.stop()
+
+    for capture in captures:
+        capture.close()
+    browser.close()
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+
+    def per_event(first: float, last: float) -> float:
+        return (last - first) / game_events
+
+    per_page = [{key: per_event(first[key], last[key]) for key in first}
+                for first, last in zip(first_metrics, last_metrics)]
+    return {
+        'mode': mode,
+        'level': level,
+        'capture': style,
+        'finished': finished,
+        'events': game_events,
+        'console_messages': sum(c.captured for c in captures),
+        'console_skipped': sum(c.skipped for c in captures),
+        'controller_task_ms_per_event': per_page[0]['task_ms'],
+        'controller_script_ms_per_event': per_page[0]['script_ms'],
+        'player_task_ms_per_event': summarize([p['task_ms'] for p in per_page[1:]]),
+        'player_script_ms_per_event': summarize([p['script_ms'] for p in per_page[1:]]),
+        'browser_cpu_ms_per_event': per_event(first_tree['cpu_seconds'], last_tree['cpu_seconds']) * 1000,
+        'harness_cpu_ms_per_event': per_event(first_cpu, last_cpu) * 1000,
+    }
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    os.makedirs('./tmp', exist_ok=True)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, HOST_EMAIL)
+    host = login(HOST_EMAIL)
+
+    def player(email):
+        ensure_user(admin, email)
+        return login(email)
+
+    print(f"🌱 LOGGING BENCH: Preparing {args.teams} answering teams and {args.pages} player tabs", flush=True)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        teams = list(pool.map(player, [f'loggingplayer{i + 1}@example.com' for i in range(args.teams)]))
+        browser_players = list(pool.map(player, [f'loggingtab{i + 1}@example.com' for i in range(args.pages)]))
+
+    runs = []
+    with sync_playwright() as p:
+        for mode in args.modes:
+            runs.append(run_mode(args, p, host, teams, browser_players, mode, rng))
+
+    # CPU per event saved relative to the first mode
+    baseline = runs[0]
+    for run in runs:
+        for key in ('controller_task_ms_per_event', 'browser_cpu_ms_per_event', 'harness_cpu_ms_per_event'):
+            run[f'{key}_saved'] = baseline[key] - run[key]
+    return {'config': vars(args), 'modes': runs}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure CPU per game event spent on console logging')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES),
+                        help='Modes to compare; the first is the baseline')
+    parser.add_argument('--profile', choices=list(DEVICE_PROFILES), default='low-end-android',
+                        help='Device profile every page emulates')
+    parser.add_argument('--teams', type=int, default=20, help='REST teams answering every question')
+    parser.add_argument('--pages', type=int, default=2, help='Player tabs next to the controller')
+    parser.add_argument('--rounds', type=int, default=2)
+    parser.add_argument('--questions-per-round', type=int, default=3)
+    parser.add_argument('--question-timer', type=int, default=6, help='Seconds per question')
+    parser.add_argument('--state-timer', type=int, default=3, help='Seconds for every other timed state')
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 CONSOLE LOGGING RESULTS")
+    print("=" * 60)
+    for run in result['modes']:
+        print(f"{run['mode']}: {run['events']} events, {run['console_messages']} console messages captured, "
+              f"{run['console_skipped']} skipped{'' if run['finished'] else ' (game did not finish)'}")
+        print(f"  Controller: {run['controller_task_ms_per_event']:.2f}ms task, "
+              f"{run['controller_script_ms_per_event']:.2f}ms script per event")
+        print(format_summary('  Player task ms/event', run['player_task_ms_per_event']))
+        print(f"  Chromium CPU: {run['browser_cpu_ms_per_event']:.2f}ms/event, "
+              f"harness CPU: {run['harness_cpu_ms_per_event']:.2f}ms/event")
+        if run is not result['modes'][0]:
+            print(f"  Saved vs {result['modes'][0]['mode']}: "
+                  f"{run['controller_task_ms_per_event_saved']:+.2f}ms controller task, "
+                  f"{run['browser_cpu_ms_per_event_saved']:+.2f}ms Chromium, "
+                  f"{run['harness_cpu_ms_per_event_saved']:+.2f}ms harness per event")
+    print(f"📄 Report: {write_report('console_logging', result)}")
+
+    sys.exit(0 if all(run['finished'] for run in result['modes']) else 1)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Device profile benchmark - player latency on slow phones and venue Wi-Fi.
+
+Plays one fully timed game per profile in --profiles. The controller tab
+runs unthrottled; every player tab emulates the profile through CDP
+(harness.browser.DEVICE_PROFILES: CPU slowdown plus network latency and
+throughput). Each player is its own team and answers every question.
+
+Measures, per profile:
+- question visible: a player's "Round r of R - Question n" heading first
+  appearing in its DOM, minus the moment an unthrottled realtime
+  subscriber received that question
+- answer acknowledged: the click on an answer until the team's answer
+  comes back from PocketBase and is highlighted
+
+Both page-side times come from a MutationObserver installed before the
+app loads, so the Python polling interval does not affect them.
+
+    python -m harness.bench_device_profiles --profiles desktop venue-wifi-3g low-end-android
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import DEVICE_PROFILES, app_url, apply_device_profile, new_authenticated_context
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, iso_time
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import format_summary, summarize, write_report
+
+# First-seen times (epoch ms) of question headings and answer acknowledgements
+PAGE_MARKS_SCRIPT = """(() => {
+  const marks = window.__deviceMarks = { visible: {}, clicked: {}, acked: {} }
+  const current = () => {
+    for (const h of document.querySelectorAll('h2')) {
+      const text = h.textContent.trim()
+      if (text.startsWith('Round ') && text.includes(' - Question ')) return text
+    }
+    return null
+  }
+  const check = () => {
+    const heading = current()
+    if (!heading) return
+    const now = Date.now()
+    if (!(heading in marks.visible)) marks.visible[heading] = now
+    if (heading in marks.clicked && !(heading in marks.acked)
+        && document.querySelector('.bg-blue-200.border-blue-500')) marks.acked[heading] = now
+  }
+  document.addEventListener('click', () => {
+    const heading = current()
+    if (heading && !(heading in marks.clicked)) marks.clicked[heading] = Date.now()
+  }, true)
+  new MutationObserver(check).observe(document, {
+    subtree: true, childList: true, characterData: true, attributes: true, attributeFilter: ['class']
+  })
+})()"""
+
+READ_MARKS = "() => window.__deviceMarks"
+
+ANSWER_SELECTOR = 'div.border-2.cursor-pointer'
+
+
+def question_heading(data: dict):
+    """The heading RoundPlayDisplay renders for a round-play games.data."""
+    round_info = data.get('round') or {}
+    question = data.get('question') or {}
+    if data.get('state') != 'round-play' or not question.get('question_number'):
+        return None
+    return (f"Round {round_info.get('round_number') or 1} of {round_info.get('rounds') or 1}"
+            f" - Question {question['question_number']}")
+
+
+class QuestionTracker:
+    """When an unthrottled subscriber first saw each question of one game."""
+
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.lock = threading.Lock()
+        self.received = {}  # heading -> epoch seconds
+        self.state = None
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if record.get('id') != self.game_id:
+            return
+        data = record.get('data') or {}
+        heading = question_heading(data)
+        with self.lock:
+            self.state = data.get('state')
+            if heading and heading not in self.received:
+                self.received[heading] = received_at
+
+
+def run_profile(args, browser, host, players, profile: str, rng: random.Random) -> dict:
+    timers = {
+        'game_start_timer': args.state_timer,
+        'round_start_timer': args.state_timer,
+        'question_timer': args.question_timer,
+        'answer_timer': args.state_timer,
+        'round_end_timer': args.state_timer,
+        'game_end_timer': args.state_timer,
+    }
+    built = create_game(host, f'Device Profile ({profile})', rounds=args.rounds,
+                        questions_per_round=args.questions_per_round, metadata=timers, rng=rng)
+    game = built['game']
+    for i, player in enumerate(players):
+        join_game(player, game, team_name=f'Device Team {i + 1}')
+
+    tracker = QuestionTracker(game['id'])
+    realtime = RealtimeSubscription(host, [f"games/{game['id']}", *STATE_TOPICS],
+                                    GameStateFollower(tracker.on_event).on_event).start()
+
+    controller = new_authenticated_context(browser, host).new_page()
+    controller.goto(app_url(f"/controller/{game['id']}"))
+
+    pages = []
+    for player in players:
+        context = new_authenticated_context(browser, player)
+        context.add_init_script(PAGE_MARKS_SCRIPT)
+        apply_device_profile(context, profile)
+        page = context.new_page()
+        page.goto(app_url(f"/game/{game['id']}"))
+        pages.append(page)
+    for page in [controller] + pages:
+        page.wait_for_load_state('networkidle')
+
+    print(f"📱 DEVICE BENCH: Playing as '{profile}' with {len(pages)} players", flush=True)
+    started = time.time()
+    host.update('games', game['id'], {'data': {
+        'state': 'game-start',
+        'timer': {'startedAt': iso_time(started), 'duration': args.state_timer,
+                  'expiresAt': iso_time(started + args.state_timer)},
+    }})
+
+    # Answer each question once per player as soon as its buttons show up
+    answered = [set() for _ in pages]
+    deadline = started + args.timeout
+    while time.time() < deadline:
+        with tracker.lock:
+            if tracker.state == 'thanks':
+                break
+        for page, done in zip(pages, answered):
+            try:
+                marks = page.evaluate(READ_MARKS)
+            except Exception:
+                continue
+            pending = [heading for heading in marks['visible'] if heading not in done]
+            if not pending:
+                continue
+            buttons = page.locator(ANSWER_SELECTOR)
+            try:
+                count = buttons.count()
+                if count:
+                    buttons.nth(rng.randrange(count)).click(timeout=2000)
+                    done.update(pending)
+            except Exception:
+                pass
+        time.sleep(args.poll_interval)
+    time.sleep(2)  # Let the last acknowledgements land
+
+    visible, acked = [], []
+    missing_acks = 0
+    for page in pages:
+        marks = page.evaluate(READ_MARKS)
+        with tracker.lock:
+            received = dict(tracker.received)
+        for heading, seen_at in marks['visible'].items():
+            if heading in received:
+                visible.append(seen_at - received[heading] * 1000)
+        for heading, clicked_at in marks['clicked'].items():
+            if heading in marks['acked']:
+                acked.append(marks['acked'][heading] - clicked_at)
+            else:
+                missing_acks += 1
+
+    realtime.stop()
+    for page in [controller] + pages:
+        page.context.close()
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+
+    return {
+        'profile': profile,
+        'settings': DEVICE_PROFILES[profile],
+        'questions': len(tracker.received),
+        'question_visible_ms': summarize(visible),
+        'answer_acknowledged_ms': summarize(acked),
+        'missing_acknowledgements': missing_acks,
+    }
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'devicehost@example.com')
+    host = login('devicehost@example.com')
+    players = []
+    for i in range(args.players):
+        email = f'deviceplayer{i + 1}@example.com'
+        ensure_user(admin, email)
+        players.append(login(email))
+
+    runs = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        for profile in args.profiles:
+            runs.append(run_profile(args, browser, host, players, profile, rng))
+        browser.close()
+
+    # Degradation relative to the first profile
+    baseline = runs[0]
+    for run in runs:
+        for key in ('question_visible_ms', 'answer_acknowledged_ms'):
+            if run[key].get('count') and baseline[key].get('count'):
+                run[f'{key}_p95_delta'] = run[key]['p95'] - baseline[key]['p95']
+    return {'config': vars(args), 'profiles': runs}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure player latency under emulated devices and networks')
+    parser.add_argument('--profiles', nargs='+', choices=list(DEVICE_PROFILES),
+                        default=['desktop', 'venue-wifi-3g', 'low-end-android'],
+                        help='Device profiles to compare; the first is the baseline')
+    parser.add_argument('--players', type=int, default=3, help='Player tabs, one team each')
+    parser.add_argument('--rounds', type=int, default=2)
+    parser.add_argument('--questions-per-round', type=int, default=3)
+    parser.add_argument('--question-timer', type=int, default=8, help='Seconds per question')
+    parser.add_argument('--state-timer', type=int, default=3, help='Seconds for every other timed state')
+    parser.add_argument('--poll-interval', type=float, default=0.2, help='Seconds between answer checks')
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 DEVICE PROFILE RESULTS")
+    print("=" * 60)
+    for run in result['profiles']:
+        print(f"{run['profile']} - {run['questions']} questions, "
+              f"{run['missing_acknowledgements']} answers never acknowledged")
+        print(format_summary('  Question visible', run['question_visible_ms']))
+        print(format_summary('  Answer acknowledged', run['answer_acknowledged_ms']))
+        for key, label in (('question_visible_ms', 'question visible'), ('answer_acknowledged_ms', 'answer acknowledged')):
+            if f'{key}_p95_delta' in run and run is not result['profiles'][0]:
+                print(f"  p95 {label} vs {args.profiles[0]}: {run[f'{key}_p95_delta']:+.1f}ms")
+    print(f"📄 Report: {write_report('device_profiles', result)}")
+
+    sys.exit(0 if all(run['missing_acknowledgements'] == 0 for run in result['profiles']) else 1)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Game code benchmark - joining by code and allocating codes with 1M games.
+
+Grows the games table to each --checkpoints size with historical
+(completed) games and at every size measures:
+
+- lookup: findGameByCode's query (code + ready/in-progress status, one
+  row, no total count) from --concurrency threads, for codes of live games
+  and for codes nobody holds, while other players join live games
+- allocation: gamesService.createGame's allocator - draw a code, let the
+  unique index on code reject it if taken, draw again - latency and retries
+
+Codes come from the same generator as the app (36^6 codes), so the
+collisions met while seeding are the generator's real collision rate at
+that table size; the report sets them against the birthday-bound
+expectation. Lookup and allocation should stay flat from the first
+checkpoint to the last: both are one index probe.
+
+Seeded games belong to codebench-host@example.com and are kept between
+runs (seeding a million takes a while); the next run tops the table up.
+
+    python -m harness.bench_game_codes --checkpoints 10000 100000 1000000
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.pocketbase import PocketBaseClient, PocketBaseError
+from harness.seed import (GAME_CODE_CHARS, GAME_CODE_LENGTH, create_game_record, ensure_user, join_game, login,
+                          random_game_code)
+from harness.stats import format_summary, summarize, write_report
+
+HOST_EMAIL = 'codebench-host@example.com'
+CODE_SPACE = len(GAME_CODE_CHARS) ** GAME_CODE_LENGTH
+
+
+def expected_collision_rate(existing: int) -> float:
+    """Chance that one fresh code is already taken with existing games."""
+    return existing / CODE_SPACE
+
+
+def find_game_by_code(client: PocketBaseClient, code: str):
+    """The query gamesService.findGameByCode sends."""
+    result = client.get_list('games', page=1, per_page=1, skipTotal=1,
+                             filter=f'code = "{code}" && (status = "ready" || status = "in-progress")')
+    return result['items'][0] if result['items'] else None
+
+
+def count_games(admin: PocketBaseClient, host_id: str) -> int:
+    return admin.get_list('games', page=1, per_page=1, filter=f'host = "{host_id}"')['totalItems']
+
+
+def seed_until(admin: PocketBaseClient, host_id: str, target: int, args, rng: random.Random) -> dict:
+    """Add historical games until host_id owns target of them; returns collision counts."""
+    have = count_games(admin, host_id)
+    missing = max(0, target - have)
+    if not missing:
+        return {'created': 0, 'collisions': 0, 'expected_collisions': 0.0}
+    print(f"🌱 CODE BENCH: Seeding {missing} games ({have} -> {target})", flush=True)
+
+    lock = threading.Lock()
+    totals = {'created': 0, 'collisions': 0}
+    seeds = [rng.getrandbits(64) for _ in range(args.workers)]
+
+    def worker(index):
+        client = PocketBaseClient(token=admin.token)
+        worker_rng = random.Random(seeds[index])
+        for _ in range(index, missing, args.workers):
+            _, collisions = create_game_record(client, {
+                'host': host_id,
+                'name': 'Code Bench History',
+                'status': 'completed',
+                'data': {'state': 'thanks'},
+            }, worker_rng)
+            with lock:
+                totals['created'] += 1
+                totals['collisions'] += collisions
+                if totals['created'] % 50000 == 0:
+                    print(f"   {have + totals['created']} games", flush=True)
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        list(pool.map(worker, range(args.workers)))
+
+    # Sum over every create of the chance its first code was taken
+    expected = sum(expected_collision_rate(n) for n in range(have, target))
+    return {**totals, 'expected_collisions': expected}
+
+
+def measure_checkpoint(host, players, live_games, args, rng) -> dict:
+    live_codes = [game['code'] for game in live_games]
+    stop = threading.Event()
+    joins, join_errors = [], []
+
+    def join_loop(player, seed):
+        player_rng = random.Random(seed)
+        while not stop.is_set():
+            game = player_rng.choice(live_games)
+            started = time.time()
+            try:
+                find_game_by_code(player, game['code'])
+                join_game(player, game)
+                joins.append((time.time() - started) * 1000)
+            except PocketBaseError as e:
+                join_errors.append(str(e))
+
+    joiners = [threading.Thread(target=join_loop, args=(player, rng.getrandbits(64)), daemon=True)
+               for player in players]
+    for joiner in joiners:
+        joiner.start()
+
+    hits, misses, wrong = [], [], []
+
+    def lookup(index):
+        client = players[index % len(players)]
+        hit = index % 2 == 0
+        code = live_codes[index % len(live_codes)] if hit else random_game_code(random.Random(index))
+        started = time.perf_counter()
+        game = find_game_by_code(client, code)
+        elapsed = (time.perf_counter() - started) * 1000
+        (hits if hit else misses).append(elapsed)
+        if hit and (game is None or game['code'] != code):
+            wrong.append(code)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(lookup, range(args.lookups)))
+    stop.set()
+    for joiner in joiners:
+        joiner.join()
+
+    allocations, retries = [], 0
+    for _ in range(args.allocations):
+        started = time.perf_counter()
+        game, collisions = create_game_record(host, {'host': host.record['id'], 'name': 'Code Bench Allocation',
+                                                     'status': 'setup'}, rng)
+        allocations.append((time.perf_counter() - started) * 1000)
+        retries += collisions
+        host.delete('games', game['id'])
+
+    return {
+        'lookup_hit_ms': summarize(hits),
+        'lookup_miss_ms': summarize(misses),
+        'lookup_wrong_results': len(wrong),
+        'join_ms': summarize(joins),
+        'join_errors': len(join_errors),
+        'allocation_ms': summarize(allocations),
+        'allocation_retries': retries,
+    }
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, HOST_EMAIL)
+    host = login(HOST_EMAIL)
+    host_id = host.record['id']
+    players = []
+    for i in range(args.players):
+        email = f'codebench{i + 1}@example.com'
+        ensure_user(admin, email)
+        players.append(login(email))
+
+    # Games players can join, alongside the history
+    live_games = [create_game_record(host, {'host': host_id, 'name': f'Code Bench Live {i + 1}',
+                                            'status': rng.choice(['ready', 'in-progress'])}, rng)[0]
+                  for i in range(args.live_games)]
+
+    checkpoints = []
+    seeding = {'created': 0, 'collisions': 0, 'expected_collisions': 0.0}
+    try:
+        for target in sorted(args.checkpoints):
+            seeded = seed_until(admin, host_id, target, args, rng)
+            for key in seeding:
+                seeding[key] += seeded[key]
+            size = admin.get_list('games', page=1, per_page=1)['totalItems']
+            print(f"🔎 CODE BENCH: Measuring with {size} games", flush=True)
+            checkpoint = measure_checkpoint(host, players, live_games, args, rng)
+            checkpoint['games'] = size
+            checkpoint['expected_collision_rate'] = expected_collision_rate(size)
+            checkpoints.append(checkpoint)
+    finally:
+        if not args.keep:
+            for game in live_games:
+                try:
+                    host.delete('games', game['id'])
+                except PocketBaseError:
+                    pass
+
+    # Growth of lookup/allocation p95 from the smallest to the largest table
+    flatness = {}
+    if len(checkpoints) > 1:
+        for key in ('lookup_hit_ms', 'lookup_miss_ms', 'allocation_ms'):
+            first, last = checkpoints[0][key], checkpoints[-1][key]
+            if first.get('count') and last.get('count') and first['p95']:
+                flatness[key] = last['p95'] / first['p95']
+
+    return {
+        'config': vars(args),
+        'code_space': CODE_SPACE,
+        'seeding': {**seeding, 'collision_rate': seeding['collisions'] / seeding['created'] if seeding['created'] else None},
+        'checkpoints': checkpoints,
+        'p95_growth_first_to_last': flatness,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark joining by game code and code allocation at scale')
+    parser.add_argument('--checkpoints', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help='Historical game counts to measure at')
+    parser.add_argument('--live-games', type=int, default=20, help='ready/in-progress games to join')
+    parser.add_argument('--players', type=int, default=16, help='Players joining during lookups')
+    parser.add_argument('--lookups', type=int, default=5000, help='Timed lookups per checkpoint (half misses)')
+    parser.add_argument('--concurrency', type=int, default=32, help='Concurrent lookups')
+    parser.add_argument('--allocations', type=int, default=200, help='Timed code allocations per checkpoint')
+    parser.add_argument('--workers', type=int, default=32, help='Concurrent creates while seeding')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--keep', action='store_true', help='Keep the live games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 GAME CODE RESULTS")
+    print("=" * 60)
+    seeding = result['seeding']
+    print(f"Seeded {seeding['created']} games: {seeding['collisions']} code collisions "
+          f"(expected {seeding['expected_collisions']:.1f})")
+    for checkpoint in result['checkpoints']:
+        print(f"{checkpoint['games']} games (a fresh code is taken 1 in "
+              f"{1 / max(checkpoint['expected_collision_rate'], 1 / CODE_SPACE):.0f})")
+        print(format_summary('  Lookup (live code)', checkpoint['lookup_hit_ms']))
+        print(format_summary('  Lookup (unused code)', checkpoint['lookup_miss_ms']))
+        print(format_summary('  Join', checkpoint['join_ms']))
+        print(format_summary('  Allocation', checkpoint['allocation_ms']))
+        print(f"  {checkpoint['allocation_retries']} allocation retries, "
+              f"{checkpoint['lookup_wrong_results']} wrong lookups, {checkpoint['join_errors']} join errors")
+    for key, ratio in result['p95_growth_first_to_last'].items():
+        print(f"p95 {key} growth: {ratio:.2f}x")
+    print(f"📄 Report: {write_report('game_codes', result)}")
+
+    sys.exit(1 if any(c['lookup_wrong_results'] for c in result['checkpoints']) else 0)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Host dashboard benchmark - paging through 10k games per host.
+
+HostPage lists the host's games newest first and loads more as the host
+scrolls (gamesService.getGamesPage). Each page is filtered and sorted by
+PocketBase and continues after the last game shown, so with
+idx_games_host_startdate covering the sort, page 400 should cost what
+page 1 does.
+
+Seeds --games games for one host (plus --other-hosts hosts with games of
+their own), then walks every page:
+
+- cursor: the app's query, continuing after the last game
+- offset: the same sort with page numbers, for comparison
+- legacy: the old dashboard query (first 50 games of every host, filtered
+  and sorted in the browser) - how many of the host's games it shows and
+  how many bytes it moves
+
+Per mode it reports page latency over the first and last tenth of the
+walk and checks that the pages add up to every game exactly once, in
+order. With --browser-pages a logged-in HostPage is scrolled that many
+pages and each page's time to render is measured.
+
+    python -m harness.bench_host_dashboard --games 10000 --browser-pages 10
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import app_url, new_authenticated_context
+from harness.pocketbase import PocketBaseClient
+from harness.seed import create_game_record, ensure_user, login
+from harness.stats import format_summary, summarize, write_report
+
+HOST_EMAIL = 'dashboardhost@example.com'
+
+# Same as GAMES_PAGE_SIZE in src/lib/games.ts
+PAGE_SIZE = 25
+SORT = '-startdate,-updated,-id'
+
+# One button per game row on HostPage
+GAME_ROW_SELECTOR = 'button[title="Edit game"]'
+
+
+def page_filter(host_id: str, after: dict = None) -> str:
+    """The filter gamesService.getGamesPage sends."""
+    query = f'host = "{host_id}"'
+    if after:
+        startdate, updated, record_id = after.get('startdate') or '', after['updated'], after['id']
+        query += (f' && startdate <= "{startdate}" && (startdate < "{startdate}" || (startdate = "{startdate}" && '
+                  f'(updated < "{updated}" || (updated = "{updated}" && id < "{record_id}"))))')
+    return query
+
+
+def timed_list(client: PocketBaseClient, **params) -> tuple:
+    started = time.perf_counter()
+    result = client.get_list('games', **params)
+    return result, (time.perf_counter() - started) * 1000, len(json.dumps(result))
+
+
+def walk(client: PocketBaseClient, host_id: str, mode: str) -> dict:
+    """Every page of the host's games in one mode; latency per page and the ids in order."""
+    latencies, sizes, ids = [], [], []
+    after, page = None, 1
+    while True:
+        if mode == 'cursor':
+            result, elapsed, size = timed_list(client, page=1, per_page=PAGE_SIZE, skipTotal=1, sort=SORT,
+                                               filter=page_filter(host_id, after))
+        else:
+            result, elapsed, size = timed_list(client, page=page, per_page=PAGE_SIZE, skipTotal=1, sort=SORT,
+                                               filter=page_filter(host_id))
+        items = result['items']
+        latencies.append(elapsed)
+        sizes.append(size)
+        ids.extend(item['id'] for item in items)
+        if len(items) < PAGE_SIZE:
+            break
+        after, page = items[-1], page + 1
+
+    tenth = max(1, len(latencies) // 10)
+    first, last = summarize(latencies[:tenth]), summarize(latencies[-tenth:])
+    return {
+        'pages': len(latencies),
+        'page_ms': summarize(latencies),
+        'first_tenth_ms': first,
+        'last_tenth_ms': last,
+        'last_vs_first_p50': last['p50'] / first['p50'] if first.get('p50') else None,
+        'bytes_per_page': summarize(sizes),
+        'ids': ids,
+    }
+
+
+def scroll_dashboard(page, pages: int, timeout: float = 30) -> list:
+    """
+    Scroll HostPage's games list until pages more pages have loaded.
+
+    Returns each page's milliseconds from reaching the bottom to its rows
+    rendering.
+    """
+    rows = page.locator(GAME_ROW_SELECTOR)
+    rows.first.wait_for(timeout=timeout * 1000)
+    timings = []
+    for _ in range(pages):
+        before = rows.count()
+        started = time.time()
+        page.mouse.wheel(0, 100000)
+        page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
+        deadline = started + timeout
+        while rows.count() <= before and time.time() < deadline:
+            page.wait_for_timeout(10)
+        if rows.count() <= before:
+            break
+        timings.append((time.time() - started) * 1000)
+    return timings
+
+
+def seed_host(admin: PocketBaseClient, host_id: str, target: int, workers: int, rng: random.Random) -> int:
+    """Give host_id target games with start dates over the last three years (a tenth undated)."""
+    have = admin.get_list('games', page=1, per_page=1, filter=f'host = "{host_id}"')['totalItems']
+    missing = max(0, target - have)
+    if not missing:
+        return 0
+    print(f"🌱 DASHBOARD BENCH: Seeding {missing} games for {host_id}", flush=True)
+
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    seeds = [rng.getrandbits(64) for _ in range(workers)]
+    created = [0]
+    lock = threading.Lock()
+
+    def worker(index):
+        client = PocketBaseClient(token=admin.token)
+        worker_rng = random.Random(seeds[index])
+        for n in range(index, missing, workers):
+            # Whole hours, so start dates tie and the updated/id tiebreaks get exercised
+            startdate = '' if worker_rng.random() < 0.1 else \
+                (now - timedelta(hours=worker_rng.randrange(3 * 365 * 24))).strftime('%Y-%m-%d %H:00:00.000Z')
+            create_game_record(client, {
+                'host': host_id,
+                'name': f'Dashboard Game {have + n + 1}',
+                'status': worker_rng.choice(['setup', 'ready', 'completed', 'completed', 'completed']),
+                'startdate': startdate,
+                'duration': 120,
+                'location': 'Bench Pub',
+            }, worker_rng)
+            with lock:
+                created[0] += 1
+                if created[0] % 2000 == 0:
+                    print(f"   {have + created[0]} games", flush=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(worker, range(workers)))
+    return missing
+
+
+def run_browser(host: PocketBaseClient, pages: int) -> list:
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = new_authenticated_context(browser, host).new_page()
+        page.goto(app_url('/host'))
+        timings = scroll_dashboard(page, pages)
+        browser.close()
+    return timings
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, HOST_EMAIL)
+    host = login(HOST_EMAIL)
+    host_id = host.record['id']
+
+    seed_host(admin, host_id, args.games, args.workers, rng)
+    for i in range(args.other_hosts):
+        other = ensure_user(admin, f'dashboardother{i + 1}@example.com')
+        seed_host(admin, other['id'], args.games // 10, args.workers, rng)
+
+    # Reference order straight from the database
+    print("📚 DASHBOARD BENCH: Reading the host's games in order", flush=True)
+    expected = [g['id'] for g in admin.get_full_list('games', filter=f'host = "{host_id}"', sort=SORT,
+                                                     fields='id')]
+
+    modes = {}
+    for mode in ('cursor', 'offset'):
+        print(f"📜 DASHBOARD BENCH: Walking {len(expected)} games ({mode})", flush=True)
+        walked = walk(host, host_id, mode)
+        ids = walked.pop('ids')
+        walked['complete_and_ordered'] = ids == expected
+        walked['duplicates'] = len(ids) - len(set(ids))
+        modes[mode] = walked
+
+    # What the dashboard used to do
+    result, elapsed, size = timed_list(host, page=1, per_page=50)
+    legacy = {
+        'request_ms': elapsed,
+        'bytes': size,
+        'host_games_shown': sum(1 for game in result['items'] if game['host'] == host_id),
+        'other_hosts_rows': sum(1 for game in result['items'] if game['host'] != host_id),
+    }
+
+    browser_pages = run_browser(host, args.browser_pages) if args.browser_pages else []
+
+    return {
+        'config': vars(args),
+        'host_games': len(expected),
+        'modes': modes,
+        'legacy': legacy,
+        'browser_page_ms': summarize(browser_pages),
+        'browser_pages_loaded': len(browser_pages),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark paging through a host with thousands of games')
+    parser.add_argument('--games', type=int, default=10000, help='Games for the benchmark host')
+    parser.add_argument('--other-hosts', type=int, default=3, help='Other hosts, each with a tenth as many games')
+    parser.add_argument('--browser-pages', type=int, default=0, help='Pages to scroll through on HostPage')
+    parser.add_argument('--workers', type=int, default=16, help='Concurrent creates while seeding')
+    parser.add_argument('--max-growth', type=float, default=1.5,
+                        help='Allowed last-tenth/first-tenth p50 ratio for cursor pages')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 HOST DASHBOARD RESULTS")
+    print("=" * 60)
+    print(f"Host games: {result['host_games']}")
+    for mode, walked in result['modes'].items():
+        print(f"{mode}: {walked['pages']} pages, complete and ordered: {walked['complete_and_ordered']}")
+        print(format_summary('  First tenth', walked['first_tenth_ms']))
+        print(format_summary('  Last tenth', walked['last_tenth_ms']))
+        if walked['last_vs_first_p50']:
+            print(f"  p50 last/first: {walked['last_vs_first_p50']:.2f}x")
+    legacy = result['legacy']
+    print(f"legacy: {legacy['host_games_shown']} of {result['host_games']} host games shown, "
+          f"{legacy['other_hosts_rows']} other hosts' rows, {legacy['bytes'] / 1024:.1f}KB")
+    if result['browser_pages_loaded']:
+        print(format_summary('HostPage scroll page', result['browser_page_ms']))
+    print(f"📄 Report: {write_report('host_dashboard', result)}")
+
+    cursor = result['modes']['cursor']
+    ok = cursor['complete_and_ordered'] and (cursor['last_vs_first_p50'] or 0) <= args.max_growth
+    sys.exit(0 if ok else 1)
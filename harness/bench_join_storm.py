@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Join-storm benchmark - many players join one game within a few seconds.
+
+A real ControllerPage tab maintains games.scoreboard while --players
+players create and join teams over REST inside --storm-ms. Runs once per
+roster mode (ControllerPage's `controller.rosterMode` setting):
+
+- full: refetch teams and players and rewrite the scoreboard per event
+- incremental: apply events in memory, coalesce bursts into one write
+
+Measures scoreboard writes per join (each one is broadcast to every
+client), bytes per write, the controller's roster reads, and how long
+after the last join the roster settles - and whether it ends up correct.
+
+    python -m harness.bench_join_storm --players 100 --storm-ms 3000
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import app_url, new_authenticated_context
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import format_summary, summarize, write_report
+
+ROSTER_READ_PATHS = ('/api/collections/game_players/records', '/api/collections/game_teams/records')
+
+
+class ScoreboardTracker:
+    """Counts scoreboard rewrites of one game seen over realtime."""
+
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.lock = threading.Lock()
+        self.last_updated = None
+        self.writes = []  # (received_at, bytes)
+        self.scoreboard = None
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        scoreboard = record.get('scoreboard') or {}
+        if record.get('id') != self.game_id or not scoreboard.get('updated'):
+            return
+        with self.lock:
+            if scoreboard['updated'] == self.last_updated:
+                return
+            self.last_updated = scoreboard['updated']
+            self.writes.append((received_at, len(json.dumps(scoreboard))))
+            self.scoreboard = scoreboard
+
+
+def roster_matches(scoreboard: dict, expected: dict) -> bool:
+    """expected: team id -> set of user ids."""
+    teams = (scoreboard or {}).get('teams') or {}
+    actual = {team_id: {p['id'] for p in team.get('players', [])}
+              for team_id, team in teams.items() if team.get('players')}
+    return actual == expected
+
+
+def run_storm(args, admin, browser, host, players, mode: str, rng: random.Random) -> dict:
+    built = create_game(host, f'Join Storm ({mode})', rounds=1, questions_per_round=1, rng=rng)
+    game = built['game']
+
+    context = new_authenticated_context(browser, host)
+    context.add_init_script(f"window.localStorage.setItem('controller.rosterMode', {json.dumps(mode)});")
+    page = context.new_page()
+    roster_reads = []
+    page.on('request', lambda request: roster_reads.append(time.time())
+            if request.method == 'GET' and request.url.split('?')[0].endswith(ROSTER_READ_PATHS) else None)
+    page.goto(app_url(f"/controller/{game['id']}"))
+    page.wait_for_load_state('networkidle')
+
+    tracker = ScoreboardTracker(game['id'])
+    realtime = RealtimeSubscription(admin, [f"games/{game['id']}"], tracker.on_event).start()
+    time.sleep(1)
+    reads_before = len(roster_reads)
+    writes_before = len(tracker.writes)
+
+    # Captains create their team, the rest of the team joins it once it exists
+    teams = [players[i:i + args.team_size] for i in range(0, len(players), args.team_size)]
+    offsets = [rng.uniform(0, args.storm_ms / 1000) for _ in teams]
+    expected = {}
+    join_times = []
+    lock = threading.Lock()
+    storm_started = time.time()
+
+    def storm_team(t):
+        delay = storm_started + offsets[t] - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        captain, *members = teams[t]
+        try:
+            seat = join_game(captain, game, team_name=f'Storm Team {t + 1}')
+            for member in members:
+                join_game(member, game, team=seat['team'])
+        except PocketBaseError as e:
+            print(f"❌ JOIN STORM: Team {t + 1} failed to join: {e}", flush=True)
+            return
+        with lock:
+            expected[seat['team']['id']] = {p.record['id'] for p in teams[t]}
+            join_times.append(time.time())
+
+    with ThreadPoolExecutor(max_workers=min(len(teams), 128)) as pool:
+        list(pool.map(storm_team, range(len(teams))))
+    last_join = max(join_times) if join_times else storm_started
+
+    # Settled once no scoreboard write has arrived for --settle seconds
+    deadline = time.time() + args.timeout
+    while time.time() < deadline:
+        with tracker.lock:
+            last_write = tracker.writes[-1][0] if tracker.writes else 0
+        if time.time() - max(last_write, last_join) >= args.settle:
+            break
+        time.sleep(0.1)
+
+    realtime.stop()
+    context.close()
+
+    writes = tracker.writes[writes_before:]
+    joins = len(players)
+    result = {
+        'mode': mode,
+        'players': joins,
+        'teams': len(teams),
+        'scoreboard_writes': len(writes),
+        'writes_per_join': len(writes) / joins if joins else None,
+        'write_bytes': summarize([size for _, size in writes]),
+        'broadcast_bytes': sum(size for _, size in writes),
+        'controller_roster_reads': len(roster_reads) - reads_before,
+        'storm_seconds': last_join - storm_started,
+        'stable_after_last_join_ms': max(0.0, (writes[-1][0] - last_join) * 1000) if writes else None,
+        'roster_correct': roster_matches(tracker.scoreboard, expected),
+    }
+
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+    return result
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'stormhost@example.com')
+    host = login('stormhost@example.com')
+
+    print(f"🌱 JOIN STORM: Preparing {args.players} player accounts", flush=True)
+    emails = [f'stormplayer{i + 1}@example.com' for i in range(args.players)]
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(lambda email: ensure_user(admin, email), emails))
+        players = list(pool.map(login, emails))
+
+    runs = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        for mode in args.modes:
+            for _ in range(args.repeat):
+                print(f"🌪️  JOIN STORM: {args.players} players, roster mode '{mode}'", flush=True)
+                runs.append(run_storm(args, admin, browser, host, players, mode, rng))
+        browser.close()
+
+    by_mode = {}
+    for mode in args.modes:
+        matching = [r for r in runs if r['mode'] == mode]
+        by_mode[mode] = {
+            'runs': len(matching),
+            'correct': sum(1 for r in matching if r['roster_correct']),
+            'writes_per_join': summarize([r['writes_per_join'] for r in matching]),
+            'controller_roster_reads': summarize([r['controller_roster_reads'] for r in matching]),
+            'broadcast_bytes': summarize([r['broadcast_bytes'] for r in matching]),
+            'stable_after_last_join_ms': summarize([r['stable_after_last_join_ms'] for r in matching
+                                                    if r['stable_after_last_join_ms'] is not None]),
+        }
+    return {'config': vars(args), 'by_mode': by_mode, 'runs': runs}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure scoreboard rebuilds during a join storm')
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--team-size', type=int, default=4)
+    parser.add_argument('--storm-ms', type=float, default=3000, help='Window the teams start joining within')
+    parser.add_argument('--modes', nargs='+', choices=['full', 'incremental'], default=['full', 'incremental'])
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per mode')
+    parser.add_argument('--settle', type=float, default=3, help='Quiet seconds that count as stable')
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 JOIN STORM RESULTS")
+    print("=" * 60)
+    for mode, summary in result['by_mode'].items():
+        print(f"{mode} - roster correct {summary['correct']}/{summary['runs']}")
+        print(format_summary('  Writes per join', summary['writes_per_join'], unit=''))
+        print(format_summary('  Controller roster reads', summary['controller_roster_reads'], unit=''))
+        print(format_summary('  Broadcast bytes', summary['broadcast_bytes'], unit='B'))
+        print(format_summary('  Stable after last join', summary['stable_after_last_join_ms']))
+    print(f"📄 Report: {write_report('join_storm', result)}")
+
+    sys.exit(0 if all(s['correct'] == s['runs'] for s in result['by_mode'].values()) else 1)
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Memory leak detector - a long timed game with the host, a player and a display.
+
+Plays one fully timed game of --rounds rounds (20 by default, roughly a
+two-hour game compressed into minutes) with three real pages open:
+
+- host: ControllerPage
+- player: GamePage
+- display: the trivia-party-display app, claimed for the game
+
+At the end of every round each page is garbage collected and sampled via
+CDP Performance.getMetrics: JS heap, event listeners, DOM nodes and
+documents. A metric is flagged when it grows round after round (most
+steps rising and an overall rise past its threshold) after --warmup
+rounds. Leaky subscriptions, presence intervals or panels that re-register
+listeners show up here.
+
+Heap snapshots are taken of every page after warm-up and again at the end;
+they are kept in ./tmp/heap only for pages that were flagged, so the two
+can be compared in the DevTools Memory panel.
+
+Needs the display app's dev server on DISPLAY_URL (port 5174).
+
+    python -m harness.bench_memory_leak --rounds 20
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import app_url, display_url, new_authenticated_context
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, iso_time
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import write_report
+
+# Performance.getMetrics name -> (relative, absolute) rise that counts as a leak
+LEAK_THRESHOLDS = {
+    'JSHeapUsedSize': (0.10, 1024 * 1024),
+    'JSEventListeners': (0.10, 20),
+    'Nodes': (0.10, 200),
+    'Documents': (0.0, 1),
+}
+
+# Share of round-to-round steps that must rise for growth to count as steady
+MONOTONIC_FRACTION = 0.8
+
+HEAP_DIR = './tmp/heap'
+
+
+def steady_growth(values: list, relative: float, absolute: float) -> dict:
+    """Whether values rise round after round by more than the thresholds."""
+    if len(values) < 3:
+        return {'flagged': False, 'rising_steps': None, 'growth': None, 'slope': None}
+    steps = [b - a for a, b in zip(values, values[1:])]
+    rising = sum(1 for step in steps if step > 0) / len(steps)
+    n = len(values)
+    mean_x, mean_y = (n - 1) / 2, sum(values) / n
+    slope = (sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+             / sum((x - mean_x) ** 2 for x in range(n)))
+    growth = values[-1] - values[0]
+    flagged = (rising >= MONOTONIC_FRACTION and slope > 0
+               and growth > absolute and growth > values[0] * relative)
+    return {'flagged': flagged, 'rising_steps': rising, 'growth': growth, 'slope': slope}
+
+
+class RoundTracker:
+    """Rounds of one game that reached round-end, in order."""
+
+    def __init__(self, game_id):
+        self.game_id = game_id
+        self.lock = threading.Lock()
+        self.ended = []
+        self.state = None
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if record.get('id') != self.game_id:
+            return
+        data = record.get('data') or {}
+        with self.lock:
+            self.state = data.get('state')
+            round_number = (data.get('round') or {}).get('round_number')
+            if self.state == 'round-end' and round_number and round_number not in self.ended:
+                self.ended.append(round_number)
+
+
+class MonitoredPage:
+    """One app page with a CDP session for metrics and heap snapshots."""
+
+    def __init__(self, role: str, page):
+        self.role = role
+        self.page = page
+        self.cdp = page.context.new_cdp_session(page)
+        self.cdp.send('Performance.enable')
+        self.cdp.send('HeapProfiler.enable')
+        self.samples = []  # (round, metrics)
+        self._chunks = []
+        self.cdp.on('HeapProfiler.addHeapSnapshotChunk', lambda params: self._chunks.append(params['chunk']))
+
+    def sample(self, round_number):
+        self.cdp.send('HeapProfiler.collectGarbage')
+        metrics = {m['name']: m['value'] for m in self.cdp.send('Performance.getMetrics')['metrics']}
+        self.samples.append((round_number, {name: metrics.get(name) for name in LEAK_THRESHOLDS}))
+
+    def snapshot(self, path: str) -> str:
+        """Write a .heapsnapshot of the page to path."""
+        self._chunks = []
+        # Chunks arrive as events before the command returns
+        self.cdp.send('HeapProfiler.takeHeapSnapshot', {'reportProgress': False})
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(''.join(self._chunks))
+        self._chunks = []
+        return path
+
+
+def claim_display(admin: PocketBaseClient, host: PocketBaseClient, page, game: dict, timeout: float = 30):
+    """Claim the display app running in page for game, as ControllerPage does."""
+    deadline = time.time() + timeout
+    display = None
+    while display is None and time.time() < deadline:
+        display_id = page.evaluate("() => window.localStorage.getItem('displayId')")
+        if display_id:
+            user = admin.get_first('users', f'email="{display_id}@trivia-party-displays.com"')
+            if user:
+                display = admin.get_first('displays', f'display_user="{user["id"]}" && available=true')
+        if display is None:
+            time.sleep(0.5)
+    if display is None:
+        raise RuntimeError('Display app did not register a display')
+    host.update('displays', display['id'], {'host': host.record['id'], 'game': game['id'], 'available': False})
+    return display
+
+
+def run_benchmark(args):
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'leakhost@example.com')
+    ensure_user(admin, 'leakplayer@example.com')
+    host = login('leakhost@example.com')
+    player = login('leakplayer@example.com')
+
+    timers = {
+        'game_start_timer': args.state_timer,
+        'round_start_timer': args.state_timer,
+        'question_timer': args.question_timer,
+        'answer_timer': args.state_timer,
+        'round_end_timer': args.state_timer,
+        'game_end_timer': args.state_timer,
+    }
+    print(f"🌱 LEAK BENCH: Seeding a {args.rounds}-round game", flush=True)
+    built = create_game(host, 'Leak Bench', rounds=args.rounds,
+                        questions_per_round=args.questions_per_round, metadata=timers)
+    game = built['game']
+    join_game(player, game, team_name='Leak Team')
+
+    tracker = RoundTracker(game['id'])
+    realtime = RealtimeSubscription(admin, [f"games/{game['id']}", *STATE_TOPICS],
+                                    GameStateFollower(tracker.on_event).on_event).start()
+
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+
+        host_page = new_authenticated_context(browser, host).new_page()
+        host_page.goto(app_url(f"/controller/{game['id']}"))
+        player_page = new_authenticated_context(browser, player).new_page()
+        player_page.goto(app_url(f"/game/{game['id']}"))
+        pages = [MonitoredPage('host', host_page), MonitoredPage('player', player_page)]
+        if not args.no_display:
+            display_page = browser.new_context(viewport={'width': 1920, 'height': 1080}).new_page()
+            display_page.goto(display_url())
+            claim_display(admin, host, display_page, game)
+            pages.append(MonitoredPage('display', display_page))
+        for monitored in pages:
+            monitored.page.wait_for_load_state('networkidle')
+            monitored.sample(0)
+
+        print(f"🚀 LEAK BENCH: Playing {args.rounds} rounds", flush=True)
+        started = time.time()
+        host.update('games', game['id'], {'data': {
+            'state': 'game-start',
+            'timer': {'startedAt': iso_time(started), 'duration': args.state_timer,
+                      'expiresAt': iso_time(started + args.state_timer)},
+        }})
+
+        baselines = {}
+        sampled = 0
+        deadline = started + args.timeout
+        while time.time() < deadline:
+            with tracker.lock:
+                ended = list(tracker.ended)
+                state = tracker.state
+            for round_number in ended[sampled:]:
+                for monitored in pages:
+                    monitored.sample(round_number)
+                print(f"🧮 LEAK BENCH: Round {round_number} sampled", flush=True)
+                if round_number == args.warmup:
+                    for monitored in pages:
+                        path = os.path.join(HEAP_DIR, f'leak_{stamp}_{monitored.role}_round{round_number}.heapsnapshot')
+                        baselines[monitored.role] = monitored.snapshot(path)
+            sampled = len(ended)
+            if state == 'thanks':
+                break
+            time.sleep(0.5)
+
+        pages_report = {}
+        for monitored in pages:
+            measured = [metrics for round_number, metrics in monitored.samples if round_number >= args.warmup]
+            flags = {}
+            for name, (relative, absolute) in LEAK_THRESHOLDS.items():
+                values = [metrics[name] for metrics in measured if metrics.get(name) is not None]
+                flags[name] = steady_growth(values, relative, absolute)
+            leaking = [name for name, flag in flags.items() if flag['flagged']]
+
+            snapshots = []
+            baseline = baselines.pop(monitored.role, None)
+            if leaking:
+                final = os.path.join(HEAP_DIR, f'leak_{stamp}_{monitored.role}_final.heapsnapshot')
+                snapshots = [path for path in (baseline, monitored.snapshot(final)) if path]
+            elif baseline:
+                os.remove(baseline)
+
+            pages_report[monitored.role] = {
+                'samples': [{'round': round_number, **metrics} for round_number, metrics in monitored.samples],
+                'growth': flags,
+                'leaking': leaking,
+                'heap_snapshots': snapshots,
+            }
+
+        browser.close()
+
+    realtime.stop()
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+
+    return {
+        'config': vars(args),
+        'rounds_completed': len(tracker.ended),
+        'game_seconds': time.time() - started,
+        'pages': pages_report,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Detect browser memory growth over a long game')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--questions-per-round', type=int, default=3)
+    parser.add_argument('--question-timer', type=int, default=3, help='Seconds per question')
+    parser.add_argument('--state-timer', type=int, default=1, help='Seconds for every other timed state')
+    parser.add_argument('--warmup', type=int, default=2, help='Rounds before growth is measured')
+    parser.add_argument('--no-display', action='store_true', help='Skip the display app page')
+    parser.add_argument('--timeout', type=float, default=1800, help='Seconds to wait for the game to finish')
+    parser.add_argument('--keep', action='store_true', help='Keep the seeded game after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 MEMORY LEAK RESULTS")
+    print("=" * 60)
+    print(f"Rounds completed: {result['rounds_completed']}/{args.rounds}")
+    for role, page in result['pages'].items():
+        first, last = page['samples'][0], page['samples'][-1]
+        print(f"{role}: heap {first['JSHeapUsedSize'] / 1048576:.1f} -> {last['JSHeapUsedSize'] / 1048576:.1f}MB, "
+              f"listeners {first['JSEventListeners']:.0f} -> {last['JSEventListeners']:.0f}, "
+              f"nodes {first['Nodes']:.0f} -> {last['Nodes']:.0f}")
+        if page['leaking']:
+            print(f"  🚨 Steady growth in {', '.join(page['leaking'])}")
+            for path in page['heap_snapshots']:
+                print(f"  📸 {path}")
+    print(f"📄 Report: {write_report('memory_leak', result)}")
+
+    sys.exit(1 if any(page['leaking'] for page in result['pages'].values()) else 0)
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reconnect storm - every player's connection drops mid-question.
+
+When the venue Wi-Fi blips, every phone loses its realtime (SSE)
+connection at once, and they all come back at once. Each one reconnects
+and refetches the game, so PocketBase takes the whole room's requests in
+the same second.
+
+--clients simulated players connect through harness.proxy and follow the
+game state (harness.gamestate). Mid-question the proxy cuts every
+connection and refuses new ones for --outage seconds. The host, on the
+wired side, reveals the answer during the outage. The scenario then
+measures how long it takes until every client has a live realtime
+connection again and holds the host's latest state, and the request rate
+PocketBase saw while they came back.
+
+Two client policies, run one after the other:
+
+- herd: the old app - the SDK's fixed reconnect delays, then an immediate
+  refetch of the game record, its state patches and the team's answers
+- jittered: the app now - reconnect delays spread by +/-50%
+  (src/lib/pocketbase.ts), then one GET /api/games/:id/state at a random
+  point in --spread ms (GameStateChannel.resync)
+
+    python -m harness.bench_reconnect_storm --clients 200 --outage 3
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.aio import AsyncPocketBaseClient, AsyncRealtimeSubscription
+from harness.gamestate import STATE_TOPICS, GameStateFollower, diff_state
+from harness.pocketbase import PocketBaseClient, PocketBaseError, iso_time
+from harness.proxy import TcpProxy
+from harness.seed import create_game, ensure_user, login
+from harness.sessions import SessionPool
+from harness.stats import format_summary, peak_rate, summarize, write_report
+
+HOST_EMAIL = 'stormhost@example.com'
+
+# The SDK's RealtimeService.predefinedReconnectIntervals
+RECONNECT_INTERVALS_MS = [200, 300, 500, 1000, 1200, 1500, 2000]
+
+# Same as RESYNC_SPREAD_MS in src/lib/gameState.ts
+RESYNC_SPREAD_MS = 3000
+
+POLICIES = ('herd', 'jittered')
+
+
+class StormClient:
+    """One player's connection to the game, reconnecting by policy."""
+
+    def __init__(self, token: str, base_url: str, game_id: str, policy: str, spread_ms: float,
+                 rng: random.Random, requests: list):
+        self.client = AsyncPocketBaseClient(base_url, token=token)
+        self.game_id = game_id
+        self.policy = policy
+        self.spread_ms = spread_ms
+        self.rng = rng
+        self.requests = requests  # shared: time of every request sent
+        self.follower = GameStateFollower(lambda topic, payload, received_at: None)
+        self.realtime = None
+        self.connected = asyncio.Event()
+        self.reconnects = 0
+        self.failed_attempts = 0
+        if policy == 'jittered':
+            self.intervals = [ms * rng.uniform(0.5, 1.5) for ms in RECONNECT_INTERVALS_MS]
+        else:
+            self.intervals = list(RECONNECT_INTERVALS_MS)
+
+    @property
+    def seq(self) -> int:
+        return self.follower.seq(self.game_id)
+
+    async def request(self, method: str, path: str, params: dict = None):
+        self.requests.append(time.time())
+        return await self.client.request(method, path, params=params)
+
+    async def connect(self):
+        # GET /api/realtime, then the subscriptions POST
+        self.requests.extend([time.time()] * 2)
+        self.realtime = await AsyncRealtimeSubscription(
+            self.client, [f'games/{self.game_id}', *STATE_TOPICS], self.follower.on_event).start()
+        self.connected.set()
+
+    async def resync(self):
+        if self.policy == 'jittered':
+            await asyncio.sleep(self.rng.uniform(0, self.spread_ms) / 1000)
+            snapshot = await self.request('GET', f'/api/games/{self.game_id}/state')
+            data = {**(snapshot['state'] or {}), 'seq': snapshot['seq']}
+            self.follower.on_event(f'games/{self.game_id}', {'action': 'update',
+                                                             'record': {**snapshot['game'], 'data': data}}, time.time())
+            return
+        # What GamePage did: the game record, then everything that might have changed
+        game = await self.request('GET', f'/api/collections/games/records/{self.game_id}')
+        self.follower.on_event(f'games/{self.game_id}', {'action': 'update', 'record': game}, time.time())
+        updates = await self.request('GET', '/api/collections/game_state_updates/records', params={
+            'filter': f'game = "{self.game_id}" && seq > {self.seq}', 'sort': 'seq', 'perPage': 500})
+        for update in updates['items']:
+            self.follower.on_event('game_state_updates/*', {'action': 'create', 'record': update}, time.time())
+        await self.request('GET', '/api/collections/game_answers/records', params={
+            'filter': f'game = "{self.game_id}"', 'perPage': 500})
+
+    async def run(self, stop: asyncio.Event):
+        await self.connect()
+        await self.resync()
+        while not stop.is_set():
+            await self.realtime.wait_closed()
+            if stop.is_set():
+                return
+            self.connected.clear()
+            await self.client.close()
+            attempt = 0
+            while not stop.is_set():
+                await asyncio.sleep(self.intervals[min(attempt, len(self.intervals) - 1)] / 1000)
+                attempt += 1
+                try:
+                    await self.connect()
+                    await self.resync()
+                    break
+                except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, PocketBaseError):
+                    self.failed_attempts += 1
+                    self.connected.clear()
+                    await self.client.close()
+            self.reconnects += 1
+
+    async def close(self):
+        if self.realtime is not None:
+            await self.realtime.stop()
+        await self.client.close()
+
+
+async def run_policy(args, policy: str, tokens: list, host_token: str, game_id: str, rng: random.Random) -> dict:
+    proxy = await TcpProxy().start()
+    host = AsyncPocketBaseClient(token=host_token)  # Wired: straight to PocketBase
+    requests = []
+    clients = [StormClient(token, proxy.url, game_id, policy, args.spread, random.Random(rng.getrandbits(64)),
+                           requests) for token in tokens]
+    stop = asyncio.Event()
+
+    # A fresh question, sequenced after whatever the previous policy left
+    latest = await host.get_list('game_state_updates', page=1, per_page=1, filter=f'game = "{game_id}"',
+                                 sort='-seq', skipTotal=1)
+    seq = latest['items'][0]['seq'] if latest['items'] else 0
+    state = {}
+
+    async def write_state(new_state: dict):
+        nonlocal seq, state
+        seq += 1
+        await host.create('game_state_updates', {'game': game_id, 'seq': seq, 'patch': diff_state(state, new_state)})
+        state = new_state
+
+    now = time.time()
+    question = {'id': f'storm{seq:010d}', 'question_number': 1, 'category': 'General',
+                'question': f'Which policy is this? ({policy})', 'difficulty': 'easy',
+                'a': 'herd', 'b': 'jittered', 'c': 'neither', 'd': 'both'}
+    await write_state({'state': 'round-play', 'question': question,
+                       'timer': {'startedAt': iso_time(now), 'duration': 30, 'expiresAt': iso_time(now + 30)}})
+
+    print(f"🌐 STORM ({policy}): Connecting {len(clients)} clients through {proxy.url}", flush=True)
+    tasks = [asyncio.ensure_future(client.run(stop)) for client in clients]
+    deadline = time.time() + args.timeout
+    while time.time() < deadline and not all(c.connected.is_set() and c.seq == seq for c in clients):
+        await asyncio.sleep(0.05)
+    ready = sum(1 for c in clients if c.connected.is_set() and c.seq == seq)
+
+    # Wi-Fi blip mid-question; the host reveals the answer while it lasts
+    await asyncio.sleep(args.settle)
+    print(f"💥 STORM ({policy}): Dropping every connection for {args.outage}s", flush=True)
+    dropped_at = time.time()
+    dropped = proxy.outage(args.outage)
+    await asyncio.sleep(args.outage / 2)
+    await write_state({**state, 'question': {**question, 'correct_answer': 'b'}})
+    target = seq
+
+    synced_at = {}
+    deadline = time.time() + args.timeout
+    while time.time() < deadline and len(synced_at) < len(clients):
+        now = time.time()
+        for i, client in enumerate(clients):
+            if i not in synced_at and client.connected.is_set() and client.seq >= target:
+                synced_at[i] = now - dropped_at
+        await asyncio.sleep(0.02)
+
+    stop.set()
+    for client in clients:
+        await client.close()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await proxy.stop()
+    await host.close()
+
+    herd = [t - dropped_at for t in requests if t >= dropped_at]
+    return {
+        'clients': len(clients),
+        'ready_before_drop': ready,
+        'dropped_connections': dropped,
+        'synced': len(synced_at),
+        'all_synced_s': max(synced_at.values()) if len(synced_at) == len(clients) else None,
+        'sync_s': summarize(list(synced_at.values())),
+        'requests_after_drop': len(herd),
+        'requests_per_client': len(herd) / len(clients) if clients else 0,
+        'peak_requests_per_s': peak_rate(herd, 1.0),
+        'peak_requests_per_100ms': peak_rate(herd, 0.1),
+        'failed_reconnects': sum(c.failed_attempts for c in clients),
+        'proxy': dict(proxy.stats),
+    }
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, HOST_EMAIL)
+    host = login(HOST_EMAIL)
+    game = create_game(host, 'Reconnect Storm', rounds=1, questions_per_round=1, rng=rng)['game']
+
+    print(f"🔑 STORM: Sessions for {args.clients} players", flush=True)
+    pool = SessionPool()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        sessions = list(executor.map(pool.get, [f'stormplayer{i + 1}@example.com' for i in range(args.clients)]))
+    tokens = [session['token'] for session in sessions]
+
+    policies = {}
+    for policy in args.policies:
+        policies[policy] = asyncio.run(run_policy(args, policy, tokens, host.token, game['id'], rng))
+
+    return {'config': vars(args), 'game': game['id'], 'policies': policies}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Drop every client connection mid-question and time the recovery')
+    parser.add_argument('--clients', type=int, default=200, help='Simulated players')
+    parser.add_argument('--outage', type=float, default=3, help='Seconds new connections are refused after the drop')
+    parser.add_argument('--spread', type=float, default=RESYNC_SPREAD_MS, help='Jittered resync window in ms')
+    parser.add_argument('--settle', type=float, default=2, help='Seconds between all clients in sync and the drop')
+    parser.add_argument('--policies', nargs='+', choices=POLICIES, default=list(POLICIES))
+    parser.add_argument('--timeout', type=float, default=60, help='Seconds to wait for every client to resync')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 RECONNECT STORM RESULTS")
+    print("=" * 60)
+    for policy, stats in result['policies'].items():
+        synced = f"{stats['all_synced_s']:.2f}s" if stats['all_synced_s'] is not None else 'never'
+        print(f"{policy}: {stats['synced']}/{stats['clients']} back in sync, all by {synced}")
+        print(format_summary('  Time to sync (s)', stats['sync_s']))
+        print(f"  Requests: {stats['requests_after_drop']} ({stats['requests_per_client']:.1f}/client), "
+              f"peak {stats['peak_requests_per_s']}/s, {stats['peak_requests_per_100ms']}/100ms")
+        print(f"  Failed reconnect attempts: {stats['failed_reconnects']}")
+    print(f"📄 Report: {write_report('reconnect_storm', result)}")
+
+    ok = all(stats['all_synced_s'] is not None for stats in result['policies'].values())
+    sys.exit(0 if ok else 1)
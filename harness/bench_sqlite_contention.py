@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite write contention - how many teams one PocketBase instance can take.
+
+PocketBase writes through a single SQLite writer connection, so when every
+team answers in the same second the game_answers creates queue behind each
+other and behind the controller's games updates (scoreboard, timer state).
+
+Two scenarios, each swept over --teams:
+
+pocketbase: bursts against the live server. Per burst, every team creates
+    its game_answers record while --game-updates games PATCHes carrying a
+    scoreboard sized for that many teams run at the same moment. Each
+    request is tagged in its query string so its PocketBase log entry
+    (data.execTime) can be matched. A serial calibration gives the
+    uncontended execution time per request kind, and each burst request
+    is split into:
+      execution  = min(execTime, uncontended execTime)
+      queue wait = the rest of the client-observed latency (waiting for
+                   the writer inside the handler plus accept/scheduling)
+
+sqlite: the same write pattern straight against SQLite from Python, once
+    per journal mode / synchronous / busy_timeout combination. Lock wait
+    (BEGIN IMMEDIATE until the write lock is held) and execution (insert
+    or update plus commit) are measured exactly, with readers polling
+    game_answers like subscribed clients do. PocketBase's own pragmas are
+    fixed at build time (WAL, synchronous=NORMAL, busy_timeout 10s), so
+    this is where the alternatives are compared.
+
+Both report answer p99 per team count and the largest team count that
+stays under --p99-budget (500 ms).
+
+    python -m harness.bench_sqlite_contention pocketbase --teams 25 50 100 200
+    python -m harness.bench_sqlite_contention sqlite --teams 50 100 200 400 \\
+        --journal-modes WAL DELETE --busy-timeouts 100 10000
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.pocketbase import PocketBaseClient, PocketBaseError, iso_time
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import format_summary, summarize, write_report
+
+ANSWERS_PATH = '/api/collections/game_answers/records'
+
+
+def max_teams_within(by_teams: dict, budget_ms: float):
+    """
+    Largest team count before the first one, in ascending order, with failed
+    answers or answer p99 over budget (None if the smallest already fails).
+    """
+    passed = None
+    for teams in sorted(by_teams, key=int):
+        result = by_teams[teams]
+        if (result['answers']['errors'] or not result['answer_total_ms'].get('count')
+                or result['answer_total_ms']['p99'] > budget_ms):
+            break
+        passed = int(teams)
+    return passed
+
+
+def scoreboard_for(team_ids: list, rng: random.Random) -> dict:
+    """Scoreboard blob the size ControllerPage writes for these teams."""
+    return {
+        'teams': {team_id: {
+            'name': f'Team {i + 1}',
+            'players': [{'id': uuid.uuid4().hex[:15], 'name': f'Player {i + 1}', 'avatar': ''}],
+            'score': rng.randint(0, 30),
+            'roundScores': {'1': rng.randint(0, 10)},
+        } for i, team_id in enumerate(team_ids)},
+        'updated': iso_time(time.time()),
+    }
+
+
+# ----------------------------------------------------------------------
+# pocketbase: live server
+# ----------------------------------------------------------------------
+
+def tagged(client: PocketBaseClient, method: str, path: str, body: dict, tag: str):
+    """Request with a tag PocketBase keeps in the logged URL."""
+    started = time.time()
+    try:
+        client.request(method, path, body, params={'bench': tag})
+        ok = True
+    except (PocketBaseError, OSError):
+        ok = False
+    return {'tag': tag, 'latency_ms': (time.time() - started) * 1000, 'ok': ok}
+
+
+def fetch_exec_times(admin: PocketBaseClient, since: float, tags: set, timeout: float = 30) -> dict:
+    """tag -> data.execTime from the request log (logs are flushed in batches)."""
+    found = {}
+    log_filter = (f'data.type = "request" && data.url ~ "bench=" '
+                  f'&& created >= "{iso_time(since - 1).replace("T", " ")}"')
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        page = 1
+        while True:
+            result = admin.request('GET', '/api/logs', params={'filter': log_filter, 'page': page, 'perPage': 500})
+            for entry in result.get('items', []):
+                data = entry.get('data', {})
+                tag = data.get('url', '').rsplit('bench=', 1)[-1].split('&')[0]
+                if tag in tags:
+                    found[tag] = data.get('execTime')
+            if len(result.get('items', [])) < 500:
+                break
+            page += 1
+        if len(found) >= len(tags):
+            break
+        time.sleep(1)
+    return found
+
+
+def split_latency(requests: list, exec_times: dict, baseline_ms: float) -> dict:
+    total, queue, execution, server = [], [], [], []
+    for request in requests:
+        if not request['ok']:
+            continue
+        total.append(request['latency_ms'])
+        exec_ms = exec_times.get(request['tag'])
+        if exec_ms is None:
+            continue
+        server.append(exec_ms)
+        execution.append(min(exec_ms, baseline_ms))
+        queue.append(max(0.0, request['latency_ms'] - min(exec_ms, baseline_ms)))
+    return {
+        'total_ms': summarize(total),
+        'server_ms': summarize(server),
+        'execution_ms': summarize(execution),
+        'queue_wait_ms': summarize(queue),
+        'errors': sum(1 for request in requests if not request['ok']),
+    }
+
+
+def run_pocketbase(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'contentionhost@example.com')
+    host = login('contentionhost@example.com')
+
+    most = max(args.teams)
+    print(f"🌱 CONTENTION: Preparing {most} player accounts", flush=True)
+    emails = [f'contention{i + 1}@example.com' for i in range(most)]
+    with ThreadPoolExecutor(max_workers=32) as pool:
+        list(pool.map(lambda email: ensure_user(admin, email), emails))
+        players = list(pool.map(login, emails))
+
+    by_teams = {}
+    for teams in args.teams:
+        built = create_game(host, f'Contention {teams}', rounds=1,
+                            questions_per_round=args.bursts + 1, rng=rng)
+        game = built['game']
+        questions = next(iter(built['questions'].values()))
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            seats = list(pool.map(lambda i: join_game(players[i], game, team_name=f'Team {i + 1}'), range(teams)))
+        team_ids = [seat['team']['id'] for seat in seats]
+        games_path = f"/api/collections/games/records/{game['id']}"
+
+        def answer_body(question, team_id):
+            return {'game': game['id'], 'game_questions_id': question['id'], 'team': team_id,
+                    'answer': rng.choice('ABCD'), 'host': game['host']}
+
+        def update_body():
+            now = time.time()
+            return {'scoreboard': scoreboard_for(team_ids, rng), 'data': {
+                'state': 'round-play',
+                'timer': {'startedAt': iso_time(now), 'duration': 20, 'expiresAt': iso_time(now + 20)},
+            }}
+
+        # Uncontended execution time per kind, one request at a time
+        since = time.time()
+        calibration = {'answer': [], 'update': []}
+        for i in range(min(teams, args.calibration)):
+            tag = uuid.uuid4().hex
+            calibration['answer'].append(tag)
+            tagged(players[i], 'POST', ANSWERS_PATH, answer_body(questions[0], team_ids[i]), tag)
+            tag = uuid.uuid4().hex
+            calibration['update'].append(tag)
+            tagged(host, 'PATCH', games_path, update_body(), tag)
+        exec_times = fetch_exec_times(admin, since, set(calibration['answer'] + calibration['update']))
+        baseline = {kind: summarize([exec_times[t] for t in tags if exec_times.get(t) is not None]).get('p50', 0)
+                    for kind, tags in calibration.items()}
+
+        print(f"💥 CONTENTION: {teams} teams x {args.bursts} bursts "
+              f"(+{args.game_updates} games updates each)", flush=True)
+        answers, updates = [], []
+        since = time.time()
+        with ThreadPoolExecutor(max_workers=teams + args.game_updates) as pool:
+            for burst in range(args.bursts):
+                question = questions[burst + 1]
+                barrier = threading.Barrier(teams + args.game_updates)
+
+                def fire_answer(i):
+                    body = answer_body(question, team_ids[i])
+                    barrier.wait()
+                    return tagged(players[i], 'POST', ANSWERS_PATH, body, uuid.uuid4().hex)
+
+                def fire_update(_):
+                    body = update_body()
+                    barrier.wait()
+                    return tagged(host, 'PATCH', games_path, body, uuid.uuid4().hex)
+
+                answer_futures = [pool.submit(fire_answer, i) for i in range(teams)]
+                update_futures = [pool.submit(fire_update, j) for j in range(args.game_updates)]
+                answers.extend(f.result() for f in answer_futures)
+                updates.extend(f.result() for f in update_futures)
+                time.sleep(args.gap)
+
+        exec_times = fetch_exec_times(admin, since, {r['tag'] for r in answers + updates})
+        answer_split = split_latency(answers, exec_times, baseline['answer'])
+        update_split = split_latency(updates, exec_times, baseline['update'])
+        by_teams[str(teams)] = {
+            'uncontended_exec_ms': baseline,
+            'answer_total_ms': answer_split['total_ms'],
+            'answers': answer_split,
+            'games_updates': update_split,
+            'log_entries_matched': len(exec_times),
+        }
+        print(format_summary(f'   {teams} teams answer latency', answer_split['total_ms']), flush=True)
+
+        if not args.keep:
+            try:
+                host.delete('games', game['id'])
+            except PocketBaseError:
+                pass
+
+    return {'config': vars(args), 'by_teams': by_teams,
+            'max_teams_within_budget': max_teams_within(by_teams, args.p99_budget)}
+
+
+# ----------------------------------------------------------------------
+# sqlite: direct, per setting
+# ----------------------------------------------------------------------
+
+SCHEMA = """
+CREATE TABLE games (id TEXT PRIMARY KEY, data JSON, scoreboard JSON, updated TEXT);
+CREATE TABLE game_answers (
+    id TEXT PRIMARY KEY, game TEXT, game_questions_id TEXT, team TEXT,
+    answer TEXT, host TEXT, is_correct BOOLEAN, created TEXT, updated TEXT
+);
+CREATE INDEX idx_answers_game_question ON game_answers (game, game_questions_id);
+CREATE INDEX idx_answers_team ON game_answers (team);
+"""
+
+
+def connect(path: str, setting: dict) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=0)
+    conn.execute(f"PRAGMA busy_timeout = {int(setting['busy_timeout'])}")
+    conn.execute(f"PRAGMA synchronous = {setting['synchronous']}")
+    return conn
+
+
+def timed_write(conn: sqlite3.Connection, sql: str, params: tuple) -> dict:
+    started = time.perf_counter()
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+    except sqlite3.OperationalError:
+        return {'ok': False, 'wait_ms': (time.perf_counter() - started) * 1000}
+    locked = time.perf_counter()
+    try:
+        conn.execute(sql, params)
+        conn.execute('COMMIT')
+    except sqlite3.OperationalError:
+        conn.execute('ROLLBACK')
+        return {'ok': False, 'wait_ms': (locked - started) * 1000}
+    done = time.perf_counter()
+    return {'ok': True, 'wait_ms': (locked - started) * 1000, 'exec_ms': (done - locked) * 1000,
+            'total_ms': (done - started) * 1000}
+
+
+def sqlite_burst(path: str, setting: dict, teams: int, args, rng: random.Random) -> dict:
+    game_id = uuid.uuid4().hex[:15]
+    team_ids = [uuid.uuid4().hex[:15] for _ in range(teams)]
+    setup = connect(path, setting)
+    setup.execute('INSERT INTO games (id, data, scoreboard, updated) VALUES (?, ?, ?, ?)',
+                  (game_id, '{}', '{}', iso_time(time.time())))
+    setup.close()
+
+    writers = teams + args.game_updates
+    connections = [connect(path, setting) for _ in range(writers + args.readers)]
+    answers, updates = [], []
+    stop_readers = threading.Event()
+    reads = []
+
+    def read_loop(conn):
+        while not stop_readers.is_set():
+            started = time.perf_counter()
+            try:
+                conn.execute('SELECT * FROM game_answers WHERE game = ?', (game_id,)).fetchall()
+                reads.append((time.perf_counter() - started) * 1000)
+            except sqlite3.OperationalError:
+                pass
+            time.sleep(0.01)
+
+    readers = [threading.Thread(target=read_loop, args=(conn,), daemon=True)
+               for conn in connections[writers:]]
+    for reader in readers:
+        reader.start()
+
+    with ThreadPoolExecutor(max_workers=writers) as pool:
+        for burst in range(args.bursts):
+            question_id = uuid.uuid4().hex[:15]
+            barrier = threading.Barrier(writers)
+            scoreboard = json.dumps(scoreboard_for(team_ids, rng))
+
+            def fire_answer(i):
+                row = (uuid.uuid4().hex[:15], game_id, question_id, team_ids[i], rng.choice('ABCD'),
+                       'host', False, iso_time(time.time()), iso_time(time.time()))
+                barrier.wait()
+                return timed_write(connections[i],
+                                   'INSERT INTO game_answers VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', row)
+
+            def fire_update(j):
+                barrier.wait()
+                return timed_write(connections[teams + j],
+                                   'UPDATE games SET scoreboard = ?, data = ?, updated = ? WHERE id = ?',
+                                   (scoreboard, '{"state": "round-play"}', iso_time(time.time()), game_id))
+
+            answer_futures = [pool.submit(fire_answer, i) for i in range(teams)]
+            update_futures = [pool.submit(fire_update, j) for j in range(args.game_updates)]
+            answers.extend(f.result() for f in answer_futures)
+            updates.extend(f.result() for f in update_futures)
+            time.sleep(args.gap)
+
+    stop_readers.set()
+    for reader in readers:
+        reader.join()
+    for conn in connections:
+        conn.close()
+
+    def split(results):
+        ok = [r for r in results if r['ok']]
+        return {
+            'total_ms': summarize([r['total_ms'] for r in ok]),
+            'queue_wait_ms': summarize([r['wait_ms'] for r in ok]),
+            'execution_ms': summarize([r['exec_ms'] for r in ok]),
+            'errors': len(results) - len(ok),
+        }
+
+    answer_split = split(answers)
+    return {
+        'answer_total_ms': answer_split['total_ms'],
+        'answers': answer_split,
+        'games_updates': split(updates),
+        'reads_ms': summarize(reads),
+    }
+
+
+def run_sqlite(args):
+    rng = random.Random(args.seed)
+    settings = [{'journal_mode': mode, 'synchronous': sync, 'busy_timeout': timeout}
+                for mode in args.journal_modes for sync in args.synchronous for timeout in args.busy_timeouts]
+    results = []
+    for setting in settings:
+        label = f"journal={setting['journal_mode']} synchronous={setting['synchronous']} busy_timeout={setting['busy_timeout']}"
+        print(f"🗄️  CONTENTION: {label}", flush=True)
+        with tempfile.TemporaryDirectory(dir=args.workdir) as directory:
+            path = os.path.join(directory, 'data.db')
+            conn = sqlite3.connect(path, isolation_level=None)
+            conn.execute(f"PRAGMA journal_mode = {setting['journal_mode']}")
+            conn.executescript(SCHEMA)
+            conn.close()
+            by_teams = {}
+            for teams in args.teams:
+                by_teams[str(teams)] = sqlite_burst(path, setting, teams, args, rng)
+                print(format_summary(f'   {teams} teams answer latency', by_teams[str(teams)]['answer_total_ms']),
+                      flush=True)
+        results.append({'setting': setting, 'label': label, 'by_teams': by_teams,
+                        'max_teams_within_budget': max_teams_within(by_teams, args.p99_budget)})
+    return {'config': vars(args), 'settings': results}
+
+
+def print_by_teams(by_teams: dict):
+    for teams, result in by_teams.items():
+        answers = result['answers']
+        print(f"  {teams} teams ({answers['errors']} failed answers)")
+        print(format_summary('    Answer total', answers['total_ms']))
+        print(format_summary('    Answer queue wait', answers['queue_wait_ms']))
+        print(format_summary('    Answer execution', answers['execution_ms']))
+        print(format_summary('    games update total', result['games_updates']['total_ms']))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Profile SQLite write contention from answer bursts')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--teams', type=int, nargs='+', default=[25, 50, 100, 200], help='Team counts to sweep')
+    common.add_argument('--bursts', type=int, default=5, help='Answer bursts per team count')
+    common.add_argument('--game-updates', type=int, default=2, help='Concurrent games updates per burst')
+    common.add_argument('--gap', type=float, default=1, help='Seconds between bursts')
+    common.add_argument('--p99-budget', type=float, default=500, help='Answer p99 that counts as too slow (ms)')
+    common.add_argument('--seed', type=int, default=None)
+
+    live = sub.add_parser('pocketbase', parents=[common], help='Bursts against the running PocketBase')
+    live.add_argument('--calibration', type=int, default=10, help='Serial requests per kind for uncontended timing')
+    live.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+
+    direct = sub.add_parser('sqlite', parents=[common], help='Same write pattern straight against SQLite')
+    direct.add_argument('--journal-modes', nargs='+', default=['WAL', 'DELETE'])
+    direct.add_argument('--synchronous', nargs='+', default=['NORMAL', 'FULL'])
+    direct.add_argument('--busy-timeouts', type=int, nargs='+', default=[1000, 10000], help='Milliseconds')
+    direct.add_argument('--readers', type=int, default=8, help='Threads polling game_answers during bursts')
+    direct.add_argument('--workdir', default=None, help='Where the scratch databases go (same disk as pb_data)')
+
+    args = parser.parse_args()
+
+    result = run_pocketbase(args) if args.command == 'pocketbase' else run_sqlite(args)
+
+    print("\n" + "=" * 60)
+    print("📊 SQLITE CONTENTION RESULTS")
+    print("=" * 60)
+    if args.command == 'pocketbase':
+        print_by_teams(result['by_teams'])
+        print(f"Max teams with answer p99 <= {args.p99_budget:.0f}ms: {result['max_teams_within_budget']}")
+    else:
+        for entry in result['settings']:
+            print(entry['label'])
+            print_by_teams(entry['by_teams'])
+            print(f"  Max teams with answer p99 <= {args.p99_budget:.0f}ms: {entry['max_teams_within_budget']}")
+    print(f"📄 Report: {write_report(f'sqlite_contention_{args.command}', result)}")
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Game state deltas - bytes and parse time per state transition.
+
+The controller used to PATCH games.data on every transition, so every
+subscriber received the whole games record, scoreboard included, and
+parsed all of it to read a state change of a few hundred bytes. With
+src/lib/gameState.ts each transition is a game_state_updates record
+holding a JSON merge patch, and games.data is rewritten only as a
+snapshot every GAME_STATE_SNAPSHOT_EVERY updates and at the end.
+
+Plays the same game twice against one game record whose scoreboard holds
+--teams teams:
+
+- full: games.data rewritten per transition (the old controller)
+- delta: one patch record per transition, snapshots as the app writes them
+
+A subscriber on games/<id> and game_state_updates receives every event.
+Per transition it reports the bytes delivered and the time to parse them
+(and apply the patch, in delta mode) in Python and, with --browser, with
+JSON.parse in Chromium. It also checks that a GameStateFollower fed the
+delta stream ends on the same state as the full stream.
+
+    python -m harness.bench_state_deltas --teams 100 --browser
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+
+from playwright.sync_api import sync_playwright
+
+from harness.bench_sqlite_contention import scoreboard_for
+from harness.gamestate import STATE_TOPICS, GameStateFollower, apply_patch, diff_state
+from harness.pocketbase import PocketBaseClient, RealtimeSubscription, iso_time
+from harness.seed import create_game, ensure_user, login
+from harness.stats import format_summary, summarize, write_report
+
+HOST_EMAIL = 'deltahost@example.com'
+
+# Same as GAME_STATE_SNAPSHOT_EVERY in src/lib/gameState.ts
+SNAPSHOT_EVERY = 10
+
+# JSON.parse (and merge patch apply for patches) over one game's events, in the page
+BROWSER_PARSE = """
+([payloads, repeat]) => {
+  const apply = (state, patch) => {
+    const result = { ...state }
+    for (const [key, value] of Object.entries(patch)) {
+      if (value === null) delete result[key]
+      else if (typeof value === 'object' && !Array.isArray(value)) result[key] = apply(result[key] || {}, value)
+      else result[key] = value
+    }
+    return result
+  }
+  const timings = payloads.map(() => 0)
+  for (let r = 0; r < repeat; r++) {
+    let state = {}
+    payloads.forEach(([kind, raw], i) => {
+      const started = performance.now()
+      const event = JSON.parse(raw)
+      state = kind === 'patch' ? apply(state, event.record.patch) : event.record.data
+      timings[i] += performance.now() - started
+    })
+  }
+  return timings.map(total => total / repeat)
+}
+"""
+
+
+def game_transitions(rounds: int, questions_per_round: int, timer: int) -> list:
+    """The games.data values ControllerPage writes over one game."""
+    def timed(seconds):
+        now = time.time()
+        return {'startedAt': iso_time(now), 'duration': seconds, 'expiresAt': iso_time(now + seconds)}
+
+    states = [{'state': 'game-start', 'timer': timed(10)}]
+    for r in range(1, rounds + 1):
+        round_info = {'round_number': r, 'rounds': rounds, 'question_count': questions_per_round,
+                      'title': f'Round {r}', 'categories': ['History', 'Science', 'Sports']}
+        states.append({'state': 'round-start', 'round': round_info, 'timer': timed(10)})
+        for q in range(1, questions_per_round + 1):
+            question = {
+                'id': uuid.uuid4().hex[:15], 'question_number': q, 'category': 'History',
+                'question': f'Which of these happened first in question {r}.{q}?', 'difficulty': 'medium',
+                'a': 'The first answer', 'b': 'The second answer', 'c': 'The third answer', 'd': 'The fourth answer',
+            }
+            states.append({'state': 'round-play', 'round': round_info, 'question': question, 'timer': timed(timer)})
+            states.append({'state': 'round-play', 'round': round_info,
+                           'question': {**question, 'correct_answer': 'b'}, 'timer': timed(5)})
+        states.append({'state': 'round-end', 'round': round_info, 'timer': timed(15)})
+    states.append({'state': 'game-end', 'timer': timed(15)})
+    states.append({'state': 'thanks'})
+    return states
+
+
+class EventLog:
+    """Every realtime event for one game, with its size and Python parse time."""
+
+    def __init__(self, game_id: str, repeat: int):
+        self.game_id = game_id
+        self.repeat = repeat
+        self.lock = threading.Condition()
+        self.events = []  # (kind, raw, parse_ms)
+        self.follower = GameStateFollower(lambda topic, payload, received_at: None)
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if topic.startswith('game_state_updates/'):
+            kind = 'patch'
+            if record.get('game') != self.game_id:
+                return
+        elif record.get('id') == self.game_id:
+            kind = 'games'
+        else:
+            return
+        self.follower.on_event(topic, payload, received_at)
+
+        raw = json.dumps(payload, separators=(',', ':'))
+        started = time.perf_counter()
+        for _ in range(self.repeat):
+            event = json.loads(raw)
+            if kind == 'patch':
+                apply_patch({}, event['record']['patch'])
+        parse_ms = (time.perf_counter() - started) * 1000 / self.repeat
+        with self.lock:
+            self.events.append((kind, raw, parse_ms))
+            self.lock.notify_all()
+
+    def wait_for(self, count: int, timeout: float = 10) -> bool:
+        with self.lock:
+            return self.lock.wait_for(lambda: len(self.events) >= count, timeout)
+
+    def take(self) -> list:
+        with self.lock:
+            events, self.events = self.events, []
+            return events
+
+
+def play(host: PocketBaseClient, log: EventLog, game_id: str, states: list, mode: str) -> dict:
+    """Write every transition in one mode; events are grouped per transition."""
+    log.take()
+    write_ms, transitions, missing = [], [], 0
+    previous = None
+    for seq, state in enumerate(states, start=1):
+        started = time.perf_counter()
+        if mode == 'full':
+            host.update('games', game_id, {'data': state})
+            expected = 1
+        else:
+            host.create('game_state_updates', {'game': game_id, 'seq': seq, 'patch': diff_state(previous, state)})
+            expected = 1
+            if seq % SNAPSHOT_EVERY == 0 or state['state'] == 'thanks':
+                host.update('games', game_id, {'data': {**state, 'seq': seq}})
+                expected = 2
+        write_ms.append((time.perf_counter() - started) * 1000)
+        if not log.wait_for(expected):
+            missing += 1
+        transitions.append(log.take())
+        previous = state
+
+    per_transition_bytes = [sum(len(raw) for _, raw, _ in events) for events in transitions]
+    per_transition_parse = [sum(ms for _, _, ms in events) for events in transitions]
+    return {
+        'transitions': len(states),
+        'missing_events': missing,
+        'bytes_total': sum(per_transition_bytes),
+        'bytes_per_transition': summarize(per_transition_bytes),
+        'parse_ms_per_transition': summarize(per_transition_parse),
+        'write_ms': summarize(write_ms),
+        'events': [(kind, raw) for events in transitions for kind, raw, _ in events],
+    }
+
+
+def browser_parse(payloads: list, repeat: int) -> list:
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        timings = page.evaluate(BROWSER_PARSE, [payloads, repeat])
+        browser.close()
+    return timings
+
+
+def run_benchmark(args):
+    rng = random.Random(args.seed)
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, HOST_EMAIL)
+    host = login(HOST_EMAIL)
+
+    print(f"🌱 DELTA BENCH: Game with {args.teams} teams on the scoreboard", flush=True)
+    game = create_game(host, f'Delta Bench {args.teams}', rounds=args.rounds,
+                       questions_per_round=args.questions_per_round, rng=rng)['game']
+    team_ids = [uuid.uuid4().hex[:15] for _ in range(args.teams)]
+    host.update('games', game['id'], {'scoreboard': scoreboard_for(team_ids, rng), 'data': {}})
+    states = game_transitions(args.rounds, args.questions_per_round, args.timer)
+
+    log = EventLog(game['id'], args.repeat)
+    realtime = RealtimeSubscription(host, [f"games/{game['id']}", *STATE_TOPICS], log.on_event).start()
+    modes = {}
+    try:
+        for mode in ('full', 'delta'):
+            print(f"🚀 DELTA BENCH: {len(states)} transitions ({mode})", flush=True)
+            modes[mode] = play(host, log, game['id'], states, mode)
+    finally:
+        realtime.stop()
+
+    final = log.follower.state(game['id'])
+    for mode, result in modes.items():
+        events = result.pop('events')
+        if args.browser:
+            timings = browser_parse(events, args.repeat)
+            result['browser_parse_ms_total'] = sum(timings)
+            result['browser_parse_ms_per_event'] = summarize(timings)
+
+    full, delta = modes['full'], modes['delta']
+    return {
+        'config': vars(args),
+        'modes': modes,
+        'bytes_reduction': full['bytes_total'] / delta['bytes_total'] if delta['bytes_total'] else None,
+        'follower_matches': final == states[-1],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark delta-encoded game state against full games.data writes')
+    parser.add_argument('--teams', type=int, default=100, help='Teams on the scoreboard')
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--questions-per-round', type=int, default=5)
+    parser.add_argument('--timer', type=int, default=20, help='Question timer in seconds')
+    parser.add_argument('--repeat', type=int, default=50, help='Parse repetitions per event')
+    parser.add_argument('--browser', action='store_true', help='Also time JSON.parse in Chromium')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 STATE DELTA RESULTS")
+    print("=" * 60)
+    for mode, stats in result['modes'].items():
+        print(f"{mode}: {stats['transitions']} transitions, {stats['bytes_total'] / 1024:.1f}KB delivered, "
+              f"{stats['missing_events']} missing events")
+        print(format_summary('  Bytes/transition', stats['bytes_per_transition']))
+        print(format_summary('  Parse ms/transition', stats['parse_ms_per_transition']))
+        print(format_summary('  Write ms', stats['write_ms']))
+        if 'browser_parse_ms_total' in stats:
+            print(f"  Browser parse: {stats['browser_parse_ms_total']:.2f}ms over the game")
+    if result['bytes_reduction']:
+        print(f"Bytes full/delta: {result['bytes_reduction']:.1f}x")
+    print(f"Follower matches final state: {result['follower_matches']}")
+    print(f"📄 Report: {write_report('state_deltas', result)}")
+
+    ok = result['follower_matches'] and not any(m['missing_events'] for m in result['modes'].values())
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Timer precision benchmark - runs many fully timed games through the real UI.
+
+Every game gets all TimersAccordion timers set, one ControllerPage (host)
+and a few GamePage (player) tabs. The controller auto-advances each state
+when its timer expires, so a game plays itself to the "thanks" screen.
+
+Measures:
+- advance lateness: realtime receipt of the next state minus the previous
+  timer's expiresAt (includes handleNextState's fetches and the write)
+- scheduling lateness: the controller's own expiry callback minus
+  expiresAt, read back from the `timer-expiry` performance marks
+- countdown disagreement: max - min of the displayed countdown across a
+  game's tabs, sampled together
+
+Host tabs can be CPU throttled through CDP to model a slow host laptop.
+
+With --trace, the first game's controller tab and --trace-players of its
+player tabs record Chrome performance traces (harness.trace). The report
+gains their long tasks, scripting time per state transition and frame
+drops, and the raw traces are kept in ./tmp/traces.
+
+    python -m harness.bench_timer_drift --games 5 --players 3 --cpu-throttle 4
+    python -m harness.bench_timer_drift --games 1 --trace --trace-players 2
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+from playwright.sync_api import sync_playwright
+
+from harness.browser import app_url, new_authenticated_context, set_cpu_throttling
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, iso_time, parse_time
+from harness.seed import create_game, ensure_user, join_game, login
+from harness.stats import format_summary, summarize, write_report
+from harness.trace import PageTrace, analyze_trace
+
+COUNTDOWN_SELECTOR = '.fixed.bottom-4.right-4 span.tabular-nums'
+
+READ_EXPIRY_MARKS = """() => performance.getEntriesByName('timer-expiry')
+    .map(entry => entry.detail && entry.detail.lateness)
+    .filter(lateness => typeof lateness === 'number')"""
+
+
+class TransitionTracker:
+    """Follows games.data over realtime and times each state change."""
+
+    def __init__(self, game_ids):
+        self.lock = threading.Lock()
+        self.last = {game_id: None for game_id in game_ids}  # game id -> previous games.data
+        self.lateness = []
+        self.transitions = {game_id: 0 for game_id in game_ids}
+        self.history = {game_id: [] for game_id in game_ids}  # (received_at, state)
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        game_id = record.get('id')
+        if game_id not in self.last or payload.get('action') != 'update':
+            return
+        data = record.get('data') or {}
+        with self.lock:
+            previous = self.last[game_id]
+            self.last[game_id] = data
+            if previous is None or self._key(previous) == self._key(data):
+                return
+            self.transitions[game_id] += 1
+            self.history[game_id].append((received_at, data.get('state')))
+            timer = previous.get('timer') or {}
+            if timer.get('expiresAt') and not timer.get('isPaused'):
+                self.lateness.append((received_at - parse_time(timer['expiresAt'])) * 1000)
+
+    @staticmethod
+    def _key(data):
+        question = data.get('question') or {}
+        return data.get('state'), question.get('id'), question.get('correct_answer')
+
+    def finished(self, game_id):
+        with self.lock:
+            data = self.last[game_id] or {}
+        return data.get('state') == 'thanks'
+
+
+def sample_countdowns(pages):
+    """Displayed seconds on each page that currently shows a countdown."""
+    values = []
+    for page in pages:
+        try:
+            text = page.locator(COUNTDOWN_SELECTOR).first.inner_text(timeout=50)
+        except Exception:
+            continue
+        if text.strip().isdigit():
+            values.append(int(text.strip()))
+    return values
+
+
+def run_benchmark(args):
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    timers = {
+        'game_start_timer': args.state_timer,
+        'round_start_timer': args.state_timer,
+        'question_timer': args.question_timer,
+        'answer_timer': args.state_timer,
+        'round_end_timer': args.state_timer,
+        'game_end_timer': args.state_timer,
+        # No thanks_timer: the game stops on the thanks screen
+    }
+
+    print(f"🌱 TIMER BENCH: Seeding {args.games} games with {args.players} players each", flush=True)
+    games = []
+    for g in range(args.games):
+        host_email = f'timerhost{g + 1}@example.com'
+        ensure_user(admin, host_email)
+        host = login(host_email)
+        built = create_game(host, f'Timer Bench {g + 1}', rounds=args.rounds,
+                            questions_per_round=args.questions_per_round, metadata=timers)
+        players = []
+        for p in range(args.players):
+            email = f'timerplayer{g + 1}_{p + 1}@example.com'
+            ensure_user(admin, email)
+            player = login(email)
+            join_game(player, built['game'], team_name=f'Team {p + 1}')
+            players.append(player)
+        games.append({'host': host, 'built': built, 'players': players, 'pages': []})
+
+    tracker = TransitionTracker([entry['built']['game']['id'] for entry in games])
+    realtime = RealtimeSubscription(admin, ['games/*', *STATE_TOPICS],
+                                    GameStateFollower(tracker.on_event).on_event).start()
+
+    disagreement = []
+    host_pages = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+
+        for entry in games:
+            game_id = entry['built']['game']['id']
+            context = new_authenticated_context(browser, entry['host'])
+            host_page = context.new_page()
+            host_page.goto(app_url(f'/controller/{game_id}'))
+            set_cpu_throttling(host_page, args.cpu_throttle)
+            host_pages.append(host_page)
+            entry['pages'].append(host_page)
+            for player in entry['players']:
+                player_page = new_authenticated_context(browser, player).new_page()
+                player_page.goto(app_url(f'/game/{game_id}'))
+                entry['pages'].append(player_page)
+
+        for page in (page for entry in games for page in entry['pages']):
+            page.wait_for_load_state('networkidle')
+
+        traces = []
+        if args.trace:
+            traced = games[0]['pages'][:1 + args.trace_players]
+            traces = [(('host' if i == 0 else f'player{i}'), PageTrace(page).start()) for i, page in enumerate(traced)]
+
+        # Start every game the same way: a game-start timer the controller
+        # will pick up and act on
+        print(f"🚀 TIMER BENCH: Starting {len(games)} games", flush=True)
+        now = time.time()
+        for entry in games:
+            entry['host'].update('games', entry['built']['game']['id'], {'data': {
+                'state': 'game-start',
+                'timer': {'startedAt': iso_time(now), 'duration': args.state_timer,
+                          'expiresAt': iso_time(now + args.state_timer)},
+            }})
+
+        deadline = time.time() + args.timeout
+        while time.time() < deadline:
+            running = [entry for entry in games if not tracker.finished(entry['built']['game']['id'])]
+            if not running:
+                break
+            for entry in running:
+                values = sample_countdowns(entry['pages'])
+                if len(values) > 1:
+                    disagreement.append(max(values) - min(values))
+            time.sleep(args.sample_interval)
+
+        trace_reports = []
+        if traces:
+            game_id = games[0]['built']['game']['id']
+            with tracker.lock:
+                transitions = [(at, state) for at, state in tracker.history[game_id]]
+            stamp = time.strftime('%Y%m%d-%H%M%S')
+            for role, trace in traces:
+                path = os.path.join('./tmp/traces', f'timer_drift_{stamp}_{role}.json')
+                try:
+                    events = trace.stop(path)
+                except Exception as e:
+                    print(f"⚠️ TIMER BENCH: Could not collect the {role} trace: {e}", flush=True)
+                    continue
+                trace_reports.append({'role': role, 'path': path, **analyze_trace(events, transitions)})
+
+        scheduling = []
+        for page in host_pages:
+            try:
+                scheduling.extend(page.evaluate(READ_EXPIRY_MARKS))
+            except Exception as e:
+                print(f"⚠️ TIMER BENCH: Could not read expiry marks: {e}", flush=True)
+
+        browser.close()
+
+    realtime.stop()
+
+    report = {
+        'config': vars(args),
+        'completed_games': sum(1 for entry in games if tracker.finished(entry['built']['game']['id'])),
+        'transitions': sum(tracker.transitions.values()),
+        'advance_lateness_ms': summarize(tracker.lateness),
+        'scheduling_lateness_ms': summarize(scheduling),
+        'countdown_disagreement_s': summarize(disagreement),
+        'traces': trace_reports,
+    }
+
+    if not args.keep:
+        for entry in games:
+            try:
+                entry['host'].delete('games', entry['built']['game']['id'])
+            except PocketBaseError:
+                pass
+
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Measure timer auto-advance precision across concurrent games')
+    parser.add_argument('--games', type=int, default=3, help='Concurrent games')
+    parser.add_argument('--players', type=int, default=2, help='Player tabs per game')
+    parser.add_argument('--rounds', type=int, default=2)
+    parser.add_argument('--questions-per-round', type=int, default=3)
+    parser.add_argument('--question-timer', type=int, default=5, help='Seconds per question')
+    parser.add_argument('--state-timer', type=int, default=3, help='Seconds for every other timed state')
+    parser.add_argument('--cpu-throttle', type=float, default=1, help='CDP CPU slowdown for host tabs (e.g. 4)')
+    parser.add_argument('--sample-interval', type=float, default=0.25, help='Seconds between countdown samples')
+    parser.add_argument('--timeout', type=float, default=600, help='Seconds to wait for all games to finish')
+    parser.add_argument('--trace', action='store_true',
+                        help="Record Chrome performance traces of the first game's host and players")
+    parser.add_argument('--trace-players', type=int, default=1, help='Player tabs to trace with --trace')
+    parser.add_argument('--keep', action='store_true', help='Keep seeded games after the run')
+    args = parser.parse_args()
+
+    result = run_benchmark(args)
+
+    print("\n" + "=" * 60)
+    print("📊 TIMER DRIFT RESULTS")
+    print("=" * 60)
+    print(f"Games completed: {result['completed_games']}/{args.games} ({result['transitions']} transitions)")
+    print(format_summary('Advance lateness', result['advance_lateness_ms']))
+    print(format_summary('Scheduling lateness', result['scheduling_lateness_ms']))
+    print(format_summary('Countdown disagreement', result['countdown_disagreement_s'], unit='s'))
+    for trace in result['traces']:
+        scripting = {}
+        for transition in trace['transitions']:
+            scripting.setdefault(transition['state'], []).append(transition['scripting_ms'])
+        print(f"🔬 {trace['role']}: {trace['long_tasks']} long tasks, {trace['scripting_ms_total']:.0f}ms scripting, "
+              f"{trace['frames_dropped']}/{trace['frames_drawn'] + trace['frames_dropped']} frames dropped "
+              f"({trace['path']})")
+        for state, values in scripting.items():
+            print(format_summary(f'   Scripting in {state}', summarize(values)))
+    print(f"📄 Report: {write_report('timer_drift', result)}")
+
+    sys.exit(0 if result['completed_games'] == args.games else 1)
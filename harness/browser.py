@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Playwright helpers for harness scenarios that need real app pages.
+
+Pages here skip the login form: the user is authenticated over REST and
+the token is written to the same localStorage key the PocketBase JS SDK
+reads on startup. harness.sessions caches those tokens on disk.
+"""
+
+import json
+import queue
+import threading
+import urllib.parse
+
+from harness.pocketbase import APP_URL, DISPLAY_URL, PocketBaseClient
+
+# LocalAuthStore default key in the pocketbase JS SDK
+PB_AUTH_STORAGE_KEY = 'pocketbase_auth'
+
+# Lean client profile: what a load client never needs to fetch or paint
+LEAN_BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media')
+LEAN_BLOCKED_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'segment.io', 'plausible.io', 'sentry.io', 'hotjar.com',
+)
+LEAN_CONTEXT_OPTIONS = {
+    'viewport': {'width': 360, 'height': 640},
+    'device_scale_factor': 1,
+    'reduced_motion': 'reduce',
+}
+# Named player devices: CPU slowdown and network conditions (None = unthrottled).
+# Network numbers follow Chrome DevTools' presets; latency is added per request.
+DEVICE_PROFILES = {
+    'desktop': {'cpu': 1, 'network': None},
+    'venue-wifi': {'cpu': 1, 'network': {'latency_ms': 40, 'download_kbps': 10000, 'upload_kbps': 2000}},
+    'venue-wifi-3g': {'cpu': 1, 'network': {'latency_ms': 150, 'download_kbps': 1600, 'upload_kbps': 750}},
+    'slow-3g': {'cpu': 1, 'network': {'latency_ms': 400, 'download_kbps': 400, 'upload_kbps': 400}},
+    'mid-range-android': {'cpu': 4, 'network': {'latency_ms': 40, 'download_kbps': 10000, 'upload_kbps': 2000}},
+    'low-end-android': {'cpu': 6, 'network': {'latency_ms': 150, 'download_kbps': 1600, 'upload_kbps': 750}},
+}
+
+# Playwright console message types by severity; anything unlisted ranks as 'log'
+CONSOLE_LEVELS = {'debug': 0, 'log': 1, 'info': 1, 'warning': 2, 'error': 3}
+
+# localStorage key src/lib/logger.ts reads its level from, and the app
+# level that matches each capture level
+LOG_LEVEL_STORAGE_KEY = 'trivia_log_level'
+APP_LOG_LEVELS = {'debug': 'debug', 'log': 'info', 'info': 'info', 'warning': 'warn', 'error': 'error'}
+
+NO_ANIMATIONS_SCRIPT = """(() => {
+  const add = () => {
+    const style = document.createElement('style')
+    style.textContent = '*, *::before, *::after { animation: none !important; transition: none !important; }'
+    document.documentElement.appendChild(style)
+  }
+  if (document.documentElement) add()
+  else document.addEventListener('DOMContentLoaded', add)
+})()"""
+
+
+def auth_storage_value(token: str, record: dict) -> str:
+    """localStorage value for PB_AUTH_STORAGE_KEY (SDK reads record, older code model)."""
+    return json.dumps({'token': token, 'record': record, 'model': record})
+
+
+def auth_init_script(client: PocketBaseClient) -> str:
+    """JS snippet that seeds the SDK auth store before any app code runs."""
+    payload = auth_storage_value(client.token, client.record)
+    return f"window.localStorage.setItem({json.dumps(PB_AUTH_STORAGE_KEY)}, {json.dumps(payload)});"
+
+
+def new_authenticated_context(browser, client: PocketBaseClient, **context_options):
+    """Browser context whose pages start signed in as client's user."""
+    context = browser.new_context(**context_options)
+    context.add_init_script(auth_init_script(client))
+    return context
+
+
+def set_cpu_throttling(page, rate: float):
+    """Slow the page's CPU by rate (1 = no throttling) via CDP."""
+    if rate and rate > 1:
+        cdp = page.context.new_cdp_session(page)
+        cdp.send('Emulation.setCPUThrottlingRate', {'rate': rate})
+        return cdp
+    return None
+
+
+def emulate_device(page, profile: str):
+    """Apply a DEVICE_PROFILES entry to one page via CDP."""
+    settings = DEVICE_PROFILES[profile]
+    cdp = page.context.new_cdp_session(page)
+    network = settings['network']
+    if network:
+        cdp.send('Network.enable')
+        cdp.send('Network.emulateNetworkConditions', {
+            'offline': False,
+            'latency': network['latency_ms'],
+            'downloadThroughput': network['download_kbps'] * 1000 / 8,
+            'uploadThroughput': network['upload_kbps'] * 1000 / 8,
+        })
+    cdp.send('Emulation.setCPUThrottlingRate', {'rate': settings['cpu']})
+    return cdp
+
+
+def apply_device_profile(context, profile: str):
+    """Emulate a DEVICE_PROFILES entry on every current and future page of context."""
+    if profile not in DEVICE_PROFILES:
+        raise ValueError(f"Unknown device profile '{profile}' (known: {', '.join(DEVICE_PROFILES)})")
+    for page in context.pages:
+        emulate_device(page, profile)
+    context.on('page', lambda page: emulate_device(page, profile))
+    return context
+
+
+def proxy_launch_options(proxy_url: str = None) -> dict:
+    """chromium.launch() options sending every request through a harness.proxy listener."""
+    if not proxy_url:
+        return {}
+    # Chromium never proxies localhost unless the bypass list says so
+    return {'proxy': {'server': proxy_url, 'bypass': '<-loopback>'}}
+
+
+def app_log_level_script(level: str) -> str:
+    """
+    Init script setting the app logger (src/lib/logger.ts) to match a
+    CONSOLE_LEVELS capture level, so filtered messages are never logged.
+    """
+    value = APP_LOG_LEVELS[level]
+    return f"window.localStorage.setItem({json.dumps(LOG_LEVEL_STORAGE_KEY)}, {json.dumps(value)});"
+
+
+class ConsoleCapture:
+    """
+    Page console output at or above level, written to a file off the
+    Playwright event thread.
+
+    The console handler only filters and queues; a writer thread formats,
+    echoes and writes, flushing when the queue runs dry rather than per line.
+
+        capture = ConsoleCapture('./tmp/player1_console.log', 'info', echo='PLAYER1')
+        capture.attach(page)
+        ...
+        capture.close()
+
+    Args:
+        path: Log file
+        level: Lowest CONSOLE_LEVELS type written
+        echo: Also print captured lines to stdout with this prefix
+    """
+
+    def __init__(self, path: str, level: str = 'info', echo: str = None):
+        self.min_rank = CONSOLE_LEVELS[level]
+        self.echo = echo
+        self.captured = 0
+        self.skipped = 0
+        self._queue = queue.SimpleQueue()
+        self._file = open(path, 'w')
+        self._writer = threading.Thread(target=self._write, daemon=True)
+        self._writer.start()
+
+    def attach(self, page):
+        page.on('console', self._on_console)
+        page.on('pageerror', self._on_error)
+        return page
+
+    def _on_console(self, msg):
+        kind = msg.type
+        if CONSOLE_LEVELS.get(kind, 1) < self.min_rank:
+            self.skipped += 1
+            return
+        self.captured += 1
+        self._queue.put(('CONSOLE ' + kind, msg))
+
+    def _on_error(self, error):
+        self.captured += 1
+        self._queue.put(('ERROR', error))
+
+    def _write(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            tag, entry = item
+            line = f"[{tag}] {entry.text if tag != 'ERROR' else entry}"
+            if self.echo:
+                print(f"{self.echo}: {line}", flush=True)
+            self._file.write(line + '\n')
+            if self._queue.empty():
+                self._file.flush()
+        self._file.close()
+
+    def close(self):
+        """Write out everything queued and close the file."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+
+def app_url(path: str) -> str:
+    return f"{APP_URL.rstrip('/')}{path}"
+
+
+def display_url(path: str = '/') -> str:
+    return f"{DISPLAY_URL.rstrip('/')}{path}"
+
+
+def apply_lean_profile(context, blocked: dict = None):
+    """
+    Block images, fonts, media and analytics and switch off animations.
+
+    The React app and the PocketBase realtime stream are left alone - the
+    realtime URL is not even routed, so the SSE connection never passes
+    through Playwright. Aborted requests are counted into blocked by
+    resource type when a dict is given.
+    """
+    def handle(route):
+        request = route.request
+        host = urllib.parse.urlsplit(request.url).hostname or ''
+        if request.resource_type in LEAN_BLOCKED_RESOURCE_TYPES or host.endswith(LEAN_BLOCKED_HOSTS):
+            if blocked is not None:
+                blocked[request.resource_type] = blocked.get(request.resource_type, 0) + 1
+            route.abort()
+        else:
+            route.continue_()
+
+    context.route(lambda url: '/api/realtime' not in url, handle)
+    context.add_init_script(NO_ANIMATIONS_SCRIPT)
+    return context
+
+
+def new_lean_context(browser, blocked: dict = None, **context_options):
+    """Small-viewport, reduced-motion context with the lean profile applied."""
+    context = browser.new_context(**{**LEAN_CONTEXT_OPTIONS, **context_options})
+    return apply_lean_profile(context, blocked)
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Throwaway PocketBase per run or worker, restored from a snapshot.
+
+The benchmarks used to share the one PocketBase (and Vite) that dev.sh
+starts, so one run's games, answers and scoreboards were another run's
+starting state, and two runs at once measured each other.
+EphemeralPocketBase starts a private PocketBase on a free port:
+
+- pb_data lives in tmpfs (/dev/shm, override with HARNESS_TMPFS)
+- pb_migrations and pb_hooks come from this checkout, and pending
+  migrations are applied on startup
+- a snapshot (superuser, test users, questions) is restored by copying
+  the database files, not by replaying API calls
+
+    with EphemeralPocketBase().start() as pb:
+        admin = PocketBaseClient(pb.url)
+
+Most modules read PB_URL at import time, so the usual way in is to run a
+command against its own instance; PB_URL and HARNESS_SESSION_DIR are set
+for it:
+
+    python -m harness.fixture snapshot --from pb_data
+    python -m harness.fixture run -- python -m harness.bench_join_storm --players 50
+    python -m harness.fixture run --app -- python test_orchestrator.py --session-cache
+    python -m harness.fixture startup --count 4
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from harness.pocketbase import SUPERUSER_EMAIL, SUPERUSER_PASSWORD, PocketBaseClient, iso_time
+from harness.seed import ensure_user
+from harness.stats import summarize, write_report
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS_DIR = os.path.join(ROOT, 'pb_migrations')
+HOOKS_DIR = os.path.join(ROOT, 'pb_hooks')
+POCKETBASE_BIN = os.environ.get('PB_BINARY', 'pocketbase')
+TMPFS_DIR = os.environ.get('HARNESS_TMPFS', '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir())
+SNAPSHOT_DIR = os.environ.get('HARNESS_PB_SNAPSHOT', './tmp/pb_snapshot')
+
+# pb_data files a snapshot carries; storage holds uploaded files (avatars)
+DB_FILES = ('data.db', 'auxiliary.db')
+STORAGE_DIR = 'storage'
+
+# Accounts test_host.py and test_player.py sign in with
+TEST_EMAILS = ['host1@example.com', 'user1@example.com', 'user2@example.com',
+               'user3@example.com', 'user4@example.com']
+
+# Vite dev servers the fixture can start next to PocketBase
+APP_DIRS = {'app': ROOT, 'display': os.path.join(ROOT, 'trivia-party-display')}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_http(url: str, process: subprocess.Popen, timeout: float) -> bool:
+    """Poll url until it answers 2xx; False if process exits or time runs out."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return False
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return True
+        except (urllib.error.URLError, ConnectionError, OSError):
+            time.sleep(0.02)
+    return False
+
+
+def backup_data_dir(source: str, destination: str):
+    """
+    Consistent copy of a pb_data that may be in use, via SQLite's online
+    backup (the WAL is folded in). Used to take a snapshot of the dev data.
+    """
+    os.makedirs(destination, exist_ok=True)
+    for name in DB_FILES:
+        path = os.path.join(source, name)
+        if not os.path.exists(path):
+            continue
+        src = sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+        dst = sqlite3.connect(os.path.join(destination, name))
+        try:
+            src.backup(dst)
+        finally:
+            src.close()
+            dst.close()
+    if os.path.isdir(os.path.join(source, STORAGE_DIR)):
+        shutil.copytree(os.path.join(source, STORAGE_DIR), os.path.join(destination, STORAGE_DIR), dirs_exist_ok=True)
+
+
+def copy_data_dir(source: str, destination: str):
+    """Restore a snapshot: plain file copies, no PocketBase involved."""
+    os.makedirs(destination, exist_ok=True)
+    for name in os.listdir(source):
+        path = os.path.join(source, name)
+        if os.path.isdir(path):
+            shutil.copytree(path, os.path.join(destination, name))
+        else:
+            shutil.copyfile(path, os.path.join(destination, name))
+
+
+class EphemeralPocketBase:
+    """
+    A private PocketBase process with pb_data in tmpfs.
+
+    Args:
+        snapshot: pb_data directory to restore (None = empty database)
+        port: Port to listen on (0 picks a free one)
+        superuser: Upsert the harness superuser before serving (needed
+            for an empty database; snapshots already have it)
+        tmpfs: Directory the instance's pb_data is created under
+        log_path: Where PocketBase's output goes (default: discarded)
+    """
+
+    def __init__(self, snapshot: str = None, port: int = 0, superuser: bool = None, tmpfs: str = TMPFS_DIR,
+                 log_path: str = None):
+        self.snapshot = snapshot
+        self.port = port or free_port()
+        self.superuser = snapshot is None if superuser is None else superuser
+        self.tmpfs = tmpfs
+        self.log_path = log_path
+        self.root = None
+        self.process = None
+        self.startup_s = None
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.port}'
+
+    @property
+    def data_dir(self) -> str:
+        return os.path.join(self.root, 'pb_data')
+
+    def env(self) -> dict:
+        """Environment for a child process that should use this instance."""
+        return {**os.environ, 'PB_URL': self.url, 'HARNESS_SESSION_DIR': os.path.join(self.root, 'sessions')}
+
+    def _command(self, *args) -> list:
+        return [POCKETBASE_BIN, *args, f'--dir={self.data_dir}', f'--migrationsDir={MIGRATIONS_DIR}']
+
+    def start(self, timeout: float = 30):
+        started = time.time()
+        self.root = tempfile.mkdtemp(prefix='pb-fixture-', dir=self.tmpfs)
+        try:
+            self._start(timeout)
+        except BaseException:
+            self.stop()
+            raise
+        self.startup_s = time.time() - started
+        return self
+
+    def _start(self, timeout: float):
+        if self.snapshot:
+            copy_data_dir(self.snapshot, self.data_dir)
+        else:
+            os.makedirs(self.data_dir)
+        if self.superuser:
+            subprocess.run(self._command('superuser', 'upsert', SUPERUSER_EMAIL, SUPERUSER_PASSWORD),
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+
+        log = open(self.log_path, 'ab') if self.log_path else subprocess.DEVNULL
+        self.process = subprocess.Popen(
+            self._command('serve', f'--http=127.0.0.1:{self.port}', f'--hooksDir={HOOKS_DIR}', '--hooksWatch=false'),
+            stdout=log, stderr=subprocess.STDOUT)
+        if log is not subprocess.DEVNULL:
+            log.close()
+        if not wait_for_http(f'{self.url}/api/health', self.process, timeout):
+            raise RuntimeError(f'PocketBase did not become healthy on {self.url} within {timeout}s')
+
+    def stop(self, keep: bool = False):
+        """Stop PocketBase; the data directory is removed unless keep."""
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        if not keep and self.root:
+            shutil.rmtree(self.root, ignore_errors=True)
+            self.root = None
+
+    def save(self, path: str):
+        """Write this (stopped, kept) instance's pb_data as a snapshot at path."""
+        staging = f'{path}.tmp'
+        shutil.rmtree(staging, ignore_errors=True)
+        backup_data_dir(self.data_dir, staging)
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(staging, path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def start_app_server(name: str, pb_url: str, timeout: float = 60) -> tuple:
+    """
+    Vite dev server for APP_DIRS[name] on a free port, talking to pb_url
+    (VITE_POCKETBASE_URL). Returns (process, url).
+    """
+    port = free_port()
+    process = subprocess.Popen(
+        ['npx', 'vite', '--host', '127.0.0.1', '--port', str(port), '--strictPort'],
+        cwd=APP_DIRS[name], env={**os.environ, 'VITE_POCKETBASE_URL': pb_url},
+        stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+    url = f'http://127.0.0.1:{port}'
+    if not wait_for_http(url, process, timeout):
+        process.terminate()
+        raise RuntimeError(f'Vite ({name}) did not start on {url} within {timeout}s')
+    return process, url
+
+
+def seed_questions(admin: PocketBaseClient, count: int):
+    """Synthetic question bank so harness.seed.create_game works on an empty database."""
+    categories = ['History', 'Science', 'Sports', 'Geography', 'Music']
+    for i in range(count):
+        admin.create('questions', {
+            'category': categories[i % len(categories)],
+            'subcategory': 'Harness',
+            'difficulty': ('easy', 'medium', 'hard')[i % 3],
+            'question': f'Synthetic question {i + 1}?',
+            'answer_a': 'Alpha', 'answer_b': 'Bravo', 'answer_c': 'Charlie', 'answer_d': 'Delta',
+            'imported_at': iso_time(time.time()),
+        })
+
+
+def build_snapshot(args):
+    staging = None
+    source = None
+    if args.source:
+        staging = tempfile.mkdtemp(prefix='pb-source-', dir=TMPFS_DIR)
+        backup_data_dir(args.source, staging)
+        source = staging
+
+    print(f"🧪 FIXTURE: Building snapshot from {args.source or 'an empty database'}", flush=True)
+    pb = EphemeralPocketBase(snapshot=source, superuser=True).start()
+    try:
+        admin = PocketBaseClient(pb.url)
+        admin.auth_superuser()
+        emails = list(args.emails)
+        for prefix_count in args.bulk:
+            prefix, _, count = prefix_count.partition(':')
+            emails += [f'{prefix}{i + 1}@example.com' for i in range(int(count))]
+        for email in emails:
+            ensure_user(admin, email)
+        questions = admin.get_list('questions', page=1, per_page=1).get('totalItems', 0)
+        if questions < args.questions:
+            seed_questions(admin, args.questions - questions)
+        pb.stop(keep=True)
+        pb.save(args.out)
+    finally:
+        pb.stop()
+        if staging:
+            shutil.rmtree(staging, ignore_errors=True)
+    print(f"✅ FIXTURE: Snapshot with {len(emails)} users saved to {args.out}", flush=True)
+    return 0
+
+
+def run_command(args):
+    command = args.command[1:] if args.command[:1] == ['--'] else args.command
+    if not command:
+        print("❌ FIXTURE: Nothing to run (python -m harness.fixture run -- COMMAND)")
+        return 2
+    snapshot = args.snapshot if os.path.isdir(args.snapshot) else None
+    if snapshot is None:
+        print(f"⚠️  FIXTURE: No snapshot at {args.snapshot}, starting from an empty database", flush=True)
+
+    servers = []
+    with EphemeralPocketBase(snapshot=snapshot, log_path=args.log).start() as pb:
+        env = pb.env()
+        print(f"🧪 FIXTURE: PocketBase at {pb.url} ready in {pb.startup_s:.2f}s", flush=True)
+        try:
+            for name, var in (('app', 'APP_URL'), ('display', 'DISPLAY_URL')):
+                if getattr(args, name):
+                    process, env[var] = start_app_server(name, pb.url)
+                    servers.append(process)
+                    print(f"🧪 FIXTURE: {name} at {env[var]}", flush=True)
+            return subprocess.call(command, env=env)
+        finally:
+            for process in servers:
+                process.terminate()
+                process.wait()
+
+
+def run_startup_check(args):
+    """Start --count instances at once, time them, and check none sees another's writes."""
+    snapshot = args.snapshot if os.path.isdir(args.snapshot) else None
+    instances = [EphemeralPocketBase(snapshot=snapshot) for _ in range(args.count)]
+    errors = []
+
+    def start(pb):
+        try:
+            pb.start()
+        except (RuntimeError, OSError, subprocess.CalledProcessError) as e:
+            errors.append(str(e))
+
+    print(f"🚀 FIXTURE: Starting {args.count} instances at once from "
+          f"{snapshot or 'an empty database'}", flush=True)
+    started = time.time()
+    threads = [threading.Thread(target=start, args=(pb,)) for pb in instances]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    all_ready_s = time.time() - started
+
+    running = [pb for pb in instances if pb.process is not None]
+    isolated = True
+    try:
+        admins = []
+        for i, pb in enumerate(running):
+            admin = PocketBaseClient(pb.url)
+            admin.auth_superuser()
+            ensure_user(admin, f'isolation{i + 1}@example.com')
+            admins.append(admin)
+        for admin in admins:
+            seen = admin.get_list('users', page=1, per_page=1, filter='email ~ "isolation"').get('totalItems', 0)
+            isolated = isolated and seen == 1
+    finally:
+        for pb in instances:
+            pb.stop()
+
+    return {
+        'config': vars(args),
+        'started': len(running),
+        'errors': errors,
+        'all_ready_s': all_ready_s,
+        'startup_s': summarize([pb.startup_s * 1000 for pb in running]),
+        'isolated': isolated,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Isolated PocketBase instances for harness runs')
+    commands = parser.add_subparsers(dest='action', required=True)
+
+    snapshot_parser = commands.add_parser('snapshot', help='Build the snapshot instances are restored from')
+    snapshot_parser.add_argument('--from', dest='source', metavar='PB_DATA',
+                                 help='Start from this pb_data (e.g. the dev one; safe while it is running)')
+    snapshot_parser.add_argument('--out', default=SNAPSHOT_DIR)
+    snapshot_parser.add_argument('--emails', nargs='*', default=TEST_EMAILS, help='Users to create')
+    snapshot_parser.add_argument('--bulk', nargs='*', default=[], metavar='PREFIX:N',
+                                 help='Also create PREFIX1..PREFIXN@example.com, e.g. answerplayer:200')
+    snapshot_parser.add_argument('--questions', type=int, default=50,
+                                 help='Top the question bank up to this many synthetic questions')
+
+    run_parser = commands.add_parser('run', help='Run a command against its own instance')
+    run_parser.add_argument('--snapshot', default=SNAPSHOT_DIR)
+    run_parser.add_argument('--app', action='store_true', help='Also start the web app (APP_URL)')
+    run_parser.add_argument('--display', action='store_true', help='Also start the display app (DISPLAY_URL)')
+    run_parser.add_argument('--log', metavar='PATH', help="Append PocketBase's output to PATH")
+    run_parser.add_argument('command', nargs=argparse.REMAINDER)
+
+    startup_parser = commands.add_parser('startup', help='Time concurrent instance startup and check isolation')
+    startup_parser.add_argument('--snapshot', default=SNAPSHOT_DIR)
+    startup_parser.add_argument('--count', type=int, default=4)
+
+    args = parser.parse_args()
+
+    if args.action == 'snapshot':
+        sys.exit(build_snapshot(args))
+    if args.action == 'run':
+        sys.exit(run_command(args))
+
+    result = run_startup_check(args)
+
+    print("\n" + "=" * 60)
+    print("📊 FIXTURE STARTUP RESULTS")
+    print("=" * 60)
+    print(f"Started {result['started']}/{args.count}, all ready in {result['all_ready_s']:.2f}s")
+    if result['startup_s'].get('count'):
+        print(f"Startup: p50={result['startup_s']['p50'] / 1000:.2f}s max={result['startup_s']['max'] / 1000:.2f}s")
+    for error in result['errors']:
+        print(f"❌ {error}")
+    print(f"Isolated: {result['isolated']}")
+    print(f"📄 Report: {write_report('fixture_startup', result)}")
+
+    sys.exit(0 if result['started'] == args.count and result['isolated'] else 1)
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Follow a game's state the way the clients do (src/lib/gameState.ts).
+
+The controller no longer rewrites games.data on every transition. Each
+transition is a game_state_updates record holding a JSON merge patch and a
+per-game seq, and games.data carries a full snapshot (with its seq) every
+few updates. Trackers that used to read games.data off games/<id> events
+wrap their on_event in a GameStateFollower and keep seeing a games record
+whose data is the current state:
+
+    follower = GameStateFollower(tracker.on_event)
+    RealtimeSubscription(admin, [f"games/{game_id}", *STATE_TOPICS], follower.on_event).start()
+"""
+
+import json
+import threading
+
+# Realtime topics carrying the patches; the follower filters by game itself
+STATE_TOPICS = ['game_state_updates/*']
+
+
+def diff_state(prev: dict, new: dict):
+    """JSON merge patch turning prev into new, or None when they are equal."""
+    prev = prev or {}
+    patch = {}
+    for key in prev:
+        if key not in new:
+            patch[key] = None
+    for key, value in new.items():
+        old = prev.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = diff_state(old, value)
+            if nested:
+                patch[key] = nested
+        elif key not in prev or value != old:
+            patch[key] = value
+    return patch or None
+
+
+def apply_patch(state: dict, patch: dict) -> dict:
+    """Apply a JSON merge patch (RFC 7386), returning a new dict."""
+    result = dict(state or {})
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        elif isinstance(value, dict):
+            result[key] = apply_patch(result[key] if isinstance(result.get(key), dict) else {}, value)
+        else:
+            result[key] = value
+    return result
+
+
+def parse_snapshot(data) -> tuple:
+    """Split games.data into (state, seq); seq is None for unversioned writes."""
+    if isinstance(data, str):
+        data = json.loads(data) if data else None
+    if not isinstance(data, dict):
+        return None, None
+    state = dict(data)
+    seq = state.pop('seq', None)
+    return state, seq if isinstance(seq, int) else None
+
+
+class GameStateFollower:
+    """
+    Rebuild each game's state from games snapshots and state patches.
+
+    Every games event and every patch that moves a game's state forward is
+    passed on to on_event as a games update whose record['data'] is the
+    rebuilt state. Patches that arrive ahead of a missing seq wait for it
+    (or for the next snapshot that covers it). games.data written without
+    a seq counts as the state before patch 1. Events from other topics are
+    passed through untouched.
+    """
+
+    def __init__(self, on_event):
+        self.wrapped = on_event
+        self.lock = threading.Lock()
+        self.games = {}  # game id -> {'state', 'seq', 'pending', 'record'}
+
+    def _game(self, game_id: str) -> dict:
+        return self.games.setdefault(game_id, {'state': None, 'seq': 0, 'pending': {}, 'record': {'id': game_id}})
+
+    def state(self, game_id: str) -> dict:
+        with self.lock:
+            return self._game(game_id)['state']
+
+    def seq(self, game_id: str) -> int:
+        with self.lock:
+            return self._game(game_id)['seq']
+
+    def on_event(self, topic, payload, received_at):
+        record = payload.get('record') or {}
+        if topic.startswith('game_state_updates/'):
+            if payload.get('action') == 'create':
+                self._on_patch(record, received_at)
+            return
+        if topic.startswith('games/') and payload.get('action') == 'update' and 'data' in record:
+            self._on_snapshot(payload, record, received_at)
+            return
+        self.wrapped(topic, payload, received_at)
+
+    def _on_snapshot(self, payload, record, received_at):
+        try:
+            state, seq = parse_snapshot(record.get('data'))
+        except ValueError:
+            state, seq = None, None
+        with self.lock:
+            game = self._game(record['id'])
+            game['record'] = {k: v for k, v in record.items() if k != 'data'}
+            # Unversioned writes are seq 0 - the state before the first patch
+            seq = seq or 0
+            if state is not None and (seq > game['seq'] or game['state'] is None or game['seq'] == 0):
+                game['state'] = state
+                game['seq'] = max(seq, game['seq'])
+            self._drain(game)
+            data = game['state']
+        self.wrapped(f"games/{record['id']}", {**payload, 'record': {**record, 'data': data or {}}}, received_at)
+
+    def _on_patch(self, record, received_at):
+        with self.lock:
+            game = self._game(record.get('game'))
+            if record.get('seq', 0) <= game['seq']:
+                return
+            game['pending'][record['seq']] = record.get('patch') or {}
+            if not self._drain(game):
+                return
+            # Same shape as a games update; 'updated' is when the patch was written
+            synthesized = {**game['record'], 'data': game['state'], 'updated': record.get('created', '')}
+        self.wrapped(f"games/{synthesized['id']}", {'action': 'update', 'record': synthesized}, received_at)
+
+    def _drain(self, game: dict) -> bool:
+        """Apply pending patches that follow seq; True if any were applied."""
+        for seq in [s for s in game['pending'] if s <= game['seq']]:
+            del game['pending'][seq]
+        applied = False
+        while game['seq'] + 1 in game['pending']:
+            game['seq'] += 1
+            game['state'] = apply_patch(game['state'], game['pending'].pop(game['seq']))
+            applied = True
+        return applied
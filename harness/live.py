@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Live metrics for long runs: a Prometheus endpoint and a terminal dashboard.
+
+A soak run through test_orchestrator.py used to show nothing but child
+output until it ended. LiveMetrics collects while the run goes:
+
+- active clients, per-step counts and latency percentiles over the last
+  WINDOW_S seconds, error and warning counts per source
+- the game phase, so spikes line up with questions and reveals
+- PocketBase's RSS and CPU, read from /proc (harness.procstat)
+
+MetricsServer serves them in the Prometheus text format on /metrics, and
+Dashboard redraws a summary with per-step rates every few seconds.
+
+    live = LiveMetrics(pocketbase=PocketBaseProcess())
+    MetricsServer(live, port=9464).start()
+    live.observe('player_login', 812)
+    live.count('errors', source='player3')
+    live.set_phase('question 2')
+
+    curl -s localhost:9464/metrics
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from harness.pocketbase import PB_URL
+from harness.procstat import cpu_seconds, rss_kb
+from harness.stats import percentile
+
+METRICS_PORT = int(os.environ.get('HARNESS_METRICS_PORT', 9464))
+
+# Latency percentiles cover this many recent seconds
+WINDOW_S = 60
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())) + '}'
+
+
+class PocketBaseProcess:
+    """
+    The PocketBase serving pb_url, found in /proc by its --http port.
+
+    PB_PID pins the process. Otherwise the pocketbase process whose
+    --http flag names the URL's port wins (serve's default is 8090), or
+    the only pocketbase process running.
+    """
+
+    def __init__(self, pb_url: str = PB_URL):
+        self.port = urlparse(pb_url).port or 8090
+        self.pid = int(os.environ['PB_PID']) if os.environ.get('PB_PID') else None
+        self._last = None
+
+    def find(self):
+        candidates = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/cmdline', 'rb') as f:
+                    argv = f.read().decode(errors='replace').split('\0')
+            except OSError:
+                continue
+            if argv and os.path.basename(argv[0]) == 'pocketbase' and 'serve' in argv:
+                match = re.search(r'--http[= ]\S*:(\d+)', ' '.join(argv))
+                candidates[int(entry)] = int(match.group(1)) if match else 8090
+        matching = [pid for pid, port in candidates.items() if port == self.port]
+        if matching:
+            return matching[0]
+        return next(iter(candidates)) if len(candidates) == 1 else None
+
+    def sample(self) -> dict:
+        """{'up', 'rss_kb', 'cpu_seconds', 'cpu_percent'} (cpu_percent since the previous sample)."""
+        if self.pid is None or not os.path.exists(f'/proc/{self.pid}'):
+            self.pid = self.find()
+            self._last = None
+        if self.pid is None:
+            return {'up': 0}
+        now, cpu = time.time(), cpu_seconds(self.pid)
+        percent = None
+        if self._last and now > self._last[0]:
+            percent = (cpu - self._last[1]) / (now - self._last[0]) * 100
+        self._last = (now, cpu)
+        return {'up': 1, 'pid': self.pid, 'rss_kb': rss_kb(self.pid), 'cpu_seconds': cpu, 'cpu_percent': percent}
+
+
+class LiveMetrics:
+    """Thread-safe counters, gauges and windowed step latencies for one run."""
+
+    def __init__(self, pocketbase: PocketBaseProcess = None, window_s: float = WINDOW_S):
+        self.pocketbase = pocketbase
+        self.window_s = window_s
+        self.started = time.time()
+        self.phase = 'starting'
+        self.phase_started = self.started
+        self.counters = {}
+        self.gauges = {}
+        self.steps = {}  # step -> {'count', 'sum', 'recent': deque of (at, ms)}
+        self.fixed_steps = {}  # step -> summarize()-shaped dict from elsewhere (worker histograms)
+        self._pocketbase_sample = {'up': 0}
+        self._lock = threading.Lock()
+
+    def count(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_count(self, name: str, value: float, **labels):
+        """Overwrite a counter with a total kept elsewhere (e.g. merged worker counters)."""
+        with self._lock:
+            self.counters[(name, tuple(sorted(labels.items())))] = value
+
+    def gauge(self, name: str, value: float, **labels):
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def add_gauge(self, name: str, delta: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.gauges[key] = self.gauges.get(key, 0) + delta
+
+    def observe(self, step: str, ms: float):
+        now = time.time()
+        with self._lock:
+            stats = self.steps.setdefault(step, {'count': 0, 'sum': 0.0, 'recent': deque()})
+            stats['count'] += 1
+            stats['sum'] += ms
+            stats['recent'].append((now, ms))
+
+    def set_step(self, step: str, summary: dict):
+        """Step percentiles computed elsewhere; counts and sums come from summary."""
+        with self._lock:
+            self.fixed_steps[step] = summary
+
+    def set_phase(self, phase: str):
+        with self._lock:
+            if phase != self.phase:
+                self.phase = phase
+                self.phase_started = time.time()
+
+    def sample_pocketbase(self):
+        if self.pocketbase is not None:
+            sample = self.pocketbase.sample()
+            with self._lock:
+                self._pocketbase_sample = sample
+
+    def snapshot(self) -> dict:
+        """Plain-dict view: counters, gauges, per-step count/sum/windowed percentiles, PocketBase."""
+        cutoff = time.time() - self.window_s
+        with self._lock:
+            steps = {}
+            for step, stats in self.steps.items():
+                while stats['recent'] and stats['recent'][0][0] < cutoff:
+                    stats['recent'].popleft()
+                recent = [ms for _, ms in stats['recent']]
+                steps[step] = {'count': stats['count'], 'sum': stats['sum'],
+                               **{f'p{int(q * 100)}': percentile(recent, q * 100) for q in QUANTILES}}
+            for step, summary in self.fixed_steps.items():
+                if summary.get('count'):
+                    steps[step] = {'count': summary['count'], 'sum': summary['mean'] * summary['count'],
+                                   **{f'p{int(q * 100)}': summary[f'p{int(q * 100)}'] for q in QUANTILES}}
+            return {
+                'uptime_s': time.time() - self.started,
+                'phase': self.phase,
+                'phase_s': time.time() - self.phase_started,
+                'counters': dict(self.counters),
+                'gauges': dict(self.gauges),
+                'steps': steps,
+                'pocketbase': dict(self._pocketbase_sample),
+            }
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        self.sample_pocketbase()
+        snap = self.snapshot()
+        lines = [
+            '# HELP trivia_run_uptime_seconds Seconds since the run started',
+            '# TYPE trivia_run_uptime_seconds gauge',
+            f"trivia_run_uptime_seconds {snap['uptime_s']:.3f}",
+            '# HELP trivia_game_phase Current game phase (value is seconds in it)',
+            '# TYPE trivia_game_phase gauge',
+            f"trivia_game_phase{_labels({'phase': snap['phase']})} {snap['phase_s']:.3f}",
+        ]
+
+        def family(prefix: str, kind: str, items: dict):
+            for name in sorted({name for name, _ in items}):
+                lines.append(f'# TYPE {prefix}{name} {kind}')
+                for (n, labels), value in sorted(items.items()):
+                    if n == name:
+                        lines.append(f'{prefix}{n}{_labels(dict(labels))} {value}')
+
+        family('trivia_', 'gauge', snap['gauges'])
+        family('trivia_', 'counter', {(f'{name}_total', labels): value
+                                      for (name, labels), value in snap['counters'].items()})
+
+        if snap['steps']:
+            lines.append(f'# HELP trivia_step_latency_ms Step latency; quantiles over the last {self.window_s:g}s')
+            lines.append('# TYPE trivia_step_latency_ms summary')
+        for step, stats in sorted(snap['steps'].items()):
+            for q in QUANTILES:
+                value = stats[f'p{int(q * 100)}']
+                lines.append(f"trivia_step_latency_ms{_labels({'step': step, 'quantile': q})} "
+                             f"{'NaN' if value != value else f'{value:.3f}'}")
+            lines.append(f"trivia_step_latency_ms_sum{_labels({'step': step})} {stats['sum']:.3f}")
+            lines.append(f"trivia_step_latency_ms_count{_labels({'step': step})} {stats['count']}")
+
+        pocketbase = snap['pocketbase']
+        lines += ['# TYPE pocketbase_up gauge', f"pocketbase_up {pocketbase['up']}"]
+        if pocketbase['up']:
+            lines += [
+                '# TYPE pocketbase_resident_memory_bytes gauge',
+                f"pocketbase_resident_memory_bytes {pocketbase['rss_kb'] * 1024}",
+                '# TYPE pocketbase_cpu_seconds_total counter',
+                f"pocketbase_cpu_seconds_total {pocketbase['cpu_seconds']:.3f}",
+            ]
+        return '\n'.join(lines) + '\n'
+
+
+class MetricsServer:
+    """GET /metrics in the Prometheus text format, served from a daemon thread."""
+
+    def __init__(self, live: LiveMetrics, host: str = '127.0.0.1', port: int = METRICS_PORT):
+        self.live = live
+        self.host = host
+        self.port = port
+        self.server = None
+
+    def start(self):
+        live = self.live
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = live.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.host}:{self.port}/metrics'
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+
+class Dashboard:
+    """
+    Redraws a run summary every interval seconds.
+
+    On a terminal the screen is cleared and the last tail lines of output
+    passed to log() are shown under it; otherwise the summary is printed
+    as a block between output lines.
+    """
+
+    def __init__(self, live: LiveMetrics, interval: float = 2, tail: int = 8, stream=None):
+        self.live = live
+        self.interval = interval
+        self.stream = stream or sys.stdout
+        self.redraw = self.stream.isatty()
+        self.lines = deque(maxlen=tail)
+        self._previous = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def log(self, line: str):
+        """Output that would otherwise go to stdout; kept for the tail when redrawing."""
+        if self.redraw:
+            self.lines.append(line)
+        else:
+            print(line, file=self.stream, flush=True)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.draw()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.draw()
+
+    def draw(self):
+        self.live.sample_pocketbase()
+        snap = self.live.snapshot()
+        now = time.time()
+        previous, self._previous = self._previous, (now, snap)
+        elapsed = now - previous[0] if previous else None
+
+        def rate(count, old):
+            return f'{(count - old) / elapsed:6.1f}/s' if elapsed else '     -  '
+
+        out = [f"📺 LIVE  {time.strftime('%H:%M:%S')}  up {snap['uptime_s']:.0f}s  "
+               f"phase {snap['phase']} ({snap['phase_s']:.0f}s)"]
+        gauges = ', '.join(f"{name}{_labels(dict(labels))}={value:g}"
+                           for (name, labels), value in sorted(snap['gauges'].items()))
+        if gauges:
+            out.append(f'   {gauges}')
+        pocketbase = snap['pocketbase']
+        if pocketbase['up']:
+            cpu = f"{pocketbase['cpu_percent']:.0f}%" if pocketbase.get('cpu_percent') is not None else '-'
+            out.append(f"   PocketBase pid {pocketbase['pid']}: RSS {pocketbase['rss_kb'] / 1024:.0f} MB, CPU {cpu}")
+        else:
+            out.append('   PocketBase: not found')
+        if snap['steps']:
+            out.append(f"   {'step':<24}{'count':>7}{'rate':>10}{'p50':>9}{'p95':>9}{'p99':>9}  "
+                       f"(ms, last {self.live.window_s:g}s)")
+        for step, stats in sorted(snap['steps'].items()):
+            old = previous[1]['steps'].get(step, {}).get('count', 0) if previous else 0
+            cells = ''.join('        -' if stats[p] != stats[p] else f'{stats[p]:9.0f}' for p in ('p50', 'p95', 'p99'))
+            out.append(f"   {step:<24}{stats['count']:>7}{rate(stats['count'], old):>10}{cells}")
+        counters = ', '.join(f"{name}{_labels(dict(labels))}={value:g}"
+                             for (name, labels), value in sorted(snap['counters'].items()))
+        if counters:
+            out.append(f'   {counters}')
+
+        if self.redraw:
+            screen = out + ['─' * 60, *self.lines]
+            self.stream.write('\033[H\033[2J' + '\n'.join(screen) + '\n')
+        else:
+            self.stream.write('\n'.join(out) + '\n')
+        self.stream.flush()
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Minimal PocketBase REST and realtime client used by the harness.
+
+Only the standard library is used so benchmarks can run on any box with
+Python, without the Playwright stack the UI scripts need.
+"""
+
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+import uuid
+from datetime import datetime, timezone
+
+PB_URL = os.environ.get('PB_URL', 'http://localhost:8090')
+APP_URL = os.environ.get('APP_URL', 'http://localhost:5173')
+DISPLAY_URL = os.environ.get('DISPLAY_URL', 'http://localhost:5174')
+SUPERUSER_EMAIL = os.environ.get('PB_SUPERUSER_EMAIL', 'admin@example.com')
+SUPERUSER_PASSWORD = os.environ.get('PB_SUPERUSER_PASSWORD', 'Password123')
+DEFAULT_PASSWORD = 'Password123!'
+
+
+def iso_time(epoch: float) -> str:
+    """Epoch seconds -> the ISO string the app writes into games.data timers."""
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+def parse_time(value: str) -> float:
+    """ISO or PocketBase ('2025-01-01 12:00:00.000Z') timestamp -> epoch seconds."""
+    return datetime.fromisoformat(value.replace(' ', 'T').replace('Z', '+00:00')).timestamp()
+
+
+class PocketBaseError(Exception):
+    """Raised when PocketBase answers with a non-2xx status."""
+
+    def __init__(self, status, message, data=None):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+        self.data = data or {}
+
+
+class PocketBaseClient:
+    """
+    Thin synchronous wrapper around the PocketBase REST API.
+
+    Args:
+        base_url: PocketBase origin, e.g. http://localhost:8090
+        token: Optional auth token to start with
+        timeout: Per-request socket timeout in seconds
+    """
+
+    def __init__(self, base_url: str = PB_URL, token: str = None, timeout: float = 30):
+        self.base_url = base_url.rstrip('/')
+        self.token = token
+        self.timeout = timeout
+        self.record = None
+
+    def request(self, method: str, path: str, body=None, params: dict = None, content_type: str = None):
+        """
+        Send a request and return the decoded JSON body (or None).
+
+        body is sent as JSON, or as-is when it is bytes with content_type.
+        """
+        url = f"{self.base_url}{path}"
+        if params:
+            query = {k: v for k, v in params.items() if v is not None}
+            url += '?' + urllib.parse.urlencode(query)
+
+        data = None
+        headers = {'Accept': 'application/json'}
+        if isinstance(body, bytes):
+            data = body
+            headers['Content-Type'] = content_type
+        elif body is not None:
+            data = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        if self.token:
+            headers['Authorization'] = self.token
+
+        req = urllib.request.Request(url, data=data, method=method, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                raw = response.read()
+        except urllib.error.HTTPError as e:
+            raw = e.read()
+            try:
+                payload = json.loads(raw or b'{}')
+            except ValueError:
+                payload = {'message': raw.decode('utf-8', 'replace')}
+            raise PocketBaseError(e.code, payload.get('message', e.reason), payload.get('data'))
+
+        if not raw:
+            return None
+        return json.loads(raw)
+
+    # ------------------------------------------------------------------
+    # Auth
+    # ------------------------------------------------------------------
+
+    def auth_with_password(self, email: str, password: str = DEFAULT_PASSWORD, collection: str = 'users'):
+        """Authenticate and keep the returned token on this client."""
+        result = self.request(
+            'POST',
+            f'/api/collections/{collection}/auth-with-password',
+            {'identity': email, 'password': password},
+        )
+        self.token = result['token']
+        self.record = result.get('record')
+        return result
+
+    def auth_superuser(self, email: str = SUPERUSER_EMAIL, password: str = SUPERUSER_PASSWORD):
+        return self.auth_with_password(email, password, collection='_superusers')
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+
+    def get_list(self, collection: str, page: int = 1, per_page: int = 30, **params):
+        params.update({'page': page, 'perPage': per_page})
+        return self.request('GET', f'/api/collections/{collection}/records', params=params)
+
+    def get_full_list(self, collection: str, batch: int = 500, **params):
+        items = []
+        page = 1
+        while True:
+            result = self.get_list(collection, page=page, per_page=batch, skipTotal=1, **params)
+            items.extend(result['items'])
+            if len(result['items']) < batch:
+                return items
+            page += 1
+
+    def get_first(self, collection: str, filter: str, **params):
+        result = self.get_list(collection, page=1, per_page=1, filter=filter, skipTotal=1, **params)
+        return result['items'][0] if result['items'] else None
+
+    def get_one(self, collection: str, record_id: str, **params):
+        return self.request('GET', f'/api/collections/{collection}/records/{record_id}', params=params)
+
+    def create(self, collection: str, data: dict):
+        return self.request('POST', f'/api/collections/{collection}/records', data)
+
+    def update(self, collection: str, record_id: str, data: dict):
+        return self.request('PATCH', f'/api/collections/{collection}/records/{record_id}', data)
+
+    def delete(self, collection: str, record_id: str):
+        return self.request('DELETE', f'/api/collections/{collection}/records/{record_id}')
+
+    def upload(self, collection: str, record_id: str, files: dict, data: dict = None):
+        """
+        Update a record's file fields (and plain fields in data) as multipart/form-data.
+
+        files maps field name -> (filename, content bytes, content type).
+        """
+        boundary = uuid.uuid4().hex
+        parts = []
+        for name, value in (data or {}).items():
+            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode())
+        for name, (filename, content, mime) in files.items():
+            parts.append(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                         f'Content-Type: {mime}\r\n\r\n'.encode() + content + b'\r\n')
+        parts.append(f'--{boundary}--\r\n'.encode())
+        return self.request('PATCH', f'/api/collections/{collection}/records/{record_id}', b''.join(parts),
+                            content_type=f'multipart/form-data; boundary={boundary}')
+
+
+class RealtimeSubscription:
+    """
+    Background reader for the PocketBase SSE realtime endpoint.
+
+    Args:
+        client: Authenticated client whose token is used for the subscription
+        topics: Subscription topics, e.g. ['games/*', 'game_answers/*']
+        on_event: Callback receiving (topic, payload, received_at)
+    """
+
+    def __init__(self, client: PocketBaseClient, topics: list, on_event):
+        self.client = client
+        self.topics = topics
+        self.on_event = on_event
+        self.client_id = None
+        self.connected = threading.Event()
+        self._response = None
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self, timeout: float = 10):
+        self._thread.start()
+        if not self.connected.wait(timeout):
+            raise TimeoutError('Realtime connection was not established')
+        return self
+
+    def stop(self):
+        self._stopped = True
+        if self._response is not None:
+            try:
+                self._response.close()
+            except Exception:
+                pass
+
+    def _subscribe(self):
+        self.client.request('POST', '/api/realtime', {
+            'clientId': self.client_id,
+            'subscriptions': self.topics,
+        })
+
+    def _run(self):
+        req = urllib.request.Request(
+            f"{self.client.base_url}/api/realtime",
+            headers={'Accept': 'text/event-stream'},
+        )
+        try:
+            self._response = urllib.request.urlopen(req, timeout=600)
+            event_name, data_lines = None, []
+            for raw_line in self._response:
+                line = raw_line.decode('utf-8').rstrip('\r\n')
+                if line.startswith('event:'):
+                    event_name = line[6:].strip()
+                elif line.startswith('data:'):
+                    data_lines.append(line[5:].strip())
+                elif line == '' and event_name:
+                    self._dispatch(event_name, '\n'.join(data_lines))
+                    event_name, data_lines = None, []
+        except Exception:
+            if not self._stopped:
+                raise
+
+    def _dispatch(self, event_name: str, data: str):
+        received_at = time.time()
+        try:
+            payload = json.loads(data) if data else {}
+        except ValueError:
+            payload = {'raw': data}
+
+        if event_name == 'PB_CONNECT':
+            self.client_id = payload.get('clientId')
+            self._subscribe()
+            self.connected.set()
+            return
+
+        self.on_event(event_name, payload, received_at)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process CPU and memory from /proc (Linux only, no psutil).
+
+Chromium runs one browser process plus GPU, network and renderer children,
+so per-client numbers are taken over a whole process tree. Memory is PSS
+(shared pages split between the processes that map them) where the kernel
+provides smaps_rollup, so summing a tree does not count the shared
+Chromium binary once per process.
+
+    before = descendants(os.getpid())
+    browser = p.chromium.launch()
+    sampler = TreeSampler(new_roots(before, descendants(os.getpid())))
+    sampler.sample()  # {'cpu_seconds': ..., 'memory_kb': ..., 'processes': ...}
+"""
+
+import os
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK')
+
+
+def _parents() -> dict:
+    """pid -> parent pid for every visible process."""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name is parenthesised and may contain spaces
+        fields = stat[stat.rindex(')') + 2:].split()
+        parents[int(entry)] = int(fields[1])
+    return parents
+
+
+def descendants(pid: int) -> set:
+    """Every live process below pid."""
+    children = {}
+    for child, parent in _parents().items():
+        children.setdefault(parent, []).append(child)
+    found, stack = set(), [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            if child not in found:
+                found.add(child)
+                stack.append(child)
+    return found
+
+
+def new_roots(before: set, after: set) -> set:
+    """Top-most processes among those that appeared between two snapshots."""
+    new = after - before
+    parents = _parents()
+    return {pid for pid in new if parents.get(pid) not in new}
+
+
+def cpu_seconds(pid: int) -> float:
+    """User + system CPU time of pid, 0 once it has exited."""
+    try:
+        with open(f'/proc/{pid}/stat') as f:
+            stat = f.read()
+    except OSError:
+        return 0.0
+    fields = stat[stat.rindex(')') + 2:].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def memory_kb(pid: int) -> int:
+    """PSS of pid in kB, falling back to RSS on kernels without smaps_rollup."""
+    for path, key in ((f'/proc/{pid}/smaps_rollup', 'Pss:'), (f'/proc/{pid}/status', 'VmRSS:')):
+        try:
+            with open(path) as f:
+                for line in f:
+                    if line.startswith(key):
+                        return int(line.split()[1])
+        except OSError:
+            continue
+    return 0
+
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of pid in kB, 0 once it has exited."""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+class TreeSampler:
+    """
+    CPU and memory of the process trees under a set of roots.
+
+    CPU is cumulative; the last seen value of a process is kept after it
+    exits so a renderer that goes away mid-run still counts.
+    """
+
+    def __init__(self, roots):
+        self.roots = set(roots)
+        self._cpu = {}
+
+    def pids(self) -> set:
+        pids = set(self.roots)
+        for root in self.roots:
+            pids |= descendants(root)
+        return pids
+
+    def sample(self) -> dict:
+        pids = self.pids()
+        memory = 0
+        for pid in pids:
+            self._cpu[pid] = max(self._cpu.get(pid, 0.0), cpu_seconds(pid))
+            memory += memory_kb(pid)
+        return {
+            'cpu_seconds': sum(self._cpu.values()),
+            'memory_kb': memory,
+            'processes': len(pids),
+        }
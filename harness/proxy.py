@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Local TCP/HTTP proxy in front of PocketBase for network chaos scenarios.
+
+Clients connect to the proxy instead of PocketBase and every byte is
+forwarded unchanged. The proxy keeps each open connection, so a scenario
+can cut all of them at once and refuse new ones for a while - what a
+venue Wi-Fi blip looks like from the server:
+
+    proxy = await TcpProxy().start()
+    client = AsyncPocketBaseClient(proxy.url)
+    ...
+    proxy.outage(3)  # drop every connection, refuse new ones for 3s
+
+A listener also works as an HTTP forward proxy, so a browser launched
+with harness.browser.proxy_launch_options() sends the app and PocketBase
+traffic through it. Give it a Link and everything it forwards gets that
+client's latency, jitter, loss and bandwidth.
+
+NetworkScenario runs one shaped listener per named client from a JSON
+scenario file, with scheduled partitions, and logs every connection's
+byte counts. test_orchestrator.py --network-scenario runs it as:
+
+    python -m harness.proxy --scenario venue.json --clients host player1 player2 \\
+        --log tmp/proxy_connections.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import signal
+import sys
+import time
+import urllib.parse
+
+from harness.pocketbase import PB_URL, iso_time
+
+# Read size per chunk; smaller chunks make bandwidth caps smoother
+CHUNK_SIZE = 16384
+
+# Chunks a shaped direction buffers before it stops reading
+PIPE_QUEUE = 64
+
+# Headers for the proxy hop only; never forwarded
+HOP_HEADERS = ('connection', 'proxy-connection', 'keep-alive', 'proxy-authorization')
+
+PARTITION_MODES = ('reset', 'blackhole')
+
+
+def forward_head(head: bytes) -> tuple:
+    """
+    (mode, host, port, head to send upstream) for a client's request head.
+
+    Absolute-URI requests come from a browser using the listener as its
+    HTTP proxy: they are rewritten to origin form with Connection: close,
+    so each request gets its own upstream connection. CONNECT opens a
+    tunnel. Anything else is a client talking to PocketBase directly and
+    is forwarded as is to the proxy's target.
+    """
+    lines = head.decode('latin-1').split('\r\n')
+    method, uri, version = lines[0].split(' ', 2)
+    if method == 'CONNECT':
+        host, _, port = uri.rpartition(':')
+        return 'connect', host.strip('[]'), int(port), b''
+    if '://' not in uri:
+        return 'tcp', None, None, head
+    parsed = urllib.parse.urlsplit(uri)
+    path = (parsed.path or '/') + (f'?{parsed.query}' if parsed.query else '')
+    headers = [line for line in lines[1:] if line and line.split(':', 1)[0].strip().lower() not in HOP_HEADERS]
+    rebuilt = '\r\n'.join([f'{method} {path} {version}', *headers, 'Connection: close', '', ''])
+    return 'http', parsed.hostname, parsed.port or 80, rebuilt.encode('latin-1')
+
+
+class Link:
+    """
+    One client's network: delay, loss and bandwidth for everything it sends
+    and receives, shared by all of its connections.
+
+    Args:
+        latency_ms: One-way delay added in each direction
+        jitter_ms: Uniform +/- spread on that delay (order is kept)
+        loss: Chance a chunk is lost; TCP resends it after loss_rto_ms,
+            doubling for every further loss
+        loss_rto_ms: Retransmission timeout for a lost chunk
+        down_kbps: Bandwidth from PocketBase to the client (None = uncapped)
+        up_kbps: Bandwidth from the client to PocketBase (None = uncapped)
+        rng: Random source for jitter and loss
+    """
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, loss: float = 0, loss_rto_ms: float = 200,
+                 down_kbps: float = None, up_kbps: float = None, rng: random.Random = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+        self.loss_rto_ms = loss_rto_ms
+        self.kbps = {'down': down_kbps, 'up': up_kbps}
+        self.rng = rng or random.Random()
+        self.free_at = {'down': 0.0, 'up': 0.0}
+        self.blackhole_until = 0.0
+        self.lost = 0
+
+    @classmethod
+    def from_conditions(cls, conditions: dict, rng: random.Random = None):
+        """
+        Link from a scenario entry. 'profile' names a harness.browser
+        DEVICE_PROFILES entry whose network numbers fill in the rest; its
+        latency is a round trip, so half goes each way.
+        """
+        conditions = dict(conditions)
+        profile = conditions.pop('profile', None)
+        if profile:
+            from harness.browser import DEVICE_PROFILES
+            network = DEVICE_PROFILES[profile]['network'] or {}
+            conditions = {
+                'latency_ms': network.get('latency_ms', 0) / 2,
+                'down_kbps': network.get('download_kbps'),
+                'up_kbps': network.get('upload_kbps'),
+                **conditions,
+            }
+        return cls(rng=rng, **conditions)
+
+    def schedule(self, direction: str, size: int, after: float) -> float:
+        """When a chunk read now is delivered; never before after (the previous chunk)."""
+        now = time.time()
+        delay = self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+        rto = self.loss_rto_ms
+        while self.loss and self.rng.random() < self.loss:
+            self.lost += 1
+            delay += rto
+            rto *= 2
+        sent = now
+        kbps = self.kbps[direction]
+        if kbps:
+            sent = max(now, self.free_at[direction]) + size * 8 / (kbps * 1000)
+            self.free_at[direction] = sent
+        return max(after, sent + max(delay, 0) / 1000)
+
+    def blackhole(self, seconds: float):
+        """Hold every byte in both directions for seconds, without closing anything."""
+        self.blackhole_until = max(self.blackhole_until, time.time() + seconds)
+
+    async def wait(self, at: float):
+        while True:
+            wait = max(at, self.blackhole_until) - time.time()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+
+class TcpProxy:
+    """
+    asyncio TCP proxy on the running event loop.
+
+    Args:
+        target: Origin to forward to, e.g. http://localhost:8090
+        listen_host: Interface to listen on
+        listen_port: Port to listen on (0 picks a free one)
+        link: Network conditions applied to everything forwarded
+        name: Client name recorded with each connection
+        on_close: Called with each connection's record once it closes
+    """
+
+    def __init__(self, target: str = PB_URL, listen_host: str = '127.0.0.1', listen_port: int = 0,
+                 link: Link = None, name: str = None, on_close=None):
+        parsed = urllib.parse.urlsplit(target)
+        self.target_host = parsed.hostname
+        self.target_port = parsed.port or 80
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.link = link
+        self.name = name
+        self.on_close = on_close
+        self.down_until = 0.0
+        self.stats = {'connections': 0, 'refused': 0, 'dropped': 0, 'bytes_up': 0, 'bytes_down': 0}
+        self._server = None
+        self._open = set()  # (client writer, upstream writer)
+        self._pending = set()  # client writers still sending their first request head
+        self._handlers = set()
+        self._next_id = 0
+
+    @property
+    def url(self) -> str:
+        return f'http://{self.listen_host}:{self.listen_port}'
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.listen_host, self.listen_port)
+        self.listen_port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+        self.drop_all()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+    def drop_all(self) -> int:
+        """Close every open connection; returns how many were cut."""
+        for client in list(self._pending):
+            client.transport.abort()
+        dropped = list(self._open)
+        self._open.clear()
+        for client, upstream in dropped:
+            client.transport.abort()
+            upstream.transport.abort()
+        self.stats['dropped'] += len(dropped)
+        return len(dropped)
+
+    def outage(self, seconds: float) -> int:
+        """Drop every connection and refuse new ones for seconds."""
+        self.down_until = time.time() + seconds
+        return self.drop_all()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        self._next_id += 1
+        conn = {'client': self.name, 'id': self._next_id, 'mode': None, 'target': None, 'request': None,
+                'opened': iso_time(time.time()), 'bytes_up': 0, 'bytes_down': 0, 'closed_by': 'eof'}
+        started = time.time()
+        try:
+            await self._forward(reader, writer, conn)
+        finally:
+            self._handlers.discard(task)
+            conn['duration_s'] = round(time.time() - started, 3)
+            if self.on_close is not None:
+                self.on_close(conn)
+
+    async def _forward(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, conn: dict):
+        if time.time() < self.down_until:
+            self.stats['refused'] += 1
+            conn['closed_by'] = 'refused'
+            writer.transport.abort()
+            return
+
+        self._pending.add(writer)
+        try:
+            head = await reader.readuntil(b'\r\n\r\n')
+            mode, host, port, head = forward_head(head)
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError):
+            # Closed before asking for anything (a browser preconnect), or not HTTP
+            conn['closed_by'] = 'idle'
+            writer.transport.abort()
+            return
+        finally:
+            self._pending.discard(writer)
+        if mode == 'tcp':
+            host, port = self.target_host, self.target_port
+        conn.update(mode=mode, target=f'{host}:{port}', request=head.split(b'\r\n', 1)[0].decode('latin-1')[:200])
+
+        try:
+            up_reader, up_writer = await asyncio.open_connection(host, port)
+        except OSError:
+            self.stats['refused'] += 1
+            conn['closed_by'] = 'refused'
+            writer.transport.abort()
+            return
+
+        self.stats['connections'] += 1
+        pair = (writer, up_writer)
+        self._open.add(pair)
+        try:
+            if mode == 'connect':
+                if self.link is not None:
+                    await self.link.wait(self.link.schedule('down', 39, 0))
+                writer.write(b'HTTP/1.1 200 Connection Established\r\n\r\n')
+            else:
+                self._count(conn, 'up', len(head))
+                if self.link is not None:
+                    await self.link.wait(self.link.schedule('up', len(head), 0))
+                up_writer.write(head)
+            await asyncio.gather(self._pipe(reader, up_writer, conn, 'up'),
+                                 self._pipe(up_reader, writer, conn, 'down'))
+        finally:
+            if pair in self._open:
+                self._open.discard(pair)
+                writer.close()
+                up_writer.close()
+            else:
+                conn['closed_by'] = 'dropped'
+
+    def _count(self, conn: dict, direction: str, size: int):
+        self.stats[f'bytes_{direction}'] += size
+        conn[f'bytes_{direction}'] += size
+
+    async def _pipe(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, conn: dict, direction: str):
+        queue = sender = None
+        if self.link is not None:
+            queue = asyncio.Queue(PIPE_QUEUE)
+            sender = asyncio.ensure_future(self._deliver(queue, writer))
+        last = 0.0
+        try:
+            while True:
+                chunk = await reader.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                self._count(conn, direction, len(chunk))
+                if queue is None:
+                    writer.write(chunk)
+                    await writer.drain()
+                else:
+                    last = self.link.schedule(direction, len(chunk), last)
+                    await queue.put((last, chunk))
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            if sender is not None:
+                if writer.is_closing():
+                    sender.cancel()
+                else:
+                    await queue.put(None)
+                await asyncio.gather(sender, return_exceptions=True)
+            # Half-close so the other direction can finish
+            if not writer.is_closing() and writer.can_write_eof():
+                try:
+                    writer.write_eof()
+                except OSError:
+                    pass
+
+    async def _deliver(self, queue: asyncio.Queue, writer: asyncio.StreamWriter):
+        """Write queued chunks when the link says they arrive; keeps draining after a write fails."""
+        failed = False
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if failed:
+                continue
+            at, chunk = item
+            await self.link.wait(at)
+            try:
+                writer.write(chunk)
+                await writer.drain()
+            except (ConnectionError, OSError):
+                failed = True
+
+
+class NetworkScenario:
+    """
+    One shaped TcpProxy per named client, partitioned on a schedule.
+
+    The scenario is a dict (usually a JSON file):
+
+        {
+          "target": "http://localhost:8090",
+          "seed": 1,
+          "default": {"latency_ms": 20, "jitter_ms": 5},
+          "clients": {
+            "player1": {"profile": "venue-wifi-3g", "loss": 0.02},
+            "player2": {"latency_ms": 200, "down_kbps": 400, "up_kbps": 400}
+          },
+          "partitions": [
+            {"at": 60, "duration": 5, "clients": ["player1", "player2"], "mode": "reset"}
+          ]
+        }
+
+    Clients missing from "clients" get "default". A partition starts "at"
+    seconds after start() and lasts "duration" seconds, for the listed
+    clients or everyone. "reset" cuts their connections and refuses new
+    ones; "blackhole" keeps them open but holds every byte.
+
+    Args:
+        scenario: The scenario dict
+        clients: Client names to listen for, on top of those in the scenario
+        log_path: JSONL file getting one line per closed connection
+    """
+
+    def __init__(self, scenario: dict, clients: list = (), log_path: str = None):
+        self.scenario = scenario
+        self.names = list(dict.fromkeys([*clients, *scenario.get('clients', {})]))
+        self.log_path = log_path
+        self.proxies = {}
+        self.links = {}
+        self.partitions = []
+        self._log = None
+        self._tasks = []
+        for partition in scenario.get('partitions', []):
+            if partition.get('mode', 'reset') not in PARTITION_MODES:
+                raise ValueError(f"Unknown partition mode '{partition['mode']}' (known: {', '.join(PARTITION_MODES)})")
+
+    @classmethod
+    def load(cls, path: str, clients: list = (), log_path: str = None):
+        with open(path) as f:
+            return cls(json.load(f), clients, log_path)
+
+    def url(self, name: str) -> str:
+        return self.proxies[name].url
+
+    async def start(self):
+        rng = random.Random(self.scenario.get('seed'))
+        target = self.scenario.get('target', PB_URL)
+        self._log = open(self.log_path, 'a') if self.log_path else None
+        for name in self.names:
+            conditions = self.scenario.get('clients', {}).get(name, self.scenario.get('default', {}))
+            self.links[name] = Link.from_conditions(conditions, random.Random(rng.getrandbits(64)))
+            self.proxies[name] = await TcpProxy(target, link=self.links[name], name=name,
+                                                on_close=self._write_log).start()
+        started = time.time()
+        self._tasks = [asyncio.ensure_future(self._partition(started, p)) for p in self.scenario.get('partitions', [])]
+        return self
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for proxy in self.proxies.values():
+            await proxy.stop()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def summary(self) -> dict:
+        """Per-client proxy stats, chunks lost and partitions applied."""
+        return {
+            'clients': {name: {**proxy.stats, 'lost_chunks': self.links[name].lost}
+                        for name, proxy in self.proxies.items()},
+            'partitions': self.partitions,
+        }
+
+    def _write_log(self, conn: dict):
+        if self._log is not None:
+            self._log.write(json.dumps(conn) + '\n')
+            self._log.flush()
+
+    async def _partition(self, started: float, partition: dict):
+        await asyncio.sleep(max(0, started + partition['at'] - time.time()))
+        names = partition.get('clients') or self.names
+        mode = partition.get('mode', 'reset')
+        print(f"✂️  PROXY: Partitioning {', '.join(names)} for {partition['duration']}s ({mode})", flush=True)
+        dropped = 0
+        for name in names:
+            if mode == 'reset':
+                dropped += self.proxies[name].outage(partition['duration'])
+            else:
+                self.links[name].blackhole(partition['duration'])
+        self.partitions.append({**partition, 'mode': mode, 'started': iso_time(time.time()), 'dropped': dropped})
+
+
+async def serve(args):
+    scenario = NetworkScenario.load(args.scenario, args.clients, args.log)
+    await scenario.start()
+    for name in scenario.names:
+        print(f"PROXY_LISTEN: {name} {scenario.url(name)}", flush=True)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    if args.duration:
+        loop.call_later(args.duration, stop.set)
+    await stop.wait()
+
+    await scenario.stop()
+    return scenario.summary()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Shaped, partitionable proxies in front of PocketBase')
+    parser.add_argument('--scenario', required=True, help='Scenario JSON file')
+    parser.add_argument('--clients', nargs='*', default=[], help='Client names to listen for')
+    parser.add_argument('--log', metavar='PATH', help='Append one JSON line per closed connection')
+    parser.add_argument('--duration', type=float, default=None, help='Stop after this many seconds')
+    args = parser.parse_args()
+
+    summary = asyncio.run(serve(args))
+
+    print("\n" + "=" * 60)
+    print("📊 NETWORK PROXY RESULTS")
+    print("=" * 60)
+    for name, stats in summary['clients'].items():
+        print(f"{name}: {stats['connections']} connections, {stats['bytes_up'] / 1024:.1f}KB up, "
+              f"{stats['bytes_down'] / 1024:.1f}KB down, {stats['dropped']} dropped, {stats['refused']} refused, "
+              f"{stats['lost_chunks']} chunks lost")
+    print(f"Partitions: {len(summary['partitions'])}")
+    sys.exit(0)
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Record a real game's write stream and replay it against another PocketBase.
+
+Three sub-commands:
+
+    # Capture a live game (e.g. started by test_orchestrator.py)
+    python -m harness.replay record --game-code ABC123 --out ./tmp/game.jsonl
+
+    # Rebuild a recording after the fact from PocketBase's request log
+    python -m harness.replay import-log --game-id abc123def456ghi --out ./tmp/game.jsonl
+
+    # Re-issue it at 10x speed, 20 copies in parallel
+    python -m harness.replay replay ./tmp/game.jsonl --speed 10 --copies 20
+
+A recording is JSONL: a header line, then one entry per write in the order
+PocketBase applied it. Every write fans out as one realtime event per
+subscriber, so the recorded writes are also the realtime event stream the
+clients saw. Entries created before recording started are snapshotted at
+t=0 in dependency order.
+
+The replayer gives every copy its own synthetic host and players, remaps all
+record ids (including ids embedded in games.data / games.scoreboard JSON)
+and issues each write as the user who made it, so collection rules are
+exercised the same way the browsers exercise them.
+"""
+
+import argparse
+import json
+import re
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.pocketbase import PocketBaseClient, PocketBaseError, RealtimeSubscription, parse_time
+from harness.seed import ensure_user, login, random_game_code
+from harness.stats import format_summary, summarize, write_report
+
+FORMAT_VERSION = 1
+
+# Creation order - parents before children
+GAME_COLLECTIONS = ['games', 'rounds', 'game_questions', 'game_teams', 'game_players', 'game_answers',
+                    'game_state_updates']
+
+SYSTEM_FIELDS = {'id', 'collectionId', 'collectionName', 'created', 'updated', 'expand'}
+
+RECORD_URL = re.compile(r'^/api/collections/(?P<collection>[^/]+)/records(?:/(?P<id>[^/?]+))?')
+
+
+def strip_system_fields(record: dict) -> dict:
+    return {k: v for k, v in record.items() if k not in SYSTEM_FIELDS}
+
+
+def actor_for(collection: str, record: dict) -> str:
+    """
+    Who issued a write, in recording terms.
+
+    games/rounds/game_questions are written by the host, game_players by the
+    player themselves, and team-scoped records by a member of the team.
+    """
+    if collection == 'game_players':
+        return f"player:{record.get('player')}"
+    if collection == 'game_answers':
+        return f"team:{record.get('team')}"
+    if collection == 'game_teams':
+        return f"team:{record.get('id')}"
+    return 'host'
+
+
+def belongs_to_game(collection: str, record: dict, game_id: str) -> bool:
+    if collection == 'games':
+        return record.get('id') == game_id
+    return record.get('game') == game_id
+
+
+class RecordingWriter:
+    """Appends entries to a JSONL recording with timestamps relative to start."""
+
+    def __init__(self, path: str, game_id: str, source: str):
+        self.file = open(path, 'w')
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.count = 0
+        self._write({'kind': 'header', 'version': FORMAT_VERSION, 'game_id': game_id,
+                     'source': source, 'recorded_at': self.started})
+
+    def _write(self, entry: dict):
+        self.file.write(json.dumps(entry) + '\n')
+
+    def add(self, action: str, collection: str, record: dict, at: float = None, actor: str = None):
+        t = 0.0 if at is None else max(0.0, at - self.started)
+        with self.lock:
+            self._write({
+                't': round(t, 4),
+                'kind': 'write',
+                'action': action,
+                'collection': collection,
+                'id': record['id'],
+                'actor': actor or actor_for(collection, record),
+                'record': strip_system_fields(record),
+            })
+            self.count += 1
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+def snapshot_game(admin: PocketBaseClient, game_id: str) -> dict:
+    """Current records of a game, keyed by collection, plus referenced questions."""
+    snapshot = {'games': [admin.get_one('games', game_id)]}
+    for collection in GAME_COLLECTIONS[1:]:
+        snapshot[collection] = admin.get_full_list(collection, filter=f'game = "{game_id}"', sort='created')
+
+    question_ids = sorted({gq['question'] for gq in snapshot['game_questions'] if gq.get('question')})
+    snapshot['questions'] = []
+    for i in range(0, len(question_ids), 50):
+        chunk = question_ids[i:i + 50]
+        snapshot['questions'].extend(
+            admin.get_full_list('questions', filter=' || '.join(f'id = "{qid}"' for qid in chunk)))
+    return snapshot
+
+
+# ----------------------------------------------------------------------
+# record
+# ----------------------------------------------------------------------
+
+def record_live(args):
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+
+    if args.game_id:
+        game = admin.get_one('games', args.game_id)
+    else:
+        game = admin.get_first('games', f'code = "{args.game_code}"', sort='-created')
+        if not game:
+            print(f"❌ RECORDER: No game with code {args.game_code}", flush=True)
+            return 1
+    game_id = game['id']
+
+    writer = RecordingWriter(args.out, game_id, 'live')
+    finished = threading.Event()
+    state_lock = threading.Lock()
+    buffered = []
+    snapshotted = None
+
+    def on_event(topic, payload, received_at):
+        collection = topic.split('/')[0]
+        record = payload.get('record') or {}
+        if not belongs_to_game(collection, record, game_id):
+            return
+        with state_lock:
+            if snapshotted is None:
+                buffered.append((payload.get('action'), collection, record, received_at))
+                return
+        writer.add(payload.get('action'), collection, record, at=received_at)
+        if collection == 'games' and record.get('status') == 'completed':
+            finished.set()
+
+    # Subscribe before snapshotting so nothing falls between the two; events
+    # that arrive meanwhile are held back until the snapshot is written.
+    realtime = RealtimeSubscription(admin, [f'{c}/*' for c in GAME_COLLECTIONS], on_event).start()
+
+    snapshot = snapshot_game(admin, game_id)
+    for question in snapshot['questions']:
+        writer.add('create', 'questions', question, actor='admin')
+    for collection in GAME_COLLECTIONS:
+        for record in snapshot[collection]:
+            writer.add('create', collection, record)
+
+    with state_lock:
+        snapshotted = {r['id'] for c in GAME_COLLECTIONS for r in snapshot[c]}
+        for action, collection, record, received_at in buffered:
+            if action == 'create' and record.get('id') in snapshotted:
+                continue
+            writer.add(action, collection, record, at=received_at)
+
+    print(f"🎙️  RECORDER: Recording game {game_id} ({game['code']}) to {args.out} - Ctrl+C to stop", flush=True)
+    signal.signal(signal.SIGTERM, lambda *_: finished.set())
+    try:
+        deadline = time.time() + args.max_duration
+        while not finished.wait(1) and time.time() < deadline:
+            pass
+    except KeyboardInterrupt:
+        pass
+
+    realtime.stop()
+    writer.close()
+    print(f"✅ RECORDER: Captured {writer.count} writes", flush=True)
+    return 0
+
+
+# ----------------------------------------------------------------------
+# import-log
+# ----------------------------------------------------------------------
+
+def iter_logs(admin: PocketBaseClient, log_filter: str, per_page: int = 500):
+    """Every request log entry matching log_filter, oldest first, a page at a time."""
+    page = 1
+    while True:
+        result = admin.request('GET', '/api/logs', params={
+            'filter': log_filter, 'sort': 'created', 'page': page, 'perPage': per_page})
+        items = result.get('items', [])
+        if not items:
+            return
+        yield from items
+        page += 1
+
+
+def import_from_log(args):
+    """
+    Rebuild a recording from PocketBase's request log (pb_data logs).
+
+    The request log has method, URL, auth and timing but no bodies, so each
+    write is paired with the record's current state. Updates therefore all
+    carry the final field values - ordering and timing (to the millisecond)
+    follow the log, payloads are approximate.
+
+    Create URLs carry no record id. A create is only paired with one of
+    this game's records when it was made by the game's host or one of its
+    players; creates by anyone else on the server are skipped.
+    """
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    game_id = args.game_id
+
+    snapshot = snapshot_game(admin, game_id)
+    records = {}
+    unclaimed_creates = {c: sorted(snapshot[c], key=lambda r: r['created']) for c in GAME_COLLECTIONS}
+    for collection in GAME_COLLECTIONS:
+        for record in snapshot[collection]:
+            records[record['id']] = (collection, record)
+
+    # Users whose creates can belong to this game
+    actors = {snapshot['games'][0].get('host')}
+    actors.update(player.get('player') for player in snapshot['game_players'])
+    actors.discard(None)
+
+    since = args.since or snapshot['games'][0]['created']
+    log_filter = f'data.type = "request" && created >= "{since}"'
+    if args.until:
+        log_filter += f' && created <= "{args.until}"'
+
+    log_writes = []
+    first_at = None
+    for entry in iter_logs(admin, log_filter):
+        data = entry.get('data', {})
+        method = data.get('method')
+        match = RECORD_URL.match(data.get('url', ''))
+        if method not in ('POST', 'PATCH', 'DELETE') or not match or (data.get('status') or 0) >= 400:
+            continue
+        collection, record_id = match.group('collection'), match.group('id')
+        if collection not in GAME_COLLECTIONS:
+            continue
+
+        record = None
+        if method == 'POST':
+            # Pair the create with the oldest unclaimed record of that collection
+            if data.get('authId') in actors and unclaimed_creates[collection]:
+                record = unclaimed_creates[collection].pop(0)
+        elif record_id in records:
+            record = records[record_id][1]
+        if record is None:
+            continue
+
+        at = parse_time(entry['created'])
+        first_at = first_at or at
+        action = {'POST': 'create', 'PATCH': 'update', 'DELETE': 'delete'}[method]
+        log_writes.append((action, collection, record, at - first_at))
+
+    writer = RecordingWriter(args.out, game_id, 'log')
+    for question in snapshot['questions']:
+        writer.add('create', 'questions', question, actor='admin')
+    # Records created before the log window still have to exist for the replay
+    for collection in GAME_COLLECTIONS:
+        for record in unclaimed_creates[collection]:
+            writer.add('create', collection, record)
+    for action, collection, record, offset in log_writes:
+        writer.add(action, collection, record, at=writer.started + offset)
+
+    writer.close()
+    print(f"✅ LOG IMPORT: Wrote {writer.count} writes to {args.out}", flush=True)
+    return 0
+
+
+# ----------------------------------------------------------------------
+# replay
+# ----------------------------------------------------------------------
+
+def load_recording(path: str):
+    with open(path) as f:
+        lines = [json.loads(line) for line in f if line.strip()]
+    header, entries = lines[0], lines[1:]
+    if header.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported recording version {header.get('version')}")
+    return header, entries
+
+
+def remap(value, id_map: dict):
+    """Rewrite every known id in value - dict keys, strings and JSON-in-strings."""
+    if isinstance(value, dict):
+        return {id_map.get(k, k): remap(v, id_map) for k, v in value.items()}
+    if isinstance(value, list):
+        return [remap(v, id_map) for v in value]
+    if isinstance(value, str):
+        if value in id_map:
+            return id_map[value]
+        if len(value) > 15 and any(old in value for old in id_map):
+            for old, new in id_map.items():
+                value = value.replace(old, new)
+        return value
+    return value
+
+
+class ReplayCopy:
+    """One independent re-run of a recording with its own users and records."""
+
+    def __init__(self, copy_index: int, header: dict, entries: list, question_map: dict, speed: float,
+                 as_superuser: bool):
+        self.index = copy_index
+        self.header = header
+        self.entries = entries
+        self.speed = speed
+        self.as_superuser = as_superuser
+        self.id_map = dict(question_map)
+        self.latencies = []
+        self.errors = Counter()
+        self.clients = {}
+        self.team_members = {}
+
+    def prepare(self, admin: PocketBaseClient):
+        """Create this copy's synthetic users and map recorded user ids onto them."""
+        recorded_host = None
+        players = []
+        for entry in self.entries:
+            record = entry['record']
+            if entry['collection'] == 'games' and recorded_host is None:
+                recorded_host = record.get('host')
+            if entry['collection'] == 'game_players':
+                if record.get('player') not in players:
+                    players.append(record.get('player'))
+                if record.get('team') and record['team'] not in self.team_members:
+                    self.team_members[record['team']] = record.get('player')
+
+        host_email = f'replay{self.index}_host@example.com'
+        host_user = ensure_user(admin, host_email, name=f'Replay {self.index} Host')
+        self.id_map[recorded_host] = host_user['id']
+        self.clients['host'] = admin if self.as_superuser else login(host_email)
+
+        for n, player_id in enumerate(players, start=1):
+            email = f'replay{self.index}_player{n}@example.com'
+            user = ensure_user(admin, email, name=f'Replay {self.index} Player {n}')
+            self.id_map[player_id] = user['id']
+            self.clients[f'player:{player_id}'] = admin if self.as_superuser else login(email)
+
+        self.admin = admin
+
+    def client_for(self, actor: str) -> PocketBaseClient:
+        if actor.startswith('team:'):
+            member = self.team_members.get(actor[5:])
+            actor = f'player:{member}' if member else 'host'
+        return self.clients.get(actor) or self.clients['host']
+
+    def run(self):
+        started = time.perf_counter()
+        for entry in self.entries:
+            if entry['collection'] == 'questions':
+                continue
+            if self.speed > 0:
+                delay = entry['t'] / self.speed - (time.perf_counter() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            self.apply(entry)
+        return time.perf_counter() - started
+
+    def apply(self, entry: dict):
+        collection, action = entry['collection'], entry['action']
+        payload = remap(entry['record'], self.id_map)
+        if collection == 'games' and action == 'create':
+            payload['code'] = random_game_code()
+        client = self.client_for(entry['actor'])
+
+        t0 = time.perf_counter()
+        try:
+            if action == 'create':
+                created = client.create(collection, payload)
+                self.id_map[entry['id']] = created['id']
+            elif action == 'update':
+                target = self.id_map.get(entry['id'])
+                if target is None:
+                    self.errors['unmapped'] += 1
+                    return
+                client.update(collection, target, payload)
+            elif action == 'delete':
+                target = self.id_map.get(entry['id'])
+                if target is not None:
+                    client.delete(collection, target)
+        except PocketBaseError as e:
+            self.errors[f'{collection}:{action}:{e.status}'] += 1
+            return
+        self.latencies.append((time.perf_counter() - t0) * 1000)
+
+    def cleanup(self):
+        game_id = self.id_map.get(self.header['game_id'])
+        if game_id:
+            try:
+                self.admin.delete('games', game_id)
+            except PocketBaseError:
+                pass
+
+
+def resolve_questions(admin: PocketBaseClient, entries: list) -> dict:
+    """Map recorded question ids to questions in the target instance, creating missing ones."""
+    question_map = {}
+    for entry in entries:
+        if entry['collection'] != 'questions':
+            continue
+        record = entry['record']
+        existing = None
+        try:
+            existing = admin.get_one('questions', entry['id'])
+        except PocketBaseError:
+            if record.get('external_id'):
+                existing = admin.get_first('questions', f'external_id = "{record["external_id"]}"')
+        if existing is None:
+            existing = admin.create('questions', record)
+        question_map[entry['id']] = existing['id']
+    return question_map
+
+
+def replay(args):
+    header, entries = load_recording(args.recording)
+    writes = [e for e in entries if e['collection'] != 'questions']
+    duration = writes[-1]['t'] if writes else 0
+    speed_label = 'max' if args.speed <= 0 else f'{args.speed:g}x'
+    print(f"▶️  REPLAY: {len(writes)} writes over {duration:.1f}s, {args.copies} copies at {speed_label}", flush=True)
+
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    question_map = resolve_questions(admin, entries)
+
+    events = Counter()
+    realtime = None
+    if args.count_events:
+        realtime = RealtimeSubscription(
+            admin, [f'{c}/*' for c in GAME_COLLECTIONS],
+            lambda topic, payload, at: events.update([topic.split('/')[0]])).start()
+
+    copies = [ReplayCopy(i, header, entries, question_map, args.speed, args.as_superuser)
+              for i in range(1, args.copies + 1)]
+    for copy in copies:
+        copy.prepare(admin)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.copies) as pool:
+        durations = list(pool.map(lambda c: c.run(), copies))
+    wall = time.perf_counter() - wall_start
+
+    if realtime:
+        time.sleep(1)
+        realtime.stop()
+    if not args.keep:
+        for copy in copies:
+            copy.cleanup()
+
+    latencies = [ms for copy in copies for ms in copy.latencies]
+    errors = Counter()
+    for copy in copies:
+        errors.update(copy.errors)
+
+    report = {
+        'recording': args.recording,
+        'speed': args.speed,
+        'copies': args.copies,
+        'recorded_duration_seconds': duration,
+        'wall_seconds': wall,
+        'copy_duration_seconds': summarize(durations),
+        'writes_issued': len(latencies) + sum(errors.values()),
+        'writes_per_second': len(latencies) / wall if wall else None,
+        'write_latency_ms': summarize(latencies),
+        'errors': dict(errors),
+        'realtime_events_seen': dict(events) if args.count_events else None,
+    }
+
+    print(format_summary('Write latency', report['write_latency_ms']))
+    print(f"Throughput: {report['writes_per_second'] or 0:.1f} writes/s, errors: {dict(errors) or 'none'}")
+    print(f"📄 Report: {write_report('replay', report)}")
+    return 0 if not errors else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Record and replay game write streams')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help='Capture a live game')
+    target = rec.add_mutually_exclusive_group(required=True)
+    target.add_argument('--game-code', help='6-character game code')
+    target.add_argument('--game-id', help='games record id')
+    rec.add_argument('--out', required=True)
+    rec.add_argument('--max-duration', type=float, default=4 * 3600, help='Stop after this many seconds')
+
+    imp = sub.add_parser('import-log', help='Rebuild a recording from the PocketBase request log')
+    imp.add_argument('--game-id', required=True)
+    imp.add_argument('--since', help='Log start, e.g. "2025-11-20 19:00:00" (defaults to game creation)')
+    imp.add_argument('--until')
+    imp.add_argument('--out', required=True)
+
+    rep = sub.add_parser('replay', help='Re-issue a recording against PB_URL')
+    rep.add_argument('recording')
+    rep.add_argument('--speed', type=float, default=1.0, help='Time scale, e.g. 1 or 10; 0 = max speed')
+    rep.add_argument('--copies', type=int, default=1, help='Independent copies replayed in parallel')
+    rep.add_argument('--as-superuser', action='store_true', help='Skip per-user auth and collection rules')
+    rep.add_argument('--count-events', action='store_true', help='Count realtime events the replay produces')
+    rep.add_argument('--keep', action='store_true', help='Keep replayed games afterwards')
+
+    args = parser.parse_args()
+    handlers = {'record': record_live, 'import-log': import_from_log, 'replay': replay}
+    sys.exit(handlers[args.command](args))
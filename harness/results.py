@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run history and regression checks across harness runs.
+
+write_report leaves one JSON file per run in ./tmp, with nothing tying it
+to the code or the machine that produced it. record_run appends a run to
+a JSONL history (./tmp/results.jsonl, override with HARNESS_RESULTS):
+
+- per-step latency percentiles, plus up to MAX_SAMPLES raw samples per
+  step so later comparisons can resample them
+- throughput figures
+- the git sha (and whether the tree was dirty) and an environment
+  fingerprint: CPU, cores, memory, OS, Python, PocketBase version
+- an optional label (--label, or HARNESS_RUN_LABEL), e.g. 'main'
+
+compare bootstraps a confidence interval for the change in p95 per step,
+hierarchically: each iteration resamples the runs on each side, then the
+samples within each chosen run, so run-to-run variance (a noisy machine,
+a slow start) widens the interval instead of hiding in a pooled sample. A
+step regressed when the whole interval is above zero and the change is
+more than --threshold percent.
+
+With a single run on either side there is no run-to-run variance to
+resample, so the interval only covers sample noise within that run. Such
+verdicts are marked provisional; record a few runs per side before
+trusting them.
+
+    python -m harness.results list --name orchestrator
+    python -m harness.results compare --name orchestrator --baseline label:main --candidate latest
+    python -m harness.results compare --name orchestrator --baseline sha:3f2c1ab --candidate label:scoreboard-batch
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import random
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from harness.stats import Histogram, percentile, summarize, write_report
+
+RESULTS_PATH = os.environ.get('HARNESS_RESULTS', './tmp/results.jsonl')
+RUN_LABEL = os.environ.get('HARNESS_RUN_LABEL')
+
+# Raw samples kept per step; larger sets are subsampled (seeded, so stable)
+MAX_SAMPLES = 2000
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def git_info() -> dict:
+    """Commit the run measured; dirty means uncommitted changes to tracked files."""
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True, timeout=10).stdout.strip()
+
+    try:
+        return {
+            'sha': git('rev-parse', 'HEAD') or None,
+            'branch': git('rev-parse', '--abbrev-ref', 'HEAD') or None,
+            'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+        }
+    except (OSError, subprocess.SubprocessError):
+        return {'sha': None, 'branch': None, 'dirty': None}
+
+
+def _cpu_model() -> str:
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _memory_mb():
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def _pocketbase_version():
+    try:
+        output = subprocess.run([os.environ.get('PB_BINARY', 'pocketbase'), '--version'],
+                                capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r'v?(\d+\.\d+\.\d+)', output)
+    return match.group(1) if match else None
+
+
+def environment() -> dict:
+    """What the machine looked like; 'fingerprint' hashes the parts that move latency."""
+    env = {
+        'host': socket.gethostname(),
+        'cpu': _cpu_model(),
+        'cores': os.cpu_count(),
+        'memory_mb': _memory_mb(),
+        'os': f'{platform.system()} {platform.release()}',
+        'python': platform.python_version(),
+        'pocketbase': _pocketbase_version(),
+    }
+    key = json.dumps([env['cpu'], env['cores'], env['memory_mb'], env['os'], env['pocketbase']])
+    env['fingerprint'] = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return env
+
+
+def histogram_samples(data: dict) -> list:
+    """Expand a Histogram.to_dict() back into one value per recorded sample (bucket bounds)."""
+    histogram = Histogram.from_dict(data)
+    values = []
+    for index in sorted(histogram.buckets):
+        value = min(max(Histogram.FLOOR * Histogram.GROWTH ** index, histogram.min), histogram.max)
+        values.extend([value] * histogram.buckets[index])
+    return values
+
+
+def step_record(values, rng: random.Random) -> dict:
+    """summarize() over all values plus at most MAX_SAMPLES of them."""
+    if isinstance(values, Histogram):
+        values = values.to_dict()
+    if isinstance(values, dict):
+        values = histogram_samples(values)
+    values = list(values)
+    kept = values if len(values) <= MAX_SAMPLES else rng.sample(values, MAX_SAMPLES)
+    return {**summarize(values), 'samples': kept}
+
+
+def record_run(name: str, steps: dict, throughput: dict = None, config: dict = None, label: str = None,
+               ok: bool = True, path: str = None) -> dict:
+    """
+    Append one run to the history and return it.
+
+    Args:
+        name: What was run ('orchestrator', 'sharded', a bench name)
+        steps: Step name -> latency samples in ms (a list, a Histogram
+            or Histogram.to_dict())
+        throughput: Name -> rate, e.g. {'answers_per_s': 41.2}
+        config: The run's arguments
+        label: Free-form tag to select the run by later
+        ok: Whether the run itself succeeded
+    """
+    path = path or RESULTS_PATH
+    started = time.time()
+    rng = random.Random(f'{name}:{started}')
+    git = git_info()
+    record = {
+        'id': f"{time.strftime('%Y%m%d_%H%M%S', time.localtime(started))}_{(git['sha'] or 'nogit')[:7]}_"
+              f"{rng.getrandbits(16):04x}",
+        'name': name,
+        'label': label or RUN_LABEL,
+        'time': started,
+        'ok': ok,
+        'git': git,
+        'environment': environment(),
+        'config': config or {},
+        'steps': {step: step_record(values, rng) for step, values in steps.items()},
+        'throughput': throughput or {},
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record, default=str) + '\n')
+    return record
+
+
+def load_runs(path: str = None, name: str = None) -> list:
+    path = path or RESULTS_PATH
+    if not os.path.exists(path):
+        return []
+    runs = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                run = json.loads(line)
+                if name is None or run['name'] == name:
+                    runs.append(run)
+    return runs
+
+
+def select_runs(runs: list, ref: str) -> list:
+    """
+    Runs matching ref:
+
+    - 'latest' or 'latest:N': the newest run, or the newest N
+    - 'label:NAME': every run with that label
+    - 'sha:PREFIX': every run of commits starting with PREFIX
+    - anything else: the run with that id
+    """
+    runs = sorted(runs, key=lambda run: run['time'])
+    if ref == 'latest' or ref.startswith('latest:'):
+        count = int(ref.partition(':')[2] or 1)
+        return runs[-count:]
+    if ref.startswith('label:'):
+        return [run for run in runs if run.get('label') == ref[6:]]
+    if ref.startswith('sha:'):
+        return [run for run in runs if (run['git'].get('sha') or '').startswith(ref[4:])]
+    return [run for run in runs if run['id'] == ref]
+
+
+def resample_runs(runs: list, rng: random.Random) -> list:
+    """One hierarchical bootstrap draw: runs with replacement, then samples within each run."""
+    values = []
+    for samples in rng.choices(runs, k=len(runs)):
+        values.extend(rng.choices(samples, k=len(samples)))
+    return values
+
+
+def bootstrap_p95_delta(baseline: list, candidate: list, iterations: int = 2000, confidence: float = 0.95,
+                        rng: random.Random = None) -> tuple:
+    """
+    Percentile bootstrap CI for p95(candidate) - p95(baseline): (low, high).
+
+    baseline and candidate are lists of runs, each a non-empty list of samples.
+    """
+    rng = rng or random.Random(0)
+    deltas = []
+    for _ in range(iterations):
+        deltas.append(percentile(resample_runs(candidate, rng), 95) - percentile(resample_runs(baseline, rng), 95))
+    tail = (1 - confidence) / 2 * 100
+    return percentile(deltas, tail), percentile(deltas, 100 - tail)
+
+
+def step_samples(runs: list, step: str) -> list:
+    """The recorded samples of step, one list per run that has any."""
+    return [run['steps'][step]['samples'] for run in runs if run['steps'].get(step, {}).get('samples')]
+
+
+def compare_runs(baseline: list, candidate: list, threshold_pct: float = 5, iterations: int = 2000,
+                 confidence: float = 0.95, min_samples: int = 5) -> dict:
+    """Per-step p95 change with a bootstrap CI, and the throughput change, candidate vs baseline."""
+    rng = random.Random(0)
+    steps = {}
+    names = sorted({step for run in baseline + candidate for step in run['steps']})
+    for step in names:
+        base_runs, cand_runs = step_samples(baseline, step), step_samples(candidate, step)
+        base = [v for samples in base_runs for v in samples]
+        cand = [v for samples in cand_runs for v in samples]
+        if len(base) < min_samples or len(cand) < min_samples:
+            steps[step] = {'baseline_n': len(base), 'candidate_n': len(cand), 'verdict': 'too few samples'}
+            continue
+        base_p95, cand_p95 = percentile(base, 95), percentile(cand, 95)
+        low, high = bootstrap_p95_delta(base_runs, cand_runs, iterations, confidence, rng)
+        change_pct = (cand_p95 - base_p95) / base_p95 * 100 if base_p95 else 0.0
+        if low > 0 and change_pct > threshold_pct:
+            verdict = 'regression'
+        elif high < 0 and change_pct < -threshold_pct:
+            verdict = 'improvement'
+        else:
+            verdict = 'no change'
+        steps[step] = {
+            'baseline_n': len(base),
+            'candidate_n': len(cand),
+            'baseline_runs': len(base_runs),
+            'candidate_runs': len(cand_runs),
+            # Single-run sides leave run-to-run variance out of the interval
+            'provisional': len(base_runs) < 2 or len(cand_runs) < 2,
+            'baseline_p95': base_p95,
+            'candidate_p95': cand_p95,
+            'change_pct': change_pct,
+            'ci': [low, high],
+            'verdict': verdict,
+        }
+
+    def mean_rate(runs, key):
+        rates = [run['throughput'][key] for run in runs if key in run.get('throughput', {})]
+        return sum(rates) / len(rates) if rates else None
+
+    throughput = {}
+    for key in sorted({key for run in baseline + candidate for key in run.get('throughput', {})}):
+        base, cand = mean_rate(baseline, key), mean_rate(candidate, key)
+        throughput[key] = {'baseline': base, 'candidate': cand,
+                           'change_pct': (cand - base) / base * 100 if base and cand is not None else None}
+
+    fingerprints = {run['environment'].get('fingerprint') for run in baseline + candidate}
+    return {
+        'baseline': [run['id'] for run in baseline],
+        'candidate': [run['id'] for run in candidate],
+        'confidence': confidence,
+        'threshold_pct': threshold_pct,
+        'same_environment': len(fingerprints) == 1,
+        'steps': steps,
+        'throughput': throughput,
+        'regressions': sorted(step for step, stats in steps.items() if stats['verdict'] == 'regression'),
+    }
+
+
+class StepTimer:
+    """
+    Step latencies from the progress lines scripts print.
+
+    spans: step -> (start pattern, end pattern); the time from a start line
+    to the next end line from the same source is one sample. A pattern
+    can be both, so 'Question \\d+' to the next 'Question \\d+' times each
+    question. values: step -> pattern with a named group 'ms' whose value
+    is recorded as printed. on_sample(step, ms) is called for every sample
+    (e.g. harness.live.LiveMetrics.observe).
+    """
+
+    def __init__(self, spans: dict = None, values: dict = None, on_sample=None):
+        self.spans = {step: (re.compile(start), re.compile(end)) for step, (start, end) in (spans or {}).items()}
+        self.values = {step: re.compile(pattern) for step, pattern in (values or {}).items()}
+        self.samples = {step: [] for step in [*self.spans, *self.values]}
+        self.on_sample = on_sample
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def _record(self, step: str, ms: float):
+        self.samples.setdefault(step, []).append(ms)
+        if self.on_sample is not None:
+            self.on_sample(step, ms)
+
+    def feed(self, source: str, line: str, at: float = None):
+        at = time.time() if at is None else at
+        with self._lock:
+            for step, (start, end) in self.spans.items():
+                key = (source, step)
+                if key in self._open and end.search(line):
+                    self._record(step, (at - self._open.pop(key)) * 1000)
+                if start.search(line):
+                    self._open[key] = at
+            for step, pattern in self.values.items():
+                match = pattern.search(line)
+                if match:
+                    self._record(step, float(match.group('ms')))
+
+    def add(self, step: str, ms: float):
+        with self._lock:
+            self._record(step, ms)
+
+
+def print_runs(runs: list):
+    for run in runs:
+        sha = (run['git'].get('sha') or '-')[:7] + ('*' if run['git'].get('dirty') else '')
+        p95s = ', '.join(f"{step} {stats['p95']:.0f}" for step, stats in sorted(run['steps'].items())
+                         if stats.get('count'))
+        print(f"{run['id']}  {run['name']:<14} {sha:<8} {run.get('label') or '-':<16} "
+              f"{'ok ' if run['ok'] else 'FAIL'} env {run['environment'].get('fingerprint')}  p95 ms: {p95s}")
+
+
+def print_comparison(comparison: dict):
+    print("\n" + "=" * 60)
+    print("📊 RESULTS COMPARISON")
+    print("=" * 60)
+    print(f"Baseline: {', '.join(comparison['baseline'])}")
+    print(f"Candidate: {', '.join(comparison['candidate'])}")
+    if not comparison['same_environment']:
+        print("⚠️  Runs come from different environments; differences may not be the code")
+    for step, stats in comparison['steps'].items():
+        if 'ci' not in stats:
+            print(f"{step}: {stats['verdict']} (n={stats['baseline_n']}/{stats['candidate_n']})")
+            continue
+        mark = {'regression': '❌', 'improvement': '✅'}.get(stats['verdict'], '  ')
+        low, high = stats['ci']
+        provisional = ' (provisional: one run on a side)' if stats['provisional'] else ''
+        print(f"{mark} {step}: p95 {stats['baseline_p95']:.1f} -> {stats['candidate_p95']:.1f}ms "
+              f"({stats['change_pct']:+.1f}%, {comparison['confidence']:.0%} CI {low:+.1f}..{high:+.1f}ms) "
+              f"{stats['verdict']}{provisional}")
+    for key, stats in comparison['throughput'].items():
+        change = f"{stats['change_pct']:+.1f}%" if stats['change_pct'] is not None else 'n/a'
+        print(f"   {key}: {stats['baseline']} -> {stats['candidate']} ({change})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='List recorded runs and compare them for regressions')
+    parser.add_argument('--results', default=RESULTS_PATH, help='History file (JSONL)')
+    commands = parser.add_subparsers(dest='action', required=True)
+
+    list_parser = commands.add_parser('list', help='Show recorded runs')
+    list_parser.add_argument('--name', help='Only runs of this name')
+    list_parser.add_argument('--last', type=int, default=20)
+
+    compare_parser = commands.add_parser('compare', help='Flag p95 regressions, candidate vs baseline')
+    compare_parser.add_argument('--name', required=True, help='Runs of this name (e.g. orchestrator)')
+    compare_parser.add_argument('--baseline', required=True, help='latest[:N], label:NAME, sha:PREFIX or a run id')
+    compare_parser.add_argument('--candidate', default='latest')
+    compare_parser.add_argument('--threshold', type=float, default=5, help='Smallest p95 change in %% that counts')
+    compare_parser.add_argument('--confidence', type=float, default=0.95)
+    compare_parser.add_argument('--iterations', type=int, default=2000, help='Bootstrap resamples')
+    args = parser.parse_args()
+
+    runs = load_runs(args.results, getattr(args, 'name', None))
+    if args.action == 'list':
+        print_runs(sorted(runs, key=lambda run: run['time'])[-args.last:])
+        sys.exit(0)
+
+    baseline, candidate = select_runs(runs, args.baseline), select_runs(runs, args.candidate)
+    if not baseline or not candidate:
+        print(f"❌ No runs named '{args.name}' match {args.baseline if not baseline else args.candidate}")
+        sys.exit(2)
+    candidate_ids = {run['id'] for run in candidate}
+    baseline = [run for run in baseline if run['id'] not in candidate_ids]
+    if not baseline:
+        print("❌ The baseline and the candidate are the same runs")
+        sys.exit(2)
+
+    comparison = compare_runs(baseline, candidate, args.threshold, args.iterations, args.confidence)
+    print_comparison(comparison)
+    print(f"📄 Report: {write_report('results_compare', comparison)}")
+    sys.exit(1 if comparison['regressions'] else 0)
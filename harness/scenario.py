@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seeded, reproducible scenarios for test_orchestrator.py and harness.shard.
+
+test_player.py drew think times and answers from the global `random`, so
+no two runs played the same game. A run now has one seed, and every client
+gets its own stream derived from it and the client's name
+(client_rng(seed, 'player3')). A client's choices therefore do not
+depend on how many other clients there are, the order they start in, or
+which worker they land on.
+
+A scenario file fixes the rest of the run: the players, their teams,
+how each one behaves, and the game length.
+
+    {
+      "seed": 1234,
+      "questions": 5,
+      "behaviours": {"sprinter": {"think_s": [0.2, 0.6]}},
+      "teams": [
+        {"name": "Team A", "players": [
+          {"email": "user1@example.com", "behaviour": "quick"},
+          {"email": "user2@example.com", "behaviour": "hesitant"}
+        ]},
+        {"name": "Team B", "players": [
+          {"email": "user3@example.com", "behaviour": "sprinter"},
+          {"email": "user4@example.com"}
+        ]}
+      ]
+    }
+
+    python test_orchestrator.py --scenario scenarios/venue.json
+    python test_orchestrator.py --seed 1234   # default scenario, fixed seed
+"""
+
+import copy
+import hashlib
+import json
+import random
+
+# How a player answers: think time before clicking (seconds, uniform) and
+# the chance of sitting a question out
+BEHAVIOURS = {
+    'casual': {'think_s': [1.0, 5.0], 'skip': 0.0},
+    'quick': {'think_s': [0.3, 1.5], 'skip': 0.0},
+    'slow': {'think_s': [4.0, 12.0], 'skip': 0.0},
+    'hesitant': {'think_s': [2.0, 6.0], 'skip': 0.2},
+}
+DEFAULT_BEHAVIOUR = 'casual'
+
+# What test_orchestrator.py always ran: two teams of two, five questions
+DEFAULT_SCENARIO = {
+    'seed': None,
+    'questions': 5,
+    'teams': [
+        {'name': 'Team A', 'players': [{'email': 'user1@example.com'}, {'email': 'user2@example.com'}]},
+        {'name': 'Team B', 'players': [{'email': 'user3@example.com'}, {'email': 'user4@example.com'}]},
+    ],
+}
+
+
+def derive_seed(seed: int, *names) -> int:
+    """64-bit seed for the stream named by names; stable across processes and Python versions."""
+    key = ':'.join(str(part) for part in (seed, *names))
+    return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], 'big')
+
+
+def client_rng(seed: int, *names) -> random.Random:
+    """The RNG stream for one client (or the game, the host...) of a seeded run."""
+    return random.Random(derive_seed(seed, *names))
+
+
+def new_seed() -> int:
+    """Seed for a run that was not given one, so it can still be re-run."""
+    return random.SystemRandom().randrange(1, 2 ** 31)
+
+
+def display_name(email: str) -> str:
+    """The name harness.seed.ensure_user gives a new account."""
+    return email.split('@')[0].title()
+
+
+def load_scenario(path: str = None) -> dict:
+    """
+    The scenario at path (or the default), validated, with each player
+    resolved to player_id, team, action and behaviour settings.
+
+    Raises ValueError for unknown behaviours or an empty team.
+    """
+    scenario = copy.deepcopy(DEFAULT_SCENARIO)
+    if path:
+        with open(path) as f:
+            scenario.update(json.load(f))
+
+    behaviours = {**BEHAVIOURS, **scenario.get('behaviours', {})}
+    for name, behaviour in behaviours.items():
+        low, high = behaviour.get('think_s', BEHAVIOURS[DEFAULT_BEHAVIOUR]['think_s'])
+        if not 0 <= low <= high:
+            raise ValueError(f"Behaviour '{name}': think_s must be [low, high] with 0 <= low <= high")
+
+    players = []
+    for team in scenario['teams']:
+        if not team.get('players'):
+            raise ValueError(f"Team '{team.get('name')}' has no players")
+        for i, player in enumerate(team['players']):
+            name = player.get('behaviour', DEFAULT_BEHAVIOUR)
+            if name not in behaviours:
+                raise ValueError(f"Unknown behaviour '{name}' (known: {', '.join(behaviours)})")
+            players.append({
+                'player_id': f'player{len(players) + 1}',
+                'email': player['email'],
+                'team_name': team['name'],
+                # The first player of each team creates it, the rest join
+                'action': 'create' if i == 0 else 'join',
+                'behaviour': name,
+                'think_s': behaviours[name].get('think_s', BEHAVIOURS[DEFAULT_BEHAVIOUR]['think_s']),
+                'skip': behaviours[name].get('skip', 0.0),
+            })
+    scenario['behaviours'] = behaviours
+    scenario['players'] = players
+    return scenario
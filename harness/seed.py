@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Seeding helpers - synthetic users and fully built games over REST.
+
+Mirrors what HostPage/RoundEditModal do through the UI: a game record, its
+rounds and the game_questions that link each round to the question bank.
+"""
+
+import random
+import secrets
+
+from harness.pocketbase import PocketBaseClient, PocketBaseError, DEFAULT_PASSWORD
+
+GAME_CODE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+GAME_CODE_LENGTH = 6
+GAME_CODE_ATTEMPTS = 5
+
+
+def random_game_code(rng: random.Random = random) -> str:
+    """Same alphabet and length as generateGameCode() in src/lib/games.ts."""
+    return ''.join(rng.choice(GAME_CODE_CHARS) for _ in range(GAME_CODE_LENGTH))
+
+
+def is_code_collision(error: PocketBaseError) -> bool:
+    """Whether a games create failed on the unique index on code."""
+    return error.status == 400 and (error.data.get('code') or {}).get('code') == 'validation_not_unique'
+
+
+def create_game_record(client: PocketBaseClient, data: dict, rng: random.Random = random,
+                       attempts: int = GAME_CODE_ATTEMPTS) -> tuple:
+    """
+    Create a games record with a fresh code, as gamesService.createGame does.
+
+    Returns:
+        (record, collisions) - collisions is how many codes were already taken
+    """
+    for collisions in range(attempts):
+        try:
+            return client.create('games', {**data, 'code': random_game_code(rng)}), collisions
+        except PocketBaseError as e:
+            if not is_code_collision(e):
+                raise
+    raise RuntimeError('Could not allocate a unique game code')
+
+
+def ensure_user(admin: PocketBaseClient, email: str, name: str = None, password: str = DEFAULT_PASSWORD) -> dict:
+    """Return the users record for email, creating it through the superuser if missing."""
+    existing = admin.get_first('users', f'email = "{email}"')
+    if existing:
+        return existing
+    return admin.create('users', {
+        'email': email,
+        'password': password,
+        'passwordConfirm': password,
+        'name': name or email.split('@')[0].title(),
+        'verified': True,
+    })
+
+
+def login(email: str, password: str = DEFAULT_PASSWORD) -> PocketBaseClient:
+    """Authenticated client for a regular user."""
+    client = PocketBaseClient()
+    client.auth_with_password(email, password)
+    return client
+
+
+def sample_question_ids(client: PocketBaseClient, count: int, rng: random.Random = random) -> list:
+    """Pick count question records from the bank (falls back to the first pages)."""
+    first = client.get_list('questions', page=1, per_page=1)
+    total = first.get('totalItems', 0)
+    if total == 0:
+        raise RuntimeError('questions collection is empty - run npm run import-questions first')
+
+    per_page = 200
+    pages = max(1, (total + per_page - 1) // per_page)
+    picked = {}
+    while len(picked) < min(count, total):
+        page = rng.randint(1, pages)
+        items = client.get_list('questions', page=page, per_page=per_page, skipTotal=1)['items']
+        for item in rng.sample(items, min(len(items), count - len(picked))):
+            picked[item['id']] = item
+    return list(picked.values())
+
+
+def create_game(host: PocketBaseClient, name: str, rounds: int = 3, questions_per_round: int = 3,
+                status: str = 'ready', metadata: dict = None, rng: random.Random = random) -> dict:
+    """
+    Create a playable game owned by the authenticated host.
+
+    Returns:
+        dict with 'game', 'rounds' (sorted by sequence_number) and
+        'questions' (round id -> list of game_questions sorted by sequence)
+    """
+    host_id = host.record['id']
+    bank = sample_question_ids(host, rounds * questions_per_round, rng)
+
+    game, _ = create_game_record(host, {
+        'host': host_id,
+        'name': name,
+        'status': status,
+        'metadata': metadata or {},
+        'data': {'state': 'game-start'},
+    }, rng)
+
+    round_records = []
+    questions = {}
+    for r in range(rounds):
+        chunk = bank[r * questions_per_round:(r + 1) * questions_per_round]
+        round_record = host.create('rounds', {
+            'host': host_id,
+            'game': game['id'],
+            'title': f'Round {r + 1}',
+            'question_count': len(chunk),
+            'categories': sorted({q['category'] for q in chunk}),
+            'sequence_number': r + 1,
+        })
+        round_records.append(round_record)
+        questions[round_record['id']] = [
+            host.create('game_questions', {
+                'host': host_id,
+                'game': game['id'],
+                'round': round_record['id'],
+                'question': q['id'],
+                'sequence': i + 1,
+                'category_name': q['category'],
+                'key': secrets.token_hex(16),
+            })
+            for i, q in enumerate(chunk)
+        ]
+
+    return {'game': game, 'rounds': round_records, 'questions': questions}
+
+
+def join_game(player: PocketBaseClient, game: dict, team: dict = None, team_name: str = None) -> dict:
+    """
+    Put the authenticated player on a team, creating the team if needed.
+
+    Mirrors GamePage's team modal: teams and players carry the game's host.
+
+    Returns:
+        dict with 'team' and 'player'
+    """
+    if team is None:
+        team = player.create('game_teams', {
+            'game': game['id'],
+            'name': team_name or f"Team {player.record.get('name') or player.record['id']}",
+            'host': game['host'],
+        })
+    record = player.create('game_players', {
+        'game': game['id'],
+        'player': player.record['id'],
+        'team': team['id'],
+        'name': player.record.get('name', ''),
+        'host': game['host'],
+    })
+    return {'team': team, 'player': record}
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Session pool - authenticate each synthetic user once, reuse the token.
+
+Logging in through the UI costs seconds per client and a bcrypt check on
+PocketBase. The pool authenticates over REST, caches the token on disk
+until shortly before its JWT expiry, and hands it out as a Playwright
+storage_state (the pocketbase_auth localStorage entry the JS SDK reads) or
+as a ready PocketBaseClient. New browser contexts then start signed in.
+
+    pool = SessionPool()
+    context = pool.new_context(browser, 'user1@example.com')
+    context.new_page().goto(app_url('/lobby'))
+
+The cache lives in ./tmp/sessions (override with HARNESS_SESSION_DIR).
+Entries are keyed by PocketBase origin and email, and written 0600 since
+they hold bearer tokens.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+
+from harness.browser import PB_AUTH_STORAGE_KEY, auth_storage_value
+from harness.pocketbase import APP_URL, DEFAULT_PASSWORD, PB_URL, PocketBaseClient, PocketBaseError
+
+SESSION_DIR = os.environ.get('HARNESS_SESSION_DIR', './tmp/sessions')
+
+# Re-authenticate when less than this is left on a cached token
+MIN_REMAINING_SECONDS = 15 * 60
+
+
+def token_expiry(token: str) -> float:
+    """exp claim of a PocketBase JWT (not verified - only used for caching)."""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, ValueError):
+        return 0.0
+
+
+class SessionPool:
+    """
+    Disk-backed cache of user auth tokens.
+
+    Args:
+        directory: Where cached sessions are stored
+        base_url: PocketBase origin the tokens are for
+        register: Sign the user up over REST if the login fails
+        min_remaining: Seconds of validity a cached token must still have
+    """
+
+    def __init__(self, directory: str = SESSION_DIR, base_url: str = PB_URL, register: bool = True,
+                 min_remaining: float = MIN_REMAINING_SECONDS):
+        self.directory = directory
+        self.base_url = base_url
+        self.register = register
+        self.min_remaining = min_remaining
+        self.hits = 0
+        self.misses = 0
+        self._memory = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, email: str) -> str:
+        key = hashlib.sha1(f'{self.base_url}|{email}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _fresh(self, session: dict) -> bool:
+        return bool(session) and session.get('expires', 0) - time.time() > self.min_remaining
+
+    def _load(self, email: str):
+        session = self._memory.get(email)
+        if self._fresh(session):
+            return session
+        try:
+            with open(self._path(email)) as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not self._fresh(session):
+            return None
+        self._memory[email] = session
+        return session
+
+    def _store(self, email: str, session: dict):
+        path = self._path(email)
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(session, f)
+        os.replace(tmp_path, path)
+        self._memory[email] = session
+
+    def _authenticate(self, email: str, password: str) -> dict:
+        client = PocketBaseClient(self.base_url)
+        try:
+            client.auth_with_password(email, password)
+        except PocketBaseError as e:
+            if not self.register or e.status != 400:
+                raise
+            # Same fallback as login_or_register_user, without the UI
+            client.create('users', {
+                'email': email,
+                'password': password,
+                'passwordConfirm': password,
+                'name': email.split('@')[0].title(),
+            })
+            client.auth_with_password(email, password)
+        return {
+            'email': email,
+            'token': client.token,
+            'record': client.record,
+            'expires': token_expiry(client.token),
+            'created': time.time(),
+        }
+
+    def get(self, email: str, password: str = DEFAULT_PASSWORD) -> dict:
+        """Cached session for email, authenticating only when needed."""
+        with self._lock:
+            session = self._load(email)
+        if session:
+            self.hits += 1
+            return session
+
+        self.misses += 1
+        session = self._authenticate(email, password)
+        with self._lock:
+            self._store(email, session)
+        return session
+
+    def invalidate(self, email: str):
+        with self._lock:
+            self._memory.pop(email, None)
+            try:
+                os.remove(self._path(email))
+            except OSError:
+                pass
+
+    def client(self, email: str, password: str = DEFAULT_PASSWORD) -> PocketBaseClient:
+        """REST client carrying the cached token - no request made."""
+        session = self.get(email, password)
+        client = PocketBaseClient(self.base_url, token=session['token'])
+        client.record = session['record']
+        return client
+
+    def storage_state(self, email: str, password: str = DEFAULT_PASSWORD, app_url: str = APP_URL) -> dict:
+        """Playwright storage_state with the SDK auth entry for app_url."""
+        session = self.get(email, password)
+        return {
+            'cookies': [],
+            'origins': [{
+                'origin': app_url.rstrip('/'),
+                'localStorage': [{
+                    'name': PB_AUTH_STORAGE_KEY,
+                    'value': auth_storage_value(session['token'], session['record']),
+                }],
+            }],
+        }
+
+    def new_context(self, browser, email: str, password: str = DEFAULT_PASSWORD, **context_options):
+        """Browser context that starts signed in as email."""
+        return browser.new_context(storage_state=self.storage_state(email, password), **context_options)
+
+
+if __name__ == "__main__":
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+
+    parser = argparse.ArgumentParser(description='Warm the session cache for synthetic users')
+    parser.add_argument('--prefix', default='user', help='Emails are <prefix><n>@example.com')
+    parser.add_argument('--count', type=int, default=4)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--refresh', action='store_true', help='Drop cached sessions first')
+    args = parser.parse_args()
+
+    pool = SessionPool()
+    emails = [f'{args.prefix}{n + 1}@example.com' for n in range(args.count)]
+    if args.refresh:
+        for email in emails:
+            pool.invalidate(email)
+
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(pool.get, emails))
+    print(f"🔑 SESSIONS: {len(emails)} sessions in {time.time() - started:.2f}s "
+          f"({pool.hits} cached, {pool.misses} authenticated) -> {pool.directory}")
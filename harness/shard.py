@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sharded load - many simulated players split across worker processes.
+
+The coordinator seeds one timed game, opens a single ControllerPage tab to
+run it (timers and auto-reveal advance it without clicks), and starts W
+worker processes, one per core by default. Each worker runs its share of
+players as coroutines on its own event loop: join the team, follow the
+game over realtime, and have each team's captain answer every question.
+
+Workers never print per client. They ship counters and mergeable
+histograms (harness.stats.Histogram) to the coordinator over a
+multiprocessing pipe every --report-interval seconds and once at the end,
+so the client count scales with cores instead of one GIL and one stdout.
+
+    python test_orchestrator.py --sharded --clients 2000 --workers 8
+    python -m harness.shard --clients 2000 --workers 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter
+from multiprocessing.connection import wait
+
+from harness.aio import AsyncPocketBaseClient, AsyncRealtimeSubscription
+from harness.gamestate import STATE_TOPICS, GameStateFollower
+from harness.pocketbase import (PocketBaseClient, PocketBaseError, RealtimeSubscription, SUPERUSER_EMAIL,
+                                SUPERUSER_PASSWORD, DEFAULT_PASSWORD, iso_time, parse_time)
+from harness.scenario import client_rng, new_seed
+from harness.seed import create_game, ensure_user, login
+from harness.stats import Histogram, format_summary, write_report
+
+METRICS = ('login_ms', 'join_ms', 'subscribe_ms', 'question_seen_ms', 'answer_ms')
+FINAL_STATES = ('game-end', 'thanks', 'return-to-lobby')
+
+
+def raise_fd_limit():
+    """Each simulated client holds two sockets - lift the soft fd limit."""
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+class WorkerMetrics:
+    """Per-worker counters and histograms, shipped as plain dicts."""
+
+    def __init__(self):
+        self.counters = Counter()
+        self.histograms = {name: Histogram() for name in METRICS}
+
+    def snapshot(self) -> dict:
+        return {
+            'counters': dict(self.counters),
+            'histograms': {name: h.to_dict() for name, h in self.histograms.items()},
+        }
+
+
+class SimulatedPlayer:
+    """One player: login, join, follow the game, answer if captain."""
+
+    def __init__(self, spec: dict, game: dict, metrics: WorkerMetrics, rng: random.Random, think_ms: float):
+        self.spec = spec
+        self.game = game
+        self.metrics = metrics
+        self.rng = rng
+        self.think_ms = think_ms
+        self.client = AsyncPocketBaseClient()
+        self.realtime = None
+        self.answered = set()
+        self.finished = asyncio.Event()
+        self._tasks = set()
+
+    async def prepare(self, admin: AsyncPocketBaseClient):
+        email = self.spec['email']
+        if not await admin.get_first('users', f'email = "{email}"'):
+            try:
+                await admin.create('users', {
+                    'email': email,
+                    'password': DEFAULT_PASSWORD,
+                    'passwordConfirm': DEFAULT_PASSWORD,
+                    'name': email.split('@')[0].title(),
+                    'verified': True,
+                })
+            except PocketBaseError as e:
+                if e.status != 400:  # Created by a previous run in the meantime
+                    raise
+
+        started = time.time()
+        await self.client.auth_with_password(email)
+        self.metrics.histograms['login_ms'].record((time.time() - started) * 1000)
+
+        started = time.time()
+        self.realtime = await AsyncRealtimeSubscription(
+            self.client, [f"games/{self.game['id']}", *STATE_TOPICS], GameStateFollower(self.on_event).on_event).start()
+        self.metrics.histograms['subscribe_ms'].record((time.time() - started) * 1000)
+
+        started = time.time()
+        await self.client.create('game_players', {
+            'game': self.game['id'],
+            'player': self.client.record['id'],
+            'team': self.spec['team'],
+            'name': self.client.record.get('name', ''),
+            'host': self.game['host'],
+        })
+        self.metrics.histograms['join_ms'].record((time.time() - started) * 1000)
+
+    def on_event(self, topic, payload, received_at):
+        self.metrics.counters['events'] += 1
+        record = payload.get('record') or {}
+        data = record.get('data') or {}
+        question = data.get('question') or {}
+        state = data.get('state')
+
+        if state == 'round-play' and question.get('id') and not question.get('correct_answer') \
+                and question['id'] not in self.answered:
+            self.answered.add(question['id'])
+            self.metrics.counters['questions_seen'] += 1
+            if record.get('updated'):
+                # Same host clock as PocketBase when run locally
+                self.metrics.histograms['question_seen_ms'].record((received_at - parse_time(record['updated'])) * 1000)
+            if self.spec['captain']:
+                task = asyncio.ensure_future(self.answer(question['id']))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        elif state in FINAL_STATES:
+            self.finished.set()
+
+    async def answer(self, question_id: str):
+        await asyncio.sleep(self.rng.uniform(0, self.think_ms) / 1000)
+        started = time.time()
+        try:
+            await self.client.create('game_answers', {
+                'game': self.game['id'],
+                'game_questions_id': question_id,
+                'team': self.spec['team'],
+                'answer': self.rng.choice('ABCD'),
+                'host': self.game['host'],
+            })
+            self.metrics.histograms['answer_ms'].record((time.time() - started) * 1000)
+            self.metrics.counters['answers'] += 1
+        except (PocketBaseError, OSError, asyncio.TimeoutError):
+            self.metrics.counters['answer_errors'] += 1
+
+    async def close(self):
+        if self.realtime:
+            await self.realtime.stop()
+        await self.client.close()
+
+
+async def run_worker_loop(index: int, conn, assignment: dict):
+    metrics = WorkerMetrics()
+    game = assignment['game']
+    admin = AsyncPocketBaseClient()
+    await admin.auth_with_password(SUPERUSER_EMAIL, SUPERUSER_PASSWORD, collection='_superusers')
+
+    # Each client's stream depends on the seed and its email only, not on the worker count
+    players = [SimulatedPlayer(spec, game, metrics, client_rng(assignment['seed'], spec['email']),
+                               assignment['think_ms']) for spec in assignment['players']]
+
+    # Ramp up in waves so logins don't all land in the same millisecond
+    semaphore = asyncio.Semaphore(assignment['ramp_concurrency'])
+    # Players that failed to log in, subscribe or join never see the game end
+    prepared = []
+
+    async def prepare(player):
+        async with semaphore:
+            try:
+                await player.prepare(admin)
+                prepared.append(player)
+                metrics.counters['ready'] += 1
+            except Exception as e:
+                metrics.counters['prepare_errors'] += 1
+                metrics.counters[f'prepare_error:{type(e).__name__}'] += 1
+
+    await asyncio.gather(*(prepare(player) for player in players))
+    await admin.close()
+    conn.send(('ready', index, metrics.snapshot()))
+
+    async def report():
+        while True:
+            await asyncio.sleep(assignment['report_interval'])
+            conn.send(('progress', index, metrics.snapshot()))
+
+    reporter = asyncio.ensure_future(report())
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    loop.add_reader(conn.fileno(), lambda: stop.set() if conn.poll() and conn.recv() == 'stop' else None)
+
+    everyone_done = asyncio.ensure_future(asyncio.gather(*(p.finished.wait() for p in prepared)))
+    stop_requested = asyncio.ensure_future(stop.wait())
+    await asyncio.wait({everyone_done, stop_requested}, timeout=assignment['timeout'],
+                       return_when=asyncio.FIRST_COMPLETED)
+    everyone_done.cancel()
+    stop_requested.cancel()
+    loop.remove_reader(conn.fileno())
+    reporter.cancel()
+
+    metrics.counters['finished'] = sum(1 for p in prepared if p.finished.is_set())
+    await asyncio.gather(*(p.close() for p in players), return_exceptions=True)
+    conn.send(('done', index, metrics.snapshot()))
+
+
+def worker_main(index: int, conn, assignment: dict):
+    """Worker process entry point."""
+    raise_fd_limit()
+    try:
+        asyncio.run(run_worker_loop(index, conn, assignment))
+    except Exception as e:
+        conn.send(('error', index, f'{type(e).__name__}: {e}'))
+    finally:
+        conn.close()
+
+
+def merge_snapshots(snapshots) -> dict:
+    counters = Counter()
+    histograms = {name: Histogram() for name in METRICS}
+    for snapshot in snapshots:
+        counters.update(snapshot['counters'])
+        for name, data in snapshot['histograms'].items():
+            histograms[name].merge(Histogram.from_dict(data))
+    return {'counters': dict(counters), 'latency_ms': {name: h.summary() for name, h in histograms.items()},
+            'histograms': {name: h.to_dict() for name, h in histograms.items()}}
+
+
+def seed_game(args):
+    """Game with every timer set and one team per --team-size players."""
+    admin = PocketBaseClient()
+    admin.auth_superuser()
+    ensure_user(admin, 'shardhost@example.com')
+    host = login('shardhost@example.com')
+    built = create_game(host, f'Sharded {args.clients} Players', rounds=args.rounds, rng=client_rng(args.seed, 'game'),
+                        questions_per_round=args.questions_per_round, metadata={
+                            'game_start_timer': 3,
+                            'round_start_timer': 3,
+                            'question_timer': args.question_timer,
+                            'answer_timer': 3,
+                            'round_end_timer': 3,
+                            'game_end_timer': 3,
+                            'auto_reveal_on_all_answered': True,
+                        })
+    game = built['game']
+    team_count = (args.clients + args.team_size - 1) // args.team_size
+    teams = [host.create('game_teams', {'game': game['id'], 'name': f'Team {t + 1}', 'host': game['host']})
+             for t in range(team_count)]
+    players = [{
+        'email': f'shard{i + 1}@example.com',
+        'team': teams[i // args.team_size]['id'],
+        'captain': i % args.team_size == 0,
+    } for i in range(args.clients)]
+    return host, game, players
+
+
+def open_controller(host: PocketBaseClient, game: dict):
+    """Headless ControllerPage that runs the game on its timers."""
+    from playwright.sync_api import sync_playwright
+    from harness.browser import app_url, new_authenticated_context
+
+    playwright = sync_playwright().start()
+    browser = playwright.chromium.launch(headless=True)
+    page = new_authenticated_context(browser, host).new_page()
+    page.goto(app_url(f"/controller/{game['id']}"))
+    page.wait_for_load_state('networkidle')
+    return playwright, browser
+
+
+def publish(live, merged: dict):
+    """Merged worker counters and histograms into a harness.live.LiveMetrics."""
+    counters = merged['counters']
+    for name, value in counters.items():
+        name, _, error = name.partition(':')
+        if error:
+            live.set_count(name, value, error=error)
+        else:
+            live.set_count(name, value)
+    live.gauge('active_clients', counters.get('ready', 0) - counters.get('finished', 0))
+    for name, summary in merged['latency_ms'].items():
+        live.set_step(name.replace('_ms', ''), summary)
+
+
+def follow_phase(host: PocketBaseClient, game_id: str, live) -> RealtimeSubscription:
+    """Keep live's phase on the game's state ('round-play q3') as the controller moves it."""
+    def on_state(topic, payload, received_at):
+        record = payload.get('record') or {}
+        if record.get('id') != game_id:
+            return
+        data = record.get('data') or {}
+        number = (data.get('question') or {}).get('question_number')
+        if data.get('state'):
+            live.set_phase(f"{data['state']} q{number}" if number else data['state'])
+
+    return RealtimeSubscription(host, [f'games/{game_id}', *STATE_TOPICS],
+                                GameStateFollower(on_state).on_event).start()
+
+
+def run_sharded(args, live=None) -> dict:
+    """
+    Run the game across the workers. live (harness.live.LiveMetrics), if
+    given, gets the merged counters and latencies at every worker report
+    and follows the game phase.
+    """
+    workers = args.workers or os.cpu_count() or 1
+    if args.seed is None:
+        args.seed = new_seed()
+    print(f"🧩 SHARDED: {args.clients} clients across {workers} workers, seed {args.seed}", flush=True)
+
+    host, game, players = seed_game(args)
+    print(f"🎮 SHARDED: Game {game['code']} ({game['id']})", flush=True)
+
+    ctx = multiprocessing.get_context('spawn')
+    processes, connections, latest = [], {}, {}
+    for index in range(workers):
+        parent_conn, child_conn = ctx.Pipe()
+        assignment = {
+            'game': game,
+            'players': players[index::workers],
+            'seed': args.seed,
+            'think_ms': args.think_ms,
+            'ramp_concurrency': args.ramp_concurrency,
+            'report_interval': args.report_interval,
+            'timeout': args.timeout,
+        }
+        process = ctx.Process(target=worker_main, args=(index, child_conn, assignment), daemon=True)
+        process.start()
+        child_conn.close()
+        processes.append(process)
+        connections[parent_conn] = index
+
+    def pump(until_kind: str, deadline: float):
+        """Receive worker messages until every worker has sent until_kind."""
+        pending = set(connections.values())
+        while pending and time.time() < deadline:
+            for conn in wait(list(connections), timeout=1):
+                try:
+                    kind, index, payload = conn.recv()
+                except EOFError:
+                    pending.discard(connections.pop(conn))
+                    continue
+                if kind == 'error':
+                    print(f"❌ SHARDED: Worker {index} failed: {payload}", flush=True)
+                    pending.discard(index)
+                    continue
+                latest[index] = payload
+                if live is not None:
+                    publish(live, merge_snapshots(latest.values()))
+                if kind == until_kind:
+                    pending.discard(index)
+                elif kind == 'progress':
+                    totals = merge_snapshots(latest.values())['counters']
+                    print(f"📈 SHARDED: {totals.get('events', 0)} events, {totals.get('answers', 0)} answers, "
+                          f"{totals.get('answer_errors', 0)} answer errors", flush=True)
+        return pending
+
+    started = time.time()
+    if live is not None:
+        live.set_phase('preparing')
+    not_ready = pump('ready', started + args.timeout)
+    ready = merge_snapshots(latest.values())
+    prepare_seconds = time.time() - started
+    print(f"✅ SHARDED: {ready['counters'].get('ready', 0)}/{args.clients} clients ready "
+          f"in {prepare_seconds:.1f}s", flush=True)
+
+    playwright, browser = open_controller(host, game)
+    phase = follow_phase(host, game['id'], live) if live is not None else None
+    now = time.time()
+    host.update('games', game['id'], {'data': {
+        'state': 'game-start',
+        'timer': {'startedAt': iso_time(now), 'duration': 3, 'expiresAt': iso_time(now + 3)},
+    }})
+    print("🚀 SHARDED: Game started", flush=True)
+
+    not_done = pump('done', time.time() + args.timeout)
+    for conn in list(connections):
+        try:
+            conn.send('stop')
+        except (BrokenPipeError, OSError):
+            pass
+    not_done = pump('done', time.time() + 30) if not_done else not_done
+    for process in processes:
+        process.join(timeout=10)
+        if process.is_alive():
+            process.terminate()
+
+    browser.close()
+    playwright.stop()
+    if phase is not None:
+        phase.stop()
+
+    result = merge_snapshots(latest.values())
+    result.update({
+        'config': vars(args),
+        'workers': workers,
+        'game_id': game['id'],
+        'prepare_seconds': prepare_seconds,
+        'game_seconds': time.time() - now,
+        'workers_not_ready': sorted(not_ready),
+        'workers_not_done': sorted(not_done),
+    })
+
+    if not args.keep:
+        try:
+            host.delete('games', game['id'])
+        except PocketBaseError:
+            pass
+    return result
+
+
+def print_results(result: dict):
+    counters = result['counters']
+    print("\n" + "=" * 60)
+    print("📊 SHARDED RESULTS")
+    print("=" * 60)
+    print(f"Workers: {result['workers']}  Clients ready: {counters.get('ready', 0)}/{result['config']['clients']}  "
+          f"finished: {counters.get('finished', 0)}")
+    print(f"Events: {counters.get('events', 0)}  Answers: {counters.get('answers', 0)}  "
+          f"errors: {counters.get('answer_errors', 0) + counters.get('prepare_errors', 0)}")
+    for name in METRICS:
+        print(format_summary(name.replace('_ms', '').replace('_', ' ').capitalize(), result['latency_ms'][name]))
+    print(f"📄 Report: {write_report('sharded', result)}")
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--clients', type=int, default=200, help='Simulated players in total')
+    parser.add_argument('--workers', type=int, default=0, help='Worker processes (default: one per core)')
+    parser.add_argument('--team-size', type=int, default=4)
+    parser.add_argument('--rounds', type=int, default=2)
+    parser.add_argument('--questions-per-round', type=int, default=3)
+    parser.add_argument('--question-timer', type=int, default=20)
+    parser.add_argument('--think-ms', type=float, default=5000, help='Max random delay before a captain answers')
+    parser.add_argument('--ramp-concurrency', type=int, default=50, help='Clients preparing at once per worker')
+    parser.add_argument('--report-interval', type=float, default=5)
+    parser.add_argument('--timeout', type=float, default=900)
+    parser.add_argument('--seed', type=int, default=None, help='Run seed; each client gets its own stream from it')
+    parser.add_argument('--keep', action='store_true', help='Keep the seeded game after the run')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Run many simulated players across worker processes')
+    add_arguments(parser)
+    args = parser.parse_args()
+    result = run_sharded(args)
+    print_results(result)
+    sys.exit(0 if not result['workers_not_done'] and not result['counters'].get('prepare_errors') else 1)
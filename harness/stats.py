@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Latency statistics and JSON run reports shared by the harness scripts.
+"""
+
+import json
+import math
+import os
+import time
+from collections import Counter
+
+
+def percentile(values, pct: float) -> float:
+    """Linear-interpolated percentile of a list of numbers (pct in 0-100)."""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    if low == high:
+        return ordered[int(rank)]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values) -> dict:
+    """Return count/min/mean/p50/p90/p95/p99/max for a list of samples."""
+    if not values:
+        return {'count': 0}
+    return {
+        'count': len(values),
+        'min': min(values),
+        'mean': sum(values) / len(values),
+        'p50': percentile(values, 50),
+        'p90': percentile(values, 90),
+        'p95': percentile(values, 95),
+        'p99': percentile(values, 99),
+        'max': max(values),
+    }
+
+
+def peak_rate(timestamps, window: float = 1.0) -> int:
+    """Largest number of events inside any window-second bucket."""
+    buckets = Counter(int(t / window) for t in timestamps)
+    return max(buckets.values()) if buckets else 0
+
+
+class Histogram:
+    """
+    Log-bucketed latency histogram (~1% precision) that merges across processes.
+
+    Worker processes record into their own Histogram and ship to_dict()
+    over a pipe; the coordinator merge()s them. Percentiles come from the
+    bucket bounds, so they stay exact to within one bucket however many
+    samples were taken.
+    """
+
+    GROWTH = 1.01
+    FLOOR = 0.01  # Smaller values (including negatives) share the first bucket
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value: float):
+        index = math.ceil(math.log(max(value, self.FLOOR) / self.FLOOR, self.GROWTH))
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: 'Histogram'):
+        for index, n in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return float('nan')
+        target = max(1, math.ceil(self.count * pct / 100.0))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(max(self.FLOOR * self.GROWTH ** index, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """Same shape as summarize()."""
+        if not self.count:
+            return {'count': 0}
+        return {
+            'count': self.count,
+            'min': self.min,
+            'mean': self.total / self.count,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+    def to_dict(self) -> dict:
+        return {'buckets': self.buckets, 'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Histogram':
+        histogram = cls()
+        histogram.buckets = {int(k): v for k, v in data['buckets'].items()}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
+
+
+def format_summary(name: str, summary: dict, unit: str = 'ms') -> str:
+    """One-line human readable rendering of summarize() output."""
+    if not summary.get('count'):
+        return f"{name}: no samples"
+    return (
+        f"{name}: n={summary['count']} "
+        f"p50={summary['p50']:.1f}{unit} p95={summary['p95']:.1f}{unit} "
+        f"p99={summary['p99']:.1f}{unit} max={summary['max']:.1f}{unit}"
+    )
+
+
+def write_report(name: str, report: dict, directory: str = './tmp') -> str:
+    """Write a JSON run report next to the screenshots and return its path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, default=str)
+    return path
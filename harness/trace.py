@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chrome performance traces of app pages and what they say about rendering.
+
+PageTrace records a DevTools timeline trace of one page over CDP (Tracing
+on the page's own session, so several pages of one browser can be traced
+at once). analyze_trace reduces it to the numbers worth tracking across
+releases:
+
+- long tasks: main-thread tasks over 50 ms
+- scripting time per state transition: script execution on the renderer
+  main thread between one game state change and the next
+- frames: frames drawn and frames Chrome reports as dropped
+
+The raw trace is saved as JSON and opens in the DevTools Performance panel
+or ui.perfetto.dev.
+
+    trace = PageTrace(page).start()
+    ...
+    events = trace.stop('./tmp/traces/host.json')
+    summary = analyze_trace(events, transitions=[(epoch_seconds, 'round-play'), ...])
+"""
+
+import base64
+import json
+import os
+import time
+
+# What the DevTools Performance panel records, minus screenshots
+TRACE_CATEGORIES = [
+    'devtools.timeline',
+    'disabled-by-default-devtools.timeline',
+    'disabled-by-default-devtools.timeline.frame',
+    'blink.user_timing',
+    'toplevel',
+    'v8.execute',
+]
+
+LONG_TASK_MS = 50
+
+# Trace events DevTools counts as scripting
+SCRIPT_EVENTS = {
+    'EvaluateScript', 'FunctionCall', 'TimerFire', 'EventDispatch', 'FireAnimationFrame',
+    'FireIdleCallback', 'RunMicrotasks', 'XHRReadyStateChange', 'XHRLoad', 'v8.compile',
+    'v8.compileModule', 'v8.evaluateModule', 'V8.Execute',
+}
+
+SYNC_MARK = 'harness-trace-sync'
+
+
+class PageTrace:
+    """
+    Timeline trace of one page.
+
+    A performance mark named after Date.now() is dropped right after tracing
+    starts so wall-clock times (e.g. realtime receipts) can be placed on
+    the trace's own clock.
+    """
+
+    def __init__(self, page, categories: list = None):
+        self.page = page
+        self.categories = categories or TRACE_CATEGORIES
+        self.cdp = page.context.new_cdp_session(page)
+        self._stream = None
+        self._complete = False
+        self.cdp.on('Tracing.tracingComplete', self._on_complete)
+
+    def _on_complete(self, params):
+        self._stream = params.get('stream')
+        self._complete = True
+
+    def start(self):
+        self.cdp.send('Tracing.start', {
+            'transferMode': 'ReturnAsStream',
+            'traceConfig': {
+                'recordMode': 'recordContinuously',
+                'includedCategories': self.categories,
+                'excludedCategories': ['*'],
+            },
+        })
+        self.page.evaluate(f"() => performance.mark('{SYNC_MARK}:' + Date.now())")
+        return self
+
+    def stop(self, path: str = None, timeout: float = 60) -> list:
+        """End tracing, return the trace events and optionally save them to path."""
+        self.cdp.send('Tracing.end')
+        deadline = time.time() + timeout
+        while not self._complete and time.time() < deadline:
+            # Events are only delivered while Playwright is waiting on something
+            self.page.wait_for_timeout(50)
+        if not self._stream:
+            raise TimeoutError('Trace was not delivered')
+
+        chunks = []
+        while True:
+            result = self.cdp.send('IO.read', {'handle': self._stream, 'size': 1 << 20})
+            data = result.get('data', '')
+            chunks.append(base64.b64decode(data) if result.get('base64Encoded') else data.encode('utf-8'))
+            if result.get('eof'):
+                break
+        self.cdp.send('IO.close', {'handle': self._stream})
+        self.cdp.detach()
+
+        raw = b''.join(chunks)
+        if path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(raw)
+        trace = json.loads(raw)
+        return trace['traceEvents'] if isinstance(trace, dict) else trace
+
+
+def _main_threads(events) -> set:
+    return {(e['pid'], e['tid']) for e in events
+            if e.get('ph') == 'M' and e.get('name') == 'thread_name'
+            and e.get('args', {}).get('name') == 'CrRendererMain'}
+
+
+def _clock_offset_us(events):
+    """trace ts minus epoch microseconds, from the sync mark (None if missing)."""
+    for e in events:
+        name = e.get('name') or ''
+        if name.startswith(SYNC_MARK + ':') and 'ts' in e:
+            try:
+                epoch_ms = float(name.split(':', 1)[1])
+            except ValueError:
+                continue
+            return e['ts'] - epoch_ms * 1000
+    return None
+
+
+def _merged(intervals):
+    """Total length of a list of (start, end) intervals, overlaps counted once."""
+    total, current_start, current_end = 0, None, None
+    for start, end in sorted(intervals):
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                total += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+    if current_end is not None:
+        total += current_end - current_start
+    return total
+
+
+def analyze_trace(events: list, transitions: list = None) -> dict:
+    """
+    Long tasks, scripting per transition and frame counts of a trace.
+
+    Args:
+        events: traceEvents as returned by PageTrace.stop
+        transitions: (epoch seconds, label) of each game state change; the
+            scripting window of a transition runs until the next one
+    """
+    main = _main_threads(events)
+    on_main = [e for e in events if (e.get('pid'), e.get('tid')) in main and e.get('ph') == 'X']
+
+    long_tasks = [e['dur'] / 1000 for e in on_main
+                  if e.get('name') in ('RunTask', 'ThreadControllerImpl::RunTask')
+                  and e.get('dur', 0) / 1000 > LONG_TASK_MS]
+    scripts = [(e['ts'], e['ts'] + e.get('dur', 0)) for e in on_main if e.get('name') in SCRIPT_EVENTS]
+
+    drawn = sum(1 for e in events if e.get('name') == 'DrawFrame')
+    dropped = sum(1 for e in events if e.get('name') == 'DroppedFrame')
+    dropped += sum(1 for e in events if e.get('name') == 'PipelineReporter' and e.get('ph') in ('b', 'X')
+                   and e.get('args', {}).get('chrome_frame_reporter', {}).get('state') == 'STATE_DROPPED')
+
+    per_transition = []
+    offset = _clock_offset_us(events)
+    if transitions and offset is not None:
+        bounds = [(at * 1e6 + offset, label) for at, label in sorted(transitions)]
+        trace_end = max((e['ts'] + e.get('dur', 0) for e in on_main), default=0)
+        for i, (start, label) in enumerate(bounds):
+            end = bounds[i + 1][0] if i + 1 < len(bounds) else trace_end
+            clipped = [(max(s, start), min(e, end)) for s, e in scripts if e > start and s < end]
+            window_tasks = [e['dur'] / 1000 for e in on_main
+                            if e.get('name') in ('RunTask', 'ThreadControllerImpl::RunTask')
+                            and start <= e['ts'] < end and e.get('dur', 0) / 1000 > LONG_TASK_MS]
+            per_transition.append({
+                'state': label,
+                'window_ms': max(0.0, (end - start) / 1000),
+                'scripting_ms': _merged(clipped) / 1000,
+                'long_tasks': len(window_tasks),
+            })
+
+    return {
+        'long_tasks': len(long_tasks),
+        'long_task_ms': long_tasks,
+        'scripting_ms_total': _merged(scripts) / 1000,
+        'frames_drawn': drawn,
+        'frames_dropped': dropped,
+        'transitions': per_transition,
+    }
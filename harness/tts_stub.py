@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Offline stand-in for the Google text-to-speech endpoint.
+
+pb_hooks/audio_generation.pb.js posts to
+{TTS_API_BASE_URL}/v1/text:synthesize. Point TTS_API_BASE_URL at this server
+to exercise the audio pipeline without network access:
+
+    python -m harness.tts_stub --port 8765 --latency-ms 400 --error-rate 0.05
+    TTS_API_BASE_URL=http://127.0.0.1:8765 GEMINI_API_KEYS='["stub"]' pocketbase serve --dev
+
+Every knob can also come from the environment (TTS_STUB_LATENCY_MS,
+TTS_STUB_JITTER_MS, TTS_STUB_ERROR_RATE, TTS_STUB_RATE_LIMIT_RATE) so the
+stub can be configured the same way PocketBase is. GET /stats returns the
+request counters as JSON.
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# One silent MPEG-1 Layer III frame (128 kbps, 44.1 kHz) - enough for an
+# <audio> element to accept the file.
+SILENT_MP3_FRAME = b'\xff\xfb\x90\x64' + b'\x00' * 413
+
+
+class StubConfig:
+    def __init__(self, latency_ms: float, jitter_ms: float, error_rate: float, rate_limit_rate: float,
+                 frames: int, seed: int = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.frames = frames
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counters = {'requests': 0, 'ok': 0, 'errors': 0, 'rate_limited': 0, 'bad_requests': 0}
+
+    def count(self, key: str):
+        with self.lock:
+            self.counters[key] += 1
+
+    def draw(self):
+        """Pick (delay_seconds, outcome) for one request."""
+        with self.lock:
+            delay = max(0.0, self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000.0
+            roll = self.rng.random()
+        if roll < self.rate_limit_rate:
+            return delay, 'rate_limited'
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay, 'errors'
+        return delay, 'ok'
+
+
+def make_handler(config: StubConfig):
+    audio_content = base64.b64encode(SILENT_MP3_FRAME * config.frames).decode('ascii')
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, payload: dict):
+            body = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == '/stats':
+                with config.lock:
+                    self._send_json(200, dict(config.counters))
+            else:
+                self._send_json(404, {'error': {'code': 404, 'message': 'Not found'}})
+
+        def do_POST(self):
+            if not self.path.startswith('/v1/text:synthesize'):
+                self._send_json(404, {'error': {'code': 404, 'message': 'Not found'}})
+                return
+
+            config.count('requests')
+            length = int(self.headers.get('Content-Length') or 0)
+            try:
+                request = json.loads(self.rfile.read(length) or b'{}')
+                text = request['input']['text']
+            except (ValueError, KeyError, TypeError):
+                config.count('bad_requests')
+                self._send_json(400, {'error': {'code': 400, 'message': 'input.text is required'}})
+                return
+
+            delay, outcome = config.draw()
+            time.sleep(delay)
+            config.count(outcome)
+
+            if outcome == 'rate_limited':
+                self._send_json(429, {'error': {'code': 429, 'status': 'RESOURCE_EXHAUSTED',
+                                                'message': 'Quota exceeded (stub)'}})
+            elif outcome == 'errors':
+                self._send_json(500, {'error': {'code': 500, 'status': 'INTERNAL',
+                                                'message': 'Injected failure (stub)'}})
+            else:
+                self._send_json(200, {'audioContent': audio_content, 'characters': len(text)})
+
+    return Handler
+
+
+def serve(host: str, port: int, config: StubConfig) -> ThreadingHTTPServer:
+    """Start the stub in a background thread and return the server."""
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    return float(value) if value not in (None, '') else default
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Local stand-in for texttospeech.googleapis.com')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('TTS_STUB_PORT', 8765)))
+    parser.add_argument('--latency-ms', type=float, default=_env_float('TTS_STUB_LATENCY_MS', 300))
+    parser.add_argument('--jitter-ms', type=float, default=_env_float('TTS_STUB_JITTER_MS', 100))
+    parser.add_argument('--error-rate', type=float, default=_env_float('TTS_STUB_ERROR_RATE', 0.0),
+                        help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=_env_float('TTS_STUB_RATE_LIMIT_RATE', 0.0),
+                        help='Fraction of requests answered with HTTP 429')
+    parser.add_argument('--frames', type=int, default=40, help='MP3 frames per response (~26 ms each)')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    stub_config = StubConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit_rate,
+                             args.frames, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(stub_config))
+    print(f"🔊 TTS STUB: listening on http://{args.host}:{args.port} "
+          f"(latency {args.latency_ms}±{args.jitter_ms} ms, 500s {args.error_rate:.0%}, "
+          f"429s {args.rate_limit_rate:.0%})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 TTS STUB: {stub_config.counters}", flush=True)
@@ -19,9 +19,15 @@ function getGeminiApiKeys() {
   }
 }
 
+// Helper: TTS endpoint origin (override with TTS_API_BASE_URL to use the local stub in harness/tts_stub.py)
+function getTtsBaseUrl() {
+  const baseUrl = __env.get('TTS_API_BASE_URL') || 'https://texttospeech.googleapis.com';
+  return baseUrl.replace(/\/+$/, '');
+}
+
 // Helper: Call Gemini TTS API with 30-second timeout
 async function generateAudio(text, apiKey) {
-  const url = `https://texttospeech.googleapis.com/v1/text:synthesize?key=${apiKey}`;
+  const url = `${getTtsBaseUrl()}/v1/text:synthesize?key=${apiKey}`;
 
   // Create timeout promise
   const timeoutPromise = new Promise((_, reject) => {
@@ -381,5 +387,5 @@ onBootstrap((e) => {
 
 // Export for testing
 if (typeof module !== 'undefined' && module.exports) {
-  module.exports = { getGeminiApiKeys, generateAudio };
+  module.exports = { getGeminiApiKeys, getTtsBaseUrl, generateAudio };
 }
@@ -0,0 +1,15 @@
+/// <reference path="../pb_data/types.d.ts" />
+
+// Long-lived caching for avatar downloads.
+//
+// PocketBase gives every uploaded file a new name (name_<random>.ext), so
+// an avatar URL - thumb or original - always points at the same bytes. The
+// default Cache-Control (30 days, revalidated after) makes every roster on
+// every phone and TV check each avatar again; marked immutable, a browser
+// that has one never asks again.
+onFileDownloadRequest((e) => {
+  if (e.collection.name === "users" && e.fileField.name === "avatar") {
+    e.response.header().set("Cache-Control", "public, max-age=31536000, immutable");
+  }
+  e.next();
+});
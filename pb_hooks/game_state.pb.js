@@ -0,0 +1,79 @@
+/// <reference path="../pb_data/types.d.ts" />
+
+// API endpoint: GET /api/games/:id/state
+//
+// A game's record and its current state in one request. The state is the
+// games.data snapshot with every game_state_updates patch after its seq
+// applied (see src/lib/gameState.ts). Clients call this when their realtime
+// connection comes back instead of refetching the game and its patches.
+//
+// Response: { game, state, seq }
+routerAdd("GET", "/api/games/{id}/state", (e) => {
+  // Handlers run in their own VM, so helpers are declared inside
+  const isObject = (value) => typeof value === "object" && value !== null && !Array.isArray(value);
+
+  // JSON merge patch (RFC 7386), same as applyGameStatePatch
+  const applyPatch = (state, patch) => {
+    const result = Object.assign({}, state || {});
+    for (const key of Object.keys(patch)) {
+      const value = patch[key];
+      if (value === null) {
+        delete result[key];
+      } else if (isObject(value)) {
+        result[key] = applyPatch(isObject(result[key]) ? result[key] : {}, value);
+      } else {
+        result[key] = value;
+      }
+    }
+    return result;
+  };
+
+  const parseJson = (raw) => {
+    try {
+      return raw ? JSON.parse(raw) : null;
+    } catch (err) {
+      return null;
+    }
+  };
+
+  const gameId = e.request.pathValue("id");
+
+  if (!e.auth) {
+    return e.json(403, { error: "Authentication required" });
+  }
+
+  let game;
+  try {
+    game = e.app.findRecordById("games", gameId);
+  } catch (err) {
+    return e.json(404, { error: "Game not found" });
+  }
+
+  try {
+    const snapshot = parseJson(game.getString("data"));
+    let state = isObject(snapshot) ? snapshot : null;
+    // games.data without a seq is the state before the first patch
+    let seq = state && typeof state.seq === "number" ? state.seq : 0;
+    if (state) delete state.seq;
+
+    // Replay the patches written after the snapshot
+    const updates = e.app.findRecordsByFilter(
+      "game_state_updates",
+      `game = {:gameId} && seq > {:seq}`,
+      "seq",
+      -1,
+      0,
+      { gameId, seq }
+    );
+    for (const update of updates) {
+      if (update.getInt("seq") !== seq + 1) break;
+      state = applyPatch(state, parseJson(update.getString("patch")) || {});
+      seq++;
+    }
+
+    return e.json(200, { game, state, seq });
+  } catch (err) {
+    console.error("[GameState] Failed to build state for game", gameId, err);
+    return e.json(500, { error: "Failed to load game state" });
+  }
+});
@@ -0,0 +1,36 @@
+/// <reference path="../pb_data/types.d.ts" />
+
+/**
+ * Migration: Cover the host dashboard sort with idx_games_host_startdate
+ *
+ * The host dashboard pages through a host's games sorted by
+ * -startdate,-updated,-id and continues each page after the last game seen
+ * (src/lib/games.ts - getGamesPage()). With every sort column in the index
+ * a page is one range scan and needs no temporary sort, however many games
+ * the host has.
+ */
+
+const OLD_INDEX = "CREATE INDEX `idx_games_host_startdate` ON `games` (`host`, `startdate`)"
+const NEW_INDEX = "CREATE INDEX `idx_games_host_startdate` ON `games` (`host`, `startdate`, `updated`, `id`)"
+
+migrate((app) => {
+  const gamesCollection = app.findCollectionByNameOrId("games")
+  if (!gamesCollection) {
+    throw new Error("Games collection not found")
+  }
+
+  gamesCollection.indexes = gamesCollection.indexes.filter(idx => !idx.includes("idx_games_host_startdate"))
+  gamesCollection.indexes.push(NEW_INDEX)
+
+  app.save(gamesCollection)
+  console.log("✓ idx_games_host_startdate now covers startdate, updated and id")
+  return null
+}, (app) => {
+  const gamesCollection = app.findCollectionByNameOrId("games")
+  if (gamesCollection) {
+    gamesCollection.indexes = gamesCollection.indexes.filter(idx => !idx.includes("idx_games_host_startdate"))
+    gamesCollection.indexes.push(OLD_INDEX)
+    app.save(gamesCollection)
+  }
+  return null
+})
@@ -0,0 +1,101 @@
+/// <reference path="../pb_data/types.d.ts" />
+
+/**
+ * Migration: game_state_updates
+ *
+ * One record per game state transition: a JSON merge patch against the
+ * previous state and its sequence number within the game. games.data keeps
+ * a full snapshot (with its seq) every few updates. See src/lib/gameState.ts.
+ */
+migrate((app) => {
+  // Resolve games collection ID dynamically
+  const gamesCollection = app.findCollectionByNameOrId("games");
+  if (!gamesCollection) {
+    throw new Error("games collection not found");
+  }
+
+  const collection = new Collection({
+    "name": "game_state_updates",
+    "type": "base",
+    "system": false,
+    "fields": [
+      {
+        "autogeneratePattern": "[a-z0-9]{15}",
+        "hidden": false,
+        "id": "text3208210256",
+        "max": 15,
+        "min": 15,
+        "name": "id",
+        "pattern": "^[a-z0-9]+$",
+        "presentable": false,
+        "primaryKey": true,
+        "required": true,
+        "system": true,
+        "type": "text"
+      },
+      {
+        "cascadeDelete": true,
+        "collectionId": gamesCollection.id,
+        "hidden": false,
+        "id": "relation590033292",
+        "maxSelect": 1,
+        "minSelect": 0,
+        "name": "game",
+        "presentable": false,
+        "required": true,
+        "system": false,
+        "type": "relation"
+      },
+      {
+        "hidden": false,
+        "id": "number2855735217",
+        "max": null,
+        "min": 1,
+        "name": "seq",
+        "onlyInt": true,
+        "presentable": false,
+        "required": true,
+        "system": false,
+        "type": "number"
+      },
+      {
+        "hidden": false,
+        "id": "json2855735218",
+        "maxSize": 0,
+        "name": "patch",
+        "presentable": false,
+        "required": false,
+        "system": false,
+        "type": "json"
+      },
+      {
+        "hidden": false,
+        "id": "autodate2990389177",
+        "name": "created",
+        "onCreate": true,
+        "onUpdate": false,
+        "presentable": false,
+        "system": false,
+        "type": "autodate"
+      }
+    ],
+    "indexes": [
+      // One writer per seq - a second controller tab gets a conflict and catches up
+      "CREATE UNIQUE INDEX `idx_game_state_updates_game_seq` ON `game_state_updates` (`game`, `seq`)"
+    ],
+    // Readable by anyone signed in, like games
+    "listRule": "@request.auth.id != ''",
+    "viewRule": "@request.auth.id != ''",
+    "createRule": "@request.auth.id != '' && game.host.id = @request.auth.id",
+    "updateRule": null,
+    "deleteRule": null
+  });
+
+  return app.save(collection);
+}, (app) => {
+  // Rollback: delete collection
+  const collection = app.findCollectionByNameOrId("game_state_updates");
+  if (collection) {
+    return app.delete(collection);
+  }
+});
@@ -0,0 +1,34 @@
+/// <reference path="../pb_data/types.d.ts" />
+
+/**
+ * Migration: Register avatar thumb sizes on users.avatar
+ *
+ * Rosters and score cards ask for avatars with ?thumb=100x100 and the
+ * detail modals with ?thumb=400x400 (getAvatarUrl in src/lib/pocketbase.ts
+ * and trivia-party-display/src/lib/pocketbase.ts). PocketBase only
+ * generates thumbs for sizes listed on the field and serves the original
+ * upload for any other, so every roster was downloading full-size photos.
+ */
+
+const AVATAR_THUMBS = ["100x100", "400x400"]
+
+migrate((app) => {
+  const users = app.findCollectionByNameOrId("_pb_users_auth_")
+  const avatar = users.fields.getByName("avatar")
+  if (!avatar) {
+    throw new Error("users.avatar field not found")
+  }
+
+  avatar.thumbs = AVATAR_THUMBS
+  app.save(users)
+  console.log("✓ users.avatar thumbs:", AVATAR_THUMBS.join(", "))
+  return null
+}, (app) => {
+  const users = app.findCollectionByNameOrId("_pb_users_auth_")
+  const avatar = users.fields.getByName("avatar")
+  if (avatar) {
+    avatar.thumbs = []
+    app.save(users)
+  }
+  return null
+})
@@ -1,18 +1,29 @@
-import { useEffect, useState } from 'react'
+import { lazy, Suspense, useEffect, useState } from 'react'
 import { Navigate, Route, BrowserRouter as Router, Routes } from 'react-router-dom'
 
 import pb from './lib/pocketbase'
 import LandingPage from './pages/LandingPage'
 import AuthPage from './pages/AuthPage'
-import HostPage from './pages/HostPage'
 import LobbyPage from './pages/LobbyPage'
 import JoinPage from './pages/JoinPage'
 import GamePage from './pages/GamePage'
-import ControllerPage from './pages/ControllerPage'
 import AuthGuard from './components/AuthGuard'
 import { Toaster } from '@/components/ui/sonner'
 import { ThemeProvider } from './contexts/ThemeContext'
 
+// Host-only pages are split into their own chunks so the player path
+// (join -> lobby -> game) never downloads the controller and editor code
+const HostPage = lazy(() => import('./pages/HostPage'))
+const ControllerPage = lazy(() => import('./pages/ControllerPage'))
+
+function PageLoading() {
+	return (
+		<div className='min-h-screen bg-slate-50 dark:bg-slate-900 flex items-center justify-center'>
+			<p className='text-lg text-slate-600 dark:text-slate-400'>Loading...</p>
+		</div>
+	)
+}
+
 function App() {
 	const [connectionStatus, setConnectionStatus] = useState<'connecting' | 'connected' | 'error'>(
 		'connecting'
@@ -76,35 +87,37 @@ function App() {
 		<ThemeProvider>
 			<Toaster />
 			<Router>
-				<Routes>
-					<Route path='/' element={<LandingPage />} />
-					<Route path='/login' element={<AuthPage />} />
-					<Route
-						path='/host'
-						element={isAuthenticated ? <HostPage /> : <Navigate to='/login' replace />}
-					/>
-									<Route
-						path='/lobby'
-						element={isAuthenticated ? <LobbyPage /> : <Navigate to='/login' replace />}
-					/>
-					<Route
-						path='/join'
-						element={<JoinPage />}
-					/>
-					<Route
-						path='/game/:id'
-						element={
-							<AuthGuard>
-								<GamePage />
-							</AuthGuard>
-						}
-					/>
-					<Route
-						path='/controller/:id'
-						element={isAuthenticated ? <ControllerPage /> : <Navigate to='/login' replace />}
-					/>
-					<Route path='*' element={<Navigate to='/' replace />} />
-				</Routes>
+				<Suspense fallback={<PageLoading />}>
+					<Routes>
+						<Route path='/' element={<LandingPage />} />
+						<Route path='/login' element={<AuthPage />} />
+						<Route
+							path='/host'
+							element={isAuthenticated ? <HostPage /> : <Navigate to='/login' replace />}
+						/>
+										<Route
+							path='/lobby'
+							element={isAuthenticated ? <LobbyPage /> : <Navigate to='/login' replace />}
+						/>
+						<Route
+							path='/join'
+							element={<JoinPage />}
+						/>
+						<Route
+							path='/game/:id'
+							element={
+								<AuthGuard>
+									<GamePage />
+								</AuthGuard>
+							}
+						/>
+						<Route
+							path='/controller/:id'
+							element={isAuthenticated ? <ControllerPage /> : <Navigate to='/login' replace />}
+						/>
+						<Route path='*' element={<Navigate to='/' replace />} />
+					</Routes>
+				</Suspense>
 			</Router>
 		</ThemeProvider>
 	)
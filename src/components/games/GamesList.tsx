@@ -5,11 +5,15 @@ import { Table, TableBody, TableCell, TableHead, TableHeader, TableRow } from '@
 import { Badge } from '@/components/ui/badge';
 import { formatDateTime } from '@/lib/utils';
 import { roundsService } from '@/lib/rounds';
+import { useInfiniteScroll } from '@/hooks/useInfiniteScroll';
 
 interface GamesListProps {
   games: Game[];
   onEdit: (game: Game) => void;
   isLoading?: boolean;
+  hasMore?: boolean;
+  isLoadingMore?: boolean;
+  onLoadMore?: () => void;
 }
 
 function getStatusBadgeVariant(status: string): "default" | "secondary" | "destructive" | "outline" {
@@ -41,8 +45,9 @@ function formatDuration(minutes?: number): string | null {
   return remainingMinutes > 0 ? `${hours}h ${remainingMinutes}m` : `${hours}h`;
 }
 
-export default function GamesList({ games, onEdit, isLoading = false }: GamesListProps) {
+export default function GamesList({ games, onEdit, isLoading = false, hasMore = false, isLoadingMore = false, onLoadMore }: GamesListProps) {
   const [roundsCount, setRoundsCount] = useState<{ [key: string]: number }>({});
+  const loadMoreRef = useInfiniteScroll(() => onLoadMore?.(), hasMore && !isLoadingMore && !!onLoadMore);
 
   useEffect(() => {
     const loadRoundsCount = async () => {
@@ -151,6 +156,11 @@ export default function GamesList({ games, onEdit, isLoading = false }: GamesLis
             ))}
           </TableBody>
         </Table>
+        {hasMore && (
+          <div ref={loadMoreRef} className="flex items-center justify-center py-4">
+            <div className="text-sm text-slate-600 dark:text-slate-400">{isLoadingMore ? 'Loading more games...' : ''}</div>
+          </div>
+        )}
       </CardContent>
     </Card>
   );
@@ -4,7 +4,7 @@ import {
   DialogHeader,
   DialogTitle,
 } from '@/components/ui/dialog'
-import { getFileUrl } from '@/lib/pocketbase'
+import { getAvatarUrl } from '@/lib/pocketbase'
 
 interface PlayerDetailsModalProps {
   playerId: string
@@ -23,9 +23,7 @@ export default function PlayerDetailsModal({
   open,
   onOpenChange
 }: PlayerDetailsModalProps) {
-  const avatarUrl = playerAvatar && playerId
-    ? getFileUrl('_pb_users_auth_', playerId, playerAvatar, { thumb: '400x400' })
-    : ''
+  const avatarUrl = getAvatarUrl(playerId, playerAvatar, 'large')
 
   return (
     <Dialog open={open} onOpenChange={onOpenChange}>
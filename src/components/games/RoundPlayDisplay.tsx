@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef, useCallback } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Badge } from '@/components/ui/badge'
 import { Switch } from '@/components/ui/switch'
@@ -8,6 +8,8 @@ import { GameScoreboard, ScoreboardPlayer } from '@/types/games'
 import { useTextSize } from '@/contexts/TextSizeContext'
 import TeamDetailsModal from './TeamDetailsModal'
 
+export const ALL_ANSWERED_MARK = 'all-teams-answered'
+
 interface RoundPlayDisplayProps {
   gameData: {
     state: 'round-play'
@@ -45,7 +47,6 @@ interface RoundPlayDisplayProps {
 
 export default function RoundPlayDisplay({ gameData, mode = 'controller', onAnswerSubmit, gameId, scoreboard, onAllTeamsAnswered }: RoundPlayDisplayProps) {
   const [teamAnswerStatus, setTeamAnswerStatus] = useState<Map<string, { answered: boolean, isCorrect?: boolean }>>(new Map()) // Track which teams have answered and their correctness
-  const [hasTriggeredCallback, setHasTriggeredCallback] = useState(false) // Prevent duplicate callback triggers
   const { textSize } = useTextSize()
   const [selectedTeam, setSelectedTeam] = useState<{ name: string; players: ScoreboardPlayer[] } | null>(null)
   const [teamModalOpen, setTeamModalOpen] = useState(false)
@@ -84,27 +85,103 @@ export default function RoundPlayDisplay({ gameData, mode = 'controller', onAnsw
 
   const textSizeClasses = getTextSizeClasses()
 
+  // All-answered detection (controller mode only). Kept in a ref so every
+  // realtime answer is an O(1) counter update checked right in the event
+  // handler - no refetch and no rescan of the status map per answer.
+  const detectorRef = useRef({
+    answered: new Set<string>(),   // Teams with an answer for the current question
+    expected: new Set<string>(),   // Teams with players, from the scoreboard
+    answeredExpected: 0,           // |answered ∩ expected|
+    armed: false,                  // Controller mode, question showing, not revealed
+    triggered: false
+  })
+  const onAllTeamsAnsweredRef = useRef(onAllTeamsAnswered)
+
+  const checkAllAnswered = useCallback(() => {
+    const detector = detectorRef.current
+    if (!detector.armed || detector.triggered || detector.expected.size === 0) return
+    if (detector.answeredExpected < detector.expected.size) return
+
+    detector.triggered = true
+    try {
+      performance.mark(ALL_ANSWERED_MARK, { detail: { teams: detector.expected.size } })
+    } catch {
+      // Older browsers without mark options - measurement only
+    }
+    console.log('🎉 [RoundPlayDisplay] All teams have answered! Triggering callback')
+    onAllTeamsAnsweredRef.current?.()
+  }, [])
+
+  const recordTeamAnswer = useCallback((teamId: string, answered: boolean) => {
+    const detector = detectorRef.current
+    if (answered && !detector.answered.has(teamId)) {
+      detector.answered.add(teamId)
+      if (detector.expected.has(teamId)) detector.answeredExpected++
+    } else if (!answered && detector.answered.delete(teamId)) {
+      if (detector.expected.has(teamId)) detector.answeredExpected--
+    }
+  }, [])
+
   // Reset team answer status when question changes
   useEffect(() => {
     setTeamAnswerStatus(new Map()) // Reset team answer status for new question
-    setHasTriggeredCallback(false) // Reset callback trigger flag for new question
+    const detector = detectorRef.current
+    detector.answered = new Set()
+    detector.answeredExpected = 0
+    detector.triggered = false // Reset callback trigger flag for new question
   }, [gameData.question?.id, gameData.question?.question_number, mode])
 
+  useEffect(() => {
+    onAllTeamsAnsweredRef.current = onAllTeamsAnswered
+  }, [onAllTeamsAnswered])
+
+  // Recount only when the roster changes, not per answer
+  useEffect(() => {
+    const detector = detectorRef.current
+    detector.expected = new Set(
+      Object.entries(scoreboard?.teams || {})
+        .filter(([teamId, team]) => teamId !== 'no-team' && team.players && team.players.length > 0)
+        .map(([teamId]) => teamId)
+    )
+    detector.answeredExpected = 0
+    detector.answered.forEach(teamId => {
+      if (detector.expected.has(teamId)) detector.answeredExpected++
+    })
+    checkAllAnswered()
+  }, [scoreboard, checkAllAnswered])
+
+  // Don't trigger once the answer is revealed
+  const hasAllAnsweredCallback = !!onAllTeamsAnswered
+  useEffect(() => {
+    detectorRef.current.armed = mode === 'controller' && hasAllAnsweredCallback &&
+      !!gameData.question?.id && !gameData.question?.correct_answer
+    checkAllAnswered()
+  }, [mode, hasAllAnsweredCallback, gameData.question?.id, gameData.question?.correct_answer, checkAllAnswered])
+
   // Track team answers in realtime (controller mode only)
   useEffect(() => {
     if (mode !== 'controller' || !gameId || !gameData.question?.id) return
 
     const questionId = gameData.question.id
+    // Set on cleanup: the detector already belongs to the next question
+    let cancelled = false
 
-    // Fetch existing answers for this question
+    // Fetch existing answers for this question once; realtime covers the rest
     const fetchExistingAnswers = async () => {
       try {
         const answers = await gameAnswersService.getTeamAnswersForQuestion(gameId, questionId)
-        const answeredTeamsMap = new Map(
-          answers.map(a => [a.team, { answered: true, isCorrect: a.is_correct }])
-        )
-        setTeamAnswerStatus(answeredTeamsMap)
-        console.log('📊 Loaded existing answers for', answeredTeamsMap.size, 'teams')
+        if (cancelled) return
+        answers.forEach(a => recordTeamAnswer(a.team, true))
+        // Merge rather than replace: events may have arrived while fetching
+        setTeamAnswerStatus(prev => {
+          const newMap = new Map(prev)
+          answers.forEach(a => {
+            if (!newMap.has(a.team)) newMap.set(a.team, { answered: true, isCorrect: a.is_correct })
+          })
+          return newMap
+        })
+        console.log('📊 Loaded existing answers for', answers.length, 'teams')
+        checkAllAnswered()
       } catch (error) {
         console.error('Failed to fetch existing answers:', error)
       }
@@ -114,14 +191,19 @@ export default function RoundPlayDisplay({ gameData, mode = 'controller', onAnsw
 
     // Subscribe to realtime answer updates
     const unsubscribe = pb.collection('game_answers').subscribe('*', (e) => {
+      if (cancelled) return
       // Check if this answer is for our game and question
       if ((e.record as any).game === gameId && (e.record as any).game_questions_id === questionId) {
         const teamId = (e.record as any).team
         const isCorrect = (e.record as any).is_correct
+        const answered = e.action === 'create' || e.action === 'update'
+
+        recordTeamAnswer(teamId, answered)
+        checkAllAnswered()
 
         setTeamAnswerStatus(prev => {
           const newMap = new Map(prev)
-          if (e.action === 'create' || e.action === 'update') {
+          if (answered) {
             newMap.set(teamId, { answered: true, isCorrect })
             console.log('✅ Team', teamId, 'has answered. Correct:', isCorrect)
           } else if (e.action === 'delete') {
@@ -135,37 +217,10 @@ export default function RoundPlayDisplay({ gameData, mode = 'controller', onAnsw
     })
 
     return () => {
+      cancelled = true
       unsubscribe.then(unsub => unsub())
     }
-  }, [mode, gameId, gameData.question?.id])
-
-  // Detect when all teams have answered and trigger callback (controller mode only)
-  useEffect(() => {
-    if (mode !== 'controller' || !onAllTeamsAnswered || !scoreboard || !gameData.question?.id) return
-
-    // Don't trigger if answer is already revealed
-    if (gameData.question.correct_answer) return
-
-    // Don't trigger if we've already triggered for this question
-    if (hasTriggeredCallback) return
-
-    // Count teams with players
-    const teamsWithPlayers = Object.values(scoreboard.teams)
-      .filter(team => team.players && team.players.length > 0).length
-
-    // If no teams with players, skip
-    if (teamsWithPlayers === 0) return
-
-    // Count teams that have answered
-    const teamsAnswered = teamAnswerStatus.size
-
-    // If all teams have answered, trigger callback
-    if (teamsAnswered >= teamsWithPlayers) {
-      console.log('🎉 [RoundPlayDisplay] All teams have answered! Triggering callback')
-      setHasTriggeredCallback(true)
-      onAllTeamsAnswered()
-    }
-  }, [mode, scoreboard, gameData.question?.id, gameData.question?.correct_answer, teamAnswerStatus, hasTriggeredCallback, onAllTeamsAnswered])
+  }, [mode, gameId, gameData.question?.id, recordTeamAnswer, checkAllAnswered])
 
   // Show answer if correct_answer exists in the data
   const shouldShowAnswer = !!gameData.question?.correct_answer
@@ -1,7 +1,7 @@
 import { useState } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Badge } from '@/components/ui/badge'
-import { getFileUrl } from '@/lib/pocketbase'
+import { getAvatarUrl } from '@/lib/pocketbase'
 import PlayerDetailsModal from './PlayerDetailsModal'
 import TeamDetailsModal from './TeamDetailsModal'
 
@@ -52,9 +52,7 @@ export default function TeamCard({ teamId, teamName, players, score }: TeamCardP
       <CardContent className="flex-1 overflow-auto pt-0">
         <div className="space-y-1.5 md:space-y-2">
           {players.map((player) => {
-            const avatarUrl = player.avatar && player.id
-              ? getFileUrl('_pb_users_auth_', player.id, player.avatar, { thumb: '100x100' })
-              : ''
+            const avatarUrl = getAvatarUrl(player.id, player.avatar)
 
             return (
               <div
@@ -66,6 +64,10 @@ export default function TeamCard({ teamId, teamName, players, score }: TeamCardP
                   <img
                     src={avatarUrl}
                     alt={`${player.name}'s avatar`}
+                    width={24}
+                    height={24}
+                    loading="lazy"
+                    decoding="async"
                     className="w-6 h-6 rounded-full object-cover flex-shrink-0"
                   />
                 ) : (
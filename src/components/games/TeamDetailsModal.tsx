@@ -4,7 +4,7 @@ import {
   DialogHeader,
   DialogTitle,
 } from '@/components/ui/dialog'
-import { getFileUrl } from '@/lib/pocketbase'
+import { getAvatarUrl } from '@/lib/pocketbase'
 
 interface Player {
   id: string
@@ -35,9 +35,7 @@ export default function TeamDetailsModal({
         <div className="py-6">
           <div className="grid grid-cols-2 sm:grid-cols-3 md:grid-cols-4 lg:grid-cols-5 gap-6">
             {players.map((player) => {
-              const avatarUrl = player.avatar && player.id
-                ? getFileUrl('_pb_users_auth_', player.id, player.avatar, { thumb: '400x400' })
-                : ''
+              const avatarUrl = getAvatarUrl(player.id, player.avatar, 'large')
 
               return (
                 <div
@@ -48,6 +46,8 @@ export default function TeamDetailsModal({
                     <img
                       src={avatarUrl}
                       alt={`${player.name}'s avatar`}
+                      loading="lazy"
+                      decoding="async"
                       className="w-32 h-32 rounded-full object-cover border-4 border-slate-200 dark:border-slate-700"
                     />
                   ) : (
@@ -1,7 +1,7 @@
 import { useState } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card'
 import { GameScoreboard, ScoreboardPlayer } from '@/types/games'
-import pb, { getFileUrl } from '@/lib/pocketbase'
+import pb, { getAvatarUrl } from '@/lib/pocketbase'
 import PlayerDetailsModal from './PlayerDetailsModal'
 import TeamDetailsModal from './TeamDetailsModal'
 
@@ -89,9 +89,7 @@ export default function TeamDisplay({ scoreboard, isLoading = false, className =
             <div className="space-y-1.5 md:space-y-2">
               {teamData.players.map((player) => {
                 const isCurrentUser = player.id === currentUserId
-                const avatarUrl = player.avatar && player.id
-                  ? getFileUrl('_pb_users_auth_', player.id, player.avatar, { thumb: '100x100' })
-                  : ''
+                const avatarUrl = getAvatarUrl(player.id, player.avatar)
 
                 return (
                   <div
@@ -107,6 +105,10 @@ export default function TeamDisplay({ scoreboard, isLoading = false, className =
                       <img
                         src={avatarUrl}
                         alt={`${player.name}'s avatar`}
+                        width={24}
+                        height={24}
+                        loading="lazy"
+                        decoding="async"
                         className="w-6 h-6 rounded-full object-cover flex-shrink-0"
                       />
                     ) : (
@@ -1,16 +1,24 @@
 import { useState, useEffect } from 'react'
+import { RosterMode } from '@/lib/roster'
 
 export interface ControllerSettings {
   showQrCode: boolean
   showJoinLink: boolean
+  rosterMode: RosterMode
 }
 
 const STORAGE_KEY_QR = 'controller.showQrCode'
 const STORAGE_KEY_LINK = 'controller.showJoinLink'
+const STORAGE_KEY_ROSTER_MODE = 'controller.rosterMode'
 
 export function useControllerSettings() {
   const [showQrCode, setShowQrCode] = useState(true)
   const [showJoinLink, setShowJoinLink] = useState(true)
+  // Read synchronously - the realtime subscriptions are set up with it on mount.
+  // 'full' refetches and rewrites the whole roster on every membership change.
+  const [rosterMode] = useState<RosterMode>(() =>
+    localStorage.getItem(STORAGE_KEY_ROSTER_MODE) === 'full' ? 'full' : 'incremental'
+  )
 
   // Load settings on mount
   useEffect(() => {
@@ -40,6 +48,7 @@ export function useControllerSettings() {
   return {
     showQrCode,
     showJoinLink,
+    rosterMode,
     toggleQrCode,
     toggleJoinLink
   }
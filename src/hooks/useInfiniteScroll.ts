@@ -0,0 +1,40 @@
+import { useCallback, useEffect, useRef } from 'react'
+
+// Start loading the next page this far before the end of the list comes into view
+const ROOT_MARGIN = '400px'
+
+/**
+ * Call onLoadMore whenever the returned ref's element scrolls into view.
+ *
+ * Attach the ref to a sentinel element after the last row. onLoadMore is
+ * kept in a ref so a new callback each render doesn't re-create the
+ * observer; pass enabled = false while a page is loading or when there are
+ * no more pages.
+ */
+export function useInfiniteScroll(onLoadMore: () => void, enabled: boolean) {
+  const onLoadMoreRef = useRef(onLoadMore)
+  const observerRef = useRef<IntersectionObserver | null>(null)
+  const enabledRef = useRef(enabled)
+
+  useEffect(() => {
+    onLoadMoreRef.current = onLoadMore
+    enabledRef.current = enabled
+  }, [onLoadMore, enabled])
+
+  const sentinelRef = useCallback((element: HTMLElement | null) => {
+    observerRef.current?.disconnect()
+    observerRef.current = null
+    if (!element) return
+
+    observerRef.current = new IntersectionObserver((entries) => {
+      if (enabledRef.current && entries.some(entry => entry.isIntersecting)) {
+        onLoadMoreRef.current()
+      }
+    }, { rootMargin: ROOT_MARGIN })
+    observerRef.current.observe(element)
+  }, [])
+
+  useEffect(() => () => observerRef.current?.disconnect(), [])
+
+  return sentinelRef
+}
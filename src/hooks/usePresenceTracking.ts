@@ -1,5 +1,6 @@
 import { useState, useEffect, useRef, useCallback } from 'react'
 import pb from '@/lib/pocketbase'
+import { logger } from '@/lib/logger'
 
 export interface UsePresenceTrackingParams {
   gameId: string | null
@@ -35,7 +36,7 @@ export function usePresenceTracking({
     if (!enabled || !gameId || !userId) return
 
     try {
-      console.log('🟢 Upserting presence record:', { gameId, userId, playerName, teamId, teamName, active: isVisible })
+      logger.debug('🟢 Upserting presence record:', { gameId, userId, playerName, teamId, teamName, active: isVisible })
 
       // Try to find existing record for this player (regardless of game)
       // Note: There's a unique index on 'player', so each player can only have one record
@@ -72,9 +73,9 @@ export function usePresenceTracking({
 
       setPresenceRecordId(recordId)
       setIsTracking(true)
-      console.log('✅ Presence record upserted:', recordId)
+      logger.debug('✅ Presence record upserted:', recordId)
     } catch (error) {
-      console.error('❌ Failed to upsert presence:', error)
+      logger.error('❌ Failed to upsert presence:', error)
     }
   }, [enabled, gameId, userId, playerName, teamId, teamName])
 
@@ -87,9 +88,9 @@ export function usePresenceTracking({
         ...updates,
         updated: new Date().toISOString()
       })
-      console.log('🔄 Presence updated:', updates)
+      logger.debug('🔄 Presence updated:', updates)
     } catch (error) {
-      console.error('❌ Failed to update presence:', error)
+      logger.error('❌ Failed to update presence:', error)
     }
   }, [presenceRecordId])
 
@@ -105,7 +106,7 @@ export function usePresenceTracking({
     if (!presenceRecordId || cleanupSentRef.current) return
 
     cleanupSentRef.current = true
-    console.log('🧹 Cleaning up presence with sendBeacon')
+    logger.debug('🧹 Cleaning up presence with sendBeacon')
 
     try {
       const data = new URLSearchParams({
@@ -117,15 +118,15 @@ export function usePresenceTracking({
       const sent = navigator.sendBeacon(url, data)
 
       if (!sent) {
-        console.warn('⚠️ sendBeacon failed, attempting regular update')
+        logger.warn('⚠️ sendBeacon failed, attempting regular update')
         // Fallback to regular update
         pb.collection('online').update(presenceRecordId, {
           active: false,
           updated: new Date().toISOString()
-        }).catch(console.error)
+        }).catch(logger.error)
       }
     } catch (error) {
-      console.error('❌ Cleanup failed:', error)
+      logger.error('❌ Cleanup failed:', error)
     }
   }, [presenceRecordId])
 
@@ -173,7 +174,7 @@ export function usePresenceTracking({
 
       visibilityDebounceRef.current = setTimeout(() => {
         const isVisible = document.visibilityState === 'visible'
-        console.log('👁️ Visibility changed:', isVisible ? 'visible' : 'hidden')
+        logger.debug('👁️ Visibility changed:', isVisible ? 'visible' : 'hidden')
         updatePresence({ active: isVisible })
       }, 200)
     }
@@ -0,0 +1,53 @@
+import { useEffect, useRef } from 'react'
+
+// Wake this long before the deadline on long waits, then re-arm for the
+// remainder. Timeouts can only fire late (clamping, busy main thread), never
+// early, so a short final hop keeps lateness to a few milliseconds.
+const EARLY_WAKE_MS = 250
+
+export const TIMER_EXPIRY_MARK = 'timer-expiry'
+
+/**
+ * Call onExpire once when expiresAt passes.
+ *
+ * Arms a single timeout for the deadline instead of polling, and keeps
+ * onExpire in a ref so re-renders (e.g. the 1 s countdown tick) don't tear
+ * down and re-create the schedule. Each firing leaves a `timer-expiry`
+ * performance mark whose detail carries the lateness in milliseconds, which
+ * the load harness reads back.
+ */
+export function useTimerExpiry(expiresAt: string | undefined, isPaused: boolean, onExpire: () => void) {
+  const onExpireRef = useRef(onExpire)
+
+  useEffect(() => {
+    onExpireRef.current = onExpire
+  }, [onExpire])
+
+  useEffect(() => {
+    if (!expiresAt || isPaused) return
+
+    const deadline = new Date(expiresAt).getTime()
+    let timeoutId: ReturnType<typeof setTimeout> | undefined
+
+    const check = () => {
+      const remaining = deadline - Date.now()
+      if (remaining > 0) {
+        timeoutId = setTimeout(check, remaining > EARLY_WAKE_MS * 2 ? remaining - EARLY_WAKE_MS : remaining)
+        return
+      }
+
+      try {
+        performance.mark(TIMER_EXPIRY_MARK, { detail: { expiresAt, lateness: -remaining } })
+      } catch {
+        // Older browsers without mark options - measurement only
+      }
+      onExpireRef.current()
+    }
+
+    check()
+
+    return () => {
+      if (timeoutId !== undefined) clearTimeout(timeoutId)
+    }
+  }, [expiresAt, isPaused])
+}
@@ -1,4 +1,5 @@
 import pb from './pocketbase'
+import { logger } from './logger'
 import { GameAnswer, CreateGameAnswerData } from '@/types/games'
 
 class GameAnswersService {
@@ -11,22 +12,15 @@ class GameAnswersService {
         host: data.host // Use the provided host (should be game host)
       }
 
-      console.log('📝 Creating answer with data:', {
-        ...answerData,
-        host: answerData.host ? 'PRESENT' : 'MISSING',
-        game: answerData.game,
-        game_questions_id: answerData.game_questions_id,
-        team: answerData.team,
-        answer: answerData.answer,
-        is_correct: answerData.is_correct
-      })
+      logger.debug('📝 Creating answer for question', answerData.game_questions_id, 'team', answerData.team,
+        'host', answerData.host ? 'PRESENT' : 'MISSING')
 
       try {
         const answer = await pb.collection('game_answers').create(answerData)
-        console.log('✅ Successfully created game answer:', answer)
+        logger.debug('✅ Successfully created game answer:', answer.id)
         return answer as unknown as GameAnswer
       } catch (createError: any) {
-        console.error('❌ Failed to create game answer with detailed error:', {
+        logger.error('❌ Failed to create game answer with detailed error:', {
           error: createError,
           message: createError?.message,
           status: createError?.status,
@@ -42,7 +36,7 @@ class GameAnswersService {
         throw createError
       }
     } catch (error) {
-      console.error('Failed to create game answer:', error)
+      logger.error('Failed to create game answer:', error)
       throw error
     }
   }
@@ -52,7 +46,7 @@ class GameAnswersService {
       const answer = await pb.collection('game_answers').getOne(id)
       return answer as unknown as GameAnswer
     } catch (error) {
-      console.error('Failed to get game answer:', error)
+      logger.error('Failed to get game answer:', error)
       throw error
     }
   }
@@ -64,7 +58,7 @@ class GameAnswersService {
       })
       return answers as unknown as GameAnswer[]
     } catch (error) {
-      console.error('Failed to get team answers for question:', error)
+      logger.error('Failed to get team answers for question:', error)
       throw error
     }
   }
@@ -76,7 +70,7 @@ class GameAnswersService {
       })
       return answers as unknown as GameAnswer[]
     } catch (error) {
-      console.error('Failed to get team answers for game:', error)
+      logger.error('Failed to get team answers for game:', error)
       throw error
     }
   }
@@ -86,7 +80,7 @@ class GameAnswersService {
       const answer = await pb.collection('game_answers').update(id, data)
       return answer as unknown as GameAnswer
     } catch (error) {
-      console.error('Failed to update game answer:', error)
+      logger.error('Failed to update game answer:', error)
       throw error
     }
   }
@@ -95,7 +89,7 @@ class GameAnswersService {
     try {
       await pb.collection('game_answers').delete(id)
     } catch (error) {
-      console.error('Failed to delete game answer:', error)
+      logger.error('Failed to delete game answer:', error)
       throw error
     }
   }
@@ -108,7 +102,7 @@ class GameAnswersService {
     answer: string,
     correctAnswer?: string
   ): Promise<GameAnswer> {
-    console.log('🚀 submitTeamAnswer called with:', {
+    logger.debug('🚀 submitTeamAnswer called with:', {
       gameId,
       gameQuestionsId,
       teamId,
@@ -126,7 +120,7 @@ class GameAnswersService {
       const game = await pb.collection('games').getOne(gameId)
       const gameHostId = game.host
 
-      console.log('🏠 Found game host:', gameHostId)
+      logger.debug('🏠 Found game host:', gameHostId)
 
       // Check if answer already exists for this team and question
       const existingAnswers = await this.getTeamAnswersForQuestion(gameId, gameQuestionsId)
@@ -134,7 +128,7 @@ class GameAnswersService {
 
       const isCorrect = correctAnswer ? answer.toUpperCase() === correctAnswer.toUpperCase() : undefined
 
-      console.log('✅ Submitting answer with game host:', gameHostId, {
+      logger.debug('✅ Submitting answer with game host:', gameHostId, {
         gameId,
         gameQuestionsId,
         teamId,
@@ -161,7 +155,7 @@ class GameAnswersService {
         })
       }
     } catch (error) {
-      console.error('Failed to submit team answer:', error)
+      logger.error('Failed to submit team answer:', error)
       throw error
     }
   }
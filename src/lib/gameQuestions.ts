@@ -16,6 +16,30 @@ export interface GameQuestion {
   updated: string;
 }
 
+// How many questions ahead of the current one the display app prefetches audio for
+export const AUDIO_LOOKAHEAD = 3;
+
+/** A question's audio as published in game state (upcoming_audio) for the display app. */
+export interface QuestionAudio {
+  id: string; // game_questions id
+  audio_file: string;
+}
+
+/** The question's audio file, if generation finished. */
+export function questionAudioFile(gameQuestion: GameQuestion): string | undefined {
+  return gameQuestion.audio_status === 'available' && gameQuestion.audio_file ? gameQuestion.audio_file : undefined;
+}
+
+/** Audio for gameQuestions[from] and the questions after it, up to count, skipping questions without audio. */
+export function upcomingQuestionAudio(gameQuestions: GameQuestion[], from: number, count: number = AUDIO_LOOKAHEAD): QuestionAudio[] {
+  const upcoming: QuestionAudio[] = [];
+  for (const gameQuestion of gameQuestions.slice(from, from + count)) {
+    const audioFile = questionAudioFile(gameQuestion);
+    if (audioFile) upcoming.push({ id: gameQuestion.id, audio_file: audioFile });
+  }
+  return upcoming;
+}
+
 export interface CreateGameQuestionData {
   host: string;
   game: string;
@@ -1,44 +1,48 @@
 import pb from './pocketbase';
-import { Game, CreateGameData, UpdateGameData, GameTeam, CreateGameTeamData, GamePlayer, CreateGamePlayerData } from '@/types/games';
+import { logger } from './logger';
+import { Game, GamesPage, CreateGameData, UpdateGameData, GameTeam, CreateGameTeamData, GamePlayer, CreateGamePlayerData } from '@/types/games';
+
+export const GAMES_PAGE_SIZE = 25;
 
 export const gamesService = {
   async getGames(): Promise<Game[]> {
-    try {
-      // Get games without server-side sorting to avoid field name issues
-      const result = await pb.collection('games').getList<Game>(1, 50);
-      // Filter client-side by host ID for security
-      const userGames = result.items.filter(game => game.host === pb.authStore.model?.id);
-
-      // Sort client-side: start_date (desc), then updated (desc)
-      userGames.sort((a, b) => {
-        // Compare start dates (newest first), treating null/undefined as oldest
-        const aStartDate = a.startdate ? new Date(a.startdate) : new Date('1970-01-01');
-        const bStartDate = b.startdate ? new Date(b.startdate) : new Date('1970-01-01');
-
-        if (aStartDate > bStartDate) return -1;
-        if (aStartDate < bStartDate) return 1;
-
-        // If start dates are equal, sort by updated (newest first)
-        const aUpdated = new Date(a.updated);
-        const bUpdated = new Date(b.updated);
+    // Most recent games only - see getGamesPage for the rest
+    const { items } = await this.getGamesPage();
+    return items;
+  },
 
-        if (aUpdated > bUpdated) return -1;
-        if (aUpdated < bUpdated) return 1;
+  async getGamesPage(after?: Game, perPage: number = GAMES_PAGE_SIZE): Promise<GamesPage> {
+    try {
+      // Newest start date first (no start date last), then most recently updated.
+      // Pages continue from the last game seen rather than an offset, so with
+      // idx_games_host_startdate covering the sort every page is one index range
+      // scan however many games the host has.
+      let filter = pb.filter('host = {:host}', { host: pb.authStore.model?.id });
+      if (after) {
+        filter += ' && ' + pb.filter(
+          'startdate <= {:startdate} && (startdate < {:startdate} || (startdate = {:startdate} && ' +
+          '(updated < {:updated} || (updated = {:updated} && id < {:id}))))',
+          { startdate: after.startdate || '', updated: after.updated, id: after.id }
+        );
+      }
 
-        return 0;
+      const result = await pb.collection('games').getList<Game>(1, perPage, {
+        filter,
+        sort: '-startdate,-updated,-id',
+        skipTotal: true  // Skip counting total records for performance
       });
 
-      return userGames;
+      return { items: result.items, hasMore: result.items.length === perPage };
     } catch (error) {
-      console.error('Failed to fetch games:', error);
+      logger.error('Failed to fetch games:', error);
       throw error;
     }
   },
 
   async getGame(id: string): Promise<Game> {
     try {
-      console.log('🎯 gamesService.getGame called for ID:', id);
-      console.log('🎯 Auth state in gamesService:', {
+      logger.debug('🎯 gamesService.getGame called for ID:', id);
+      logger.debug('🎯 Auth state in gamesService:', {
         isValid: pb.authStore.isValid,
         hasToken: !!pb.authStore.token,
         userId: pb.authStore.model?.id,
@@ -46,11 +50,11 @@ export const gamesService = {
       });
 
       const record = await pb.collection('games').getOne<Game>(id);
-      console.log('✅ gamesService.getGame succeeded:', record);
+      logger.debug('✅ gamesService.getGame succeeded:', record);
       return record;
     } catch (error: any) {
-      console.error('❌ gamesService.getGame failed:', error);
-      console.error('❌ Error details:', {
+      logger.error('❌ gamesService.getGame failed:', error);
+      logger.error('❌ Error details:', {
         message: error?.message,
         status: error?.status,
         url: error?.url,
@@ -70,13 +74,18 @@ export const gamesService = {
         ...data,
         host: pb.authStore.model?.id,
         status: data.status || 'setup',
-        code: generateGameCode(),
       };
 
-      const record = await pb.collection('games').create<Game>(gameData);
-      return record;
+      // The unique index on code is the uniqueness check: on a collision draw another code
+      for (let attempt = 1; ; attempt++) {
+        try {
+          return await pb.collection('games').create<Game>({ ...gameData, code: generateGameCode() });
+        } catch (error) {
+          if (attempt >= GAME_CODE_ATTEMPTS || !isGameCodeCollision(error)) throw error;
+        }
+      }
     } catch (error) {
-      console.error('Failed to create game:', error);
+      logger.error('Failed to create game:', error);
       throw error;
     }
   },
@@ -86,7 +95,7 @@ export const gamesService = {
       const record = await pb.collection('games').update<Game>(id, data);
       return record;
     } catch (error) {
-      console.error('Failed to update game:', error);
+      logger.error('Failed to update game:', error);
       throw error;
     }
   },
@@ -95,16 +104,17 @@ export const gamesService = {
     try {
       await pb.collection('games').delete(id);
     } catch (error) {
-      console.error('Failed to delete game:', error);
+      logger.error('Failed to delete game:', error);
       throw error;
     }
   },
 
   async findGameByCode(code: string): Promise<Game | null> {
     try {
-      // Get games with status "ready" OR "in-progress"
-      const result = await pb.collection('games').getList<Game>(1, 50, {
-        filter: `code = "${code}" && (status = "ready" || status = "in-progress")`
+      // Get the game with status "ready" OR "in-progress" (codes are unique, so at most one)
+      const result = await pb.collection('games').getList<Game>(1, 1, {
+        filter: pb.filter('code = {:code} && (status = "ready" || status = "in-progress")', { code }),
+        skipTotal: true  // Skip counting total records for performance
       });
 
       if (result.items.length > 0) {
@@ -112,7 +122,7 @@ export const gamesService = {
       }
       return null;
     } catch (error) {
-      console.error('Failed to find game by code:', error);
+      logger.error('Failed to find game by code:', error);
       throw error;
     }
   },
@@ -126,7 +136,7 @@ export const gameTeamsService = {
       });
       return result.items;
     } catch (error) {
-      console.error('Failed to fetch teams for game:', error);
+      logger.error('Failed to fetch teams for game:', error);
       throw error;
     }
   },
@@ -141,7 +151,7 @@ export const gameTeamsService = {
       const record = await pb.collection('game_teams').create<GameTeam>(teamData);
       return record;
     } catch (error) {
-      console.error('Failed to create team:', error);
+      logger.error('Failed to create team:', error);
       throw error;
     }
   },
@@ -158,7 +168,7 @@ export const gamePlayersService = {
       const record = await pb.collection('game_players').create<GamePlayer>(playerData);
       return record;
     } catch (error) {
-      console.error('Failed to create player:', error);
+      logger.error('Failed to create player:', error);
       throw error;
     }
   },
@@ -168,7 +178,7 @@ export const gamePlayersService = {
       const record = await pb.collection('game_players').update<GamePlayer>(id, data);
       return record;
     } catch (error) {
-      console.error('Failed to update player:', error);
+      logger.error('Failed to update player:', error);
       throw error;
     }
   },
@@ -185,7 +195,7 @@ export const gamePlayersService = {
       }
       return null;
     } catch (error) {
-      console.error('Failed to find player in game:', error);
+      logger.error('Failed to find player in game:', error);
       throw error;
     }
   },
@@ -196,15 +206,15 @@ export const gamePlayersService = {
       const playerRecord = await this.findPlayerInGame(gameId, playerId);
 
       if (!playerRecord) {
-        console.warn('No player record found to remove');
+        logger.warn('No player record found to remove');
         return;
       }
 
       // Delete the player record
       await pb.collection('game_players').delete(playerRecord.id);
-      console.log('Successfully removed player from game');
+      logger.info('Successfully removed player from game');
     } catch (error) {
-      console.error('Failed to remove player from game:', error);
+      logger.error('Failed to remove player from game:', error);
       throw error;
     }
   },
@@ -246,17 +256,31 @@ export const gamePlayersService = {
 
       return games;
     } catch (error) {
-      console.error('Failed to fetch active games for player:', error);
+      logger.error('Failed to fetch active games for player:', error);
       return []; // Return empty array on error to avoid breaking UI
     }
   },
 };
 
+const GAME_CODE_CHARS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
+const GAME_CODE_LENGTH = 6;
+// 36^6 codes: even with a million games a fresh code collides about once in 2000 draws
+const GAME_CODE_ATTEMPTS = 5;
+
 function generateGameCode(): string {
-  const chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
+  // Rejection sampling keeps every character equally likely
+  const limit = 256 - (256 % GAME_CODE_CHARS.length);
   let code = '';
-  for (let i = 0; i < 6; i++) {
-    code += chars.charAt(Math.floor(Math.random() * chars.length));
+  while (code.length < GAME_CODE_LENGTH) {
+    for (const byte of crypto.getRandomValues(new Uint8Array(GAME_CODE_LENGTH * 2))) {
+      if (byte < limit && code.length < GAME_CODE_LENGTH) {
+        code += GAME_CODE_CHARS.charAt(byte % GAME_CODE_CHARS.length);
+      }
+    }
   }
   return code;
-}
\ No newline at end of file
+}
+
+function isGameCodeCollision(error: any): boolean {
+  return error?.status === 400 && error?.data?.data?.code?.code === 'validation_not_unique';
+}
@@ -0,0 +1,72 @@
+/**
+ * Leveled console logging.
+ *
+ * debug and info trace the game flow while developing. Realtime handlers,
+ * grading and scoreboard updates call them on every event, so:
+ *
+ * - production builds drop logger.debug and logger.info calls entirely
+ *   (vite.config.ts marks them pure, so the minifier removes them)
+ * - below the current level they are a no-op, so nothing is formatted or
+ *   handed to the console (which serializes every argument when DevTools
+ *   or Playwright is attached)
+ *
+ * The level is the localStorage value under LOG_LEVEL_STORAGE_KEY, else
+ * VITE_LOG_LEVEL, else 'debug' in development and 'warn' in production.
+ * Guard arguments that are expensive to build with logger.enabled('debug').
+ */
+export type LogLevel = 'debug' | 'info' | 'warn' | 'error' | 'silent'
+
+export const LOG_LEVEL_STORAGE_KEY = 'trivia_log_level'
+
+const LEVELS: Record<LogLevel, number> = { debug: 10, info: 20, warn: 30, error: 40, silent: 50 }
+
+type LogFn = (...args: unknown[]) => void
+
+const noop: LogFn = () => {}
+
+function isLogLevel(value: unknown): value is LogLevel {
+  return typeof value === 'string' && value in LEVELS
+}
+
+function initialLevel(): LogLevel {
+  let stored: string | null = null
+  try {
+    stored = window.localStorage.getItem(LOG_LEVEL_STORAGE_KEY)
+  } catch {
+    // Storage can be unavailable (private mode, sandboxed frames)
+  }
+  if (isLogLevel(stored)) return stored
+  const configured = import.meta.env.VITE_LOG_LEVEL
+  if (isLogLevel(configured)) return configured
+  return import.meta.env.PROD ? 'warn' : 'debug'
+}
+
+export const logger = {
+  level: 'debug' as LogLevel,
+  debug: noop,
+  info: noop,
+  warn: noop,
+  error: noop,
+
+  /** Whether messages at level are currently written */
+  enabled(level: Exclude<LogLevel, 'silent'>): boolean {
+    return LEVELS[level] >= LEVELS[this.level]
+  },
+}
+
+/**
+ * Switch the level for the rest of the session. Enabled levels are the
+ * console methods themselves, so DevTools still shows the caller's line.
+ */
+export function setLogLevel(level: LogLevel) {
+  const at = (name: Exclude<LogLevel, 'silent'>, fn: LogFn): LogFn => LEVELS[name] >= LEVELS[level] ? fn : noop
+  logger.level = level
+  logger.debug = at('debug', console.debug.bind(console))
+  logger.info = at('info', console.info.bind(console))
+  logger.warn = at('warn', console.warn.bind(console))
+  logger.error = at('error', console.error.bind(console))
+}
+
+setLogLevel(initialLevel())
+
+export default logger
@@ -8,6 +8,12 @@ function getPocketBaseUrl(): string {
   const hostname = window.location.hostname;
   const port = window.location.port;
 
+  // A dev server started for one harness run (harness.fixture) points at
+  // that run's PocketBase. Ignored outside development.
+  if (import.meta.env.DEV && import.meta.env.VITE_POCKETBASE_URL) {
+    return import.meta.env.VITE_POCKETBASE_URL;
+  }
+
   // Development mode detection:
   // - If running on a non-standard port (not 80/443), it's a dev server
   // - Dev servers run on ports like 5173, 5174, etc.
@@ -28,6 +34,15 @@ const pb = new PocketBase(getPocketBaseUrl());
 // Disable auto-cancellation for better experience in React
 pb.autoCancellation(false);
 
+// The SDK retries a dropped realtime connection after the same fixed delays
+// on every client, so when the venue Wi-Fi blips every client reconnects in
+// the same few milliseconds. Spread this client's delays by +/-50%.
+const realtime = pb.realtime as unknown as { predefinedReconnectIntervals?: number[] };
+if (Array.isArray(realtime.predefinedReconnectIntervals)) {
+  realtime.predefinedReconnectIntervals = realtime.predefinedReconnectIntervals
+    .map(ms => Math.round(ms * (0.5 + Math.random())));
+}
+
 /**
  * Generate a file URL for a PocketBase record
  * @param collectionName - Name of the collection
@@ -56,4 +71,25 @@ export function getFileUrl(
   return url;
 }
 
+// Thumb sizes registered on users.avatar (pb_migrations/1764200000_users_avatar_thumbs.js).
+// PocketBase serves the full original for a size that is not registered there.
+export const AVATAR_THUMBS = {
+  small: '100x100', // Rosters and team lists
+  large: '400x400'  // Player and team detail modals, profile
+} as const;
+
+/**
+ * Thumbnail URL of a user's avatar.
+ * Avatar filenames change on every upload, so the URL never needs revalidating
+ * (pb_hooks/file_cache.pb.js serves avatars as immutable).
+ */
+export function getAvatarUrl(
+  userId: string | undefined,
+  avatar: string | undefined,
+  size: keyof typeof AVATAR_THUMBS = 'small'
+): string {
+  if (!userId || !avatar) return '';
+  return getFileUrl('_pb_users_auth_', userId, avatar, { thumb: AVATAR_THUMBS[size] });
+}
+
 export default pb;
\ No newline at end of file
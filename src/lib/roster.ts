@@ -0,0 +1,204 @@
+import pb from './pocketbase'
+import { ScoreboardPlayer } from '@/types/games'
+
+export interface RosterTeamRecord {
+  id: string
+  name?: string
+}
+
+export interface RosterPlayerRecord {
+  id: string
+  player?: string
+  team?: string
+  name?: string
+  avatar?: string
+  created: string
+}
+
+export type RosterTeams = Record<string, {
+  name: string
+  players: ScoreboardPlayer[]
+  score?: number
+  roundScores?: Record<number, number>
+}>
+
+export type RosterMode = 'full' | 'incremental'
+
+// How long membership changes are collected before one scoreboard write
+export const ROSTER_FLUSH_MS = 250
+
+/**
+ * Build scoreboard teams from game_teams and game_players records.
+ *
+ * Keeps the newest game_players record per user and carries score and
+ * roundScores over from the previous scoreboard so a join mid-game doesn't
+ * wipe the standings.
+ */
+export function buildRosterTeams(
+  teamRecords: RosterTeamRecord[],
+  playerRecords: RosterPlayerRecord[],
+  previous?: RosterTeams
+): RosterTeams {
+  const teams: RosterTeams = {
+    'no-team': {
+      name: 'No Team',
+      players: []
+    }
+  }
+
+  teamRecords.forEach(team => {
+    teams[team.id] = {
+      name: team.name || 'Unknown Team',
+      players: []
+    }
+  })
+
+  // Deduplicate players by user ID - keep the latest record for each user
+  const uniquePlayers: Record<string, RosterPlayerRecord> = {}
+  playerRecords.forEach(player => {
+    const playerRef = player.player
+    if (playerRef && (!uniquePlayers[playerRef] || player.created > uniquePlayers[playerRef].created)) {
+      uniquePlayers[playerRef] = player
+    }
+  })
+
+  // Assign players to teams using name/avatar from game_players record
+  for (const player of Object.values(uniquePlayers)) {
+    const assignedTeamId = player.team || 'no-team'
+
+    if (!teams[assignedTeamId]) {
+      teams[assignedTeamId] = {
+        name: assignedTeamId === 'no-team' ? 'No Team' : 'Unknown Team',
+        players: []
+      }
+    }
+
+    teams[assignedTeamId].players.push({
+      id: player.player!,
+      gamePlayerId: player.id,  // Store game_players record ID for avatar URLs
+      name: player.name || '',
+      avatar: player.avatar || ''
+    })
+  }
+
+  if (previous) {
+    for (const [teamId, team] of Object.entries(teams)) {
+      const before = previous[teamId]
+      if (before?.score !== undefined) team.score = before.score
+      if (before?.roundScores) team.roundScores = before.roundScores
+    }
+  }
+
+  return teams
+}
+
+export const rosterService = {
+  /**
+   * Fetch every team and player record for a game
+   */
+  async getRosterRecords(gameId: string): Promise<{ teams: RosterTeamRecord[], players: RosterPlayerRecord[] }> {
+    const [teams, players] = await Promise.all([
+      pb.collection('game_teams').getFullList({ filter: `game="${gameId}"` }),
+      pb.collection('game_players').getFullList({ filter: `game="${gameId}"` })
+    ])
+    return {
+      teams: teams as unknown as RosterTeamRecord[],
+      players: players as unknown as RosterPlayerRecord[]
+    }
+  }
+}
+
+/**
+ * Incremental, coalescing roster for the controller.
+ *
+ * Loads the game's teams and players once, then applies realtime
+ * create/update/delete events to in-memory copies instead of refetching.
+ * Changes that arrive within ROSTER_FLUSH_MS are merged into a single
+ * scoreboard write, and at most one write is in flight at a time - a join
+ * storm of 100 players becomes a handful of writes instead of 100 full
+ * rebuilds, each broadcast to every client.
+ */
+export class RosterCoalescer {
+  private teams = new Map<string, RosterTeamRecord>()
+  private players = new Map<string, RosterPlayerRecord>()
+  private loaded = false
+  private queued: Array<() => void> = []
+  private dirty = false
+  private flushing = false
+  private timer: ReturnType<typeof setTimeout> | null = null
+  private disposed = false
+
+  constructor(
+    private gameId: string,
+    private write: (teams: RosterTeams) => Promise<void>,
+    private previous: () => RosterTeams | undefined,
+    private flushMs: number = ROSTER_FLUSH_MS
+  ) {}
+
+  async load() {
+    const records = await rosterService.getRosterRecords(this.gameId)
+    this.teams = new Map(records.teams.map(team => [team.id, team]))
+    this.players = new Map(records.players.map(player => [player.id, player]))
+    this.loaded = true
+
+    // Events that raced the initial fetch win over the fetched copy
+    this.queued.forEach(apply => apply())
+    this.queued = []
+
+    this.dirty = true
+    await this.flush()
+  }
+
+  applyTeam(action: string, record: RosterTeamRecord) {
+    this.apply(() => {
+      if (action === 'delete') this.teams.delete(record.id)
+      else this.teams.set(record.id, record)
+    })
+  }
+
+  applyPlayer(action: string, record: RosterPlayerRecord) {
+    this.apply(() => {
+      if (action === 'delete') this.players.delete(record.id)
+      else this.players.set(record.id, record)
+    })
+  }
+
+  dispose() {
+    this.disposed = true
+    if (this.timer) clearTimeout(this.timer)
+  }
+
+  private apply(change: () => void) {
+    if (!this.loaded) {
+      this.queued.push(change)
+      return
+    }
+    change()
+    this.dirty = true
+    if (!this.timer) {
+      this.timer = setTimeout(() => {
+        this.timer = null
+        void this.flush()
+      }, this.flushMs)
+    }
+  }
+
+  private async flush() {
+    // A running flush re-checks dirty when its write completes
+    if (this.flushing) return
+    this.flushing = true
+    try {
+      while (this.dirty && !this.disposed) {
+        this.dirty = false
+        const teams = buildRosterTeams([...this.teams.values()], [...this.players.values()], this.previous())
+        try {
+          await this.write(teams)
+        } catch (error) {
+          console.error('Error writing roster:', error)
+        }
+      }
+    } finally {
+      this.flushing = false
+    }
+  }
+}
@@ -1,4 +1,5 @@
 import pb from './pocketbase'
+import { logger } from './logger'
 import { Game, GameScoreboard } from '@/types/games'
 import { gameAnswersService } from './gameAnswers'
 
@@ -11,7 +12,7 @@ export const scoreboardService = {
       const game = await pb.collection('games').getOne<Game>(gameId)
       return game.scoreboard || { teams: {} }
     } catch (error) {
-      console.error('Failed to get game scoreboard:', error)
+      logger.error('Failed to get game scoreboard:', error)
       return null
     }
   },
@@ -56,9 +57,9 @@ export const scoreboardService = {
         const correctAnswers = teamAnswers.filter(answer => answer.is_correct === true)
         scores[teamId] = correctAnswers.length
 
-        console.log(`Calculated score for team ${teamData.name}: ${scores[teamId]} points (${correctAnswers.length} correct answers)`)
+        logger.debug(`Calculated score for team ${teamData.name}: ${scores[teamId]} points (${correctAnswers.length} correct answers)`)
       } catch (error) {
-        console.error(`Failed to calculate score for team ${teamId}:`, error)
+        logger.error(`Failed to calculate score for team ${teamId}:`, error)
         scores[teamId] = 0
       }
     }
@@ -71,14 +72,13 @@ export const scoreboardService = {
    * Recalculates all scores from game_answers records
    */
   async updateScoreboard(gameId: string, currentRoundNumber: number): Promise<void> {
-    console.log('⚠️ updateScoreboard ENTERED - Game:', gameId, 'Round:', currentRoundNumber)
     try {
-      console.log(`📊 Updating scoreboard for game ${gameId}, round ${currentRoundNumber}`)
+      logger.debug(`📊 Updating scoreboard for game ${gameId}, round ${currentRoundNumber}`)
 
       // Get current game with scoreboard structure
       const game = await pb.collection('games').getOne<Game>(gameId)
       if (!game.scoreboard?.teams) {
-        console.error('No scoreboard structure found for game')
+        logger.error('No scoreboard structure found for game')
         return
       }
 
@@ -88,9 +88,9 @@ export const scoreboardService = {
         expand: 'game_questions_id'
       })
 
-      console.log(`📊 Found ${allAnswers.length} graded answers for game ${gameId}`)
-      if (allAnswers.length > 0) {
-        console.log(`📊 Sample answer:`, {
+      logger.debug(`📊 Found ${allAnswers.length} graded answers for game ${gameId}`)
+      if (allAnswers.length > 0 && logger.enabled('debug')) {
+        logger.debug(`📊 Sample answer:`, {
           id: allAnswers[0].id,
           team: allAnswers[0].team,
           is_correct: allAnswers[0].is_correct,
@@ -108,7 +108,7 @@ export const scoreboardService = {
           roundIds.add(gameQuestion.round)
         } else {
           answersWithoutRound++
-          console.warn(`⚠️ Answer ${answer.id} has no round in expanded game_questions_id`, {
+          logger.debug(`⚠️ Answer ${answer.id} has no round in expanded game_questions_id`, {
             hasExpand: !!(answer as any).expand,
             gameQuestionId: answer.game_questions_id,
             expandedGameQuestion: gameQuestion
@@ -117,10 +117,10 @@ export const scoreboardService = {
       }
 
       if (answersWithoutRound > 0) {
-        console.warn(`⚠️ Found ${answersWithoutRound} answers without round information`)
+        logger.warn(`⚠️ Found ${answersWithoutRound} answers without round information`)
       }
 
-      console.log(`📊 Collected ${roundIds.size} unique round IDs:`, Array.from(roundIds))
+      logger.debug(`📊 Collected ${roundIds.size} unique round IDs:`, Array.from(roundIds))
 
       // Fetch all rounds at once and build a map of round ID -> sequence number
       const roundIdToSequenceNumber = new Map<string, number>()
@@ -129,13 +129,13 @@ export const scoreboardService = {
         const roundIdArray = Array.from(roundIds)
         const filter = roundIdArray.map(id => `id = "${id}"`).join(' || ')
 
-        console.log(`📊 Fetching ${roundIdArray.length} rounds with filter:`, filter)
+        logger.debug(`📊 Fetching ${roundIdArray.length} rounds with filter:`, filter)
 
         const rounds = await pb.collection('rounds').getFullList({
           filter: filter
         })
 
-        console.log(`📊 Successfully fetched ${rounds.length} rounds`)
+        logger.debug(`📊 Successfully fetched ${rounds.length} rounds`)
 
         for (const round of rounds) {
           roundIdToSequenceNumber.set(round.id, round.sequence_number)
@@ -166,7 +166,7 @@ export const scoreboardService = {
         // Lookup the round number from our pre-fetched map
         const roundNumber = roundIdToSequenceNumber.get(gameQuestion.round)
         if (roundNumber === undefined) {
-          console.error(`❌ Round ${gameQuestion.round} not found in pre-fetched rounds. Available rounds:`, Array.from(roundIdToSequenceNumber.keys()))
+          logger.error(`❌ Round ${gameQuestion.round} not found in pre-fetched rounds. Available rounds:`, Array.from(roundIdToSequenceNumber.keys()))
           skippedAnswers++
           continue
         }
@@ -186,7 +186,7 @@ export const scoreboardService = {
         processedAnswers++
       }
 
-      console.log(`📊 Processed ${processedAnswers} answers, skipped ${skippedAnswers} answers`)
+      logger.debug(`📊 Processed ${processedAnswers} answers, skipped ${skippedAnswers} answers`)
 
       // Calculate total scores and update scoreboard structure
       const updatedTeams = { ...game.scoreboard.teams }
@@ -201,7 +201,7 @@ export const scoreboardService = {
           roundScores: roundScores
         }
 
-        console.log(`📊 Team ${team.name}: ${totalScore} total points, rounds:`, roundScores)
+        logger.debug(`📊 Team ${team.name}: ${totalScore} total points, rounds:`, roundScores)
       }
 
       // Update the game scoreboard
@@ -212,9 +212,9 @@ export const scoreboardService = {
         }
       })
 
-      console.log(`✅ Scoreboard updated successfully`)
+      logger.debug(`✅ Scoreboard updated successfully`)
     } catch (error) {
-      console.error('Failed to update scoreboard:', error)
+      logger.error('Failed to update scoreboard:', error)
       throw error
     }
   }
@@ -6,14 +6,18 @@ import NextQuestionPreview from '@/components/games/NextQuestionPreview'
 import { CircularTimerFixed } from '@/components/ui/circular-timer'
 import { gamesService } from '@/lib/games'
 import { roundsService } from '@/lib/rounds'
-import { gameQuestionsService } from '@/lib/gameQuestions'
+import { QuestionAudio, gameQuestionsService, questionAudioFile, upcomingQuestionAudio } from '@/lib/gameQuestions'
 import { questionsService } from '@/lib/questions'
 import { scoreboardService } from '@/lib/scoreboard'
+import { RosterCoalescer, RosterTeams, buildRosterTeams, rosterService } from '@/lib/roster'
+import { GameStateChannel, GameStateWriter, parseSnapshot } from '@/lib/gameState'
 import pb from '@/lib/pocketbase'
+import { logger } from '@/lib/logger'
 import { Game, GameMetadata } from '@/types/games'
 import DisplayManagement from '@/components/games/DisplayManagement'
 import { useControllerSettings } from '@/hooks/useControllerSettings'
 import { useKeyboardShortcuts } from '@/hooks/useKeyboardShortcuts'
+import { useTimerExpiry } from '@/hooks/useTimerExpiry'
 import ControllerHeader from '@/components/games/ControllerHeader'
 import ControllerStatsLine from '@/components/games/ControllerStatsLine'
 import ControllerGrid from '@/components/games/ControllerGrid'
@@ -46,7 +50,10 @@ interface GameData {
     d: string
     correct_answer?: string
     submitted_answer?: string
+    audio_file?: string
   }
+  // Audio of the next questions, for the display app to prefetch
+  upcoming_audio?: QuestionAudio[]
   timer?: {
     startedAt: string
     duration: number
@@ -121,6 +128,10 @@ export default function ControllerPage() {
   const [gameData, setGameData] = useState<GameData | null>(null)
   const [timerKey, setTimerKey] = React.useState(0)
 
+  // Game state goes out as versioned patches (see src/lib/gameState.ts)
+  const stateChannelRef = React.useRef<GameStateChannel | null>(null)
+  const stateWriterRef = React.useRef<GameStateWriter | null>(null)
+
   // Guard to prevent race condition when multiple answer events fire rapidly
   const isProcessingAllAnswered = React.useRef(false)
 
@@ -132,6 +143,7 @@ export default function ControllerPage() {
   const {
     showQrCode,
     showJoinLink,
+    rosterMode,
     toggleQrCode,
     toggleJoinLink
   } = useControllerSettings()
@@ -163,117 +175,51 @@ export default function ControllerPage() {
     return 'Back'
   }
 
-  // Rebuild scoreboard from database state
-  const rebuildScoreboard = useCallback(async () => {
-    if (!id) return
-
-    console.log('=== REBUILDING SCOREBOARD FOR GAME:', id, ' ===')
-
-    try {
-      // Start with empty teams structure
-      const teams: Record<string, { name: string; players: Array<{ id: string; gamePlayerId?: string; name: string; avatar: string }> }> = {
-        'no-team': {
-          name: 'No Team',
-          players: []
-        }
-      }
+  // Latest scoreboard, so roster rebuilds can keep team scores
+  const scoreboardRef = React.useRef(game?.scoreboard)
+  useEffect(() => {
+    scoreboardRef.current = game?.scoreboard
+  }, [game?.scoreboard])
 
-      // Get all teams for this game
-      try {
-        const teamsRecords = await pb.collection('game_teams').getFullList({
-          filter: `game="${id}"`
-        })
-        console.log('Found', teamsRecords.length, 'teams for game')
+  // Save roster teams as the game's scoreboard
+  const writeScoreboard = useCallback(async (teams: RosterTeams) => {
+    if (!id) return
 
-        teamsRecords.forEach((team: any) => {
-          teams[team.id] = {
-            name: team.name || 'Unknown Team',
-            players: []
-          }
-        })
-      } catch (teamsError) {
-        console.error('Error fetching teams:', teamsError)
+    await pb.collection('games').update(id, {
+      scoreboard: {
+        updated: new Date().toISOString(),
+        teams: teams
       }
+    })
 
-      // Get all players for this game
-      try {
-        const playersRecords = await pb.collection('game_players').getFullList({
-          filter: `game="${id}"`
-        })
-        console.log('Found', playersRecords.length, 'player records for game')
-
-        // Deduplicate players by user ID - keep the latest record for each user
-        const uniquePlayers: Record<string, any> = {}
-        playersRecords.forEach((player: any) => {
-          const playerRef = player.player
-          if (playerRef) {
-            // If this user doesn't exist yet, or this record is newer, keep it
-            if (!uniquePlayers[playerRef] || player.created > uniquePlayers[playerRef].created) {
-              uniquePlayers[playerRef] = player
-            }
-          }
-        })
-
-        console.log('Found', Object.keys(uniquePlayers).length, 'unique players for game')
-
-        // Assign players to teams using name/avatar from game_players record
-        for (const player of Object.values(uniquePlayers)) {
-          const playerRef = player.player
-          const assignedTeamId = player.team || 'no-team'
-
-          // Get player details directly from game_players record
-          const playerInfo = {
-            id: playerRef,
-            gamePlayerId: player.id,  // Store game_players record ID for avatar URLs
-            name: player.name || '',
-            avatar: player.avatar || ''
-          }
-
-          console.log('Added player', playerInfo.name || playerRef, 'to team', assignedTeamId)
-
-          // Ensure the team exists
-          if (!teams[assignedTeamId]) {
-            teams[assignedTeamId] = {
-              name: assignedTeamId === 'no-team' ? 'No Team' : 'Unknown Team',
-              players: []
-            }
-          }
+    logger.debug('Scoreboard rebuilt successfully with', Object.keys(teams).length, 'teams')
+  }, [id])
 
-          // Add player to their team
-          teams[assignedTeamId].players.push(playerInfo)
-        }
-      } catch (playersError) {
-        console.error('Error fetching players:', playersError)
-      }
+  // Rebuild scoreboard from database state
+  const rebuildScoreboard = useCallback(async () => {
+    if (!id) return
 
-      // Create the final scoreboard object
-      const scoreboardData = {
-        updated: new Date().toISOString(),
-        teams: teams
-      }
+    logger.debug('=== REBUILDING SCOREBOARD FOR GAME:', id, ' ===')
 
-      // Save to game
-      await pb.collection('games').update(id, {
-        scoreboard: scoreboardData
-      })
+    try {
+      const records = await rosterService.getRosterRecords(id)
+      logger.debug('Found', records.teams.length, 'teams and', records.players.length, 'player records for game')
 
-      console.log('Scoreboard rebuilt successfully with', Object.keys(teams).length, 'teams')
+      await writeScoreboard(buildRosterTeams(records.teams, records.players, scoreboardRef.current?.teams))
     } catch (error) {
-      console.error('Error rebuilding scoreboard:', error)
+      logger.error('Error rebuilding scoreboard:', error)
     }
-  }, [id])
+  }, [id, writeScoreboard])
 
   // Update game data (clean version that replaces entire data object)
   const updateGameDataClean = useCallback(async (cleanGameData: GameData) => {
     if (!id) return
 
     try {
-      await pb.collection('games').update(id, {
-        data: JSON.stringify(cleanGameData)
-      })
+      await stateWriterRef.current?.write(cleanGameData)
       setGameData(cleanGameData)
     } catch (error) {
-      console.error('Failed to update game data:', error)
+      logger.error('Failed to update game data:', error)
     }
   }, [id])
 
@@ -292,7 +238,7 @@ export default function ControllerPage() {
         pausedRemaining: undefined
       }
 
-      console.log('▶️ Resuming timer with', remaining, 'seconds remaining')
+      logger.debug('▶️ Resuming timer with', remaining, 'seconds remaining')
       await updateGameDataClean({ ...gameData, timer })
     } else {
       // Pause: calculate and store remaining time
@@ -308,7 +254,7 @@ export default function ControllerPage() {
         pausedRemaining: remainingSeconds
       }
 
-      console.log('⏸️ Pausing timer with', remainingSeconds, 'seconds remaining')
+      logger.debug('⏸️ Pausing timer with', remainingSeconds, 'seconds remaining')
       await updateGameDataClean({ ...gameData, timer })
     }
   }, [gameData, id, updateGameDataClean])
@@ -325,7 +271,7 @@ export default function ControllerPage() {
 
     // GUARD: Prevent duplicate triggers
     if (isProcessingAllAnswered.current) {
-      console.log('👥 [ControllerPage] Already processing all-answered, skipping duplicate trigger')
+      logger.debug('👥 [ControllerPage] Already processing all-answered, skipping duplicate trigger')
       return
     }
     isProcessingAllAnswered.current = true
@@ -343,7 +289,7 @@ export default function ControllerPage() {
 
         // Only trigger 3-second early advance if >3 seconds remain
         if (remainingMs > 3000) {
-          console.log('🎉 [ControllerPage] All teams answered! Triggering notification for 3 seconds')
+          logger.debug('🎉 [ControllerPage] All teams answered! Triggering notification for 3 seconds')
 
           // Create 3-second early-advance timer WITH notification flag
           const timer = {
@@ -360,10 +306,10 @@ export default function ControllerPage() {
           })
         } else {
           // Let existing question timer expire naturally
-          console.log('👥 [ControllerPage] All teams answered with ≤3s remaining, letting timer expire naturally')
+          logger.debug('👥 [ControllerPage] All teams answered with ≤3s remaining, letting timer expire naturally')
         }
       } else {
-        console.log('👥 [ControllerPage] All teams answered! Waiting for manual advance (auto-reveal disabled)')
+        logger.debug('👥 [ControllerPage] All teams answered! Waiting for manual advance (auto-reveal disabled)')
       }
     } finally {
       // Reset guard after a short delay (in case update fails or races)
@@ -394,8 +340,11 @@ export default function ControllerPage() {
       // Parse game data if exists
       if (gameData.data) {
         try {
-          const parsedData = typeof gameData.data === 'string' ? JSON.parse(gameData.data) : gameData.data
-          setGameData(parsedData)
+          // Applies the snapshot and catches up on patches written since
+          const channel = stateChannelRef.current
+          await channel?.applySnapshot(gameData.data)
+          const parsedData = channel?.current.state ?? parseSnapshot(gameData.data).state
+          if (!parsedData) return
 
           // Reset status to 'ready' if we're at game-start (allows restarting completed games)
           if (parsedData.state === 'game-start' && gameData.status === 'completed') {
@@ -407,12 +356,12 @@ export default function ControllerPage() {
             await gamesService.updateGame(id, { status: 'in-progress' })
           }
         } catch (error) {
-          console.error('Failed to parse game data:', error)
+          logger.error('Failed to parse game data:', error)
           setGameData(null)
         }
       }
     } catch (error) {
-      console.error('Failed to fetch game data:', error)
+      logger.error('Failed to fetch game data:', error)
     }
   }
 
@@ -422,12 +371,10 @@ export default function ControllerPage() {
 
     try {
       const updatedData = { ...gameData, ...newGameData }
-      await pb.collection('games').update(id, {
-        data: JSON.stringify(updatedData)
-      })
+      await stateWriterRef.current?.write(updatedData)
       setGameData(updatedData as GameData)
     } catch (error) {
-      console.error('Failed to update game data:', error)
+      logger.error('Failed to update game data:', error)
     }
   }
 
@@ -435,8 +382,8 @@ export default function ControllerPage() {
   const handleNextState = async () => {
     if (!gameData) return
 
-    console.log('🎮 handleNextState called, current state:', gameData?.state)
-    console.log(`🎮 State transition from: ${gameData.state}`)
+    logger.debug('🎮 handleNextState called, current state:', gameData?.state)
+    logger.debug(`🎮 State transition from: ${gameData.state}`)
 
     // Helper to get current round index from gameData
     const getCurrentRoundIndex = (): number => {
@@ -445,13 +392,14 @@ export default function ControllerPage() {
       return rounds.findIndex(r => r.sequence_number === gameData.round?.round_number)
     }
 
-    // Helper to create round object for a given round index
+    // Helper to create round object (and its first questions' audio) for a given round index
     const createRoundObject = async (roundIndex: number) => {
       const round = rounds[roundIndex]
       if (!round) return undefined
 
       // Get categories for this round
       let categories: string[] = []
+      let upcomingAudio: QuestionAudio[] = []
       try {
         const gameQuestions = await gameQuestionsService.getGameQuestions(round.id)
 
@@ -463,30 +411,34 @@ export default function ControllerPage() {
         }
 
         categories = Array.from(uniqueCategories)
+        upcomingAudio = upcomingQuestionAudio(gameQuestions, 0)
       } catch (error) {
-        console.error('Failed to fetch categories for round:', error)
+        logger.error('Failed to fetch categories for round:', error)
       }
 
       return {
-        round_number: round.sequence_number,
-        rounds: rounds.length,
-        question_count: round.question_count,
-        title: round.title,
-        categories
+        round: {
+          round_number: round.sequence_number,
+          rounds: rounds.length,
+          question_count: round.question_count,
+          title: round.title,
+          categories
+        },
+        upcomingAudio
       }
     }
 
     // Handle question progression within round-play
     if (gameData.state === 'round-play') {
-      console.log('🎮 Processing round-play state')
+      logger.debug('🎮 Processing round-play state')
       const currentRoundIndex = getCurrentRoundIndex()
       const currentRound = rounds[currentRoundIndex]
       if (!currentRound) return
 
       const isAnswerRevealed = !!gameData.question?.correct_answer
-      console.log('🎮 isAnswerRevealed:', isAnswerRevealed, 'correct_answer:', gameData.question?.correct_answer)
+      logger.debug('🎮 isAnswerRevealed:', isAnswerRevealed, 'correct_answer:', gameData.question?.correct_answer)
 
-      console.log('🔍 DEBUG: round-play logic', {
+      logger.debug('🔍 DEBUG: round-play logic', {
         questionNumber: gameData.question?.question_number,
         hasCorrectAnswer: !!gameData.question?.correct_answer,
         isAnswerRevealed,
@@ -494,17 +446,17 @@ export default function ControllerPage() {
       })
 
       if (!isAnswerRevealed) {
-        console.log('🎮 ENTERING REVEAL AND GRADE BLOCK')
+        logger.debug('🎮 ENTERING REVEAL AND GRADE BLOCK')
         // Reveal answer and grade all submissions
-        console.log('🔍 DEBUG: Revealing answer and grading submissions')
+        logger.debug('🔍 DEBUG: Revealing answer and grading submissions')
         if (gameData.question && id) {
-          console.log('🎮 gameData.question exists, id:', id)
+          logger.debug('🎮 gameData.question exists, id:', id)
           // Get the game_questions record to access the secure key
           const gameQuestions = await gameQuestionsService.getGameQuestions(currentRound.id)
           const gameQuestion = gameQuestions.find(gq => gq.id === gameData.question!.id)
 
           if (gameQuestion) {
-            console.log('🎮 gameQuestion found:', gameQuestion.id)
+            logger.debug('🎮 gameQuestion found:', gameQuestion.id)
             // Use the secure key to get the correct answer label
             const { getCorrectAnswerLabel, translateAnswerToOriginal, isTranslatedAnswerCorrect } = await import('@/lib/answerShuffler')
             const correctAnswerLabel = getCorrectAnswerLabel(gameQuestion.key)
@@ -513,7 +465,7 @@ export default function ControllerPage() {
             const { gameAnswersService } = await import('@/lib/gameAnswers')
             const submittedAnswers = await gameAnswersService.getTeamAnswersForQuestion(id, gameData.question.id)
 
-            console.log(`🎯 Grading ${submittedAnswers.length} submitted answers`)
+            logger.debug(`🎯 Grading ${submittedAnswers.length} submitted answers`)
 
             // Update each answer with translation and correctness
             for (const answer of submittedAnswers) {
@@ -534,9 +486,9 @@ export default function ControllerPage() {
                     is_correct: isCorrect
                   })
 
-                  console.log(`✅ Graded answer for team ${answer.team}: ${answer.answer} → ${translatedAnswer} (${isCorrect ? 'CORRECT' : 'INCORRECT'})`)
+                  logger.debug(`✅ Graded answer for team ${answer.team}: ${answer.answer} → ${translatedAnswer} (${isCorrect ? 'CORRECT' : 'INCORRECT'})`)
                 } catch (error) {
-                  console.error(`❌ Failed to grade answer ${answer.id}:`, error)
+                  logger.error(`❌ Failed to grade answer ${answer.id}:`, error)
                 }
               }
             }
@@ -548,7 +500,8 @@ export default function ControllerPage() {
               question: {
                 ...gameData.question,
                 correct_answer: correctAnswerLabel
-              }
+              },
+              upcoming_audio: gameData.upcoming_audio
             }
             // Add timer if configured (answer timer, now revealed)
             const timer = createTimerForState('round-play', true, game?.metadata)
@@ -556,15 +509,15 @@ export default function ControllerPage() {
 
             await updateGameDataClean(newGameData)
 
-            console.log(`🎯 All answers graded. Correct answer: ${correctAnswerLabel}`)
+            logger.debug(`🎯 All answers graded. Correct answer: ${correctAnswerLabel}`)
 
             // Update scoreboard with latest scores
-            console.log('🔴 BEFORE updateScoreboard call - Game ID:', id, 'Round:', gameData.round?.round_number)
+            logger.debug('🔴 BEFORE updateScoreboard call - Game ID:', id, 'Round:', gameData.round?.round_number)
             try {
               await scoreboardService.updateScoreboard(id, gameData.round?.round_number || 1)
-              console.log('🟢 AFTER updateScoreboard call - Success!')
+              logger.debug('🟢 AFTER updateScoreboard call - Success!')
             } catch (error) {
-              console.error('🔴 AFTER updateScoreboard call - Failed:', error)
+              logger.error('🔴 AFTER updateScoreboard call - Failed:', error)
               // Don't block game flow if scoreboard update fails
             }
           }
@@ -575,7 +528,7 @@ export default function ControllerPage() {
         const currentQuestionNumber = gameData.question?.question_number || 1
         const nextQuestionNumber = currentQuestionNumber + 1
 
-        console.log('🔍 DEBUG: Moving to next question', {
+        logger.debug('🔍 DEBUG: Moving to next question', {
           currentQuestionNumber,
           nextQuestionNumber,
           questionCount: currentRound.question_count
@@ -583,7 +536,7 @@ export default function ControllerPage() {
 
         if (nextQuestionNumber <= currentRound.question_count) {
           // Load next question
-          console.log('🔍 DEBUG: Loading next question', nextQuestionNumber)
+          logger.debug('🔍 DEBUG: Loading next question', nextQuestionNumber)
           const gameQuestions = await gameQuestionsService.getGameQuestions(currentRound.id)
           const nextQuestionIndex = nextQuestionNumber - 1
           if (gameQuestions.length > nextQuestionIndex) {
@@ -612,20 +565,22 @@ export default function ControllerPage() {
                 a: shuffled.shuffledAnswers[0].text,
                 b: shuffled.shuffledAnswers[1].text,
                 c: shuffled.shuffledAnswers[2].text,
-                d: shuffled.shuffledAnswers[3].text
-              }
+                d: shuffled.shuffledAnswers[3].text,
+                audio_file: questionAudioFile(gameQuestion)
+              },
+              upcoming_audio: upcomingQuestionAudio(gameQuestions, nextQuestionIndex + 1)
             }
             // Add timer if configured (question timer, not revealed yet)
             const timer = createTimerForState('round-play', false, game?.metadata)
             if (timer) newGameData.timer = timer
 
             await updateGameDataClean(newGameData)
-            console.log('🔍 DEBUG: Next question loaded successfully')
+            logger.debug('🔍 DEBUG: Next question loaded successfully')
           }
           return
         } else {
           // End of round
-          console.log('🔍 DEBUG: Ending round')
+          logger.debug('🔍 DEBUG: Ending round')
           const newGameData: GameData = {
             state: 'round-end',
             round: gameData.round
@@ -648,7 +603,8 @@ export default function ControllerPage() {
         if (firstRound) {
           const newGameData: GameData = {
             state: 'round-start',
-            round: firstRound
+            round: firstRound.round,
+            upcoming_audio: firstRound.upcomingAudio
           }
           // Add timer if configured
           const timer = createTimerForState('round-start', false, game?.metadata)
@@ -658,7 +614,7 @@ export default function ControllerPage() {
           // Update game status to in-progress
           if (game) {
             await gamesService.updateGame(game.id, { status: 'in-progress' })
-            console.log('🎮 Game status updated to in-progress')
+            logger.info('🎮 Game status updated to in-progress')
           }
         }
         break
@@ -696,8 +652,10 @@ export default function ControllerPage() {
                 a: shuffled.shuffledAnswers[0].text,
                 b: shuffled.shuffledAnswers[1].text,
                 c: shuffled.shuffledAnswers[2].text,
-                d: shuffled.shuffledAnswers[3].text
-              }
+                d: shuffled.shuffledAnswers[3].text,
+                audio_file: questionAudioFile(gameQuestion)
+              },
+              upcoming_audio: upcomingQuestionAudio(gameQuestions, 1)
             }
             // Add timer if configured (question timer, not revealed yet)
             const timer = createTimerForState('round-play', false, game?.metadata)
@@ -718,7 +676,8 @@ export default function ControllerPage() {
           if (nextRound) {
             const newGameData: GameData = {
               state: 'round-start',
-              round: nextRound
+              round: nextRound.round,
+              upcoming_audio: nextRound.upcomingAudio
             }
             // Add timer if configured
             const timer = createTimerForState('round-start', false, game?.metadata)
@@ -757,7 +716,7 @@ export default function ControllerPage() {
         // Mark game as completed before returning to lobby
         if (game) {
           await gamesService.updateGame(game.id, { status: 'completed' })
-          console.log('🏁 Game status updated to completed')
+          logger.info('🏁 Game status updated to completed')
         }
         navigate('/host')
         return
@@ -771,7 +730,7 @@ export default function ControllerPage() {
       }
 
       default:
-        console.error(`Unknown game state: ${gameData.state}`)
+        logger.error(`Unknown game state: ${gameData.state}`)
     }
   }
 
@@ -799,7 +758,8 @@ export default function ControllerPage() {
           await updateGameDataClean({
             state: 'round-play',
             round: gameData.round,
-            question: questionWithoutAnswer
+            question: questionWithoutAnswer,
+            upcoming_audio: gameData.upcoming_audio
           })
         }
         return
@@ -839,8 +799,10 @@ export default function ControllerPage() {
                   a: shuffled.shuffledAnswers[0].text,
                   b: shuffled.shuffledAnswers[1].text,
                   c: shuffled.shuffledAnswers[2].text,
-                  d: shuffled.shuffledAnswers[3].text
-                }
+                  d: shuffled.shuffledAnswers[3].text,
+                  audio_file: questionAudioFile(gameQuestion)
+                },
+                upcoming_audio: upcomingQuestionAudio(gameQuestions, prevQuestionNumber)
               })
             }
           }
@@ -870,40 +832,34 @@ export default function ControllerPage() {
   }, [gameData?.timer, gameData?.timer?.isPaused])
 
   // Auto-advance when timer expires (host only)
-  useEffect(() => {
-    if (!gameData?.timer || gameData.timer.isPaused || !id) return
-
-    console.log('⏰ Timer active:', {
-      state: gameData.state,
-      expiresAt: gameData.timer.expiresAt,
-      duration: gameData.timer.duration
-    })
-
-    const checkTimer = setInterval(() => {
-      const now = Date.now()
-      const expiresAt = new Date(gameData.timer!.expiresAt).getTime()
-
-      if (now >= expiresAt) {
-        console.log('⏰ Timer expired! Auto-advancing from state:', gameData.state)
-        clearInterval(checkTimer)
-        handleNextState()
-      }
-    }, 100)
-
-    return () => {
-      clearInterval(checkTimer)
-    }
-  }, [gameData?.timer, id, handleNextState])
+  useTimerExpiry(id ? gameData?.timer?.expiresAt : undefined, !!gameData?.timer?.isPaused, () => {
+    logger.debug('⏰ Timer expired! Auto-advancing from state:', gameData?.state)
+    handleNextState()
+  })
 
   // Set up realtime subscription for game changes
   useEffect(() => {
     if (!id) return
 
+    const stateChannel = new GameStateChannel(id, (state) => setGameData(state as GameData))
+    stateChannelRef.current = stateChannel
+    stateWriterRef.current = new GameStateWriter(id, stateChannel)
+    stateChannel.start().catch(error => logger.error('Error subscribing to game state:', error))
+
     // Initial data fetch
     fetchGameData()
 
-    // Rebuild scoreboard on initial load to ensure latest schema
-    rebuildScoreboard()
+    // Rebuild scoreboard on initial load to ensure latest schema. In
+    // incremental mode the roster is loaded once and then kept up to date
+    // from the realtime events below, coalescing bursts into one write.
+    const roster = rosterMode === 'incremental'
+      ? new RosterCoalescer(id, writeScoreboard, () => scoreboardRef.current?.teams)
+      : null
+    if (roster) {
+      roster.load().catch(error => logger.error('Error loading roster:', error))
+    } else {
+      rebuildScoreboard()
+    }
 
     // Subscribe to real-time updates for games (includes scoreboard changes)
     const unsubscribeGame = pb.collection('games').subscribe('*', (e) => {
@@ -911,14 +867,9 @@ export default function ControllerPage() {
         const updatedGame = e.record as unknown as Game
         setGame(updatedGame)
 
-        // Parse updated game data
+        // A snapshot or unversioned write of the game data
         if (updatedGame.data) {
-          try {
-            const parsedData = typeof updatedGame.data === 'string' ? JSON.parse(updatedGame.data) : updatedGame.data
-            setGameData(parsedData)
-          } catch (error) {
-            console.error('Failed to parse game data:', error)
-          }
+          stateChannel.applySnapshot(updatedGame.data)
         }
       }
     })
@@ -927,13 +878,14 @@ export default function ControllerPage() {
     const unsubscribePlayers = pb.collection('game_players').subscribe('*', (e) => {
       // Check if the player record belongs to this game
       if (e.record.game === id) {
-        console.log(`=== PLAYER ${e.action.toUpperCase()} ===`)
-        console.log('Player ID:', e.record.id)
-        console.log('Game ID:', e.record.game)
-        console.log('Team ID:', e.record.team)
+        logger.debug(`=== PLAYER ${e.action.toUpperCase()} ===`)
+        logger.debug('Player ID:', e.record.id)
+        logger.debug('Game ID:', e.record.game)
+        logger.debug('Team ID:', e.record.team)
 
         // Rebuild scoreboard on any player change
-        rebuildScoreboard()
+        if (roster) roster.applyPlayer(e.action, e.record as any)
+        else rebuildScoreboard()
       }
     }, {
       filter: `game="${id}"`
@@ -943,12 +895,13 @@ export default function ControllerPage() {
     const unsubscribeTeams = pb.collection('game_teams').subscribe('*', (e) => {
       // Check if the team record belongs to this game
       if (e.record.game === id) {
-        console.log(`=== TEAM ${e.action.toUpperCase()} ===`)
-        console.log('Team ID:', e.record.id)
-        console.log('Game ID:', e.record.game)
+        logger.debug(`=== TEAM ${e.action.toUpperCase()} ===`)
+        logger.debug('Team ID:', e.record.id)
+        logger.debug('Game ID:', e.record.game)
 
         // Rebuild scoreboard on any team change
-        rebuildScoreboard()
+        if (roster) roster.applyTeam(e.action, e.record as any)
+        else rebuildScoreboard()
       }
     }, {
       filter: `game="${id}"`
@@ -956,11 +909,15 @@ export default function ControllerPage() {
 
     // Cleanup subscriptions on unmount
     return () => {
+      roster?.dispose()
+      stateChannel.stop()
+      stateChannelRef.current = null
+      stateWriterRef.current = null
       unsubscribeGame.then((unsub) => unsub())
       unsubscribePlayers.then((unsub) => unsub())
       unsubscribeTeams.then((unsub) => unsub())
     }
-  }, [id, navigate, rebuildScoreboard])
+  }, [id, navigate, rebuildScoreboard, rosterMode, writeScoreboard])
 
   // Keyboard shortcuts (after all event handlers are defined)
   useKeyboardShortcuts({
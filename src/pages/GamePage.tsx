@@ -9,7 +9,9 @@ import TeamSelectionModal from '@/components/games/TeamSelectionModal'
 import { CircularTimerFixed } from '@/components/ui/circular-timer'
 import { gamesService, gameTeamsService, gamePlayersService } from '@/lib/games'
 import { gameAnswersService } from '@/lib/gameAnswers'
+import { GameStateChannel } from '@/lib/gameState'
 import pb from '@/lib/pocketbase'
+import { logger } from '@/lib/logger'
 import { Game } from '@/types/games'
 import { usePresenceTracking } from '@/hooks/usePresenceTracking'
 
@@ -25,6 +27,9 @@ export default function GamePage() {
   const [showTeamModal, setShowTeamModal] = useState(false)
   const [timerKey, setTimerKey] = React.useState(0)
 
+  // Game state arrives as versioned patches (see src/lib/gameState.ts)
+  const stateChannelRef = React.useRef<GameStateChannel | null>(null)
+
   // Track player presence when on game page
   usePresenceTracking({
     gameId: id || null,
@@ -43,10 +48,10 @@ export default function GamePage() {
     try {
       const questionId = gameData.question?.id
 
-      console.log('Submitting answer with question ID:', questionId, 'selected label:', selectedLabel)
+      logger.debug('Submitting answer with question ID:', questionId, 'selected label:', selectedLabel)
 
       if (!questionId) {
-        console.error('No question ID found in game data')
+        logger.error('No question ID found in game data')
         return
       }
 
@@ -61,9 +66,9 @@ export default function GamePage() {
       )
 
       // Note: The subscription will automatically update teamAnswer state when the answer is saved
-      console.log(`Answer ${selectedLabel} submitted for team ${currentTeamId}`)
+      logger.debug(`Answer ${selectedLabel} submitted for team ${currentTeamId}`)
     } catch (error) {
-      console.error('Failed to submit answer:', error)
+      logger.error('Failed to submit answer:', error)
     } finally {
       setIsSubmittingAnswer(false)
     }
@@ -94,7 +99,7 @@ export default function GamePage() {
       }
 
       if (!finalTeamId) {
-        console.error('No team selected or created')
+        logger.error('No team selected or created')
         return
       }
 
@@ -120,9 +125,9 @@ export default function GamePage() {
       }
 
       // The page will refresh via subscriptions
-      console.log('Team selected successfully, waiting for page refresh')
+      logger.debug('Team selected successfully, waiting for page refresh')
     } catch (error) {
-      console.error('Failed to join team:', error)
+      logger.error('Failed to join team:', error)
       alert('Failed to join team. Please try again.')
       setShowTeamModal(true)
     } finally {
@@ -130,61 +135,60 @@ export default function GamePage() {
     }
   }
 
+  // Take a fetched games record: keep it and find the current user's team
+  const applyGameRecord = (gameData: Game) => {
+    logger.debug('✅ Successfully fetched game data:', gameData)
+    setGame(gameData)
+
+    // Determine current user's team from scoreboard
+    if (gameData.scoreboard?.teams) {
+      const currentUserId = pb.authStore.model?.id
+      const userTeam = Object.entries(gameData.scoreboard.teams).find(([, team]: [string, any]) =>
+        team.players.some((player: any) => player.id === currentUserId)
+      )
+
+      if (userTeam) {
+        setCurrentTeamId(userTeam[0])
+        logger.debug('Current user team ID:', userTeam[0])
+      }
+    }
+  }
+
   // Fetch game data
   const fetchGameData = async () => {
     if (!id) return
 
     // Debug authentication state
-    console.log('=== GAME PAGE AUTH DEBUG ===')
-    console.log('pb.authStore.isValid:', pb.authStore.isValid)
-    console.log('pb.authStore.token:', pb.authStore.token ? 'PRESENT' : 'MISSING')
-    console.log('pb.authStore.model:', pb.authStore.model)
-    console.log('Current user ID:', pb.authStore.model?.id)
-    console.log('Game ID being requested:', id)
+    logger.debug('=== GAME PAGE AUTH DEBUG ===')
+    logger.debug('pb.authStore.isValid:', pb.authStore.isValid)
+    logger.debug('pb.authStore.token:', pb.authStore.token ? 'PRESENT' : 'MISSING')
+    logger.debug('pb.authStore.model:', pb.authStore.model)
+    logger.debug('Current user ID:', pb.authStore.model?.id)
+    logger.debug('Game ID being requested:', id)
 
     // Check if user is authenticated before making the request
     if (!pb.authStore.isValid || !pb.authStore.token) {
-      console.error('❌ User is not authenticated - cannot fetch game data')
-      console.error('Token missing:', !pb.authStore.token)
-      console.error('Invalid auth store:', !pb.authStore.isValid)
+      logger.error('❌ User is not authenticated - cannot fetch game data')
+      logger.error('Token missing:', !pb.authStore.token)
+      logger.error('Invalid auth store:', !pb.authStore.isValid)
       setIsLoading(false)
       return
     }
 
-    console.log('✅ User appears authenticated, attempting to fetch game...')
+    logger.debug('✅ User appears authenticated, attempting to fetch game...')
 
     try {
-      // Get game data (includes scoreboard)
-      const gameData = await gamesService.getGame(id)
-      console.log('✅ Successfully fetched game data:', gameData)
-      setGame(gameData)
-
-      // Parse game data if exists
-      if (gameData.data) {
-        try {
-          const parsedData = typeof gameData.data === 'string' ? JSON.parse(gameData.data) : gameData.data
-          setGameData(parsedData)
-        } catch (error) {
-          console.error('Failed to parse game data:', error)
-          setGameData(null)
-        }
-      }
-
-      // Determine current user's team from scoreboard
-      if (gameData.scoreboard?.teams) {
-        const currentUserId = pb.authStore.model?.id
-        const userTeam = Object.entries(gameData.scoreboard.teams).find(([, team]: [string, any]) =>
-          team.players.some((player: any) => player.id === currentUserId)
-        )
-
-        if (userTeam) {
-          setCurrentTeamId(userTeam[0])
-          console.log('Current user team ID:', userTeam[0])
-        }
+      // Game record (includes scoreboard), state and seq in one request;
+      // the channel hands the record to applyGameRecord
+      const channel = stateChannelRef.current
+      if (channel) {
+        await channel.resync()
+      } else {
+        applyGameRecord(await gamesService.getGame(id))
       }
     } catch (error: any) {
-      console.error('❌ Failed to fetch game data:', error)
-      console.error('Error details:', {
+      logger.error('❌ Failed to fetch game data:', error)
+      logger.error('Error details:', {
         message: error?.message,
         status: error?.status,
         url: error?.url,
@@ -195,14 +199,14 @@ export default function GamePage() {
 
       // Check if it's an authentication error
       if (error?.status === 401 || error?.message?.includes('unauthorized')) {
-        console.error('🔐 Authentication error detected - redirecting to login')
+        logger.error('🔐 Authentication error detected - redirecting to login')
         // Clear invalid auth state and redirect
         pb.authStore.clear()
         window.location.href = '/'
       } else if (error?.status === 403 || error?.message?.includes('forbidden')) {
-        console.error('🚫 Access forbidden - user does not have permission')
+        logger.error('🚫 Access forbidden - user does not have permission')
       } else if (error?.status === 404) {
-        console.error('🔍 Game not found - ID:', id)
+        logger.error('🔍 Game not found - ID:', id)
       }
     } finally {
       setIsLoading(false)
@@ -219,7 +223,7 @@ export default function GamePage() {
 
     const questionId = gameData.question.id
 
-    console.log('🔔 Setting up game_answers subscription:', {
+    logger.debug('🔔 Setting up game_answers subscription:', {
       gameId: id,
       questionId,
       teamId: currentTeamId
@@ -232,17 +236,17 @@ export default function GamePage() {
         const teamAnswerRecord = answers.find(a => a.team === currentTeamId)
 
         if (teamAnswerRecord) {
-          console.log('✅ Found existing team answer:', teamAnswerRecord)
+          logger.debug('✅ Found existing team answer:', teamAnswerRecord)
           setTeamAnswer({
             answer: teamAnswerRecord.answer || '',
             isCorrect: teamAnswerRecord.is_correct
           })
         } else {
-          console.log('ℹ️ No existing answer found for this question')
+          logger.debug('ℹ️ No existing answer found for this question')
           setTeamAnswer(null)
         }
       } catch (error) {
-        console.error('Failed to fetch existing answer:', error)
+        logger.error('Failed to fetch existing answer:', error)
       }
     }
 
@@ -250,7 +254,7 @@ export default function GamePage() {
 
     // Subscribe to real-time updates for this question's answers
     const unsubscribeAnswers = pb.collection('game_answers').subscribe('*', (e) => {
-      console.log('🔄 game_answers subscription event:', {
+      logger.debug('🔄 game_answers subscription event:', {
         action: e.action,
         recordId: e.record.id,
         game: (e.record as any).game,
@@ -264,7 +268,7 @@ export default function GamePage() {
           (e.record as any).game_questions_id === questionId &&
           (e.record as any).team === currentTeamId) {
 
-        console.log('✅ Team answer updated in real-time:', e.record)
+        logger.debug('✅ Team answer updated in real-time:', e.record)
 
         if (e.action === 'create' || e.action === 'update') {
           setTeamAnswer({
@@ -282,7 +286,7 @@ export default function GamePage() {
 
     // Cleanup subscription when question changes or component unmounts
     return () => {
-      console.log('🧹 Cleaning up game_answers subscription for question:', questionId)
+      logger.debug('🧹 Cleaning up game_answers subscription for question:', questionId)
       unsubscribeAnswers.then((unsub) => unsub())
     }
   }, [id, currentTeamId, gameData?.question?.id])
@@ -291,22 +295,29 @@ export default function GamePage() {
   useEffect(() => {
     if (!id) return
 
-    console.log('🎮 GamePage useEffect triggered for game ID:', id)
-    console.log('🎮 Auth state at useEffect:', {
+    logger.debug('🎮 GamePage useEffect triggered for game ID:', id)
+    logger.debug('🎮 Auth state at useEffect:', {
       isValid: pb.authStore.isValid,
       hasToken: !!pb.authStore.token,
       userId: pb.authStore.model?.id
     })
 
+    const stateChannel = new GameStateChannel(id, (state, seq) => {
+      logger.debug('📊 GamePage game state:', { seq, state: state.state, questionId: state.question?.id })
+      setGameData(state)
+    }, (gameRecord) => applyGameRecord(gameRecord as unknown as Game))
+    stateChannelRef.current = stateChannel
+    stateChannel.start().catch(error => logger.error('Failed to subscribe to game state:', error))
+
     // Add a small delay to ensure auth state is fully loaded
     const timeoutId = setTimeout(() => {
-      console.log('🎮 Delayed fetchGameData call')
+      logger.debug('🎮 Delayed fetchGameData call')
       fetchGameData()
     }, 100)
 
     // Subscribe to real-time updates for games (includes scoreboard changes)
     const unsubscribeGame = pb.collection('games').subscribe('*', (e) => {
-      console.log('🔄 GamePage subscription event received:', {
+      logger.debug('🔄 GamePage subscription event received:', {
         action: e.action,
         recordId: e.record.id,
         targetId: id,
@@ -315,7 +326,7 @@ export default function GamePage() {
       })
 
       if (e.action === 'update' && e.record.id === id) {
-        console.log('📝 GamePage processing game update:', {
+        logger.debug('📝 GamePage processing game update:', {
           gameId: e.record.id,
           gameName: (e.record as any).name,
           gameStatus: (e.record as any).status,
@@ -335,49 +346,26 @@ export default function GamePage() {
 
           if (userTeam) {
             setCurrentTeamId(userTeam[0])
-            console.log('Updated current user team ID from subscription:', userTeam[0])
+            logger.debug('Updated current user team ID from subscription:', userTeam[0])
           } else {
             // User is not in any team anymore
             setCurrentTeamId(null)
-            console.log('User is not in any team')
+            logger.debug('User is not in any team')
           }
         }
 
-        // Parse updated game data
+        // A snapshot or unversioned write of the game data
         if (updatedGame.data) {
-          console.log('📊 GamePage parsing updated game data:', {
-            dataType: typeof updatedGame.data,
-            dataLength: typeof updatedGame.data === 'string' ? updatedGame.data.length : 'N/A',
-            dataPreview: typeof updatedGame.data === 'string' ? updatedGame.data.substring(0, 200) + '...' : 'Object data'
-          })
-
-          try {
-            const parsedData = typeof updatedGame.data === 'string' ? JSON.parse(updatedGame.data) : updatedGame.data
-            console.log('✅ GamePage successfully parsed game data:', {
-              state: parsedData.state,
-              hasQuestion: !!parsedData.question,
-              questionId: parsedData.question?.id,
-              showAnswer: parsedData.showAnswer,
-              correctAnswer: parsedData.question?.correct_answer,
-              fullData: parsedData
-            })
-            setGameData(parsedData)
-          } catch (error) {
-            console.error('❌ GamePage failed to parse game data:', {
-              error,
-              rawData: updatedGame.data,
-              dataType: typeof updatedGame.data
-            })
-          }
+          stateChannel.applySnapshot(updatedGame.data)
         } else {
-          console.log('⚠️ GamePage received update with no game data')
+          logger.debug('⚠️ GamePage received update with no game data')
         }
       }
     })
 
     // Also refresh data when page becomes visible (focus change, tab switch, etc.)
     const handleVisibilityChange = () => {
-      console.log('👁️ GamePage visibility change detected, refreshing data...')
+      logger.debug('👁️ GamePage visibility change detected, refreshing data...')
       fetchGameData()
     }
 
@@ -388,6 +376,8 @@ export default function GamePage() {
     // Cleanup subscriptions and listeners on unmount
     return () => {
       clearTimeout(timeoutId)
+      stateChannel.stop()
+      stateChannelRef.current = null
       unsubscribeGame.then((unsub) => unsub())
       document.removeEventListener('visibilitychange', handleVisibilityChange)
       window.removeEventListener('focus', handleVisibilityChange)
@@ -12,8 +12,9 @@ import AudioGenerationModal from '@/components/games/AudioGenerationModal'
 import CategoryIcon, { getAvailableCategories } from '@/components/ui/CategoryIcon'
 import { Info, Plus, Play, User } from 'lucide-react'
 import ProfileModal from '@/components/ProfileModal'
-import pb from '@/lib/pocketbase'
-import { gamesService } from '@/lib/games'
+import { useInfiniteScroll } from '@/hooks/useInfiniteScroll'
+import pb, { getAvatarUrl } from '@/lib/pocketbase'
+import { gamesService, GAMES_PAGE_SIZE } from '@/lib/games'
 import { roundsService } from '@/lib/rounds'
 import { questionsService } from '@/lib/questions'
 import { gameQuestionsService } from '@/lib/gameQuestions'
@@ -26,6 +27,8 @@ export default function HostPage() {
   const [games, setGames] = useState<Game[]>([])
   const [rounds, setRounds] = useState<{ [key: string]: Round[] }>({})
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [hasMoreGames, setHasMoreGames] = useState(false)
   const [saving, setSaving] = useState(false)
   const [editingGame, setEditingGame] = useState<Game | null>(null)
   const [editingRound, setEditingRound] = useState<Round | null>(null)
@@ -38,31 +41,35 @@ export default function HostPage() {
   const [audioJobId, setAudioJobId] = useState<string | null>(null)
   const [isAudioModalOpen, setIsAudioModalOpen] = useState(false)
 
+  const fetchRounds = async (gamesData: Game[]) => {
+    // Fetch rounds for the games in parallel (no delays needed with server-side filtering)
+    const roundsPromises = gamesData.map(game =>
+      roundsService.getRounds(game.id)
+        .then(gameRounds => ({ gameId: game.id, rounds: gameRounds }))
+        .catch(error => {
+          console.error('Failed to load rounds for game:', game.id, error)
+          return { gameId: game.id, rounds: [] }
+        })
+    )
+
+    const roundsResults = await Promise.all(roundsPromises)
+
+    // Convert array to object keyed by game ID
+    const roundsData: { [key: string]: Round[] } = {}
+    roundsResults.forEach(result => {
+      roundsData[result.gameId] = result.rounds
+    })
+    return roundsData
+  }
+
   const fetchGames = async () => {
     try {
       setLoading(true)
-      const gamesData = await gamesService.getGames()
-      setGames(gamesData)
-
-      // Fetch rounds for all games in parallel (no delays needed with server-side filtering)
-      const roundsPromises = gamesData.map(game =>
-        roundsService.getRounds(game.id)
-          .then(gameRounds => ({ gameId: game.id, rounds: gameRounds }))
-          .catch(error => {
-            console.error('Failed to load rounds for game:', game.id, error)
-            return { gameId: game.id, rounds: [] }
-          })
-      )
-
-      const roundsResults = await Promise.all(roundsPromises)
-
-      // Convert array to object keyed by game ID
-      const roundsData: { [key: string]: Round[] } = {}
-      roundsResults.forEach(result => {
-        roundsData[result.gameId] = result.rounds
-      })
-
-      setRounds(roundsData)
+      // Reload as many games as are already listed so scrolled-in pages stay put
+      const page = await gamesService.getGamesPage(undefined, Math.max(GAMES_PAGE_SIZE, games.length))
+      setGames(page.items)
+      setHasMoreGames(page.hasMore)
+      setRounds(await fetchRounds(page.items))
     } catch (error) {
       console.error('Failed to fetch games:', error)
     } finally {
@@ -70,6 +77,24 @@ export default function HostPage() {
     }
   }
 
+  const fetchMoreGames = async () => {
+    if (loadingMore || !hasMoreGames || games.length === 0) return
+    try {
+      setLoadingMore(true)
+      const page = await gamesService.getGamesPage(games[games.length - 1])
+      setGames(current => [...current, ...page.items])
+      setHasMoreGames(page.hasMore)
+      const roundsData = await fetchRounds(page.items)
+      setRounds(current => ({ ...current, ...roundsData }))
+    } catch (error) {
+      console.error('Failed to fetch more games:', error)
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
+  const loadMoreRef = useInfiniteScroll(fetchMoreGames, hasMoreGames && !loading && !loadingMore)
+
   useEffect(() => {
     fetchGames()
   }, [])
@@ -399,7 +424,7 @@ export default function HostPage() {
           >
             {pb.authStore.model?.avatar ? (
               <img
-                src={pb.files.getUrl(pb.authStore.model, pb.authStore.model.avatar)}
+                src={getAvatarUrl(pb.authStore.model.id, pb.authStore.model.avatar)}
                 alt="Profile"
                 className="h-8 w-8 rounded-full object-cover"
               />
@@ -613,6 +638,13 @@ export default function HostPage() {
                     </AccordionItem>
                   ))}
                 </Accordion>
+                {hasMoreGames && (
+                  <div ref={loadMoreRef} className="flex items-center justify-center py-6">
+                    <div className="text-[13px] text-slate-600 dark:text-slate-400">
+                      {loadingMore ? 'Loading more games...' : ''}
+                    </div>
+                  </div>
+                )}
                 </div>
               )}
             </div>
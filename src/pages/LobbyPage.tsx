@@ -9,7 +9,7 @@ import AppHeader from '@/components/ui/AppHeader'
 import TeamSelectionModal from '@/components/games/TeamSelectionModal'
 import { gamesService, gameTeamsService, gamePlayersService } from '@/lib/games'
 import { Game } from '@/types/games'
-import pb from '@/lib/pocketbase'
+import pb, { getAvatarUrl } from '@/lib/pocketbase'
 
 export default function LobbyPage() {
   const navigate = useNavigate()
@@ -180,7 +180,7 @@ export default function LobbyPage() {
           >
             {pb.authStore.model?.avatar ? (
               <img
-                src={pb.files.getUrl(pb.authStore.model, pb.authStore.model.avatar)}
+                src={getAvatarUrl(pb.authStore.model.id, pb.authStore.model.avatar)}
                 alt="Profile"
                 className="h-8 w-8 rounded-full object-cover"
               />
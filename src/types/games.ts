@@ -48,6 +48,11 @@ export interface Game {
   updated: string;
 }
 
+export interface GamesPage {
+  items: Game[];
+  hasMore: boolean;
+}
+
 export interface CreateGameData {
   name: string;
   startdate?: string;
@@ -10,11 +10,14 @@ Test the trivia app game flow:
 """
 
 from playwright.sync_api import sync_playwright, Page, BrowserContext
+import argparse
 import time
 import os
 import random
 import re
 
+from harness.sessions import SessionPool
+
 def login_or_register_user(page: Page, email: str, password: str, role: str = "Player", name: str = None):
     """
     Helper function to login or register a user.
@@ -165,9 +168,15 @@ def login_or_register_user(page: Page, email: str, password: str, role: str = "P
         print(f"❌ Error during login/register for {email}: {e}")
         return False
 
-def test_game_flow():
+def test_game_flow(session_cache: bool = False):
+    """
+    Args:
+        session_cache: Players start from cached REST sessions
+            (harness.sessions) instead of logging in through the UI
+    """
     # Create ./tmp directory if it doesn't exist
     os.makedirs('./tmp', exist_ok=True)
+    session_pool = SessionPool() if session_cache else None
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
@@ -501,7 +510,10 @@ def test_game_flow():
 
                                             # Create separate browser contexts for each player
                                             for i, email in enumerate(player_emails, 1):
-                                                context = browser.new_context()
+                                                if session_pool:
+                                                    context = session_pool.new_context(browser, email, 'Password123!')
+                                                else:
+                                                    context = browser.new_context()
                                                 player_page = context.new_page()
 
                                                 # Enable console and error logging for this player
@@ -522,13 +534,19 @@ def test_game_flow():
                                                 player_pages.append(player_page)
 
                                                 print(f"\n👤 Setting up Player {i} ({email})...")
-                                                player_page.goto('http://localhost:5173')
-                                                player_page.wait_for_load_state('networkidle')
-                                                time.sleep(1)
-
-                                                # Login or register
-                                                if login_or_register_user(player_page, email, 'Password123!', 'Player'):
+                                                if session_pool:
+                                                    # Already signed in - go straight to the lobby
+                                                    player_page.goto('http://localhost:5173/lobby')
+                                                    player_page.wait_for_load_state('networkidle')
                                                     player_page.screenshot(path=f'./tmp/player{i}_01_logged_in.png', full_page=True)
+                                                else:
+                                                    player_page.goto('http://localhost:5173')
+                                                    player_page.wait_for_load_state('networkidle')
+                                                    time.sleep(1)
+
+                                                    # Login or register
+                                                    if login_or_register_user(player_page, email, 'Password123!', 'Player'):
+                                                        player_page.screenshot(path=f'./tmp/player{i}_01_logged_in.png', full_page=True)
 
                                             print("\n✅ All players logged in!")
 
@@ -924,4 +942,8 @@ def test_game_flow():
             browser.close()
 
 if __name__ == '__main__':
-    test_game_flow()
+    parser = argparse.ArgumentParser(description='Play a full game with a host and 4 player browsers')
+    parser.add_argument('--session-cache', action='store_true',
+                        help='Players reuse cached REST sessions instead of the login form')
+    args = parser.parse_args()
+    test_game_flow(session_cache=args.session_cache)
@@ -6,26 +6,58 @@ Runs independently and waits for teams to be ready before starting questions.
 """
 
 from playwright.sync_api import sync_playwright, Page
+import argparse
 import time
 import re
 import os
 import sys
 
-def run_host_flow():
-    """Run the host game flow and return game code."""
+from harness.bench_host_dashboard import scroll_dashboard
+from harness.browser import app_url, new_lean_context, proxy_launch_options
+
+DEFAULT_TEAMS = ['Team A', 'Team B']
+DEFAULT_PLAYERS = ['User1', 'User2', 'User3', 'User4']
+
+def run_host_flow(lean: bool = False, dashboard_pages: int = 0, network_proxy: str = None, questions: int = 5,
+                  teams: list = None, players: list = None):
+    """
+    Run the host game flow and return game code.
+
+    Args:
+        lean: Lean client profile (harness.browser) - no images, fonts,
+            media or animations, small viewport, no screenshots
+        dashboard_pages: Scroll this many pages of the games list before
+            creating the game, printing each page's load time
+        network_proxy: harness.proxy listener the browser sends all of
+            its traffic through
+        questions: Questions to play through
+        teams: Team names to wait for before starting
+        players: Player display names to wait for before starting
+    """
+    teams = teams or DEFAULT_TEAMS
+    players = players or DEFAULT_PLAYERS
+
+    def roster(content: str):
+        """(every team present, players present) on the lobby page."""
+        return all(team in content for team in teams), sum(1 for name in players if name in content)
 
     os.makedirs('./tmp', exist_ok=True)
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        browser = p.chromium.launch(headless=True, **proxy_launch_options(network_proxy))
+        # The controller layout needs a desktop viewport even when lean
+        page = new_lean_context(browser, viewport={'width': 1280, 'height': 720}).new_page() if lean else browser.new_page()
+
+        def screenshot(**kwargs):
+            if not lean:
+                page.screenshot(**kwargs)
 
         try:
             # Navigate to app
             print("🚀 HOST: Navigating to app", flush=True)
-            page.goto('http://localhost:5173')
+            page.goto(app_url('/'))
             time.sleep(2)
-            page.screenshot(path='./tmp/host_01_initial.png', full_page=True)
+            screenshot(path='./tmp/host_01_initial.png', full_page=True)
 
             # Login
             print("🔐 HOST: Logging in as host1@example.com", flush=True)
@@ -48,9 +80,15 @@ def run_host_flow():
             print("✅ HOST: Logged in", flush=True)
 
             # Navigate to host page
-            page.goto('http://localhost:5173/host')
+            page.goto(app_url('/host'))
             time.sleep(2)
-            page.screenshot(path='./tmp/host_02_host_page.png', full_page=True)
+            screenshot(path='./tmp/host_02_host_page.png', full_page=True)
+
+            if dashboard_pages:
+                print(f"📜 HOST: Scrolling {dashboard_pages} pages of games", flush=True)
+                for i, elapsed in enumerate(scroll_dashboard(page, dashboard_pages)):
+                    print(f"📜 HOST: Games page {i + 2} loaded in {elapsed:.0f}ms", flush=True)
+                page.evaluate("() => window.scrollTo(0, 0)")
 
             # Create game
             print("🎮 HOST: Creating game", flush=True)
@@ -79,7 +117,7 @@ def run_host_flow():
                 print("⏳ HOST: Modal didn't close with selector, waiting anyway...", flush=True)
                 time.sleep(3)
 
-            page.screenshot(path='./tmp/host_03_game_created.png', full_page=True)
+            screenshot(path='./tmp/host_03_game_created.png', full_page=True)
 
             # Find and click Play button for the game we just created
             print("▶️  HOST: Looking for Play button", flush=True)
@@ -132,7 +170,7 @@ def run_host_flow():
             page.wait_for_load_state('networkidle')
             time.sleep(3)
 
-            page.screenshot(path='./tmp/host_04_welcome_screen.png', full_page=True)
+            screenshot(path='./tmp/host_04_welcome_screen.png', full_page=True)
 
             # Check if we're on the welcome screen by looking for "Welcome to the Game!" text
             page_content = page.content()
@@ -180,23 +218,17 @@ def run_host_flow():
                 # Check if "Start Game" button is visible (indicates teams are ready)
                 start_button = page.locator('button:has-text("Start Game")').first
                 if start_button.is_visible(timeout=1000):
-                    # Count how many players we have
-                    player_count = content.count('User1') + content.count('User2') + content.count('User3') + content.count('User4')
-
-                    # Check if we have at least 2 teams
-                    has_team_a = 'Team A' in content
-                    has_team_b = 'Team B' in content
-
-                    # Wait for all 4 players to join before starting
-                    if has_team_a and has_team_b and player_count >= 4:
+                    # Wait for every team and player to join before starting
+                    has_teams, player_count = roster(content)
+                    if has_teams and player_count >= len(players):
                         print(f"✅ HOST: Teams ready with {player_count} players!", flush=True)
                         teams_ready = True
                         break
                     else:
-                        print(f"⏳ HOST: Waiting for all players... (TeamA: {has_team_a}, TeamB: {has_team_b}, Players: {player_count}/4)", flush=True)
+                        print(f"⏳ HOST: Waiting for all players... (Teams: {has_teams}, Players: {player_count}/{len(players)})", flush=True)
 
                 time.sleep(2)
-                page.screenshot(path='./tmp/host_05_waiting_teams.png', full_page=True)
+                screenshot(path='./tmp/host_05_waiting_teams.png', full_page=True)
 
             if not teams_ready:
                 print("⚠️  HOST: Initial timeout - players likely joining now, waiting longer...", flush=True)
@@ -210,27 +242,21 @@ def run_host_flow():
                     print("🔄 HOST: Refreshing page to check for teams...", flush=True)
                     page.reload()
                     time.sleep(3)
-                    page.screenshot(path='./tmp/host_06_after_refresh.png', full_page=True)
+                    screenshot(path='./tmp/host_06_after_refresh.png', full_page=True)
 
                     content = page.content()
 
                     # Check if "Start Game" button is visible
                     start_button = page.locator('button:has-text("Start Game")').first
                     if start_button.is_visible(timeout=1000):
-                        # Count players
-                        player_count = content.count('User1') + content.count('User2') + content.count('User3') + content.count('User4')
-
-                        # Check if we have both teams
-                        has_team_a = 'Team A' in content
-                        has_team_b = 'Team B' in content
-
-                        # Wait for all 4 players
-                        if has_team_a and has_team_b and player_count >= 4:
+                        # Wait for every team and player
+                        has_teams, player_count = roster(content)
+                        if has_teams and player_count >= len(players):
                             print(f"✅ HOST: Teams appeared after refresh with {player_count} players!", flush=True)
                             teams_ready = True
                             break
                         else:
-                            print(f"⏳ HOST: Waiting for all players... (TeamA: {has_team_a}, TeamB: {has_team_b}, Players: {player_count}/4)", flush=True)
+                            print(f"⏳ HOST: Waiting for all players... (Teams: {has_teams}, Players: {player_count}/{len(players)})", flush=True)
                     else:
                         print(f"⏳ HOST: Still waiting for teams... ({int(time.time() - start_extended)}s elapsed)", flush=True)
 
@@ -247,7 +273,7 @@ def run_host_flow():
             if start_game_btn.is_visible(timeout=5000):
                 start_game_btn.click()
                 time.sleep(2)
-                page.screenshot(path='./tmp/host_07_game_started.png', full_page=True)
+                screenshot(path='./tmp/host_07_game_started.png', full_page=True)
                 print("✅ HOST: Game started!", flush=True)
             else:
                 print("⚠️  HOST: Start Game button not found!", flush=True)
@@ -257,7 +283,7 @@ def run_host_flow():
             # Start playing through questions
             print("🎲 HOST: Starting questions", flush=True)
 
-            for question_num in range(1, 6):  # 5 questions
+            for question_num in range(1, questions + 1):
                 print(f"📝 HOST: Question {question_num}", flush=True)
 
                 # Click Next button
@@ -265,13 +291,13 @@ def run_host_flow():
                 if next_btn.is_visible(timeout=3000):
                     next_btn.click()
                     time.sleep(3)  # Wait for players to answer
-                    page.screenshot(path=f'./tmp/host_question_{question_num}.png', full_page=True)
+                    screenshot(path=f'./tmp/host_question_{question_num}.png', full_page=True)
                 else:
                     print(f"⚠️  HOST: Next button not visible for Q{question_num}", flush=True)
                     break
 
             print("🏁 HOST: Game complete!", flush=True)
-            page.screenshot(path='./tmp/host_final.png', full_page=True)
+            screenshot(path='./tmp/host_final.png', full_page=True)
 
             time.sleep(5)  # Keep browser open for a bit
             browser.close()
@@ -283,7 +309,19 @@ def run_host_flow():
             return None
 
 if __name__ == "__main__":
-    game_code = run_host_flow()
+    parser = argparse.ArgumentParser(description='Host test script')
+    parser.add_argument('--lean', action='store_true', help='Lean client profile')
+    parser.add_argument('--dashboard-pages', type=int, default=0,
+                        help='Pages of the games list to scroll through first')
+    parser.add_argument('--network-proxy', metavar='URL', help='Send browser traffic through a harness.proxy listener')
+    parser.add_argument('--questions', type=int, default=5, help='Questions to play through')
+    parser.add_argument('--teams', nargs='+', default=DEFAULT_TEAMS, help='Team names to wait for')
+    parser.add_argument('--players', nargs='+', default=DEFAULT_PLAYERS, help='Player display names to wait for')
+    args = parser.parse_args()
+
+    game_code = run_host_flow(lean=args.lean, dashboard_pages=args.dashboard_pages,
+                              network_proxy=args.network_proxy, questions=args.questions,
+                              teams=args.teams, players=args.players)
     if game_code:
         sys.exit(0)
     else:
@@ -7,15 +7,168 @@ This script:
 1. Launches the host script and waits for game code
 2. Launches 4 player scripts in parallel with the game code
 3. Monitors all scripts and reports results
+
+Pass --record PATH to capture the game's write stream with harness.replay
+so it can be replayed later at higher speed (see harness/README.md).
+
+Pass --session-cache to have players start from cached REST sessions
+(harness.sessions) instead of logging in through the UI.
+
+Pass --lean to run the host and players with the lean client profile
+(harness.browser): no images, fonts, media, animations or screenshots.
+
+Pass --device-profiles NAME [NAME ...] to emulate slower phones and networks
+(harness.browser.DEVICE_PROFILES); names are assigned to players 1-4 in
+turn, e.g. --device-profiles desktop low-end-android.
+
+Pass --sharded to replace the 4 browser players with --clients simulated
+players spread over worker processes (harness.shard), for load runs with
+hundreds or thousands of clients.
+
+Pass --network-scenario PATH to put harness.proxy between every script and
+the servers: the host and each player get their own listener with the
+latency, jitter, loss, bandwidth and partitions the scenario file gives
+them, and per-connection byte counts go to ./tmp/proxy_connections.jsonl.
+
+Every run is appended to the results history (harness.results): per-step
+latencies taken from the scripts' progress lines, the git sha and an
+environment fingerprint. Pass --label NAME to tag it, then compare runs
+with python -m harness.results compare.
+
+Pass --scenario PATH to fix the players, teams, behaviours and game length
+(harness.scenario), and --seed N to replay a run: every player draws its
+think times and answers from its own stream derived from the seed. A run
+without a seed picks one and prints it.
+
+While it runs, live metrics (harness.live) are served in the Prometheus
+text format on http://127.0.0.1:9464/metrics (--metrics-port, 0 to turn
+off): active clients, step rates and latency percentiles, errors, the game
+phase and PocketBase's RSS and CPU. Pass --dashboard to watch the same
+numbers in the terminal.
 """
 
+import argparse
+import os
 import subprocess
 import time
 import re
 import sys
-from threading import Thread
-
-def run_host_and_get_code():
+from threading import Condition, Thread
+
+# Steps timed from the host's and players' progress lines (harness.results.StepTimer)
+STEP_SPANS = {
+    'host_login': (r'HOST: Logging in', r'HOST: Logged in'),
+    'host_create_game': (r'HOST: Creating game', r'HOST: Game created'),
+    'host_open_controller': (r'HOST: Found Play button', r"HOST: Reached 'Welcome"),
+    'host_question': (r'HOST: Question \d+', r'HOST: (Question \d+|Game complete)'),
+    'player_login': (r'PLAYER\d+: Logging in as', r'PLAYER\d+: Logged in'),
+    'player_join_game': (r'PLAYER\d+: Entering game code', r'PLAYER\d+: Joined game'),
+    'player_create_team': (r'PLAYER\d+: Creating team', r'PLAYER\d+: Created and joined team'),
+    'player_join_team': (r'PLAYER\d+: Joining team', r'PLAYER\d+: Joined team'),
+    'player_question_visible': (r'PLAYER\d+: Waiting for Question', r'PLAYER\d+: Waiting [\d.]+s before answering'),
+}
+STEP_VALUES = {
+    'host_dashboard_page': r'HOST: Games page \d+ loaded in (?P<ms>\d+)ms',
+    'player_answer_ack': r'PLAYER\d+: Answer acknowledged after (?P<ms>\d+)ms',
+}
+
+# Game phase from the host's progress lines, for the live metrics
+PHASES = [
+    (r'HOST: Logging in', 'host login'),
+    (r'HOST: Creating game', 'setup'),
+    (r'GAME_CODE:', 'lobby'),
+    (r'HOST: Game started', 'game start'),
+    (r'HOST: Question (\d+)', 'question {}'),
+    (r'HOST: Game complete', 'complete'),
+]
+
+# Seconds to wait for the team creators before launching the joiners anyway
+TEAM_CREATE_TIMEOUT = 60
+
+# Lines the orchestrator waits for instead of sleeping: a team creator is
+# done once its team exists or creating it failed
+MARKS = {
+    'team_created': r'Created and joined team|team creation may have failed|Team name input not found'
+                    r'|Create New Team button not found',
+}
+
+class RunMonitor:
+    """Where the scripts' output goes: the console (or dashboard), the step timer and the live metrics."""
+
+    def __init__(self, steps, live=None, dashboard=None):
+        self.steps = steps
+        self.live = live
+        self.echo = dashboard.log if dashboard else print
+        self.phases = [(re.compile(pattern), phase) for pattern, phase in PHASES]
+        self.marks = {name: re.compile(pattern) for name, pattern in MARKS.items()}
+        self.seen = {name: set() for name in MARKS}
+        self.finished = set()
+        self.changed = Condition()
+
+    def line(self, source, line):
+        self.echo(f"{source.upper()}: {line.rstrip()}")
+        self.steps.feed(source, line)
+        for name, pattern in self.marks.items():
+            if pattern.search(line):
+                with self.changed:
+                    self.seen[name].add(source)
+                    self.changed.notify_all()
+        if self.live is None:
+            return
+        if '❌' in line:
+            self.live.count('errors', source=source)
+        elif '⚠️' in line:
+            self.live.count('warnings', source=source)
+        if source == 'host':
+            for pattern, phase in self.phases:
+                match = pattern.search(line)
+                if match:
+                    self.live.set_phase(phase.format(*match.groups()))
+
+    def wait_for(self, mark, sources, timeout):
+        """Block until every source printed mark (or exited); False on timeout."""
+        with self.changed:
+            return self.changed.wait_for(lambda: set(sources) <= self.seen[mark] | self.finished, timeout)
+
+    def client_started(self, source):
+        if self.live is not None:
+            self.live.add_gauge('active_clients', 1)
+
+    def client_finished(self, source):
+        with self.changed:
+            self.finished.add(source)
+            self.changed.notify_all()
+        if self.live is not None:
+            self.live.add_gauge('active_clients', -1)
+
+def start_live(args):
+    """LiveMetrics plus its endpoint and dashboard as configured; (live, server, dashboard)."""
+    from harness.live import Dashboard, LiveMetrics, MetricsServer, PocketBaseProcess
+
+    if not args.metrics_port and not args.dashboard:
+        return None, None, None
+    live = LiveMetrics(pocketbase=PocketBaseProcess())
+    server = None
+    if args.metrics_port:
+        try:
+            server = MetricsServer(live, port=args.metrics_port).start()
+            print(f"📈 ORCHESTRATOR: Live metrics on {server.url}")
+        except OSError as e:
+            print(f"⚠️  ORCHESTRATOR: Live metrics not served on port {args.metrics_port}: {e}")
+    dashboard = Dashboard(live, interval=args.dashboard_interval).start() if args.dashboard else None
+    return live, server, dashboard
+
+def stop_live(server, dashboard):
+    if dashboard:
+        dashboard.stop()
+    if server:
+        server.stop()
+
+def proxy_env(network_proxy):
+    """Child environment whose REST clients (harness.pocketbase) use the proxy too."""
+    return {**os.environ, 'PB_URL': network_proxy} if network_proxy else None
+
+def run_host_and_get_code(lean=False, network_proxy=None, monitor=None, extra_args=None):
     """Run host script and extract game code from output."""
     print("="*60)
     print("🎮 ORCHESTRATOR: Starting host script")
@@ -24,19 +177,26 @@ def run_host_and_get_code():
     try:
         # Run host script and capture output in real-time
         process = subprocess.Popen(
-            [sys.executable, 'test_host.py'],
+            [sys.executable, 'test_host.py'] + (['--lean'] if lean else [])
+              + (['--network-proxy', network_proxy] if network_proxy else []) + (extra_args or []),
+            env=proxy_env(network_proxy),
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
             bufsize=1
         )
+        if monitor:
+            monitor.client_started('host')
 
         game_code = None
 
         # Read output line by line until we get game code
         for line in iter(process.stdout.readline, ''):
             if line:
-                print(f"HOST: {line.rstrip()}")
+                if monitor:
+                    monitor.line('host', line)
+                else:
+                    print(f"HOST: {line.rstrip()}")
 
                 # Extract game code
                 match = re.search(r'GAME_CODE:\s*([A-Z0-9]{6})', line)
@@ -57,7 +217,8 @@ def run_host_and_get_code():
         print(f"❌ ORCHESTRATOR: Error running host: {e}")
         return None, None
 
-def run_player(game_code, email, team_name, action, player_id):
+def run_player(game_code, email, team_name, action, player_id, session_cache=False, lean=False,
+               device_profile=None, network_proxy=None, monitor=None, extra_args=None):
     """Run a single player script."""
     print(f"\n🎭 ORCHESTRATOR: Launching {player_id}")
 
@@ -70,124 +231,274 @@ def run_player(game_code, email, team_name, action, player_id):
                 '--team-name', team_name,
                 '--action', action,
                 '--player-id', player_id
-            ],
+            ] + (['--session-cache'] if session_cache else []) + (['--lean'] if lean else [])
+              + (['--device-profile', device_profile] if device_profile else [])
+              + (['--network-proxy', network_proxy] if network_proxy else []) + (extra_args or []),
+            env=proxy_env(network_proxy),
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             text=True,
             bufsize=1
         )
+        if monitor:
+            monitor.client_started(player_id)
 
         # Read output line by line
         for line in iter(process.stdout.readline, ''):
             if line:
-                print(f"{player_id.upper()}: {line.rstrip()}")
+                if monitor:
+                    monitor.line(player_id, line)
+                else:
+                    print(f"{player_id.upper()}: {line.rstrip()}")
 
         process.wait()
+        if monitor:
+            monitor.client_finished(player_id)
         return process.returncode == 0
 
     except Exception as e:
         print(f"❌ {player_id.upper()}: Error: {e}")
         return False
 
+def start_recorder(game_code, out_path):
+    """Start harness.replay in record mode for the game."""
+    print(f"🎙️  ORCHESTRATOR: Recording game {game_code} to {out_path}")
+    return subprocess.Popen(
+        [sys.executable, '-m', 'harness.replay', 'record', '--game-code', game_code, '--out', out_path]
+    )
+
+def start_network_proxy(scenario_path, names, monitor=None):
+    """Start harness.proxy with one listener per name; returns (process, {name: url}, output thread)."""
+    print(f"🌐 ORCHESTRATOR: Starting network proxy with scenario {scenario_path}")
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'harness.proxy', '--scenario', scenario_path, '--clients', *names,
+         '--log', './tmp/proxy_connections.jsonl'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+
+    urls = {}
+    echo = monitor.echo if monitor else print
+    for line in iter(process.stdout.readline, ''):
+        echo(f"PROXY: {line.rstrip()}")
+        match = re.search(r'PROXY_LISTEN:\s*(\S+)\s+(http://\S+)', line)
+        if match:
+            urls[match.group(1)] = match.group(2)
+            if all(name in urls for name in names):
+                break
+
+    if not all(name in urls for name in names):
+        process.wait()
+        print("❌ ORCHESTRATOR: Network proxy failed to start")
+        return None, {}, None
+
+    # Keep echoing partitions and the final byte counts
+    def read_proxy_output():
+        for line in iter(process.stdout.readline, ''):
+            if line:
+                echo(f"PROXY: {line.rstrip()}")
+
+    thread = Thread(target=read_proxy_output, daemon=True)
+    thread.start()
+    return process, urls, thread
+
+def run_sharded_mode(args):
+    """Coordinator for harness.shard: seed, fan out to workers, report."""
+    from harness import shard
+    from harness.results import RESULTS_PATH, record_run
+
+    print("\n" + "="*60)
+    print("🧩 TRIVIA GAME SHARDED LOAD RUN")
+    print("="*60 + "\n")
+
+    if args.record:
+        print("⚠️  ORCHESTRATOR: --record is not supported in sharded mode, ignoring")
+    if args.network_scenario:
+        print("⚠️  ORCHESTRATOR: --network-scenario is not supported in sharded mode, ignoring")
+    if args.scenario:
+        print("⚠️  ORCHESTRATOR: Sharded mode takes only the seed from --scenario")
+
+    live, server, dashboard = start_live(args)
+    try:
+        result = shard.run_sharded(args, live=live)
+    finally:
+        stop_live(server, dashboard)
+    shard.print_results(result)
+    ok = not result['workers_not_done'] and not result['counters'].get('prepare_errors')
+    record = record_run('sharded', result['histograms'], config=vars(args), label=args.label, ok=ok, throughput={
+        'answers_per_s': result['counters'].get('answers', 0) / max(result['game_seconds'], 1e-9),
+        'events_per_s': result['counters'].get('events', 0) / max(result['game_seconds'], 1e-9),
+    })
+    print(f"🗄️  ORCHESTRATOR: Run {record['id']} saved to {RESULTS_PATH}")
+    sys.exit(0 if ok else 1)
+
 def main():
     """Main orchestrator logic."""
+    from harness.live import METRICS_PORT
+    from harness.scenario import derive_seed, display_name, load_scenario, new_seed
+    from harness.shard import add_arguments as add_shard_arguments
+
+    parser = argparse.ArgumentParser(description='Run host and player scripts together')
+    parser.add_argument('--record', metavar='PATH', help='Record the game write stream to PATH (JSONL)')
+    parser.add_argument('--session-cache', action='store_true',
+                        help='Players reuse cached REST sessions instead of the login form')
+    parser.add_argument('--lean', action='store_true',
+                        help='Lean client profile: block images/fonts/media, no animations or screenshots')
+    parser.add_argument('--device-profiles', nargs='+', metavar='NAME',
+                        help='Device profiles assigned to players in turn (see harness.browser.DEVICE_PROFILES)')
+    parser.add_argument('--sharded', action='store_true',
+                        help='Simulate --clients players across worker processes instead of 4 browsers')
+    parser.add_argument('--network-scenario', metavar='PATH',
+                        help='Run host and players through harness.proxy with this scenario (JSON)')
+    parser.add_argument('--label', help='Tag for this run in the results history (harness.results)')
+    parser.add_argument('--scenario', metavar='PATH',
+                        help='Players, teams, behaviours, game length and seed (harness.scenario, JSON)')
+    parser.add_argument('--metrics-port', type=int, default=METRICS_PORT,
+                        help='Serve live Prometheus metrics on this port (0 = off)')
+    parser.add_argument('--dashboard', action='store_true', help='Show live metrics in the terminal')
+    parser.add_argument('--dashboard-interval', type=float, default=2, help='Seconds between dashboard redraws')
+    add_shard_arguments(parser.add_argument_group('sharded mode'))
+    args = parser.parse_args()
+
+    if args.device_profiles:
+        from harness.browser import DEVICE_PROFILES
+        unknown = [name for name in args.device_profiles if name not in DEVICE_PROFILES]
+        if unknown:
+            parser.error(f"unknown device profile(s) {', '.join(unknown)} (known: {', '.join(DEVICE_PROFILES)})")
+
+    try:
+        scenario = load_scenario(args.scenario)
+    except (OSError, ValueError, KeyError) as e:
+        parser.error(f"scenario {args.scenario}: {e}")
+    if args.seed is None:
+        args.seed = scenario['seed'] if scenario['seed'] is not None else new_seed()
+    print(f"🎲 ORCHESTRATOR: Seed {args.seed} (re-run with --seed {args.seed})")
+
+    if args.sharded:
+        run_sharded_mode(args)
+
     print("\n" + "="*60)
     print("🚀 TRIVIA GAME TEST ORCHESTRATOR")
     print("="*60 + "\n")
 
+    from harness.results import RESULTS_PATH, StepTimer, record_run
+    live, metrics_server, dashboard = start_live(args)
+    steps = StepTimer(STEP_SPANS, STEP_VALUES, on_sample=live.observe if live else None)
+    monitor = RunMonitor(steps, live, dashboard)
+    run_started = time.time()
+
+    proxy_process, proxy_urls, proxy_thread = None, {}, None
+    if args.network_scenario:
+        os.makedirs('./tmp', exist_ok=True)
+        proxy_process, proxy_urls, proxy_thread = start_network_proxy(
+            args.network_scenario, ['host'] + [cfg['player_id'] for cfg in scenario['players']], monitor)
+        if not proxy_process:
+            stop_live(metrics_server, dashboard)
+            sys.exit(1)
+
+    if args.scenario:
+        # Scenario players may not have accounts yet
+        from harness.pocketbase import PocketBaseClient
+        from harness.seed import ensure_user
+        admin = PocketBaseClient()
+        admin.auth_superuser()
+        for config in scenario['players']:
+            ensure_user(admin, config['email'], name=display_name(config['email']))
+        print(f"🌱 ORCHESTRATOR: {len(scenario['players'])} scenario players ready")
+
     # Step 1: Run host and get game code
-    game_code, host_process = run_host_and_get_code()
+    game_code, host_process = run_host_and_get_code(
+        lean=args.lean, network_proxy=proxy_urls.get('host'), monitor=monitor,
+        extra_args=['--questions', str(scenario['questions']),
+                    '--teams', *[team['name'] for team in scenario['teams']],
+                    '--players', *[display_name(cfg['email']) for cfg in scenario['players']]])
 
     if not game_code:
         print("❌ ORCHESTRATOR: Cannot proceed without game code")
+        if proxy_process:
+            proxy_process.terminate()
+        stop_live(metrics_server, dashboard)
         sys.exit(1)
 
+    recorder_process = start_recorder(game_code, args.record) if args.record else None
+
     # Start background thread to continue reading host output
     def read_host_output():
         for line in iter(host_process.stdout.readline, ''):
             if line:
-                print(f"HOST: {line.rstrip()}")
+                monitor.line('host', line)
         host_process.wait()
+        monitor.client_finished('host')
 
     host_thread = Thread(target=read_host_output, daemon=True)
     host_thread.start()
 
-    # Step 2: Define player configurations
-    player_configs = [
-        {
-            'email': 'user1@example.com',
-            'team_name': 'Team A',
-            'action': 'create',
-            'player_id': 'player1'
-        },
-        {
-            'email': 'user2@example.com',
-            'team_name': 'Team A',
-            'action': 'join',
-            'player_id': 'player2'
-        },
-        {
-            'email': 'user3@example.com',
-            'team_name': 'Team B',
-            'action': 'create',
-            'player_id': 'player3'
-        },
-        {
-            'email': 'user4@example.com',
-            'team_name': 'Team B',
-            'action': 'join',
-            'player_id': 'player4'
-        }
-    ]
-
-    # Step 3: Launch player 1 and player 3 first (team creators)
+    # Step 2: Player configurations come from the scenario
+    player_configs = scenario['players']
+
+    if args.device_profiles:
+        for i, config in enumerate(player_configs):
+            config['device_profile'] = args.device_profiles[i % len(args.device_profiles)]
+            print(f"📱 ORCHESTRATOR: {config['player_id']} uses device profile '{config['device_profile']}'")
+
+    if args.session_cache:
+        # Authenticate everyone once up front; player processes then hit the cache
+        from harness.sessions import SessionPool
+        pool = SessionPool()
+        for config in player_configs:
+            pool.get(config['email'], 'Password123!')
+        print(f"🔑 ORCHESTRATOR: Sessions ready ({pool.hits} cached, {pool.misses} new)")
+
+    def run_player_thread(cfg, results):
+        results[cfg['player_id']] = run_player(
+            game_code=game_code,
+            email=cfg['email'],
+            team_name=cfg['team_name'],
+            action=cfg['action'],
+            player_id=cfg['player_id'],
+            session_cache=args.session_cache,
+            lean=args.lean,
+            device_profile=cfg.get('device_profile'),
+            network_proxy=proxy_urls.get(cfg['player_id']),
+            monitor=monitor,
+            extra_args=['--seed', str(derive_seed(args.seed, cfg['player_id'])),
+                        '--think', *[str(t) for t in cfg['think_s']], '--skip-rate', str(cfg['skip']),
+                        '--questions', str(scenario['questions'])]
+        )
+
+    # Step 3: Launch the team creators first
+    creators = [cfg for cfg in player_configs if cfg['action'] == 'create']
     print("\n" + "="*60)
-    print("👥 ORCHESTRATOR: Launching team creators (Players 1 & 3)")
+    print(f"👥 ORCHESTRATOR: Launching team creators ({', '.join(cfg['player_id'] for cfg in creators)})")
     print("="*60)
 
     creator_threads = []
     creator_results = {}
 
-    for config in [player_configs[0], player_configs[2]]:  # Player 1 and 3
-        def run_player_thread(cfg):
-            result = run_player(
-                game_code=game_code,
-                email=cfg['email'],
-                team_name=cfg['team_name'],
-                action=cfg['action'],
-                player_id=cfg['player_id']
-            )
-            creator_results[cfg['player_id']] = result
-
-        thread = Thread(target=run_player_thread, args=(config,))
+    for config in creators:
+        thread = Thread(target=run_player_thread, args=(config, creator_results))
         thread.start()
         creator_threads.append(thread)
 
-    # Don't wait for team creators to finish (they stay alive for the whole game)
-    # Just give them time to create the teams
-    print("\n⏳ ORCHESTRATOR: Waiting 10 seconds for teams to be created...")
-    time.sleep(10)
+    # Don't wait for team creators to finish (they stay alive for the whole game),
+    # only until each has created its team
+    print("\n⏳ ORCHESTRATOR: Waiting for teams to be created...")
+    if not monitor.wait_for('team_created', [cfg['player_id'] for cfg in creators], TEAM_CREATE_TIMEOUT):
+        print(f"⚠️  ORCHESTRATOR: Teams not all created after {TEAM_CREATE_TIMEOUT}s, launching joiners anyway")
 
-    # Step 4: Launch player 2 and player 4 (team joiners)
+    # Step 4: Launch the team joiners
+    joiners = [cfg for cfg in player_configs if cfg['action'] == 'join']
     print("\n" + "="*60)
-    print("👥 ORCHESTRATOR: Launching team joiners (Players 2 & 4)")
+    print(f"👥 ORCHESTRATOR: Launching team joiners ({', '.join(cfg['player_id'] for cfg in joiners) or 'none'})")
     print("="*60)
 
     joiner_threads = []
     joiner_results = {}
 
-    for config in [player_configs[1], player_configs[3]]:  # Player 2 and 4
-        def run_player_thread(cfg):
-            result = run_player(
-                game_code=game_code,
-                email=cfg['email'],
-                team_name=cfg['team_name'],
-                action=cfg['action'],
-                player_id=cfg['player_id']
-            )
-            joiner_results[cfg['player_id']] = result
-
-        thread = Thread(target=run_player_thread, args=(config,))
+    for config in joiners:
+        thread = Thread(target=run_player_thread, args=(config, joiner_results))
         thread.start()
         joiner_threads.append(thread)
 
@@ -201,16 +512,31 @@ def main():
     # Step 5: Wait for host to finish
     print("\n⏳ ORCHESTRATOR: Waiting for host to finish...")
     host_process.wait()
+    game_seconds = time.time() - run_started
+    host_thread.join(timeout=5)
 
     print("\n⏳ ORCHESTRATOR: Host finished, waiting for all players...")
     # Now wait for all player threads to finish
     for thread in all_player_threads:
         thread.join()
 
+    stop_live(metrics_server, dashboard)
+
     print("\n" + "="*60)
     print("✅ ORCHESTRATOR: All players finished")
     print("="*60)
 
+    if recorder_process:
+        recorder_process.terminate()
+        recorder_process.wait()
+        print(f"🎙️  ORCHESTRATOR: Recording saved to {args.record}")
+
+    if proxy_process:
+        proxy_process.terminate()
+        proxy_process.wait()
+        proxy_thread.join()
+        print("🌐 ORCHESTRATOR: Connection log saved to ./tmp/proxy_connections.jsonl")
+
     # Step 6: Report results
     print("\n" + "="*60)
     print("📊 TEST RESULTS")
@@ -236,6 +562,11 @@ def main():
 
     print(f"📸 Screenshots saved in ./tmp/ directory")
 
+    steps.add('game', game_seconds * 1000)
+    record = record_run('orchestrator', steps.samples, config=vars(args), label=args.label, ok=all_success,
+                        throughput={'answers_per_min': len(steps.samples['player_answer_ack']) / game_seconds * 60})
+    print(f"🗄️  ORCHESTRATOR: Run {record['id']} saved to {RESULTS_PATH}")
+
     sys.exit(0 if all_success else 1)
 
 if __name__ == "__main__":
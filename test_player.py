@@ -12,7 +12,15 @@ import random
 import sys
 import os
 
-def run_player_flow(game_code: str, email: str, team_name: str, action: str, player_id: str):
+from harness.browser import (CONSOLE_LEVELS, DEVICE_PROFILES, LEAN_CONTEXT_OPTIONS, ConsoleCapture,
+                             app_log_level_script, apply_device_profile, apply_lean_profile, proxy_launch_options)
+from harness.pocketbase import APP_URL
+from harness.sessions import SessionPool
+
+def run_player_flow(game_code: str, email: str, team_name: str, action: str, player_id: str,
+                    session_cache: bool = False, lean: bool = False, device_profile: str = None,
+                    network_proxy: str = None, console_level: str = 'info', seed: int = None,
+                    think_s: tuple = (1.0, 5.0), skip: float = 0.0, questions: int = 9):
     """
     Run the player game flow.
 
@@ -22,72 +30,98 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
         team_name: Name of the team to create or join
         action: 'create' to create new team, 'join' to join existing
         player_id: Identifier for screenshots (e.g., 'player1')
+        session_cache: Skip the login form and reuse a cached REST session
+            (harness.sessions) instead
+        lean: Lean client profile (harness.browser) - no images, fonts,
+            media or animations, small viewport, no screenshots
+        device_profile: Name from harness.browser.DEVICE_PROFILES to emulate
+            a slower phone and network via CDP
+        network_proxy: harness.proxy listener the browser sends all of
+            its traffic through
+        console_level: Lowest console message type kept in
+            ./tmp/<player_id>_console.log; the app logs nothing below it
+        seed: Seed for this player's think times, skips and answers
+            (harness.scenario); None draws a fresh one
+        think_s: Seconds to wait before answering, drawn uniformly from
+            (low, high)
+        skip: Chance of not answering a question
+        questions: Questions to wait for
     """
+    rng = random.Random(seed)
 
     os.makedirs('./tmp', exist_ok=True)
 
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        browser = p.chromium.launch(headless=True, **proxy_launch_options(network_proxy))
+        session_pool = SessionPool() if session_cache else None
+        context_options = LEAN_CONTEXT_OPTIONS if lean else {}
+        if session_pool:
+            context = session_pool.new_context(browser, email, 'Password123!', **context_options)
+        else:
+            context = browser.new_context(**context_options)
+        context.add_init_script(app_log_level_script(console_level))
+        if lean:
+            apply_lean_profile(context)
+        if device_profile:
+            apply_device_profile(context, device_profile)
+            print(f"📱 {player_id.upper()}: Emulating device profile '{device_profile}'", flush=True)
+        page = context.new_page()
+
+        def screenshot(**kwargs):
+            if not lean:
+                page.screenshot(**kwargs)
+
+        # Console and page errors go to file (and stdout) from a writer thread
+        console_capture = ConsoleCapture(f'./tmp/{player_id}_console.log', console_level, echo=player_id.upper())
+        console_capture.attach(page)
 
-        # Set up console and error logging to file
-        log_file = open(f'./tmp/{player_id}_console.log', 'w')
+        try:
+            if session_pool:
+                # Cached REST session - start signed in, straight on the lobby
+                print(f"🔑 {player_id.upper()}: Using cached session for {email}", flush=True)
+                page.goto(f'{APP_URL}/lobby')
+                page.wait_for_load_state('domcontentloaded', timeout=10000)
+                print(f"✅ {player_id.upper()}: Logged in", flush=True)
+            else:
+                # Navigate to app
+                print(f"🚀 {player_id.upper()}: Navigating to app", flush=True)
+                page.goto(f'{APP_URL}/')
+                time.sleep(2)
+                screenshot(path=f'./tmp/{player_id}_01_initial.png', full_page=True)
 
-        def log_console(msg):
-            log_line = f"[CONSOLE {msg.type}] {msg.text}\n"
-            print(f"{player_id.upper()}: {log_line.strip()}", flush=True)
-            log_file.write(log_line)
-            log_file.flush()
+                # Login
+                print(f"🔐 {player_id.upper()}: Logging in as {email}", flush=True)
+                email_input = page.locator('input[type="email"]').first
+                email_input.fill(email)
 
-        def log_error(error):
-            log_line = f"[ERROR] {error}\n"
-            print(f"{player_id.upper()}: {log_line.strip()}", flush=True)
-            log_file.write(log_line)
-            log_file.flush()
+                password_input = page.locator('input[type="password"]').first
+                password_input.fill('Password123!')
 
-        page.on("console", log_console)
-        page.on("pageerror", log_error)
+                # Select Player role
+                player_button = page.locator('button:has-text("Player")').first
+                if player_button.is_visible(timeout=1000):
+                    player_button.click()
 
-        try:
-            # Navigate to app
-            print(f"🚀 {player_id.upper()}: Navigating to app", flush=True)
-            page.goto('http://localhost:5173')
-            time.sleep(2)
-            page.screenshot(path=f'./tmp/{player_id}_01_initial.png', full_page=True)
-
-            # Login
-            print(f"🔐 {player_id.upper()}: Logging in as {email}", flush=True)
-            email_input = page.locator('input[type="email"]').first
-            email_input.fill(email)
-
-            password_input = page.locator('input[type="password"]').first
-            password_input.fill('Password123!')
-
-            # Select Player role
-            player_button = page.locator('button:has-text("Player")').first
-            if player_button.is_visible(timeout=1000):
-                player_button.click()
-
-            login_button = page.locator('button:has-text("Sign In")').first
-            login_button.click()
-
-            # Wait for navigation with timeout instead of networkidle (which can hang with multiple browsers)
-            print(f"⏳ {player_id.upper()}: Waiting for login to complete...", flush=True)
-            try:
-                page.wait_for_load_state('domcontentloaded', timeout=10000)
-                time.sleep(2)
-                print(f"✅ {player_id.upper()}: Logged in", flush=True)
-            except Exception as e:
-                print(f"⚠️  {player_id.upper()}: Login wait timed out, but continuing: {e}", flush=True)
-                time.sleep(1)
-
-            # Take screenshot (with error handling for parallel browser execution)
-            try:
-                print(f"📸 {player_id.upper()}: Taking logged_in screenshot...", flush=True)
-                page.screenshot(path=f'./tmp/{player_id}_02_logged_in.png', full_page=True)
-                print(f"✅ {player_id.upper()}: Screenshot saved", flush=True)
-            except Exception as e:
-                print(f"⚠️  {player_id.upper()}: Screenshot failed: {e}", flush=True)
+                login_button = page.locator('button:has-text("Sign In")').first
+                login_button.click()
+
+                # Wait for navigation with timeout instead of networkidle (which can hang with multiple browsers)
+                print(f"⏳ {player_id.upper()}: Waiting for login to complete...", flush=True)
+                try:
+                    page.wait_for_load_state('domcontentloaded', timeout=10000)
+                    time.sleep(2)
+                    print(f"✅ {player_id.upper()}: Logged in", flush=True)
+                except Exception as e:
+                    print(f"⚠️  {player_id.upper()}: Login wait timed out, but continuing: {e}", flush=True)
+                    time.sleep(1)
+
+                # Take screenshot (with error handling for parallel browser execution)
+                try:
+                    print(f"📸 {player_id.upper()}: Taking logged_in screenshot...", flush=True)
+                    screenshot(path=f'./tmp/{player_id}_02_logged_in.png', full_page=True)
+                    print(f"✅ {player_id.upper()}: Screenshot saved", flush=True)
+                except Exception as e:
+                    print(f"⚠️  {player_id.upper()}: Screenshot failed: {e}", flush=True)
 
             # Enter game code
             print(f"🎮 {player_id.upper()}: Entering game code {game_code}", flush=True)
@@ -97,11 +131,11 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                 code_input.fill('')
                 code_input.type(game_code, delay=50)
                 time.sleep(0.5)
-                page.screenshot(path=f'./tmp/{player_id}_03_code_entered.png', full_page=True)
+                screenshot(path=f'./tmp/{player_id}_03_code_entered.png', full_page=True)
 
                 # Click Join Game button
                 print(f"🔍 {player_id.upper()}: Looking for 'Join Game' button...", flush=True)
-                page.screenshot(path=f'./tmp/{player_id}_03a_before_join_button.png', full_page=True)
+                screenshot(path=f'./tmp/{player_id}_03a_before_join_button.png', full_page=True)
 
                 join_button = page.locator('button:has-text("Join Game"), button:has-text("Join")').first
                 if join_button.is_visible(timeout=10000):
@@ -113,17 +147,17 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                         print(f"⚠️  {player_id.upper()}: Join wait timed out: {e}", flush=True)
                     time.sleep(2)
                     print(f"✅ {player_id.upper()}: Joined game", flush=True)
-                    page.screenshot(path=f'./tmp/{player_id}_04_in_game.png', full_page=True)
+                    screenshot(path=f'./tmp/{player_id}_04_in_game.png', full_page=True)
                 else:
                     print(f"❌ {player_id.upper()}: 'Join Game' button not found after 10 seconds!", flush=True)
                     print(f"📍 {player_id.upper()}: Current URL: {page.url}", flush=True)
-                    page.screenshot(path=f'./tmp/{player_id}_03b_join_button_not_found.png', full_page=True)
+                    screenshot(path=f'./tmp/{player_id}_03b_join_button_not_found.png', full_page=True)
                     print(f"⚠️  {player_id.upper()}: Continuing without joining game...", flush=True)
 
             # Handle team creation or joining
             if action == 'create':
                 print(f"👥 {player_id.upper()}: Creating team '{team_name}'", flush=True)
-                page.screenshot(path=f'./tmp/{player_id}_05_team_modal.png', full_page=True)
+                screenshot(path=f'./tmp/{player_id}_05_team_modal.png', full_page=True)
 
                 # Click "+ Create New Team"
                 create_team_btn = page.locator('button:has-text("Create New Team"), div:has-text("Create New Team")').first
@@ -136,7 +170,7 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                     if team_input.is_visible(timeout=2000):
                         team_input.fill(team_name)
                         time.sleep(0.5)
-                        page.screenshot(path=f'./tmp/{player_id}_06_team_name_filled.png', full_page=True)
+                        screenshot(path=f'./tmp/{player_id}_06_team_name_filled.png', full_page=True)
                         print(f"📝 {player_id.upper()}: Filled team name '{team_name}'", flush=True)
 
                         # Wait before pressing Enter
@@ -163,7 +197,7 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                             print(f"✅ {player_id.upper()}: Modal closed - team creation appears successful", flush=True)
 
                         print(f"✅ {player_id.upper()}: Created and joined team '{team_name}'", flush=True)
-                        page.screenshot(path=f'./tmp/{player_id}_07_team_joined.png', full_page=True)
+                        screenshot(path=f'./tmp/{player_id}_07_team_joined.png', full_page=True)
                     else:
                         print(f"⚠️  {player_id.upper()}: Team name input not found", flush=True)
                 else:
@@ -171,7 +205,7 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
 
             elif action == 'join':
                 print(f"👥 {player_id.upper()}: Joining team '{team_name}'", flush=True)
-                page.screenshot(path=f'./tmp/{player_id}_05_team_modal.png', full_page=True)
+                screenshot(path=f'./tmp/{player_id}_05_team_modal.png', full_page=True)
 
                 # Wait for team to appear
                 team_found = False
@@ -186,7 +220,7 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                         team_button.click(force=True)
                         print(f"🔘 {player_id.upper()}: Clicked team button for '{team_name}'", flush=True)
                         time.sleep(2)  # Increased wait for React state to update
-                        page.screenshot(path=f'./tmp/{player_id}_06_team_selected.png', full_page=True)
+                        screenshot(path=f'./tmp/{player_id}_06_team_selected.png', full_page=True)
 
                         # Click the "Join Game" button at the bottom of the modal
                         print(f"🔵 {player_id.upper()}: Looking for 'Join Game' submit button...", flush=True)
@@ -213,7 +247,7 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                                 print(f"✅ {player_id.upper()}: Modal closed - join appears successful", flush=True)
 
                             print(f"✅ {player_id.upper()}: Joined team '{team_name}'", flush=True)
-                            page.screenshot(path=f'./tmp/{player_id}_07_team_joined.png', full_page=True)
+                            screenshot(path=f'./tmp/{player_id}_07_team_joined.png', full_page=True)
                         else:
                             print(f"❌ {player_id.upper()}: 'Join Game' submit button not visible!", flush=True)
 
@@ -223,15 +257,20 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
 
                 if not team_found:
                     print(f"❌ {player_id.upper()}: Team '{team_name}' not found after waiting", flush=True)
-                    page.screenshot(path=f'./tmp/{player_id}_05_team_not_found.png', full_page=True)
+                    screenshot(path=f'./tmp/{player_id}_05_team_not_found.png', full_page=True)
 
-            # Play through questions - randomly answer
-            # With 3 rounds and 3 questions each, we have 9 questions total
+            # Play through questions - answer from this player's seeded stream
             print(f"🎲 {player_id.upper()}: Waiting for questions to start", flush=True)
 
-            for question_num in range(1, 10):  # 9 questions (3 rounds x 3 questions)
+            for question_num in range(1, questions + 1):
                 print(f"📝 {player_id.upper()}: Waiting for Question {question_num}...", flush=True)
 
+                # Three draws per question whatever the page shows, so the
+                # stream stays in step with the seed
+                skips = rng.random() < skip
+                wait_time = rng.uniform(*think_s)
+                pick = rng.random()
+
                 # Wait for answer buttons to appear (up to 30 seconds)
                 answer_found = False
                 max_wait = 30
@@ -255,19 +294,30 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
                         if available_answers:
                             answer_found = True
 
-                            # Random wait time between 1-5 seconds before answering
-                            wait_time = random.uniform(1, 5)
+                            if skips:
+                                # Same pacing as answering, so the next pass sees the next question
+                                print(f"🙈 {player_id.upper()}: Sitting out question {question_num}", flush=True)
+                                time.sleep(wait_time + 2)
+                                break
+
                             print(f"⏳ {player_id.upper()}: Waiting {wait_time:.1f}s before answering...", flush=True)
                             time.sleep(wait_time)
 
-                            # Randomly choose an answer
-                            chosen_answer = random.choice(available_answers)
+                            chosen_answer = available_answers[int(pick * len(available_answers))]
                             answer_text = chosen_answer.text_content()[:50] if chosen_answer.text_content() else "unknown"
 
                             print(f"🎯 {player_id.upper()}: Clicking answer: {answer_text}", flush=True)
+                            clicked_at = time.time()
                             chosen_answer.click()
                             print(f"✅ {player_id.upper()}: Answered question {question_num}", flush=True)
-                            page.screenshot(path=f'./tmp/{player_id}_q{question_num}_answered.png', full_page=True)
+                            try:
+                                # The team's answer is highlighted once the server echoes it back
+                                page.wait_for_selector('.bg-blue-200.border-blue-500', timeout=10000)
+                                print(f"📨 {player_id.upper()}: Answer acknowledged after "
+                                      f"{(time.time() - clicked_at) * 1000:.0f}ms", flush=True)
+                            except Exception:
+                                print(f"⚠️  {player_id.upper()}: Answer not acknowledged within 10s", flush=True)
+                            screenshot(path=f'./tmp/{player_id}_q{question_num}_answered.png', full_page=True)
 
                             # Wait a bit for answer to register
                             time.sleep(2)
@@ -280,10 +330,10 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
 
                 if not answer_found:
                     print(f"⚠️  {player_id.upper()}: No answer buttons found for Q{question_num} after {max_wait}s", flush=True)
-                    page.screenshot(path=f'./tmp/{player_id}_q{question_num}_no_answers.png', full_page=True)
+                    screenshot(path=f'./tmp/{player_id}_q{question_num}_no_answers.png', full_page=True)
 
             print(f"🏁 {player_id.upper()}: Completed all questions!", flush=True)
-            page.screenshot(path=f'./tmp/{player_id}_final.png', full_page=True)
+            screenshot(path=f'./tmp/{player_id}_final.png', full_page=True)
 
             time.sleep(5)  # Keep browser open
             browser.close()
@@ -291,13 +341,11 @@ def run_player_flow(game_code: str, email: str, team_name: str, action: str, pla
 
         except Exception as e:
             print(f"❌ {player_id.upper()} ERROR: {e}", flush=True)
-            page.screenshot(path=f'./tmp/{player_id}_error.png', full_page=True)
-            log_file.close()
+            screenshot(path=f'./tmp/{player_id}_error.png', full_page=True)
             browser.close()
             return False
         finally:
-            if 'log_file' in locals() and not log_file.closed:
-                log_file.close()
+            console_capture.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Run a player test for the trivia game')
@@ -306,6 +354,17 @@ if __name__ == "__main__":
     parser.add_argument('--team-name', required=True, help='Team name to create or join')
     parser.add_argument('--action', required=True, choices=['create', 'join'], help='Create new team or join existing')
     parser.add_argument('--player-id', required=True, help='Player identifier for screenshots (e.g., player1)')
+    parser.add_argument('--session-cache', action='store_true', help='Reuse a cached REST session instead of the login form')
+    parser.add_argument('--lean', action='store_true', help='Lean client profile: block images/fonts/media, no animations or screenshots')
+    parser.add_argument('--device-profile', choices=sorted(DEVICE_PROFILES), help='Emulate a slower device and network via CDP')
+    parser.add_argument('--network-proxy', metavar='URL', help='Send browser traffic through a harness.proxy listener')
+    parser.add_argument('--console-level', choices=list(CONSOLE_LEVELS), default='info',
+                        help='Lowest console message type captured (and logged by the app)')
+    parser.add_argument('--seed', type=int, default=None, help="Seed for this player's choices (harness.scenario)")
+    parser.add_argument('--think', type=float, nargs=2, default=[1.0, 5.0], metavar=('LOW', 'HIGH'),
+                        help='Seconds to wait before answering, drawn uniformly')
+    parser.add_argument('--skip-rate', type=float, default=0.0, help='Chance of not answering a question')
+    parser.add_argument('--questions', type=int, default=9, help='Questions to wait for')
 
     args = parser.parse_args()
 
@@ -314,7 +373,16 @@ if __name__ == "__main__":
         email=args.email,
         team_name=args.team_name,
         action=args.action,
-        player_id=args.player_id
+        player_id=args.player_id,
+        session_cache=args.session_cache,
+        lean=args.lean,
+        device_profile=args.device_profile,
+        network_proxy=args.network_proxy,
+        console_level=args.console_level,
+        seed=args.seed,
+        think_s=tuple(args.think),
+        skip=args.skip_rate,
+        questions=args.questions
     )
 
     sys.exit(0 if success else 1)
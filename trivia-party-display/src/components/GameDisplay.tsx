@@ -7,6 +7,7 @@ import GameEnd from '@/components/states/GameEnd'
 import Thanks from '@/components/states/Thanks'
 import { CircularTimerFixed } from '@/components/ui/circular-timer'
 import { GameData } from '@/types/games'
+import { audioPrefetcher } from '@/lib/audioPrefetch'
 import * as React from 'react'
 
 export function GameDisplay() {
@@ -15,6 +16,13 @@ export function GameDisplay() {
 
   const gameData = gameRecord?.data as GameData | undefined
 
+  // Fetch the next questions' audio while the current one is on screen
+  React.useEffect(() => {
+    if (gameData?.upcoming_audio) audioPrefetcher.prefetch(gameData.upcoming_audio)
+  }, [gameData?.upcoming_audio])
+
+  React.useEffect(() => () => audioPrefetcher.clear(), [])
+
   // Update timer display every second
   React.useEffect(() => {
     if (!gameData?.timer || gameData.timer.isPaused) return
@@ -1,8 +1,9 @@
-import { useState, useEffect, useRef } from 'react'
+import { useState, useEffect } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Badge } from '@/components/ui/badge'
 import pb from '@/lib/pocketbase'
 import { gameAnswersService } from '@/lib/gameAnswers'
+import { audioPrefetcher } from '@/lib/audioPrefetch'
 import { GameScoreboard } from '@/types/games'
 import { useTextSize } from '@/contexts/TextSizeContext'
 
@@ -27,6 +28,7 @@ interface RoundPlayDisplayProps {
       d: string
       correct_answer?: string
       submitted_answer?: string
+      audio_file?: string
     }
     // These are added by GamePage for player interaction
     playerTeam?: string
@@ -43,7 +45,6 @@ interface RoundPlayDisplayProps {
 export default function RoundPlayDisplay({ gameData, mode = 'controller', onAnswerSubmit, gameId, scoreboard }: RoundPlayDisplayProps) {
   const [teamAnswerStatus, setTeamAnswerStatus] = useState<Map<string, { answered: boolean, isCorrect?: boolean }>>(new Map()) // Track which teams have answered and their correctness
   const { textSize } = useTextSize()
-  const audioRef = useRef<HTMLAudioElement | null>(null)
 
   // Get text size classes based on the current text size setting
   const getTextSizeClasses = () => {
@@ -138,43 +139,32 @@ export default function RoundPlayDisplay({ gameData, mode = 'controller', onAnsw
     }
   }, [mode, gameId, gameData.question?.id])
 
-  // Play audio when question changes
+  // Play audio when question changes - usually already prefetched by GameDisplay
   useEffect(() => {
-    if (!gameData.question) return
-
-    // Clean up previous audio
-    if (audioRef.current) {
-      audioRef.current.pause()
-      audioRef.current = null
-    }
-
-    // Check if audio is available
-    const currentQuestion = gameData.question as any
-    if (currentQuestion.audio_status === 'available' && currentQuestion.audio_file) {
-      try {
-        const audioUrl = pb.files.getUrl(currentQuestion, currentQuestion.audio_file)
-
-        const audio = new Audio(audioUrl)
-        audioRef.current = audio
-
-        audio.play().catch(err => {
-          console.error('Failed to play audio:', err)
-          // Silently fail - question still displays
-        })
-      } catch (err) {
-        console.error('Error loading audio:', err)
+    const questionId = gameData.question?.id
+    const audioFile = gameData.question?.audio_file
+    if (!questionId || !audioFile) return
+
+    let cancelled = false
+    let audio: HTMLAudioElement | null = null
+
+    audioPrefetcher.take({ id: questionId, audio_file: audioFile })
+      .then(element => {
+        if (cancelled) return
+        audio = element
+        return element.play()
+      })
+      .catch(err => {
+        console.error('Failed to play audio:', err)
         // Silently fail - question still displays
-      }
-    }
+      })
 
-    // Cleanup on unmount
+    // Stop on question change or unmount
     return () => {
-      if (audioRef.current) {
-        audioRef.current.pause()
-        audioRef.current = null
-      }
+      cancelled = true
+      audio?.pause()
     }
-  }, [gameData.question, gameData.question?.id])
+  }, [gameData.question?.id, gameData.question?.audio_file])
 
   // Show answer if correct_answer exists in the data
   const shouldShowAnswer = !!gameData.question?.correct_answer
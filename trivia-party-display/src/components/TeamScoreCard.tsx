@@ -1,4 +1,4 @@
-import { getFileUrl } from '@/lib/pocketbase'
+import { getAvatarUrl } from '@/lib/pocketbase'
 import type { ScoreboardTeam } from '@/types/games'
 
 interface TeamScoreCardProps {
@@ -25,11 +25,15 @@ function PlayerAvatar({ player }: { player: Player }) {
   const colorName = getAvatarColor(player.id)
 
   if (player.avatar) {
-    const avatarUrl = getFileUrl('_pb_users_auth_', player.id, player.avatar, { thumb: '100x100' })
+    const avatarUrl = getAvatarUrl(player.id, player.avatar)
     return (
       <img
         src={avatarUrl}
         alt={player.name}
+        width={32}
+        height={32}
+        loading="lazy"
+        decoding="async"
         className="w-8 h-8 rounded-full object-cover"
       />
     )
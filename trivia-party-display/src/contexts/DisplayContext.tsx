@@ -1,6 +1,7 @@
 import { createContext, useContext, useEffect, useState, useCallback, useRef } from 'react'
 import type { ReactNode } from 'react'
 import pb from '@/lib/pocketbase'
+import { GameStateChannel } from '@/lib/gameState'
 import {
   generateDisplayId,
   generateDisplayPassword,
@@ -282,16 +283,27 @@ export function DisplayProvider({ children }: { children: ReactNode }) {
 
     let unsubscribe: (() => void) | undefined
 
+    // games.data is only a periodic snapshot; state patches arrive on their own channel
+    const channel = new GameStateChannel(gameId, (state) => {
+      setGameRecord(prev => prev && prev.id === gameId ? { ...prev, data: state as GamesRecord['data'] } : prev)
+    }, (game) => {
+      // From a resync: the record as of now, with the state it was resynced to
+      setGameRecord({ ...(game as GamesRecord), data: (channel.current.state ?? game.data) as GamesRecord['data'] })
+    })
+
     const subscribeToGame = async () => {
       try {
         console.log('🎮 Fetching game:', gameId)
-        const game = await pb.collection('games').getOne<GamesRecord>(gameId)
-        console.log('🎮 Game fetched:', { id: game.id, status: game.status, state: game.data?.state })
-        setGameRecord(game)
+        // Subscribe to patches first so none land between the resync and the subscription
+        await channel.start()
+        // Game record, state and seq in one request; the channel sets gameRecord
+        const game = (await channel.resync()).game as GamesRecord
+        console.log('🎮 Game fetched:', { id: game.id, status: game.status, state: channel.current.state?.state })
 
         // Check if game is already completed
         if (game.status === 'completed') {
           console.log('🏁 Game already completed, releasing display')
+          channel.stop()
           // Set gameId to null FIRST to prevent display subscription from triggering
           setGameId(null)
           gameIdRef.current = null
@@ -317,7 +329,8 @@ export function DisplayProvider({ children }: { children: ReactNode }) {
         // Subscribe to game updates
         unsubscribe = await pb.collection('games').subscribe<GamesRecord>(gameId, (e) => {
           console.log('🎮 Game update received:', { status: e.record.status, state: e.record.data?.state })
-          setGameRecord(e.record)
+          channel.applySnapshot(e.record.data)
+          setGameRecord({ ...e.record, data: (channel.current.state ?? e.record.data) as GamesRecord['data'] })
 
           // Check if game completed
           if (e.record.status === 'completed') {
@@ -352,6 +365,7 @@ export function DisplayProvider({ children }: { children: ReactNode }) {
     subscribeToGame()
 
     return () => {
+      channel.stop()
       if (unsubscribe) {
         unsubscribe()
       }
@@ -0,0 +1,120 @@
+import pb from './pocketbase'
+import { QuestionAudio } from '@/types/games'
+
+/**
+ * Look-ahead cache for question audio.
+ *
+ * RoundPlayDisplay used to create an Audio element when a question came
+ * up, so the MP3 only started downloading then and on a slow venue
+ * network the start of the narration was lost. The controller now
+ * publishes the next few questions' audio in game state (upcoming_audio,
+ * see upcomingQuestionAudio in the web app). Each file is fetched into a
+ * Blob and loaded into its own Audio element ahead of time, so playback
+ * starts from memory.
+ *
+ * The cache only holds the current upcoming list plus the question that
+ * is playing, and never more than MAX_ENTRIES. Dropping an entry aborts
+ * its download and revokes its object URL.
+ */
+
+// The controller's look-ahead (3) plus the question playing now
+const MAX_ENTRIES = 4
+
+interface Entry {
+  audio: HTMLAudioElement
+  controller: AbortController
+  objectUrl?: string
+  // Resolves once the audio can play through from memory, rejects if the download failed
+  ready: Promise<void>
+}
+
+const keyOf = (item: QuestionAudio) => `${item.id}/${item.audio_file}`
+
+/** URL of a game_questions audio file (public, so the display user can read it). */
+export function questionAudioUrl(item: QuestionAudio): string {
+  return pb.files.getURL({ id: item.id, collectionName: 'game_questions' }, item.audio_file)
+}
+
+export class AudioPrefetcher {
+  private entries = new Map<string, Entry>()
+  private current: string | null = null
+
+  constructor(private maxEntries = MAX_ENTRIES) {}
+
+  /** Make items the upcoming list: fetch what isn't cached yet, drop what is no longer upcoming. */
+  prefetch(items: QuestionAudio[]) {
+    const wanted = items.slice(0, this.maxEntries - 1)
+    const keys = new Set(wanted.map(keyOf))
+    for (const key of Array.from(this.entries.keys())) {
+      if (!keys.has(key) && key !== this.current) this.drop(key)
+    }
+    for (const item of wanted) {
+      const key = keyOf(item)
+      if (!this.entries.has(key)) this.entries.set(key, this.load(item))
+    }
+  }
+
+  /**
+   * An Audio element for item, ready to play: the prefetched one (waiting
+   * for its download to finish if it is still running), or one streaming
+   * from the server if item was never prefetched or its download failed.
+   */
+  async take(item: QuestionAudio): Promise<HTMLAudioElement> {
+    const key = keyOf(item)
+    this.current = key
+    const entry = this.entries.get(key)
+    if (entry) {
+      try {
+        await entry.ready
+        entry.audio.currentTime = 0
+        return entry.audio
+      } catch (error) {
+        console.warn('🔊 Prefetched audio unavailable, streaming instead:', error)
+        this.drop(key)
+      }
+    }
+    return new Audio(questionAudioUrl(item))
+  }
+
+  /** Drop every entry, e.g. when the display leaves the game. */
+  clear() {
+    for (const key of Array.from(this.entries.keys())) this.drop(key)
+    this.current = null
+  }
+
+  private load(item: QuestionAudio): Entry {
+    const audio = new Audio()
+    audio.preload = 'auto'
+    const controller = new AbortController()
+    const entry: Entry = { audio, controller, ready: Promise.resolve() }
+
+    entry.ready = fetch(questionAudioUrl(item), { signal: controller.signal })
+      .then(response => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`)
+        return response.blob()
+      })
+      .then(blob => new Promise<void>((resolve, reject) => {
+        entry.objectUrl = URL.createObjectURL(blob)
+        // Decode far enough to play through without waiting
+        audio.addEventListener('canplaythrough', () => resolve(), { once: true })
+        audio.addEventListener('error', () => reject(audio.error), { once: true })
+        audio.src = entry.objectUrl
+        audio.load()
+      }))
+    // Failures surface in take(); don't report them as unhandled here
+    entry.ready.catch(() => {})
+    return entry
+  }
+
+  private drop(key: string) {
+    const entry = this.entries.get(key)
+    if (!entry) return
+    this.entries.delete(key)
+    entry.controller.abort()
+    entry.audio.pause()
+    entry.audio.removeAttribute('src')
+    if (entry.objectUrl) URL.revokeObjectURL(entry.objectUrl)
+  }
+}
+
+export const audioPrefetcher = new AudioPrefetcher()
@@ -0,0 +1,236 @@
+import pb from './pocketbase'
+
+/**
+ * Versioned game state: small patches per transition, periodic snapshots.
+ * Read side of src/lib/gameState.ts in the web app - keep the two in step.
+ *
+ * The controller used to rewrite games.data on every transition, so every
+ * subscriber received the whole games record (scoreboard included) and
+ * parsed it again. Now each transition is a game_state_updates record
+ * holding a JSON merge patch (RFC 7386) against the previous state and a
+ * per-game sequence number. Every few updates, and
+ * when the game ends, the full state is also written to games.data with
+ * its seq so late joiners start from a recent snapshot and replay only
+ * the patches after it.
+ *
+ * games.data written without a seq (seeding, HostPage starting a game)
+ * is the state before the first patch, so clients that find one replay
+ * every patch on top of it.
+ */
+
+export type GameStateValue = Record<string, any>
+export type GameStatePatch = Record<string, any>
+
+export interface GameStateUpdate {
+  id: string
+  game: string
+  seq: number
+  patch: GameStatePatch
+  created: string
+}
+
+/** GET /api/games/:id/state (pb_hooks/game_state.pb.js) */
+export interface GameStateSnapshot {
+  game: Record<string, any>
+  state: GameStateValue | null
+  seq: number
+}
+
+// How long a missing seq may stay missing before refetching from the server
+const GAP_TIMEOUT_MS = 1000
+
+// After a reconnect each client resyncs at a random point in this window,
+// so a room full of phones coming back from a Wi-Fi blip doesn't refetch at once
+export const RESYNC_SPREAD_MS = 3000
+
+function isObject(value: unknown): value is Record<string, any> {
+  return typeof value === 'object' && value !== null && !Array.isArray(value)
+}
+
+/** Apply a JSON merge patch, returning a new object. */
+export function applyGameStatePatch(state: GameStateValue | null | undefined, patch: GameStatePatch): GameStateValue {
+  const result: GameStateValue = { ...(state || {}) }
+  for (const [key, value] of Object.entries(patch)) {
+    if (value === null) {
+      delete result[key]
+    } else if (isObject(value)) {
+      result[key] = applyGameStatePatch(isObject(result[key]) ? result[key] : {}, value)
+    } else {
+      result[key] = value
+    }
+  }
+  return result
+}
+
+/** Split games.data into the state and its seq (undefined for unversioned writes). */
+export function parseSnapshot(data: unknown): { state: GameStateValue | null; seq?: number } {
+  if (!data) return { state: null }
+  const parsed = typeof data === 'string' ? JSON.parse(data) : data
+  if (!isObject(parsed)) return { state: null }
+  const { seq, ...state } = parsed
+  return { state, seq: typeof seq === 'number' ? seq : undefined }
+}
+
+export const gameStateService = {
+  async getUpdatesSince(gameId: string, seq: number): Promise<GameStateUpdate[]> {
+    return pb.collection('game_state_updates').getFullList<GameStateUpdate>({
+      filter: pb.filter('game = {:game} && seq > {:seq}', { game: gameId, seq }),
+      sort: 'seq',
+      fields: 'id,game,seq,patch,created'
+    })
+  },
+
+  async getState(gameId: string): Promise<GameStateSnapshot> {
+    return pb.send<GameStateSnapshot>(`/api/games/${gameId}/state`, { method: 'GET' })
+  }
+}
+
+/**
+ * One client's view of a game's state.
+ *
+ * Subscribes to game_state_updates for the game and applies patches in
+ * seq order. Snapshots come in through applySnapshot (from the games
+ * record the page already fetches and subscribes to). A gap in the
+ * sequence that doesn't fill itself within a second, or a snapshot that
+ * moves the state forward (patches may have followed it), triggers a
+ * catch-up fetch of the missing patches. Stale snapshots are ignored.
+ *
+ * When the realtime connection comes back after a drop, the channel waits
+ * a random part of RESYNC_SPREAD_MS and then resyncs from the state
+ * endpoint: one request for the game record, state and seq.
+ */
+export class GameStateChannel {
+  private state: GameStateValue | null = null
+  private seq = 0
+  private pending = new Map<number, GameStatePatch>()
+  private gapTimer: ReturnType<typeof setTimeout> | null = null
+  private catchingUp: Promise<void> | null = null
+  private resyncTimer: ReturnType<typeof setTimeout> | null = null
+  private unsubscribers: Array<() => void> = []
+  private stopped = false
+
+  constructor(
+    private gameId: string,
+    private onState: (state: GameStateValue, seq: number) => void,
+    private onGame?: (game: Record<string, any>) => void
+  ) {}
+
+  async start(): Promise<void> {
+    const unsubscribers = [
+      await pb.collection('game_state_updates').subscribe<GameStateUpdate>('*', (e) => {
+        if (e.action === 'create' && e.record.game === this.gameId) {
+          this.receive(e.record.seq, e.record.patch)
+        }
+      }, {
+        filter: pb.filter('game = {:game}', { game: this.gameId })
+      }),
+      // Already connected by now, so every PB_CONNECT from here on is a reconnect
+      await pb.realtime.subscribe('PB_CONNECT', () => this.scheduleResync())
+    ]
+    if (this.stopped) unsubscribers.forEach(unsubscribe => unsubscribe())
+    else this.unsubscribers = unsubscribers
+  }
+
+  stop() {
+    this.stopped = true
+    if (this.gapTimer) clearTimeout(this.gapTimer)
+    if (this.resyncTimer) clearTimeout(this.resyncTimer)
+    this.unsubscribers.forEach(unsubscribe => unsubscribe())
+    this.unsubscribers = []
+  }
+
+  get current(): { state: GameStateValue | null; seq: number } {
+    return { state: this.state, seq: this.seq }
+  }
+
+  /** Take games.data as a snapshot if it is newer than what we have, then catch up. */
+  applySnapshot(data: unknown): Promise<void> {
+    let snapshot
+    try {
+      snapshot = parseSnapshot(data)
+    } catch (error) {
+      console.error('Failed to parse game data:', error)
+      return Promise.resolve()
+    }
+    if (!snapshot.state) return Promise.resolve()
+
+    // Unversioned writes are seq 0 - only useful before any patch was applied
+    const seq = snapshot.seq ?? 0
+    const advanced = seq > this.seq
+    const firstLoad = !this.state
+    if (advanced || firstLoad || (seq === 0 && this.seq === 0)) {
+      this.emit(snapshot.state, Math.max(seq, this.seq))
+    }
+    // A stale snapshot with no gap waiting to fill needs no fetch
+    if (!advanced && !firstLoad && this.pending.size === 0) return Promise.resolve()
+    return this.catchUp()
+  }
+
+  /** Fetch and apply every patch after the current seq. */
+  catchUp(): Promise<void> {
+    if (this.catchingUp) return this.catchingUp
+    this.catchingUp = gameStateService.getUpdatesSince(this.gameId, this.seq)
+      .then(updates => {
+        for (const update of updates) this.receive(update.seq, update.patch)
+      })
+      .catch(error => console.error('Failed to catch up game state:', error))
+      .finally(() => {
+        this.catchingUp = null
+      })
+    return this.catchingUp
+  }
+
+  /** Replace what we have with the server's current state; returns the snapshot, game record included. */
+  async resync(): Promise<GameStateSnapshot> {
+    const snapshot = await gameStateService.getState(this.gameId)
+    if (snapshot.state && (snapshot.seq >= this.seq || !this.state)) {
+      this.emit(snapshot.state, snapshot.seq)
+      this.drain()
+    }
+    if (!this.stopped) this.onGame?.(snapshot.game)
+    return snapshot
+  }
+
+  private scheduleResync() {
+    if (this.resyncTimer || this.stopped) return
+    this.resyncTimer = setTimeout(() => {
+      this.resyncTimer = null
+      this.resync().catch(error => console.error('Failed to resync game state:', error))
+    }, Math.random() * RESYNC_SPREAD_MS)
+  }
+
+  /** Apply patch seq - from realtime, a catch-up fetch or this client's own write. */
+  receive(seq: number, patch: GameStatePatch) {
+    if (seq <= this.seq) return
+    this.pending.set(seq, patch)
+    this.drain()
+  }
+
+  /** Apply pending patches that follow seq; refetch if one stays missing. */
+  private drain() {
+    let state = this.state
+    let applied = this.seq
+    while (this.pending.has(applied + 1)) {
+      state = applyGameStatePatch(state, this.pending.get(applied + 1)!)
+      this.pending.delete(applied + 1)
+      applied++
+    }
+    if (applied > this.seq && state) this.emit(state, applied)
+
+    if (this.pending.size > 0 && !this.gapTimer) {
+      this.gapTimer = setTimeout(() => {
+        this.gapTimer = null
+        if (this.pending.size > 0) this.catchUp()
+      }, GAP_TIMEOUT_MS)
+    }
+  }
+
+  private emit(state: GameStateValue, seq: number) {
+    this.state = state
+    this.seq = seq
+    for (const pendingSeq of Array.from(this.pending.keys())) {
+      if (pendingSeq <= seq) this.pending.delete(pendingSeq)
+    }
+    if (!this.stopped) this.onState(state, seq)
+  }
+}
@@ -127,6 +127,12 @@ export interface CreateGameAnswerData {
   is_correct?: boolean;
 }
 
+/** A game_questions record's audio file, as the controller publishes it in game state. */
+export interface QuestionAudio {
+  id: string;
+  audio_file: string;
+}
+
 export type GameState = 'game-start' | 'round-start' | 'round-play' | 'round-end' | 'game-end' | 'thanks' | 'return-to-lobby'
 
 export interface GameData {
@@ -150,7 +156,10 @@ export interface GameData {
     d: string
     correct_answer?: string
     submitted_answer?: string
+    audio_file?: string
   }
+  // Audio of the next questions, prefetched by lib/audioPrefetch
+  upcoming_audio?: QuestionAudio[]
   timer?: {
     startedAt: string
     duration: number
@@ -66,6 +66,11 @@ export default defineConfig({
       "@": path.resolve(__dirname, "./src"),
     },
   },
+  esbuild: {
+    // Let the production minifier drop debug logging (src/lib/logger.ts);
+    // dev builds are not minified, so these calls stay there
+    pure: ['logger.debug', 'logger.info'],
+  },
   server: {
     // Listen on all network interfaces to allow network access
     host: '0.0.0.0',